@@ -3,10 +3,10 @@ API Blueprints для версіювання
 v1 - базова версія API (backwards compatibility)
 v2 - покращена версія з валідацією та розширеною обробкою помилок
 """
-from flask import Blueprint, jsonify, request, session
+from flask import Blueprint, jsonify, request, session, url_for
 from functools import wraps
-from flasgger import swag_from
-from models import db, Product, Order, OrderItem, Payment, Feedback, MoodEntry, User
+from sqlalchemy.exc import IntegrityError
+from models import db, Product, Order, Payment, Feedback, MoodEntry, User
 from schemas import (
     products_schema, create_order_schema, order_output_schema,
     create_payment_schema, payment_output_schema, create_feedback_schema,
@@ -14,9 +14,11 @@ from schemas import (
     journal_entry_output_schema
 )
 from marshmallow import ValidationError
+from idempotency import idempotent
+import checkout
+import task_queue
+import tracing
 import logging
-from datetime import datetime
-import uuid
 
 # ===== Blueprints =====
 api_v1 = Blueprint('api_v1', __name__, url_prefix='/api/v1')
@@ -33,7 +35,8 @@ def validate_request_data(schema, data=None):
         return None, (jsonify({'status': 'error', 'message': 'Відсутні дані в запиті'}), 400)
     
     try:
-        validated_data = schema.load(data)
+        with tracing.span('validate', schema=type(schema).__name__):
+            validated_data = schema.load(data)
         return validated_data, None
     except ValidationError as err:
         return None, (jsonify({
@@ -56,6 +59,15 @@ def login_required_api(f):
 # ==================== API V1 (Базова версія без валідації) ====================
 # Ці endpoints підтримують backwards compatibility
 
+
+def v1_order_item(item_data):
+    """Рядок кошика v1 з int-полями: v1 завжди приймав id та кількість рядками ("1")."""
+    product_id = item_data.get('product_id')
+    return {
+        'product_id': int(product_id) if product_id is not None else None,
+        'quantity': int(item_data.get('quantity', 1))
+    }
+
 @api_v1.route('/products', methods=['GET'])
 def v1_get_products():
     """V1: Отримати список продуктів"""
@@ -69,6 +81,7 @@ def v1_get_products():
 
 @api_v1.route('/orders', methods=['POST'])
 @login_required_api
+@idempotent()
 def v1_create_order():
     """V1: Створити замовлення (без валідації)"""
     try:
@@ -78,36 +91,22 @@ def v1_create_order():
         if not items_data:
             return jsonify({'status': 'error', 'message': 'Замовлення повинно містити товари'}), 400
         
+        try:
+            items_data = [v1_order_item(item) for item in items_data]
+        except (TypeError, ValueError, AttributeError):
+            return jsonify({'status': 'error', 'message': 'Некоректний product_id або quantity'}), 400
+        
         user_id = session['user_id']
-        order = Order(user_id=user_id, status='new')
-        db.session.add(order)
-        db.session.flush()
-        
-        for item_data in items_data:
-            product_id = item_data.get('product_id')
-            quantity = item_data.get('quantity', 1)
-            
-            product = Product.query.get(product_id)
-            if not product or not product.is_active:
-                db.session.rollback()
-                return jsonify({'status': 'error', 'message': f'Продукт #{product_id} недоступний'}), 400
-            
-            order_item = OrderItem(
-                order_id=order.id,
-                product_id=product.id,
-                quantity=quantity,
-                unit_price=product.price,
-                subtotal=product.price * quantity
-            )
-            db.session.add(order_item)
-        
-        order.calculate_total()
-        db.session.commit()
+        try:
+            order, order_data = checkout.create_order(user_id, items_data)
+        except checkout.ProductUnavailable as exc:
+            db.session.rollback()
+            return jsonify({'status': 'error', 'message': f'Продукт #{exc.product_id} недоступний'}), 400
         
         return jsonify({
             'status': 'success',
             'message': 'Замовлення створено',
-            'order': order.to_dict(include_items=True)
+            'order': order_data
         }), 201
         
     except Exception as e:
@@ -167,6 +166,7 @@ def v2_get_products():
 
 @api_v2.route('/orders', methods=['POST'])
 @login_required_api
+@idempotent()
 def v2_create_order():
     """V2: Створити замовлення з валідацією"""
     try:
@@ -178,37 +178,18 @@ def v2_create_order():
         items_data = validated_data['items']
         user_id = session['user_id']
         
-        order = Order(user_id=user_id, status='new')
-        db.session.add(order)
-        db.session.flush()
-        
-        for item_data in items_data:
-            product_id = item_data['product_id']
-            quantity = item_data['quantity']
-            
-            product = Product.query.get(product_id)
-            if not product or not product.is_active:
-                db.session.rollback()
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Продукт #{product_id} недоступний',
-                    'code': 'PRODUCT_NOT_FOUND'
-                }), 404
-            
-            order_item = OrderItem(
-                order_id=order.id,
-                product_id=product.id,
-                quantity=quantity,
-                unit_price=product.price,
-                subtotal=product.price * quantity
-            )
-            db.session.add(order_item)
-        
-        order.calculate_total()
-        db.session.commit()
+        try:
+            order, order_dict = checkout.create_order(user_id, items_data)
+        except checkout.ProductUnavailable as exc:
+            db.session.rollback()
+            return jsonify({
+                'status': 'error',
+                'message': f'Продукт #{exc.product_id} недоступний',
+                'code': 'PRODUCT_NOT_FOUND'
+            }), 404
         
         # Серіалізація відповіді
-        order_data = order_output_schema.dump(order.to_dict(include_items=True))
+        order_data = order_output_schema.dump(order_dict)
         
         return jsonify({
             'status': 'success',
@@ -228,6 +209,7 @@ def v2_create_order():
 
 @api_v2.route('/payments', methods=['POST'])
 @login_required_api
+@idempotent()
 def v2_create_payment():
     """V2: Створити платіж з валідацією"""
     try:
@@ -260,7 +242,6 @@ def v2_create_payment():
             }), 404
         
         user_id = session['user_id']
-        user = User.query.get(user_id)
         
         # Перевірка чи вже є оплата
         if order.payment:
@@ -285,37 +266,36 @@ def v2_create_payment():
                 payment.card_last4 = card_number[-4:]
             payment.card_brand = validated_data.get('card_brand', 'Unknown')
         
-        # Симуляція обробки платежу
-        prefix = {'card': 'TXN', 'online_banking': 'BANK', 'paypal': 'PP'}.get(payment_method, 'TXN')
-        payment.transaction_id = f"{prefix}-{uuid.uuid4().hex[:12].upper()}"
-        payment.status = 'completed'
-        payment.completed_at = datetime.utcnow()
-        
-        # Для цифрових продуктів (Premium) - одразу completed
-        is_digital = any('premium' in (item.product.name or '').lower() or 
-                       'преміум' in (item.product.name or '').lower() 
-                       for item in order.items)
-        order.status = 'completed' if is_digital else 'processing'
-        
-        # Активація Premium для користувача
-        if is_digital and user:
-            user.is_premium = True
-            logging.info(f"Premium активовано для користувача {user.email}")
-        
         db.session.add(payment)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Конкурентний запит встиг створити платіж (order_id унікальний)
+            db.session.rollback()
+            return jsonify({
+                'status': 'error',
+                'message': 'Замовлення вже має платіж',
+                'code': 'PAYMENT_EXISTS'
+            }), 400
+        
+        # Авторизацію у платіжному шлюзі виконує фоновий воркер
+        job = task_queue.enqueue('payments.process', {'payment_id': payment.id},
+                                 key=f'payment:{payment.id}', user_id=user_id)
+        db.session.refresh(payment)
         
         # Серіалізація відповіді
         payment_data = payment_output_schema.dump(payment.to_dict())
         
         return jsonify({
-            'status': 'success',
-            'message': 'Платіж створено успішно',
+            'status': 'accepted',
+            'message': 'Платіж прийнято в обробку',
             'data': {
                 'payment': payment_data,
-                'order': order.to_dict()
+                'order': order.to_dict(),
+                'task_id': job.id,
+                'status_url': url_for('get_payment', payment_id=payment.id)
             }
-        }), 201
+        }), 202
         
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,245 @@
+"""
+Swagger-документація API з лінивою ініціалізацією.
+
+flasgger (разом з jsonschema, mistune, yaml) додавав ~350 ms до імпорту
+app.py у кожному воркері, хоча /api/docs відкривають одиниці. Тепер:
+- swag_from() тут — легка заміна декоратора flasgger: лише позначає
+  функцію шляхом до YAML-специфікації (ті самі атрибути, що читає flasgger)
+- специфікація будується один раз: під час збірки образу
+  (python scripts/build_apispec.py -> API_SPEC_DIR/apispec-<відбиток>.json)
+  або, якщо файлу немає, при першому GET /apispec.json; далі віддається з
+  пам'яті як готові байти (+ gzip) з ETag, повторні запити — 304. Відбиток —
+  хеш маршрутів і YAML-файлів, тож застарілий файл просто не знайдеться
+- flasgger — опційна залежність: потрібен лише для побудови специфікації;
+  воркер з готовим файлом його не імпортує
+- GET /api/docs — сторінка Swagger UI; статика UI віддається з пакета
+  flasgger за /flasgger_static/?v=<версія> як immutable, без імпорту пакета
+"""
+
+import gzip
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import logging
+import os
+import threading
+
+from flask import Response, abort, current_app, jsonify, render_template, request, send_from_directory
+from flask.helpers import get_root_path
+
+SPEC_ENDPOINT = 'apispec'
+SPEC_ROUTE = '/apispec.json'
+DOCS_ROUTE = '/api/docs'
+UI_STATIC_ROUTE = '/flasgger_static'
+DEFAULT_SPEC_DIR = '.cache'
+IMMUTABLE_MAX_AGE = 31536000
+# Специфікація змінюється лише з деплоєм; ETag робить повторну перевірку дешевою
+SPEC_MAX_AGE = 300
+
+SWAGGER_CONFIG = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": SPEC_ENDPOINT,
+            "route": SPEC_ROUTE,
+            "rule_filter": lambda rule: True,
+            "model_filter": lambda tag: True,
+        }
+    ],
+    "static_url_path": UI_STATIC_ROUTE,
+    "swagger_ui": True,
+    "specs_route": DOCS_ROUTE
+}
+
+SWAGGER_TEMPLATE = {
+    "swagger": "2.0",
+    "info": {
+        "title": "DailyMood API",
+        "description": "REST API для додатку DailyMood - щоденник настрою, звичок та цілей",
+        "version": "1.0.0",
+        "contact": {
+            "name": "DailyMood Team",
+            "email": "support@dailymood.app"
+        }
+    },
+    "host": "localhost:5000",
+    "basePath": "/",
+    "schemes": ["http"],
+    "securityDefinitions": {
+        "SessionAuth": {
+            "type": "apiKey",
+            "name": "session",
+            "in": "cookie",
+            "description": "Flask session cookie для авторизації"
+        }
+    }
+}
+
+_spec = None
+_spec_lock = threading.Lock()
+
+
+class BuiltSpec:
+    """Серіалізована специфікація: байти, gzip та ETag."""
+
+    def __init__(self, data):
+        self.data = data
+        self.gzip = gzip.compress(data, compresslevel=9, mtime=0)
+        self.etag = hashlib.sha256(data).hexdigest()[:16]
+
+    @classmethod
+    def from_dict(cls, spec):
+        return cls(serialize(spec))
+
+
+def swag_from(specs):
+    """Позначає view шляхом до YAML-специфікації (відносно модуля view)."""
+    def decorator(function):
+        path = str(specs)
+        if not os.path.isabs(path):
+            path = os.path.join(get_root_path(function.__module__), path)
+        function.swag_path = path
+        function.swag_type = path.rsplit('.', 1)[-1]
+        return function
+    return decorator
+
+
+def serialize(spec):
+    # sort_keys — стабільні байти (і ETag) для однакової специфікації
+    return json.dumps(spec, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def fingerprint(app):
+    """Хеш маршрутів додатку та YAML-специфікацій, з яких будується документ."""
+    digest = hashlib.sha256()
+    for rule in sorted(app.url_map.iter_rules(), key=lambda r: (r.rule, r.endpoint)):
+        digest.update(f'{rule.rule} {rule.endpoint} {sorted(rule.methods or ())}\n'.encode('utf-8'))
+        path = getattr(app.view_functions.get(rule.endpoint), 'swag_path', None)
+        if path:
+            with open(path, 'rb') as fh:
+                digest.update(fh.read())
+    return digest.hexdigest()[:12]
+
+
+def spec_file(app):
+    directory = app.config.get('API_SPEC_DIR') or DEFAULT_SPEC_DIR
+    if not os.path.isabs(directory):
+        directory = os.path.join(app.root_path, directory)
+    return os.path.join(directory, f'apispec-{fingerprint(app)}.json')
+
+
+def ui_static_folder():
+    """Папка статики Swagger UI з пакета flasgger (без імпорту пакета)."""
+    spec = importlib.util.find_spec('flasgger')
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(spec.submodule_search_locations[0], 'ui3', 'static')
+
+
+def ui_version():
+    try:
+        return importlib.metadata.version('flasgger')
+    except importlib.metadata.PackageNotFoundError:
+        return ''
+
+
+def build_spec(app):
+    """Будує специфікацію Swagger 2.0 з маршрутів додатку (імпортує flasgger)."""
+    from flasgger import Swagger
+
+    swagger = Swagger(config=SWAGGER_CONFIG, template=SWAGGER_TEMPLATE)
+    # Без init_app: flasgger не реєструє свій blueprint, лише читає url_map
+    swagger.app = app
+    swagger.load_config(app)
+    return swagger.get_apispecs(SPEC_ENDPOINT)
+
+
+def write_spec(app, path=None):
+    """Будує специфікацію і записує її у файл (крок збірки). Повертає шлях."""
+    path = path or spec_file(app)
+    with app.app_context():
+        data = serialize(build_spec(app))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as fh:
+        fh.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _load_spec(app):
+    if not app.debug:
+        path = spec_file(app)
+        try:
+            with open(path, 'rb') as fh:
+                data = fh.read()
+            logging.info("Swagger-специфікацію завантажено з %s", path)
+            return BuiltSpec(data)
+        except FileNotFoundError:
+            pass
+    spec = build_spec(app)
+    logging.info("Swagger-специфікацію побудовано: %s шляхів", len(spec.get('paths', {})))
+    return BuiltSpec.from_dict(spec)
+
+
+def get_spec():
+    """Готова специфікація з пам'яті (у debug — щоразу заново з YAML)."""
+    global _spec
+    app = current_app._get_current_object()
+    if app.debug:
+        return _load_spec(app)
+    if _spec is None:
+        with _spec_lock:
+            if _spec is None:
+                _spec = _load_spec(app)
+    return _spec
+
+
+def reset():
+    global _spec
+    _spec = None
+
+
+def apispec():
+    try:
+        built = get_spec()
+    except ImportError:
+        return jsonify({'status': 'error', 'message': 'Swagger недоступний: flasgger не встановлено'}), 503
+
+    if request.if_none_match.contains(built.etag):
+        response = Response(status=304)
+    elif request.accept_encodings['gzip']:
+        response = Response(built.gzip, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(built.data, mimetype='application/json')
+    response.set_etag(built.etag)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = SPEC_MAX_AGE
+    return response
+
+
+def api_docs():
+    return render_template('api_docs.html', spec_url=SPEC_ROUTE, static_url=UI_STATIC_ROUTE,
+                           ui_version=ui_version())
+
+
+def ui_static(filename):
+    folder = ui_static_folder()
+    if folder is None:
+        abort(404)
+    version = ui_version()
+    if version and request.args.get('v') == version:
+        response = send_from_directory(folder, filename, max_age=IMMUTABLE_MAX_AGE)
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+    return send_from_directory(folder, filename, max_age=current_app.config.get('STATIC_MAX_AGE', 3600))
+
+
+def init_app(app):
+    app.add_url_rule(SPEC_ROUTE, SPEC_ENDPOINT, apispec)
+    app.add_url_rule(DOCS_ROUTE, 'api_docs', api_docs)
+    app.add_url_rule(f'{UI_STATIC_ROUTE}/<path:filename>', 'swagger_ui_static', ui_static)
@@ -4,8 +4,12 @@ DailyMood Flask Application
 This module defines a Flask app with helper functions for database initialization
 and routes for the small DailyMood app. Routes are intentionally simple and return
 either HTML templates or JSON for frontend handling. Key helpers are:
+- create_app(): Per-process initialization for WSGI servers (`gunicorn 'app:create_app()'`)
 - test_db_connection(): Quick test of database connectivity
-- create_tables(): Initializes SQLAlchemy models
+- create_tables(): One-shot schema bootstrap (see schema_bootstrap.py)
+
+Importing this module has no side effects beyond building the app object:
+no database connections, no log files, no schema changes.
 
 Routes include:
 - /, /about, /favorites, /journal, /goals, /statistics (template renders)
@@ -14,38 +18,53 @@ Routes include:
 The code below uses SQLAlchemy models defined in `models.py` (MoodEntry).
 """
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, stream_with_context
 from flask_session import Session
-from flasgger import Swagger, swag_from
 from functools import wraps
-import time
 import os
 import logging
+import threading
 import json
 from datetime import datetime, timedelta
-from sqlalchemy import func, extract, inspect, text
-from models import db, MoodEntry, Feedback, User, Product, Order, OrderItem, Payment
+from sqlalchemy import func, extract
+from sqlalchemy.exc import IntegrityError
+from models import db, MoodEntry, Feedback, User, Product, Order, Payment, BackgroundTask, Entitlement
 from habits_models import Habit, HabitCompletion, MonthlyGoal
 from marshmallow import ValidationError
 from schemas import (
-    ma, products_schema, create_order_schema, order_output_schema,
+    products_schema, create_order_schema, order_output_schema,
     create_payment_schema, payment_output_schema, create_feedback_schema,
     feedback_output_schema, feedbacks_schema, create_journal_entry_schema,
     journal_entry_output_schema
 )
 import traceback
-import io
-import csv
-
-# Налаштування логування
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
-)
+import task_queue
+import checkout
+import payment_gateway
+import entitlements
+import session_policy
+import static_files
+import assets
+import i18n
+import quotes
+import page_cache
+from page_cache import cached_page
+import template_cache
+import api_docs
+from api_docs import swag_from
+import schema_bootstrap
+import journal_export
+import profiler
+import slow_queries
+import metrics
+import tracing
+import memory_monitor
+import db_pool
+import replica_routing
+import health
+from idempotency import idempotent
+import tasks  # noqa: F401 — реєструє обробники фонових задач
+
 
 app = Flask(__name__)
 
@@ -70,7 +89,6 @@ app.config['AVAILABLE_AVATARS'] = AVAILABLE_AVATARS
 # Configure database: prefer env `DATABASE_URL` (PostgreSQL in production), fallback to SQLite file
 basedir = os.path.abspath(os.path.dirname(__file__))
 db_path = os.path.join(basedir, 'data', 'dailymood.db')
-os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
 # Use DATABASE_URL or SQLALCHEMY_DATABASE_URI if provided, otherwise SQLite
 env_db_url = os.environ.get('DATABASE_URL') or os.environ.get('SQLALCHEMY_DATABASE_URI')
@@ -117,60 +135,232 @@ app.config['SESSION_TYPE'] = 'filesystem'
 app.config['SESSION_PERMANENT'] = True
 app.config['SESSION_FILE_DIR'] = session_dir
 
-# Ініціалізація бази даних
+# Черга фонових задач: у eager-режимі задачі виконуються одразу в запиті (тести/діагностика)
+app.config['TASK_QUEUE_EAGER'] = _str_to_bool(os.environ.get('TASK_QUEUE_EAGER'), default=False)
+
+# Idempotency-Key: скільки зберігати відповідь (секунди) та опційний Redis-рівень
+try:
+    app.config['IDEMPOTENCY_TTL'] = int(os.environ.get('IDEMPOTENCY_TTL', 86400))
+except Exception:
+    app.config['IDEMPOTENCY_TTL'] = 86400
+app.config['IDEMPOTENCY_REDIS_URL'] = os.environ.get('IDEMPOTENCY_REDIS_URL')
+
+# Платіжний шлюз: 'fake' — локальна імітація з затримкою та відсотком відмов
+app.config['PAYMENT_GATEWAY'] = os.environ.get('PAYMENT_GATEWAY', 'fake')
+try:
+    app.config['PAYMENT_GATEWAY_LATENCY'] = float(os.environ.get('PAYMENT_GATEWAY_LATENCY', 0.5))
+    app.config['PAYMENT_GATEWAY_FAILURE_RATE'] = float(os.environ.get('PAYMENT_GATEWAY_FAILURE_RATE', 0.0))
+except Exception:
+    app.config['PAYMENT_GATEWAY_LATENCY'] = 0.5
+    app.config['PAYMENT_GATEWAY_FAILURE_RATE'] = 0.0
+app.config['PAYMENT_WEBHOOK_SECRET'] = os.environ.get('PAYMENT_WEBHOOK_SECRET')
+
+# Індекс прав: TTL кешу прав у процесі (сек) та тривалість преміуму після оплати (днів, 0 — безстроково)
+try:
+    app.config['ENTITLEMENT_CACHE_TTL'] = float(os.environ.get('ENTITLEMENT_CACHE_TTL', 10))
+    app.config['PREMIUM_DURATION_DAYS'] = int(os.environ.get('PREMIUM_DURATION_DAYS', 0))
+except Exception:
+    app.config['ENTITLEMENT_CACHE_TTL'] = 10
+    app.config['PREMIUM_DURATION_DAYS'] = 0
+
+# Маніфест статики: у debug хеші перераховуються при зміні файлу, а замість бандлів — вихідні файли
+# (не задано — визначається в create_app() за app.debug, тож враховує і debug, увімкнений після імпорту)
+app.config['ASSETS_AUTO_RELOAD'] = _str_to_bool(os.environ.get('ASSETS_AUTO_RELOAD'), default=None)
+app.config['ASSETS_USE_BUNDLES'] = _str_to_bool(os.environ.get('ASSETS_USE_BUNDLES'), default=None)
+# Статика: max-age для неверсіонованих URL (?v=<поточний відбиток> кешуються як immutable)
+try:
+    app.config['STATIC_MAX_AGE'] = int(os.environ.get('STATIC_MAX_AGE', 3600))
+except Exception:
+    app.config['STATIC_MAX_AGE'] = 3600
+
+# Кеш відрендерених сторінок: вимкнений у debug, PAGE_CACHE_VERSION — додатковий ідентифікатор релізу
+app.config['PAGE_CACHE_ENABLED'] = _str_to_bool(os.environ.get('PAGE_CACHE_ENABLED'), default=not app.debug)
+app.config['PAGE_CACHE_VERSION'] = os.environ.get('PAGE_CACHE_VERSION') or os.environ.get('RELEASE_VERSION')
+app.config['PAGE_CACHE_REDIS_URL'] = os.environ.get('PAGE_CACHE_REDIS_URL')
+try:
+    app.config['PAGE_CACHE_SIZE'] = int(os.environ.get('PAGE_CACHE_SIZE', 256))
+    app.config['PAGE_CACHE_TTL'] = int(os.environ.get('PAGE_CACHE_TTL', 3600))
+except Exception:
+    app.config['PAGE_CACHE_SIZE'] = 256
+    app.config['PAGE_CACHE_TTL'] = 3600
+
+# Шаблони: файловий кеш байткоду Jinja (спільний для воркерів) та прогрів до прийому трафіку
+app.config['TEMPLATE_BYTECODE_CACHE'] = _str_to_bool(os.environ.get('TEMPLATE_BYTECODE_CACHE'), default=True)
+app.config['TEMPLATE_CACHE_DIR'] = os.environ.get('TEMPLATE_CACHE_DIR') or os.path.join(basedir, '.cache', 'jinja')
+app.config['TEMPLATE_WARMUP'] = _str_to_bool(os.environ.get('TEMPLATE_WARMUP'), default=not app.debug)
+
+# Готова Swagger-специфікація (scripts/build_apispec.py); без файлу будується flasgger-ом при першому запиті
+app.config['API_SPEC_DIR'] = os.environ.get('API_SPEC_DIR') or os.path.join(basedir, '.cache')
+
+# Схема БД розгортається явною командою (scripts/init_db.py); автозапуск у create_app() — лише за бажанням
+app.config['SCHEMA_AUTO_BOOTSTRAP'] = _str_to_bool(os.environ.get('SCHEMA_AUTO_BOOTSTRAP'), default=False)
+app.config['SCHEMA_LOCK_FILE'] = os.environ.get('SCHEMA_LOCK_FILE') or os.path.join(basedir, 'data', '.schema-bootstrap.lock')
+
+# Експорт щоденника сторінками; ASGI-режим (asgi.py): пул потоків для sync-view та ліміти async-з'єднань
+try:
+    app.config['JOURNAL_EXPORT_PAGE_SIZE'] = int(os.environ.get('JOURNAL_EXPORT_PAGE_SIZE', 500))
+    app.config['ASGI_THREADS'] = int(os.environ.get('ASGI_THREADS', 8))
+    app.config['ASGI_LONGPOLL_MAX'] = float(os.environ.get('ASGI_LONGPOLL_MAX', 25))
+    app.config['ASGI_POLL_INTERVAL'] = float(os.environ.get('ASGI_POLL_INTERVAL', 0.5))
+    app.config['ASGI_LIVE_HEARTBEAT'] = float(os.environ.get('ASGI_LIVE_HEARTBEAT', 15))
+    app.config['ASGI_MAX_STREAMS'] = int(os.environ.get('ASGI_MAX_STREAMS', 5000))
+except Exception:
+    app.config['JOURNAL_EXPORT_PAGE_SIZE'] = 500
+    app.config['ASGI_THREADS'] = 8
+    app.config['ASGI_LONGPOLL_MAX'] = 25.0
+    app.config['ASGI_POLL_INTERVAL'] = 0.5
+    app.config['ASGI_LIVE_HEARTBEAT'] = 15.0
+    app.config['ASGI_MAX_STREAMS'] = 5000
+
+# Профілювання запиту на вимогу (X-Profile / ?_profile=) для адмінів або з PROFILER_SECRET
+app.config['PROFILER_ENABLED'] = _str_to_bool(os.environ.get('PROFILER_ENABLED'), default=True)
+app.config['PROFILER_SECRET'] = os.environ.get('PROFILER_SECRET')
+app.config['PROFILER_DIR'] = os.environ.get('PROFILER_DIR') or os.path.join(basedir, 'data', 'profiles')
+try:
+    app.config['PROFILER_MAX_CAPTURES'] = int(os.environ.get('PROFILER_MAX_CAPTURES', 200))
+    app.config['PROFILER_SAMPLE_INTERVAL'] = float(os.environ.get('PROFILER_SAMPLE_INTERVAL', 0.005))
+except Exception:
+    app.config['PROFILER_MAX_CAPTURES'] = 200
+    app.config['PROFILER_SAMPLE_INTERVAL'] = 0.005
+
+# Журнал повільних SQL-запитів (поріг у мс) та метрики Prometheus на /metrics
+app.config['SLOW_QUERY_LOG_ENABLED'] = _str_to_bool(os.environ.get('SLOW_QUERY_LOG_ENABLED'), default=True)
+app.config['SLOW_QUERY_EXPLAIN'] = _str_to_bool(os.environ.get('SLOW_QUERY_EXPLAIN'), default=True)
+try:
+    app.config['SLOW_QUERY_THRESHOLD_MS'] = float(os.environ.get('SLOW_QUERY_THRESHOLD_MS', 100))
+    app.config['SLOW_QUERY_MAX_FINGERPRINTS'] = int(os.environ.get('SLOW_QUERY_MAX_FINGERPRINTS', 500))
+except Exception:
+    app.config['SLOW_QUERY_THRESHOLD_MS'] = 100.0
+    app.config['SLOW_QUERY_MAX_FINGERPRINTS'] = 500
+app.config['METRICS_ENABLED'] = _str_to_bool(os.environ.get('METRICS_ENABLED'), default=True)
+# Без токена /metrics відповідає 401 на кожен запит
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+
+# Трасування запитів: X-Request-ID, tail-семплування (повільні та 5xx зберігаються завжди).
+# Кожен запит — лише кореневий спан; спани фаз — для семплованих і нещодавно повільних шляхів
+app.config['TRACING_ENABLED'] = _str_to_bool(os.environ.get('TRACING_ENABLED'), default=True)
+app.config['TRACING_SERIALIZE_SPANS'] = _str_to_bool(os.environ.get('TRACING_SERIALIZE_SPANS'), default=True)
+app.config['TRACING_EXPORTER'] = os.environ.get('TRACING_EXPORTER', 'file')
+app.config['TRACING_FILE'] = os.environ.get('TRACING_FILE') or os.path.join(basedir, 'data', 'traces', 'traces.jsonl')
+app.config['TRACING_OTLP_ENDPOINT'] = os.environ.get('TRACING_OTLP_ENDPOINT', 'http://127.0.0.1:4318/v1/traces')
+app.config['TRACING_SERVICE_NAME'] = os.environ.get('TRACING_SERVICE_NAME', 'dailymood')
+try:
+    app.config['TRACING_SAMPLE_RATE'] = float(os.environ.get('TRACING_SAMPLE_RATE', 0.01))
+    app.config['TRACING_SLOW_MS'] = float(os.environ.get('TRACING_SLOW_MS', 500))
+    app.config['TRACING_SLOW_DETAIL'] = int(os.environ.get('TRACING_SLOW_DETAIL', 5))
+    app.config['TRACING_MAX_SPANS'] = int(os.environ.get('TRACING_MAX_SPANS', 512))
+    app.config['TRACING_QUEUE_SIZE'] = int(os.environ.get('TRACING_QUEUE_SIZE', 1000))
+except Exception:
+    app.config['TRACING_SAMPLE_RATE'] = 0.01
+    app.config['TRACING_SLOW_MS'] = 500.0
+    app.config['TRACING_SLOW_DETAIL'] = 5
+    app.config['TRACING_MAX_SPANS'] = 512
+    app.config['TRACING_QUEUE_SIZE'] = 1000
+
+# Пам'ять воркера: історія RSS, бюджет з м'яким перезапуском (0 — вимкнено), tracemalloc на вимогу
+app.config['MEMORY_MONITOR_ENABLED'] = _str_to_bool(os.environ.get('MEMORY_MONITOR_ENABLED'), default=True)
+try:
+    app.config['MEMORY_SAMPLE_INTERVAL'] = float(os.environ.get('MEMORY_SAMPLE_INTERVAL', 10))
+    app.config['MEMORY_HISTORY_SIZE'] = int(os.environ.get('MEMORY_HISTORY_SIZE', 360))
+    app.config['MEMORY_MAX_RSS_MB'] = float(os.environ.get('MEMORY_MAX_RSS_MB', 0))
+    app.config['MEMORY_MAX_SNAPSHOTS'] = int(os.environ.get('MEMORY_MAX_SNAPSHOTS', 4))
+except Exception:
+    app.config['MEMORY_SAMPLE_INTERVAL'] = 10.0
+    app.config['MEMORY_HISTORY_SIZE'] = 360
+    app.config['MEMORY_MAX_RSS_MB'] = 0.0
+    app.config['MEMORY_MAX_SNAPSHOTS'] = 4
+
+# Пул з'єднань БД і серверний statement_timeout (PostgreSQL); pool_timeout і таймаут запиту — менші за GUNICORN_TIMEOUT
+app.config['DB_POOL_PRE_PING'] = _str_to_bool(os.environ.get('DB_POOL_PRE_PING'), default=True)
+try:
+    app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE', 5))
+    app.config['DB_MAX_OVERFLOW'] = int(os.environ.get('DB_MAX_OVERFLOW', 5))
+    app.config['DB_POOL_TIMEOUT'] = float(os.environ.get('DB_POOL_TIMEOUT', 10))
+    app.config['DB_POOL_RECYCLE'] = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    app.config['DB_STATEMENT_TIMEOUT_MS'] = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 20000))
+    app.config['DB_CONNECT_TIMEOUT'] = int(os.environ.get('DB_CONNECT_TIMEOUT', 5))
+except Exception:
+    app.config['DB_POOL_SIZE'] = 5
+    app.config['DB_MAX_OVERFLOW'] = 5
+    app.config['DB_POOL_TIMEOUT'] = 10.0
+    app.config['DB_POOL_RECYCLE'] = 1800
+    app.config['DB_STATEMENT_TIMEOUT_MS'] = 20000
+    app.config['DB_CONNECT_TIMEOUT'] = 5
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = db_pool.engine_options(app.config['SQLALCHEMY_DATABASE_URI'], app.config)
+
+# Репліки для читання (через кому): GET-запити читають з них, після запису клієнт DB_REPLICA_STICKY_SECONDS читає з primary
+app.config['DB_REPLICA_ROUTE_GET'] = _str_to_bool(os.environ.get('DB_REPLICA_ROUTE_GET'), default=True)
+try:
+    app.config['DB_REPLICA_STICKY_SECONDS'] = int(os.environ.get('DB_REPLICA_STICKY_SECONDS', 5))
+    app.config['DB_REPLICA_RETRY_SECONDS'] = float(os.environ.get('DB_REPLICA_RETRY_SECONDS', 30))
+    app.config['DB_REPLICA_STATEMENT_TIMEOUT_MS'] = int(os.environ.get('DB_REPLICA_STATEMENT_TIMEOUT_MS',
+                                                                       app.config['DB_STATEMENT_TIMEOUT_MS']))
+except Exception:
+    app.config['DB_REPLICA_STICKY_SECONDS'] = 5
+    app.config['DB_REPLICA_RETRY_SECONDS'] = 30.0
+    app.config['DB_REPLICA_STATEMENT_TIMEOUT_MS'] = app.config['DB_STATEMENT_TIMEOUT_MS']
+_replica_urls = [url.strip() for url in os.environ.get('DB_REPLICA_URLS', '').split(',') if url.strip()]
+if _replica_urls:
+    app.config['SQLALCHEMY_BINDS'] = replica_routing.replica_binds(_replica_urls, app.config)
+
+# Проби: /health/live без I/O; /health/ready — кеш перевірок БД, сесій, схеми та прогріву, що оновлюється у фоні
+app.config['HEALTH_REQUIRE_WARMUP'] = _str_to_bool(os.environ.get('HEALTH_REQUIRE_WARMUP'), default=True)
+try:
+    app.config['HEALTH_CHECK_INTERVAL'] = float(os.environ.get('HEALTH_CHECK_INTERVAL', 5))
+    app.config['HEALTH_MAX_AGE'] = float(os.environ.get('HEALTH_MAX_AGE', 0))
+except Exception:
+    app.config['HEALTH_CHECK_INTERVAL'] = 5.0
+    app.config['HEALTH_MAX_AGE'] = 0.0
+
+# Ініціалізація бази даних; сесія маршрутизує читання HTTP-запитів на репліки (DB_REPLICA_URLS), якщо вони є
+db.session.session_factory.class_ = replica_routing.RoutingSession
 db.init_app(app)
 # Ініціалізація постійної сесії (filesystem)
 Session(app)
-
-# Health check endpoint for container orchestration
+# Статика, /health та публічний каталог — без читання сесії та завантаження користувача
+session_policy.init_app(app)
+static_files.init_app(app)
+# Маніфест статики з хешами вмісту: {{ asset('style.css') }} у шаблонах
+assets.init_app(app)
+# Каталоги перекладів по мовах (/i18n/<lang>.js) та публічні ендпоінти цитат без сесії
+i18n.init_app(app)
+session_policy.register_public('/api/quotes', '/api/quotes/daily')
+# Кеш HTML сторінок, що не залежать від користувача (версія — від маніфесту та шаблонів)
+page_cache.init_app(app)
+# Кеш байткоду шаблонів; прогрів виконує create_app() — до прийому трафіку воркером
+template_cache.init_app(app)
+# Профілювач першим стартує в before_request і останнім завершується в after_request
+profiler.init_app(app)
+# Повільні SQL-запити: відбитки, агрегати та EXPLAIN; метрики процесу на /metrics
+slow_queries.init_app(app)
+metrics.init_app(app)
+# Трасування обгортає інтерфейс сесії та методи Flask — після їх налаштування вище
+tracing.init_app(app, db)
+# RSS воркера знімається в after_request не частіше ніж раз на MEMORY_SAMPLE_INTERVAL
+memory_monitor.init_app(app)
+# Лічильники з'єднань пулу та метрики dailymood_db_pool_*
+db_pool.init_app(app, db)
+# Читання GET-запитів — з реплік (якщо задано DB_REPLICA_URLS), cookie липкості після запису
+replica_routing.init_app(app, db)
+# Кеш перевірок готовності; фоновий потік стартує на першій пробі у воркері
+health.init_app(app, db)
+
+# Health check endpoints for container orchestration
 @app.route('/health', methods=['GET'])
-def health():
+@app.route('/health/live', methods=['GET'])
+def health_live():
+    """Процес живий і обробляє запити (без звернень до БД чи диска)."""
     return jsonify({'status': 'ok'}), 200
 
-# Ініціалізація Marshmallow для валідації
-ma.init_app(app)
 
-# Ініціалізація Swagger для API документації
-swagger_config = {
-    "headers": [],
-    "specs": [
-        {
-            "endpoint": 'apispec',
-            "route": '/apispec.json',
-            "rule_filter": lambda rule: True,
-            "model_filter": lambda tag: True,
-        }
-    ],
-    "static_url_path": "/flasgger_static",
-    "swagger_ui": True,
-    "specs_route": "/api/docs"
-}
-
-swagger_template = {
-    "swagger": "2.0",
-    "info": {
-        "title": "DailyMood API",
-        "description": "REST API для додатку DailyMood - щоденник настрою, звичок та цілей",
-        "version": "1.0.0",
-        "contact": {
-            "name": "DailyMood Team",
-            "email": "support@dailymood.app"
-        }
-    },
-    "host": "localhost:5000",
-    "basePath": "/",
-    "schemes": ["http"],
-    "securityDefinitions": {
-        "SessionAuth": {
-            "type": "apiKey",
-            "name": "session",
-            "in": "cookie",
-            "description": "Flask session cookie для авторизації"
-        }
-    }
-}
+@app.route('/health/ready', methods=['GET'])
+def health_ready():
+    """Готовність приймати трафік: кешований результат перевірок БД, сесій, схеми та прогріву."""
+    ready, payload = health.get_monitor(app).readiness()
+    return jsonify(payload), 200 if ready else 503
 
-swagger = Swagger(app, config=swagger_config, template=swagger_template)
+# Swagger UI (/api/docs) та специфікація (/apispec.json): flasgger імпортується лише при першому зверненні
+api_docs.init_app(app)
 
 # Реєстрація API Blueprints для версіювання
 from api_blueprints import api_v1, api_v2
@@ -197,7 +387,8 @@ def validate_request_data(schema, data=None):
         return None, (jsonify({'status': 'error', 'message': 'Відсутні дані в запиті'}), 400)
     
     try:
-        validated_data = schema.load(data)
+        with tracing.span('validate', schema=type(schema).__name__):
+            validated_data = schema.load(data)
         return validated_data, None
     except ValidationError as err:
         return None, (jsonify({
@@ -236,6 +427,20 @@ def admin_required(f):
     return decorated_function
 
 
+def premium_required(f):
+    """Декоратор для преміум-роутів — перевіряє право 'premium' через кешований індекс прав."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not entitlements.has_premium(session.get('user_id')):
+            return jsonify({
+                'status': 'error',
+                'message': 'Ця функція доступна тільки для Premium користувачів',
+                'premium_required': True
+            }), 403
+        return f(*args, **kwargs)
+    return decorated_function
+
+
 def ensure_admin_presence(candidate_user: User) -> None:
     """Гарантує, що принаймні один адміністратор існує.
 
@@ -253,16 +458,6 @@ def ensure_admin_presence(candidate_user: User) -> None:
         db.session.rollback()
 
 
-@app.context_processor
-def inject_static_version():
-    """Provide a static_version value (file mtime or server start time) to use as a cache-buster in templates."""
-    try:
-        static_path = os.path.join(basedir, 'static', 'style.css')
-        v = int(os.path.getmtime(static_path))
-    except Exception:
-        v = int(time.time())
-    return dict(static_version=v)
-
 def test_db_connection():
     """Перевірка з'єднання з базою даних.
 
@@ -282,141 +477,18 @@ def test_db_connection():
 def create_tables():
     """Create database tables if they don't exist.
 
-    Uses SQLAlchemy's metadata to create any missing tables. This is safe
-    to call on application startup and will be skipped if tables already
-    exist. Any exceptions are logged and re-raised to make failures visible.
+    Runs the one-shot schema bootstrap (create_all, SQLite column helpers,
+    entitlement backfill) under a cross-process lock. Safe to call repeatedly;
+    `python scripts/init_db.py` is the usual entry point. Any exceptions are
+    logged and re-raised to make failures visible.
     """
     try:
-        with app.app_context():
-            db.create_all()
-            logging.info("Database tables created successfully")
+        schema_bootstrap.bootstrap(app)
+        logging.info("Database tables created successfully")
     except Exception as e:
         logging.error(f"Error creating database tables: {str(e)}")
         raise
 
-# Переконуємось що таблиці існують при імпорті/запуску для розробки
-def ensure_user_avatar_column():
-    """Додає колонку avatar до таблиці users, якщо її ще немає."""
-    try:
-        inspector = inspect(db.engine)
-        columns = {col['name'] for col in inspector.get_columns('users')}
-        if 'avatar' not in columns:
-            with db.engine.connect() as conn:
-                conn.execute(text('ALTER TABLE users ADD COLUMN avatar VARCHAR(255)'))
-            logging.info("Додано колонку avatar до таблиці users")
-    except Exception as exc:
-        logging.error("Не вдалося гарантувати наявність avatar у users: %s", exc)
-
-
-def ensure_user_premium_columns():
-    """Додає колонки для преміум-статусу, якщо їх немає."""
-    try:
-        inspector = inspect(db.engine)
-        columns = {col['name'] for col in inspector.get_columns('users')}
-        alterations = []
-        if 'is_premium' not in columns:
-            alterations.append('ADD COLUMN is_premium BOOLEAN NOT NULL DEFAULT 0')
-        if 'premium_started_at' not in columns:
-            alterations.append('ADD COLUMN premium_started_at DATETIME')
-        if 'premium_expires_at' not in columns:
-            alterations.append('ADD COLUMN premium_expires_at DATETIME')
-        if alterations:
-            with db.engine.connect() as conn:
-                for statement in alterations:
-                    conn.execute(text(f'ALTER TABLE users {statement}'))
-            logging.info("Гарантовано наявність колонок преміум у таблиці users")
-    except Exception as exc:
-        logging.error("Не вдалося гарантувати наявність колонок преміум у users: %s", exc)
-
-
-def ensure_user_advice_unlock_column():
-    """Додає колонку advice_unlock_once для одноразового скидання блокування поради."""
-    try:
-        inspector = inspect(db.engine)
-        columns = {col['name'] for col in inspector.get_columns('users')}
-        if 'advice_unlock_once' not in columns:
-            with db.engine.connect() as conn:
-                conn.execute(text('ALTER TABLE users ADD COLUMN advice_unlock_once BOOLEAN NOT NULL DEFAULT 0'))
-            logging.info("Додано колонку advice_unlock_once до таблиці users")
-    except Exception as exc:
-        logging.error("Не вдалося гарантувати наявність advice_unlock_once у users: %s", exc)
-
-
-def ensure_mood_entry_user_id():
-    """Додає колонку user_id до mood_entries, якщо її немає."""
-    try:
-        inspector = inspect(db.engine)
-        columns = {col['name'] for col in inspector.get_columns('mood_entries')}
-        if 'user_id' not in columns:
-            # Спочатку додаємо колонку як nullable
-            with db.engine.connect() as conn:
-                conn.execute(text('ALTER TABLE mood_entries ADD COLUMN user_id INTEGER'))
-                conn.commit()
-            logging.info("Додано колонку user_id до таблиці mood_entries")
-            
-            # Якщо є існуючі записи без user_id, видаляємо їх або присвоюємо першому користувачу
-            with db.engine.connect() as conn:
-                result = conn.execute(text('SELECT COUNT(*) as cnt FROM mood_entries WHERE user_id IS NULL'))
-                orphan_count = result.fetchone()[0]
-                if orphan_count > 0:
-                    # Присвоюємо першому користувачу
-                    first_user = conn.execute(text('SELECT id FROM users ORDER BY id LIMIT 1')).fetchone()
-                    if first_user:
-                        conn.execute(text(f'UPDATE mood_entries SET user_id = {first_user[0]} WHERE user_id IS NULL'))
-                        logging.info(f"Присвоєно {orphan_count} старих записів користувачу #{first_user[0]}")
-                    else:
-                        # Немає користувачів — видаляємо старі записи
-                        conn.execute(text('DELETE FROM mood_entries WHERE user_id IS NULL'))
-                        logging.info(f"Видалено {orphan_count} старих записів без користувачів")
-                    conn.commit()
-    except Exception as exc:
-        logging.error("Не вдалося гарантувати наявність user_id у mood_entries: %s", exc)
-
-
-def ensure_habit_user_column():
-    """Додає колонку user_id до таблиці habits, якщо її немає."""
-    try:
-        inspector = inspect(db.engine)
-        if 'habits' in inspector.get_table_names():
-            columns = {col['name'] for col in inspector.get_columns('habits')}
-            if 'user_id' not in columns:
-                with db.engine.connect() as conn:
-                    conn.execute(text('ALTER TABLE habits ADD COLUMN user_id INTEGER'))
-                logging.info('Додано колонку user_id до таблиці habits')
-    except Exception as exc:
-        logging.error('Не вдалося додати колонку user_id у habits: %s', exc)
-
-
-def ensure_goal_user_column():
-    """Додає колонку user_id до таблиці monthly_goals, якщо її немає."""
-    try:
-        inspector = inspect(db.engine)
-        if 'monthly_goals' in inspector.get_table_names():
-            columns = {col['name'] for col in inspector.get_columns('monthly_goals')}
-            if 'user_id' not in columns:
-                with db.engine.connect() as conn:
-                    conn.execute(text('ALTER TABLE monthly_goals ADD COLUMN user_id INTEGER'))
-                logging.info('Додано колонку user_id до таблиці monthly_goals')
-    except Exception as exc:
-        logging.error('Не вдалося додати колонку user_id у monthly_goals: %s', exc)
-
-
-with app.app_context():
-    db.create_all()
-    # Виконуємо допоміжні ALTER-и лише для SQLite (локальні оновлення схеми)
-    try:
-        if db.engine.dialect.name == 'sqlite':
-            ensure_user_avatar_column()
-            ensure_user_premium_columns()
-            ensure_user_advice_unlock_column()
-            ensure_mood_entry_user_id()
-            ensure_habit_user_column()
-            ensure_goal_user_column()
-        else:
-            logging.info("Skipping SQLite-specific schema helpers for %s", db.engine.dialect.name)
-    except Exception:
-        logging.exception("Failed running schema helpers")
-
 @app.errorhandler(404)
 def not_found_error(error):
     logging.warning(f"404 error: {request.url}")
@@ -447,14 +519,22 @@ def internal_error(error):
 @app.before_request
 def before_request():
     """Log each request and set up user context."""
+    from flask import g
+    if session_policy.is_sessionless(request):
+        logging.debug(f"Request: {request.method} {request.url}")
+        g.user = None
+        return
     logging.info(f"Request: {request.method} {request.url}")
     
+    # Кешовані сторінки не залежать від користувача — не робимо запит до БД
+    if page_cache.is_cached_page(app, request.endpoint):
+        g.user = None
+        return
+    
     # Встановлюємо поточного користувача для використання у шаблонах
     if 'user_id' in session:
-        from flask import g
         g.user = User.query.get(session['user_id'])
     else:
-        from flask import g
         g.user = None
 
 @app.after_request
@@ -471,42 +551,41 @@ def after_request(response):
     return response
 
 @app.route('/')
+@cached_page
 def index():
-    advice_unlock_once = False
-    if 'user_id' in session:
-        user = User.query.get(session['user_id'])
-        if user:
-            advice_unlock_once = user.advice_unlock_once
-            # Reset the flag if it was used
-            if advice_unlock_once:
-                user.advice_unlock_once = False
-                db.session.commit()
-    return render_template('index.html', advice_unlock_once=advice_unlock_once)
+    # Прапорець advice_unlock_once сторінка читає з /api/me і гасить через POST /api/me/advice-unlock/consume
+    return render_template('index.html')
 
 @app.route('/about')
+@cached_page
 def about():
     return render_template('about.html')
 
 @app.route('/lab6')
+@cached_page
 def lab6_demo():
     """Проста сторінка для лабораторної №6 з формою та списком ресурсів."""
     return render_template('lab6_feedback.html')
 
 @app.route('/favorites')
+@cached_page
 def favorites():
     return render_template('favorites.html')
 
 @app.route('/journal')
+@cached_page
 def journal():
     """Сторінка щоденника."""
     return render_template('journal.html')
 
 @app.route('/goals')
+@cached_page
 def goals():
     """Сторінка цілей."""
     return render_template('goals.html')
 
 @app.route('/store')
+@cached_page
 def store():
     """Публічна сторінка магазину wellness-продуктів."""
     return render_template('store.html')
@@ -822,7 +901,49 @@ def get_current_user():
         return jsonify({'status': 'error', 'message': 'Користувач не знайдений'}), 404
     
     logging.info(f"GET /api/me - user found: {user.email}")
-    return jsonify({'status': 'success', 'user': user.to_dict()}), 200
+    user_data = user.to_dict()
+    user_data['advice_unlock_once'] = bool(user.advice_unlock_once)
+    return jsonify({'status': 'success', 'user': user_data}), 200
+
+
+@app.route('/api/me/advice-unlock/consume', methods=['POST'])
+@login_required
+def consume_advice_unlock():
+    """Використати одноразовий дозвіл на ще одну пораду (скинутий адміністратором)."""
+    try:
+        user = User.query.get(session['user_id'])
+        if not user:
+            return jsonify({'status': 'error', 'message': 'Користувач не знайдений'}), 404
+        consumed = bool(user.advice_unlock_once)
+        if consumed:
+            user.advice_unlock_once = False
+            db.session.commit()
+        return jsonify({'status': 'success', 'consumed': consumed}), 200
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error consuming advice unlock: {e}")
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+
+@app.route('/api/me/entitlements', methods=['GET'])
+@login_required
+def get_my_entitlements():
+    """Активні права поточного користувача: преміум та придбані продукти."""
+    try:
+        user_id = session['user_id']
+        features = sorted(entitlements.get_entitlements(user_id))
+        now = datetime.utcnow()
+        items = Entitlement.query.filter_by(user_id=user_id).all()
+        return jsonify({
+            'status': 'success',
+            'is_premium': entitlements.PREMIUM in features,
+            'features': features,
+            'product_ids': sorted(e.product_id for e in items if e.product_id and e.is_active(now)),
+            'entitlements': [e.to_dict() for e in items if e.is_active(now)]
+        }), 200
+    except Exception as e:
+        logging.error(f"Error getting entitlements: {e}")
+        return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
 @app.route('/api/session-debug', methods=['GET'])
@@ -847,8 +968,7 @@ def list_avatars():
             'premium_locked': PREMIUM_AVATARS
         }), 200
     
-    user = User.query.get(session['user_id'])
-    if user and user.is_premium:
+    if entitlements.has_premium(session['user_id']):
         return jsonify({
             'status': 'success',
             'avatars': AVAILABLE_AVATARS,
@@ -879,7 +999,7 @@ def update_avatar():
 
         # Перевіряємо, чи аватар доступний для користувача
         all_allowed = AVAILABLE_AVATARS[:]
-        if user.is_premium:
+        if entitlements.has_premium(user.id):
             all_allowed.extend(PREMIUM_AVATARS)
         
         if avatar_key and avatar_key not in all_allowed:
@@ -1104,35 +1224,12 @@ def export_journal():
     """
     try:
         user_id = session['user_id']
-        out_format = (request.args.get('format') or 'csv').strip().lower()
-        entries = MoodEntry.query.filter_by(user_id=user_id).order_by(MoodEntry.date.asc(), MoodEntry.id.asc()).all()
-
-        if out_format == 'json':
-            return jsonify({
-                'status': 'success',
-                'count': len(entries),
-                'data': [e.to_dict() for e in entries]
-            }), 200
-
-        # Підготовка CSV
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(['id','date','mood','title','activities','content'])
-        for e in entries:
-            writer.writerow([
-                e.id,
-                e.date.isoformat(),
-                e.mood,
-                e.title or '',
-                (e.activities or ''),
-                (e.content or '').replace('\n', ' ').strip()
-            ])
-        csv_data = buf.getvalue()
-        resp = app.response_class(
-            csv_data,
-            mimetype='text/csv; charset=utf-8'
-        )
-        resp.headers['Content-Disposition'] = 'attachment; filename="journal_export.csv"'
+        out_format = journal_export.export_format(request.args.get('format'))
+        page_size = app.config['JOURNAL_EXPORT_PAGE_SIZE']
+        # Записи читаються і віддаються сторінками — без завантаження всього журналу в пам'ять
+        body = stream_with_context(journal_export.stream(user_id, out_format, page_size))
+        resp = app.response_class(body, mimetype=journal_export.mimetype(out_format))
+        resp.headers.update(journal_export.headers(out_format))
         return resp
     except Exception as exc:
         logging.exception('Помилка експорту журналу')
@@ -1420,6 +1517,51 @@ def get_products():
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
+# -------------------- Quotes API --------------------
+
+@app.route('/api/quotes/daily', methods=['GET'])
+def get_daily_quote():
+    """Цитата дня: детермінована для дати (UTC) та мови, кешується до півночі."""
+    lang = quotes.resolve_language(request.args.get('lang'))
+    if lang is None:
+        return jsonify({'status': 'error', 'message': 'Непідтримувана мова'}), 400
+    try:
+        item = quotes.daily_quote(lang)
+    except Exception as e:
+        logging.error(f"Error getting daily quote: {e}")
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+    response = jsonify({'status': 'success', 'quote': item})
+    response.set_etag(f"{lang}-{item['date']}-{item['version']}")
+    response.cache_control.public = True
+    response.cache_control.max_age = quotes.seconds_until_midnight()
+    return response.make_conditional(request)
+
+
+@app.route('/api/quotes', methods=['GET'])
+def list_quotes():
+    """Посторінковий перегляд цитат (?lang=uk&page=1&per_page=20)."""
+    lang = quotes.resolve_language(request.args.get('lang'))
+    if lang is None:
+        return jsonify({'status': 'error', 'message': 'Непідтримувана мова'}), 400
+    try:
+        page_number = int(request.args.get('page', 1))
+        per_page = int(request.args.get('per_page', quotes.DEFAULT_PER_PAGE))
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'page та per_page мають бути числами'}), 400
+    try:
+        data = quotes.page(lang, page_number, per_page)
+    except Exception as e:
+        logging.error(f"Error listing quotes: {e}")
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+    response = jsonify({'status': 'success', **data})
+    response.set_etag(f"{lang}-{data['version']}-{data['page']}-{data['per_page']}")
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+
 @app.route('/api/products', methods=['POST'])
 @admin_required
 def create_product():
@@ -1518,6 +1660,7 @@ def delete_product(product_id):
 # -------------------- API Замовлень --------------------
 @app.route('/api/orders', methods=['POST'])
 @login_required
+@idempotent()
 @swag_from('docs/swagger/orders_post.yml')
 def create_order():
     """Створити нове замовлення (потрібен вхід)."""
@@ -1530,43 +1673,20 @@ def create_order():
         items_data = validated_data['items']
         user_id = session['user_id']
         
-        # Створюємо замовлення
-        order = Order(user_id=user_id, status='new')
-        db.session.add(order)
-        db.session.flush()  # Щоб отримати order.id для items
-        
-        # Додаємо елементи замовлення
-        for item_data in items_data:
-            product_id = item_data['product_id']
-            quantity = item_data['quantity']
-            
-            product = Product.query.get(product_id)
-            if not product or not product.is_active:
-                db.session.rollback()
-                return jsonify({
-                    'status': 'error',
-                    'message': f'Продукт #{product_id} недоступний'
-                }), 404
-            
-            subtotal = product.price * quantity
-            
-            order_item = OrderItem(
-                order_id=order.id,
-                product_id=product.id,
-                quantity=quantity,
-                unit_price=product.price,
-                subtotal=subtotal
-            )
-            db.session.add(order_item)
-        
-        # Розраховуємо загальну суму
-        order.calculate_total()
-        db.session.commit()
+        # Один запит за продуктами, сума в пам'яті, пакетна вставка рядків
+        try:
+            order, order_data = checkout.create_order(user_id, items_data)
+        except checkout.ProductUnavailable as exc:
+            db.session.rollback()
+            return jsonify({
+                'status': 'error',
+                'message': f'Продукт #{exc.product_id} недоступний'
+            }), 404
         
         return jsonify({
             'status': 'success',
             'message': 'Замовлення створено',
-            'order': order.to_dict(include_items=True)
+            'order': order_data
         }), 201
         
     except Exception as e:
@@ -1603,6 +1723,7 @@ def get_orders():
 
 
 @app.route('/api/orders/<int:order_id>', methods=['GET'])
+@replica_routing.primary
 @login_required
 def get_order(order_id):
     """Отримати деталі замовлення."""
@@ -1690,6 +1811,7 @@ def get_payment_methods():
 
 @app.route('/api/payments', methods=['POST'])
 @login_required
+@idempotent()
 @swag_from('docs/swagger/payments_post.yml')
 def create_payment():
     """Створити платіж для замовлення."""
@@ -1718,7 +1840,6 @@ def create_payment():
             return jsonify({'status': 'error', 'message': 'Замовлення не знайдено'}), 404
         
         user_id = session['user_id']
-        user = User.query.get(user_id)
         
         # Перевірка чи вже є оплата (для ідемпотентності повертаємо існуючий)
         existing_payment = Payment.query.filter_by(order_id=order.id).first()
@@ -1745,33 +1866,33 @@ def create_payment():
                 payment.card_last4 = card_number[-4:]
             payment.card_brand = validated_data.get('card_brand', 'Unknown')
         
-        # Симуляція обробки платежу
-        import uuid
-        prefix = {'card': 'TXN', 'online_banking': 'BANK', 'paypal': 'PP'}.get(payment_method, 'TXN')
-        payment.transaction_id = f"{prefix}-{uuid.uuid4().hex[:12].upper()}"
-        payment.status = 'completed'
-        payment.completed_at = datetime.utcnow()
-        
-        # Для цифрових продуктів (Premium) - одразу completed
-        is_digital = any('premium' in (item.product.name or '').lower() or 
-                       'преміум' in (item.product.name or '').lower() 
-                       for item in order.items)
-        order.status = 'completed' if is_digital else 'processing'
-        
-        # Активація Premium для користувача
-        if is_digital and user:
-            user.is_premium = True
-            logging.info(f"Premium активовано для користувача {user.email}")
-        
         db.session.add(payment)
-        db.session.commit()
-        
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Конкурентний запит встиг створити платіж (order_id унікальний) — повертаємо його
+            db.session.rollback()
+            existing_payment = Payment.query.filter_by(order_id=order.id).first()
+            return jsonify({
+                'status': 'success',
+                'message': 'Платіж вже існує для цього замовлення',
+                'payment': existing_payment.to_dict(),
+                'order': order.to_dict()
+            }), 200
+
+        # Проведення платежу виконує воркер; клієнт опитує status_url
+        job = task_queue.enqueue('payments.process', {'payment_id': payment.id},
+                                 key=f'payment:{payment.id}', user_id=user_id)
+        db.session.refresh(payment)
+
         return jsonify({
-            'status': 'success',
-            'message': 'Платіж створено успішно',
+            'status': 'accepted',
+            'message': 'Платіж прийнято в обробку',
             'payment': payment.to_dict(),
-            'order': order.to_dict()
-        }), 201
+            'order': order.to_dict(),
+            'task': job.to_dict(),
+            'status_url': url_for('get_payment', payment_id=payment.id)
+        }), 202
         
     except Exception as e:
         db.session.rollback()
@@ -1786,6 +1907,7 @@ def create_payment():
 
 
 @app.route('/api/payments/<int:payment_id>', methods=['GET'])
+@replica_routing.primary
 @login_required
 def get_payment(payment_id):
     """Отримати деталі платежу."""
@@ -1797,16 +1919,53 @@ def get_payment(payment_id):
         if payment.order.user_id != user.id and not user.is_admin:
             return jsonify({'status': 'error', 'message': 'Доступ заборонено'}), 403
         
-        return jsonify({
+        response = jsonify({
             'status': 'success',
             'payment': payment.to_dict(),
             'order': payment.order.to_dict(include_items=True)
-        }), 200
+        })
+        if payment.status == 'pending':
+            # Підказка клієнту, як часто опитувати статус
+            response.headers['Retry-After'] = '1'
+        return response, 200
     except Exception as e:
         logging.error(f"Error getting payment: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
+@app.route('/api/payments/webhook', methods=['POST'])
+def payment_webhook():
+    """Callback від платіжного шлюзу з фінальним статусом платежу.
+
+    Тіло: {"payment_id": 5, "status": "completed"|"failed", "transaction_id": "...", "message": "..."}
+    Заголовок X-Gateway-Signature: HMAC-SHA256(PAYMENT_WEBHOOK_SECRET, тіло).
+    """
+    try:
+        body = request.get_data()
+        secret = app.config.get('PAYMENT_WEBHOOK_SECRET')
+        if not payment_gateway.verify_signature(secret, body, request.headers.get('X-Gateway-Signature')):
+            return jsonify({'status': 'error', 'message': 'Невірний підпис'}), 401
+
+        data = request.get_json(silent=True) or {}
+        status = data.get('status')
+        if status not in payment_gateway.TERMINAL_STATUSES:
+            return jsonify({'status': 'error', 'message': 'Невірний статус'}), 400
+
+        payment = Payment.query.get(data.get('payment_id'))
+        if not payment:
+            return jsonify({'status': 'error', 'message': 'Платіж не знайдено'}), 404
+
+        result = payment_gateway.GatewayResult(status, data.get('transaction_id'), data.get('message'))
+        applied = payment_gateway.apply_gateway_result(payment, result)
+        db.session.commit()
+        # Дублікати вебхуків для вже фінального платежу — 200 без змін
+        return jsonify({'status': 'success', 'applied': applied, 'payment': payment.to_dict()}), 200
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error handling payment webhook: {e}")
+        return jsonify({'status': 'error', 'message': 'Внутрішня помилка сервера'}), 500
+
+
 @app.route('/api/payments/<int:payment_id>/status', methods=['PUT'])
 @admin_required
 def update_payment_status(payment_id):
@@ -1841,6 +2000,23 @@ def update_payment_status(payment_id):
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
+# -------------------- API Фонових задач --------------------
+@app.route('/api/tasks/<int:task_id>', methods=['GET'])
+@replica_routing.primary
+@login_required
+def get_task(task_id):
+    """Статус фонової задачі (власник задачі або адмін)."""
+    try:
+        job = BackgroundTask.query.get_or_404(task_id)
+        user = User.query.get(session['user_id'])
+        if job.user_id != session['user_id'] and not (user and user.is_admin):
+            return jsonify({'status': 'error', 'message': 'Доступ заборонено'}), 403
+        return jsonify({'status': 'success', 'task': job.to_dict()}), 200
+    except Exception as e:
+        logging.error(f"Error getting task: {e}")
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+
 # -------------------- API Адміністрування Користувачів --------------------
 @app.route('/api/admin/users', methods=['GET'])
 @admin_required
@@ -1917,13 +2093,11 @@ def admin_set_premium(user_id):
         else:
             desired_state = bool(desired_state)
 
-        target_user.is_premium = desired_state
-        now = datetime.utcnow()
-        if desired_state and not target_user.premium_started_at:
-            target_user.premium_started_at = now
-        if not desired_state:
-            # опційно можна обнуляти дату завершення
-            target_user.premium_expires_at = None
+        # Стан дзеркалиться в індекс прав (entitlements), з якого читають преміум-ендпоінти
+        if desired_state:
+            entitlements.grant_premium(target_user, days=0)
+        else:
+            entitlements.revoke_premium(target_user)
 
         db.session.commit()
 
@@ -1950,9 +2124,16 @@ def admin_delete_user(user_id):
             if admin_count <= 1:
                 return jsonify({'status': 'error', 'message': 'Повинен залишитися хоча б один адміністратор'}), 400
 
-        db.session.delete(user)
-        db.session.commit()
-        return jsonify({'status': 'success', 'message': 'Користувача видалено', 'id': user_id}), 200
+        # Каскадне видалення всіх дочірніх записів виконується воркером
+        job = task_queue.enqueue('users.delete', {'user_id': user.id},
+                                 key=f'user-delete:{user.id}', user_id=session['user_id'])
+        return jsonify({
+            'status': 'accepted',
+            'message': 'Видалення користувача заплановано',
+            'id': user_id,
+            'task': job.to_dict(),
+            'status_url': url_for('get_task', task_id=job.id)
+        }), 202
     except Exception as e:
         db.session.rollback()
         logging.error(f"Error deleting user: {e}")
@@ -1974,25 +2155,213 @@ def admin_reset_advice_lock(user_id):
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
+# -------------------- API Профілювання запитів --------------------
+@app.route('/api/admin/profiles', methods=['GET'])
+@admin_required
+def admin_list_profiles():
+    """Останні знімки профілювання (новіші першими)."""
+    limit = max(1, min(request.args.get('limit', 50, type=int), app.config['PROFILER_MAX_CAPTURES']))
+    return jsonify({'status': 'success', 'profiles': profiler.list_captures(app, limit)}), 200
+
+
+@app.route('/api/admin/profiles/<profile_id>', methods=['GET'])
+@admin_required
+def admin_get_profile(profile_id):
+    """Повний знімок: SQL, шаблони, стеки."""
+    data = profiler.load(app, profile_id)
+    if data is None:
+        return jsonify({'status': 'error', 'message': 'Профіль не знайдено'}), 404
+    return jsonify({'status': 'success', 'profile': data}), 200
+
+
+@app.route('/api/admin/profiles/<profile_id>/export', methods=['GET'])
+@admin_required
+def admin_export_profile(profile_id):
+    """Експорт у speedscope (за замовчуванням) або collapsed stacks."""
+    data = profiler.load(app, profile_id)
+    if data is None:
+        return jsonify({'status': 'error', 'message': 'Профіль не знайдено'}), 404
+    export_format = request.args.get('format', 'speedscope')
+    if export_format == 'speedscope':
+        body = json.dumps(profiler.to_speedscope(data, basedir), ensure_ascii=False)
+        mimetype, extension = 'application/json', 'speedscope.json'
+    elif export_format == 'collapsed':
+        body = profiler.to_collapsed(data, basedir)
+        mimetype, extension = 'text/plain', 'collapsed.txt'
+    else:
+        return jsonify({'status': 'error', 'message': 'format: speedscope або collapsed'}), 400
+    response = app.response_class(body, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="profile-{profile_id}.{extension}"'
+    return response
+
+
+# -------------------- API Повільних SQL-запитів --------------------
+@app.route('/api/admin/slow-queries', methods=['GET'])
+@admin_required
+def admin_slow_queries():
+    """Повільні запити цього воркера, згруповані за відбитком."""
+    log = slow_queries.get_log(app)
+    sort = request.args.get('sort', 'total_ms')
+    if sort not in slow_queries.SORT_KEYS:
+        return jsonify({'status': 'error', 'message': f"sort: {', '.join(slow_queries.SORT_KEYS)}"}), 400
+    limit = max(1, request.args.get('limit', 50, type=int))
+    return jsonify({
+        'status': 'success',
+        'pid': os.getpid(),
+        'enabled': log.enabled,
+        'threshold_ms': log.threshold_ms,
+        'fingerprints': len(log),
+        'dropped': log.dropped,
+        'queries': log.snapshot(sort, limit),
+    }), 200
+
+
+@app.route('/api/admin/slow-queries', methods=['DELETE'])
+@admin_required
+def admin_reset_slow_queries():
+    """Очищує агрегати (наприклад, після додавання індексу)."""
+    slow_queries.get_log(app).clear()
+    return jsonify({'status': 'success', 'message': 'Журнал повільних запитів очищено'}), 200
+
+
+# -------------------- API Пам'яті воркера --------------------
+# tracemalloc і знімки — стан одного воркера gunicorn: id знімка містить pid
+# ("<pid>-<n>"), а запит, що дійшов до іншого воркера, отримує 409 з pid обох.
+# Клієнт повторює такий запит (або працює з одним воркером).
+
+def _requested_pid(value):
+    """pid цільового воркера з тіла / query; None — будь-який воркер."""
+    if value in (None, ''):
+        return None
+    return int(value)
+
+
+def _other_worker(pid):
+    """409, якщо запит адресовано воркеру pid, а обробляє його інший."""
+    if pid is None or pid == os.getpid():
+        return None
+    return jsonify({
+        'status': 'error',
+        'message': f'Запит дійшов до воркера {os.getpid()}, а не {pid} — повторіть його',
+        'pid': os.getpid(),
+        'expected_pid': pid,
+    }), 409
+
+
+@app.route('/api/admin/memory', methods=['GET'])
+@admin_required
+def admin_memory():
+    """RSS та його історія, бюджет, стан tracemalloc і знімки цього воркера."""
+    return jsonify({'status': 'success', 'memory': memory_monitor.get_monitor(app).status()}), 200
+
+
+@app.route('/api/admin/memory/tracemalloc', methods=['POST'])
+@admin_required
+def admin_memory_tracemalloc():
+    """Запуск ({"enabled": true, "frames": N, "pid": P}) або зупинка tracemalloc у воркері."""
+    data = request.get_json(silent=True) or {}
+    monitor = memory_monitor.get_monitor(app)
+    try:
+        conflict = _other_worker(_requested_pid(data.get('pid')))
+    except (TypeError, ValueError):
+        return jsonify({'status': 'error', 'message': 'pid має бути цілим числом'}), 400
+    if conflict:
+        return conflict
+    if data.get('enabled', True):
+        try:
+            frames = monitor.start_tracing(data.get('frames', memory_monitor.DEFAULT_FRAMES))
+        except (TypeError, ValueError):
+            return jsonify({'status': 'error', 'message': 'frames має бути цілим числом'}), 400
+        return jsonify({'status': 'success', 'pid': os.getpid(), 'tracing': True, 'frames': frames}), 200
+    monitor.stop_tracing()
+    return jsonify({'status': 'success', 'pid': os.getpid(), 'tracing': False}), 200
+
+
+@app.route('/api/admin/memory/snapshots', methods=['POST'])
+@admin_required
+def admin_memory_take_snapshot():
+    """Знімок tracemalloc ({"pid": P} — лише у воркері P); у відповіді — топ модулів."""
+    data = request.get_json(silent=True) or {}
+    monitor = memory_monitor.get_monitor(app)
+    try:
+        conflict = _other_worker(_requested_pid(data.get('pid')))
+    except (TypeError, ValueError):
+        return jsonify({'status': 'error', 'message': 'pid має бути цілим числом'}), 400
+    if conflict:
+        return conflict
+    snapshot_id = monitor.take_snapshot()
+    if snapshot_id is None:
+        return jsonify({'status': 'error', 'message': f'tracemalloc не запущено у воркері {os.getpid()}',
+                        'pid': os.getpid()}), 409
+    return jsonify({
+        'status': 'success',
+        'snapshot': monitor.snapshot_info(snapshot_id),
+        'top': monitor.top(snapshot_id, 'module', 10),
+    }), 201
+
+
+@app.route('/api/admin/memory/snapshots/<snapshot_id>', methods=['GET'])
+@admin_required
+def admin_memory_snapshot(snapshot_id):
+    """Топ місць алокації знімка або різниця з ?base=<id>."""
+    monitor = memory_monitor.get_monitor(app)
+    group_by = request.args.get('group_by', 'module')
+    if group_by not in memory_monitor.GROUP_BY:
+        return jsonify({'status': 'error', 'message': f"group_by: {', '.join(memory_monitor.GROUP_BY)}"}), 400
+    limit = max(1, request.args.get('limit', 20, type=int))
+    base_id = request.args.get('base')
+    ids = [snapshot_id] if base_id is None else [snapshot_id, base_id]
+    pids = {memory_monitor.snapshot_pid(value) for value in ids}
+    if None in pids:
+        return jsonify({'status': 'error', 'message': 'Знімок не знайдено'}), 404
+    if len(pids) > 1:
+        return jsonify({'status': 'error', 'message': 'Знімки з різних воркерів не порівнюються'}), 400
+    conflict = _other_worker(pids.pop())
+    if conflict:
+        return conflict
+    if base_id is None:
+        rows = monitor.top(snapshot_id, group_by, limit)
+    else:
+        rows = monitor.diff(snapshot_id, base_id, group_by, limit)
+    if rows is None:
+        return jsonify({'status': 'error', 'message': 'Знімок не знайдено'}), 404
+    return jsonify({
+        'status': 'success',
+        'snapshot': monitor.snapshot_info(snapshot_id),
+        'base': monitor.snapshot_info(base_id) if base_id is not None else None,
+        'group_by': group_by,
+        'stats': rows,
+    }), 200
+
+
+@app.route('/api/admin/memory/snapshots', methods=['DELETE'])
+@admin_required
+def admin_memory_clear_snapshots():
+    """Видаляє знімки tracemalloc цього воркера (?pid=P — лише у воркері P)."""
+    try:
+        conflict = _other_worker(_requested_pid(request.args.get('pid')))
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'pid має бути цілим числом'}), 400
+    if conflict:
+        return conflict
+    memory_monitor.get_monitor(app).clear_snapshots()
+    return jsonify({'status': 'success', 'pid': os.getpid(), 'message': 'Знімки видалено'}), 200
+
+
 # -------------------- Premium Features API --------------------
 
 @app.route('/api/premium/mood-predictor', methods=['GET'])
 @login_required
+@premium_required
 def mood_predictor():
     """Передбачає настрій на завтра на основі історії (Premium feature)."""
     try:
-        user = User.query.get(session['user_id'])
-        if not user or not user.is_premium:
-            return jsonify({
-                'status': 'error',
-                'message': 'Ця функція доступна тільки для Premium користувачів',
-                'premium_required': True
-            }), 403
+        user_id = session['user_id']
 
         # Отримуємо останні 30 днів записів ПОТОЧНОГО користувача
         thirty_days_ago = datetime.utcnow().date() - timedelta(days=30)
         recent_entries = MoodEntry.query.filter(
-            MoodEntry.user_id == user.id,
+            MoodEntry.user_id == user_id,
             MoodEntry.date >= thirty_days_ago
         ).order_by(MoodEntry.date.desc()).limit(30).all()
 
@@ -2006,21 +2375,26 @@ def mood_predictor():
             }), 200
 
         # Проста ML логіка: аналізуємо паттерни
+        # Розширені настрої (excited, calm, angry, ...) зводимо до трирівневої шкали прогнозу
+        mood_buckets = {'happy': 'happy', 'excited': 'happy', 'neutral': 'neutral', 'calm': 'neutral',
+                        'sad': 'sad', 'angry': 'sad', 'disappointed': 'sad'}
+        bucketed = [(entry.date, mood_buckets.get(entry.mood, 'neutral')) for entry in recent_entries]
+
         mood_counts = {'happy': 0, 'neutral': 0, 'sad': 0}
-        for entry in recent_entries:
-            mood_counts[entry.mood] += 1
+        for _, mood in bucketed:
+            mood_counts[mood] += 1
 
         total = len(recent_entries)
         mood_percentages = {k: (v/total)*100 for k, v in mood_counts.items()}
         
         # Тренд останніх 7 днів vs попередніх 7
-        last_week = recent_entries[:7]
-        prev_week = recent_entries[7:14] if len(recent_entries) >= 14 else []
+        last_week = bucketed[:7]
+        prev_week = bucketed[7:14] if len(bucketed) >= 14 else []
         
         def avg_mood_score(entries):
             scores = {'happy': 3, 'neutral': 2, 'sad': 1}
             if not entries: return 2
-            return sum(scores[e.mood] for e in entries) / len(entries)
+            return sum(scores[mood] for _, mood in entries) / len(entries)
         
         recent_score = avg_mood_score(last_week)
         prev_score = avg_mood_score(prev_week) if prev_week else recent_score
@@ -2031,11 +2405,11 @@ def mood_predictor():
         tomorrow_weekday = tomorrow.weekday()  # 0=Mon, 6=Sun
         
         weekday_moods = {}
-        for entry in recent_entries:
-            wd = entry.date.weekday()
+        for entry_date, mood in bucketed:
+            wd = entry_date.weekday()
             if wd not in weekday_moods:
                 weekday_moods[wd] = []
-            weekday_moods[wd].append(entry.mood)
+            weekday_moods[wd].append(mood)
         
         # Prediction logic
         predicted_mood = 'neutral'
@@ -2129,21 +2503,16 @@ def initiate_premium_purchase():
 
 @app.route('/api/premium/sleep-trends', methods=['GET'])
 @login_required
+@premium_required
 def sleep_trends():
     """Тренд сну за останній місяць (Premium feature)."""
     try:
-        user = User.query.get(session['user_id'])
-        if not user or not user.is_premium:
-            return jsonify({
-                'status': 'error',
-                'message': 'Ця функція доступна тільки для Premium користувачів',
-                'premium_required': True
-            }), 403
+        user_id = session['user_id']
 
         # Отримуємо дані за останній місяць
         thirty_days_ago = datetime.utcnow().date() - timedelta(days=30)
         sleep_entries = MoodEntry.query.filter(
-            MoodEntry.user_id == user.id,
+            MoodEntry.user_id == user_id,
             MoodEntry.date >= thirty_days_ago,
             MoodEntry.sleep_hours != None
         ).order_by(MoodEntry.date.asc()).all()
@@ -2219,22 +2588,17 @@ def sleep_trends():
 
 @app.route('/api/premium/activity-recommendations', methods=['GET'])
 @login_required
+@premium_required
 def activity_recommendations():
     """Рекомендації активностей залежно від поточного настрою (Premium feature)."""
     try:
-        user = User.query.get(session['user_id'])
-        if not user or not user.is_premium:
-            return jsonify({
-                'status': 'error',
-                'message': 'Ця функція доступна тільки для Premium користувачів',
-                'premium_required': True
-            }), 403
+        user_id = session['user_id']
 
         # Отримуємо параметр настрою або визначаємо з останнього запису користувача
         mood_param = request.args.get('mood')
         
         if not mood_param:
-            latest = MoodEntry.query.filter_by(user_id=user.id).order_by(MoodEntry.date.desc()).first()
+            latest = MoodEntry.query.filter_by(user_id=user_id).order_by(MoodEntry.date.desc()).first()
             current_mood = latest.mood if latest else 'neutral'
         else:
             current_mood = mood_param if mood_param in MoodEntry.VALID_MOODS else 'neutral'
@@ -2397,10 +2761,63 @@ def handle_marshmallow_validation(error):
     }), 400
 
 
+_initialized = False
+_init_lock = threading.Lock()
+
+
+def configure_logging():
+    """Логування у app.log та stdout (не робиться при імпорті модуля)."""
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        handlers=[
+            logging.FileHandler(os.path.join(basedir, 'app.log')),
+            logging.StreamHandler()
+        ]
+    )
+
+
+def create_app():
+    """Фабрика для WSGI-серверів і скриптів: завершує ініціалізацію процесу.
+
+    Імпорт app.py лише описує додаток (конфіг, розширення, маршрути) — без
+    з'єднань з БД, запису файлів та імпорту flasgger. create_app() один раз
+    на процес налаштовує логування, створює папку SQLite-БД, прогріває
+    шаблони і (якщо SCHEMA_AUTO_BOOTSTRAP) розгортає схему. Відкритих
+    з'єднань з БД після себе не залишає, тож безпечна для gunicorn --preload:
+
+        gunicorn --preload 'app:create_app()'
+    """
+    global _initialized
+    with _init_lock:
+        if _initialized:
+            return app
+        configure_logging()
+        assets.configure(app)
+        if app.config['SQLALCHEMY_DATABASE_URI'] == f'sqlite:///{db_path}':
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        if app.config['SCHEMA_AUTO_BOOTSTRAP']:
+            schema_bootstrap.bootstrap(app)
+        if app.config['TEMPLATE_WARMUP']:
+            template_cache.warmup(app)
+        health.mark_warm(app)
+        _initialized = True
+    return app
+
+
 if __name__ == '__main__':
+    # debug до create_app(): від нього залежать режими, що визначаються там (маніфест статики)
+    app.debug = True
+    create_app()
     # Перевіряємо з'єднання з базою даних перед запуском сервера
     if test_db_connection():
+        # Локальна розробка: схема розгортається при кожному запуску (ідемпотентно)
+        create_tables()
         logging.info("Запуск Flask додатку")
+        # Для локальної розробки обробляємо чергу задач у тому ж процесі
+        # (reloader запускає код двічі — воркер стартує лише в дочірньому процесі)
+        if not app.config['TASK_QUEUE_EAGER'] and os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            task_queue.start_embedded_worker(app)
         app.run(debug=True)
     else:
         logging.error("Неможливо запустити додаток через помилку з'єднання з базою даних")
@@ -0,0 +1,464 @@
+"""
+ASGI-режим DailyMood: Flask-додаток за асинхронним сервером.
+
+У sync-деплої кожне з'єднання тримає воркер (або потік) gunicorn на весь
+час запиту — long-polling статусу платежу, повільне завантаження експорту
+чи live-потік займають його, навіть коли нічого не відбувається. Тут:
+- усі звичайні Flask-view виконуються в обмеженому пулі потоків
+  (ASGI_THREADS) через WSGI-міст; потік зайнятий лише на час роботи view
+  і генерації шматків відповіді, а не очікування клієнта
+- нативні async-обробники:
+  GET /api/journal/export           — потоковий експорт: кожна сторінка
+                                      записів — короткий виклик у пулі
+  GET /api/payments/<id>?wait=N     — long-polling: перевірки статусу через
+                                      той самий Flask-view, між ними — asyncio.sleep
+  GET /api/live                     — Server-Sent Events (події з LiveHub + heartbeat)
+- сесія, before_request та after_request Flask виконуються і для
+  нативних обробників, тож авторизація й заголовки ті самі
+
+Очікуючі з'єднання коштують лише корутину й сокет — тисячі одночасних
+на воркер. У WSGI-режимі ?wait ігнорується (відповідь одразу, клієнт
+опитує за Retry-After), /api/live недоступний.
+
+    uvicorn --factory asgi:create_asgi_app --workers 2
+    SERVER_MODE=asgi gunicorn -c gunicorn.conf.py
+
+uvicorn — опційна залежність (pip install uvicorn); модуль її не імпортує.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import io
+import json
+import logging
+import math
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode
+
+from flask import jsonify, session
+
+import journal_export
+
+EXPORT_ROUTE = '/api/journal/export'
+LIVE_ROUTE = '/api/live'
+PAYMENT_ROUTE = re.compile(r'^/api/payments/(\d+)$')
+LIVE_QUEUE_SIZE = 100
+
+_END = object()
+
+
+def build_environ(scope, body=b''):
+    """WSGI environ з ASGI HTTP scope (PEP 3333)."""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('127.0.0.1', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': str(server[0]),
+        'SERVER_PORT': str(server[1] or 80),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for raw_name, raw_value in scope.get('headers', []):
+        name = raw_name.decode('latin-1').upper().replace('-', '_')
+        value = raw_value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            key = 'CONTENT_TYPE'
+        elif name == 'CONTENT_LENGTH':
+            key = 'CONTENT_LENGTH'
+        else:
+            key = f'HTTP_{name}'
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    # Тіло вже прочитане повністю (у т.ч. chunked) — довжина відома точно
+    environ['CONTENT_LENGTH'] = str(len(body))
+    return environ
+
+
+def encode_headers(headers):
+    return [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]
+
+
+def query_params(scope):
+    return dict(parse_qsl(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True))
+
+
+async def read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            break
+    return b''.join(chunks)
+
+
+@contextlib.asynccontextmanager
+async def disconnect_watch(receive, on_disconnect=None):
+    """Подія, що встановлюється, коли клієнт закрив з'єднання."""
+    event = asyncio.Event()
+
+    async def watch():
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                event.set()
+                if on_disconnect:
+                    on_disconnect()
+                return
+
+    task = asyncio.ensure_future(watch())
+    try:
+        yield event
+    finally:
+        task.cancel()
+
+
+class BridgedResponse:
+    """Відповідь WSGI-додатку: статус, заголовки, початок тіла і (для потокових) ітератор решти."""
+
+    __slots__ = ('status', 'headers', 'body', 'iterable', 'iterator', 'context')
+
+    def __init__(self, status, headers, body, iterable=None, iterator=None, context=None):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.iterable = iterable
+        self.iterator = iterator
+        self.context = context
+
+    @property
+    def complete(self):
+        return self.iterator is None
+
+
+class WsgiBridge:
+    """Виконує WSGI-додаток в обмеженому пулі потоків.
+
+    Усі кроки одного запиту (view, наступні шматки потокової відповіді,
+    close) виконуються в одному contextvars.Context — контексти Flask,
+    відкриті stream_with_context, коректно живуть між переходами в пул.
+    """
+
+    def __init__(self, wsgi_app, executor):
+        self.wsgi_app = wsgi_app
+        self.executor = executor
+
+    async def _in_pool(self, context, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, context.run, function, *args)
+
+    def _start(self, environ, context):
+        captured = {}
+
+        def start_response(status, headers, exc_info=None):
+            captured['status'] = int(status.split(' ', 1)[0])
+            captured['headers'] = encode_headers(headers)
+
+        iterable = self.wsgi_app(environ, start_response)
+        iterator = iter(iterable)
+        chunks = []
+        # Звичайна (не потокова) відповідь Flask — один шматок: забираємо його
+        # і перевіряємо кінець тут же, щоб віддати її за один перехід у пул
+        for _ in range(2):
+            chunk = next(iterator, _END)
+            if chunk is _END:
+                _close(iterable)
+                return BridgedResponse(captured['status'], captured['headers'], b''.join(chunks))
+            chunks.append(chunk)
+        return BridgedResponse(captured['status'], captured['headers'], b''.join(chunks),
+                               iterable, iterator, context)
+
+    async def run(self, environ):
+        context = contextvars.Context()
+        return await self._in_pool(context, self._start, environ, context)
+
+    async def close(self, response):
+        if response.iterable is not None:
+            await self._in_pool(response.context, _close, response.iterable)
+            response.iterable = response.iterator = None
+
+    async def send(self, response, send):
+        await send({'type': 'http.response.start', 'status': response.status, 'headers': response.headers})
+        if response.complete:
+            await send({'type': 'http.response.body', 'body': response.body})
+            return
+        try:
+            if response.body:
+                await send({'type': 'http.response.body', 'body': response.body, 'more_body': True})
+            while True:
+                chunk = await self._in_pool(response.context, next, response.iterator, _END)
+                if chunk is _END:
+                    break
+                if chunk:
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        finally:
+            await self.close(response)
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def __call__(self, scope, receive, send):
+        body = await read_body(receive)
+        response = await self.run(build_environ(scope, body))
+        await self.send(response, send)
+
+
+def _close(iterable):
+    close = getattr(iterable, 'close', None)
+    if close is not None:
+        close()
+
+
+class LiveHub:
+    """Підписники live-потоку в межах процесу: user_id -> черги подій.
+
+    publish() потокобезпечний — його можна викликати з Flask-view у пулі
+    потоків. Повільний клієнт з повною чергою пропускає події, а не
+    гальмує інших.
+    """
+
+    def __init__(self, queue_size=LIVE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._loop = None
+
+    @property
+    def connections(self):
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def subscribe(self, user_id):
+        self._loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id, queue):
+        queues = self._subscribers.get(user_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    def publish(self, user_id, event, data=None):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._deliver, user_id, event, data)
+
+    def _deliver(self, user_id, event, data):
+        for queue in list(self._subscribers.get(user_id, ())):
+            try:
+                queue.put_nowait((event, data))
+            except asyncio.QueueFull:
+                logging.warning("Live-потік user=%s: черга переповнена, подію %s пропущено", user_id, event)
+
+
+def sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
+
+
+class DailyMoodASGI:
+    """ASGI-додаток: нативні async-обробники + WSGI-міст для решти маршрутів."""
+
+    def __init__(self, flask_app, executor=None):
+        config = flask_app.config
+        self.flask_app = flask_app
+        self.executor = executor or ThreadPoolExecutor(max_workers=config['ASGI_THREADS'],
+                                                       thread_name_prefix='asgi')
+        self.bridge = WsgiBridge(flask_app, self.executor)
+        self.hub = LiveHub()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+        if scope['type'] != 'http':
+            # WebSocket не підтримується — сервер закриє з'єднання
+            return
+        handler = self.route(scope)
+        if handler is None:
+            return await self.bridge(scope, receive, send)
+        return await handler(scope, receive, send)
+
+    def route(self, scope):
+        if scope['method'] != 'GET':
+            return None
+        path = scope['path']
+        if path == EXPORT_ROUTE:
+            return self.export_journal
+        if path == LIVE_ROUTE:
+            return self.live
+        if PAYMENT_ROUTE.match(path) and 'wait' in query_params(scope):
+            return self.wait_payment
+        return None
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _in_pool(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    # -------------------- Авторизація для нативних обробників --------------------
+    def _open(self, environ, mimetype, headers):
+        """Сесія, before_request і after_request Flask без view.
+
+        Повертає (user_id, BridgedResponse): для авторизованого запиту —
+        заголовки майбутньої потокової відповіді (разом з cookie сесії),
+        інакше — готову відповідь (401 або результат before_request).
+        """
+        flask_app = self.flask_app
+        with flask_app.request_context(environ):
+            rv = flask_app.preprocess_request()
+            user_id = session.get('user_id') if rv is None else None
+            if rv is None and user_id is None:
+                rv = (jsonify({'status': 'error', 'message': 'Потрібна авторизація'}), 401)
+            if rv is not None:
+                response = flask_app.process_response(flask_app.make_response(rv))
+                return None, BridgedResponse(response.status_code,
+                                             encode_headers(response.headers.to_wsgi_list()),
+                                             response.get_data())
+            response = flask_app.response_class(mimetype=mimetype)
+            response.headers.update(headers)
+            response = flask_app.process_response(response)
+            response.headers.pop('Content-Length', None)
+            return user_id, BridgedResponse(response.status_code,
+                                            encode_headers(response.headers.to_wsgi_list()), b'')
+
+    # -------------------- GET /api/journal/export --------------------
+    def _export_count(self, user_id):
+        with self.flask_app.app_context():
+            return journal_export.count(user_id)
+
+    def _export_page(self, user_id, fmt, cursor, first):
+        with self.flask_app.app_context():
+            return journal_export.render_page(user_id, fmt, cursor, first,
+                                              self.flask_app.config['JOURNAL_EXPORT_PAGE_SIZE'])
+
+    async def export_journal(self, scope, receive, send):
+        fmt = journal_export.export_format(query_params(scope).get('format'))
+        user_id, response = await self._in_pool(self._open, build_environ(scope),
+                                                journal_export.mimetype(fmt), journal_export.headers(fmt))
+        if user_id is None:
+            return await self.bridge.send(response, send)
+
+        async with disconnect_watch(receive) as disconnected:
+            total = await self._in_pool(self._export_count, user_id) if fmt == 'json' else None
+            await send({'type': 'http.response.start', 'status': 200, 'headers': response.headers})
+            await send({'type': 'http.response.body', 'body': journal_export.head(fmt, total).encode('utf-8'),
+                        'more_body': True})
+            cursor, first = None, True
+            try:
+                while not disconnected.is_set():
+                    chunk, cursor = await self._in_pool(self._export_page, user_id, fmt, cursor, first)
+                    if chunk:
+                        await send({'type': 'http.response.body', 'body': chunk.encode('utf-8'), 'more_body': True})
+                        first = False
+                    if cursor is None:
+                        break
+            except Exception:
+                # Заголовки вже надіслано: хвіст (]}) не відправляємо — інакше обрізаний експорт
+                # виглядав би повним документом. Виняток передається серверу, той обриває
+                # з'єднання без завершального more_body=False, і клієнт бачить перерваний файл
+                logging.exception('Помилка потокового експорту журналу')
+                raise
+            await send({'type': 'http.response.body', 'body': journal_export.tail(fmt).encode('utf-8')})
+
+    # -------------------- GET /api/payments/<id>?wait=N --------------------
+    async def wait_payment(self, scope, receive, send):
+        params = query_params(scope)
+        try:
+            wait = float(params.pop('wait'))
+        except ValueError:
+            wait = 0.0
+        if not math.isfinite(wait):
+            # nan проходить крізь min/max без змін — дедлайн не настав би ніколи
+            wait = 0.0
+        wait = min(max(wait, 0.0), self.flask_app.config['ASGI_LONGPOLL_MAX'])
+        # Кожна перевірка — звичайний GET /api/payments/<id> (сесія, права, формат відповіді як у WSGI)
+        environ_scope = dict(scope, query_string=urlencode(params).encode('latin-1'))
+        interval = self.flask_app.config['ASGI_POLL_INTERVAL']
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+
+        async with disconnect_watch(receive) as disconnected:
+            while True:
+                response = await self.bridge.run(build_environ(environ_scope))
+                remaining = deadline - loop.time()
+                if remaining <= 0 or disconnected.is_set() or not _payment_pending(response):
+                    return await self.bridge.send(response, send)
+                await self.bridge.close(response)
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(disconnected.wait(), timeout=min(interval, remaining))
+
+    # -------------------- GET /api/live (SSE) --------------------
+    async def live(self, scope, receive, send):
+        if self.hub.connections >= self.flask_app.config['ASGI_MAX_STREAMS']:
+            body = json.dumps({'status': 'error', 'message': 'Забагато live-з\'єднань'}).encode('utf-8')
+            response = BridgedResponse(503, [(b'content-type', b'application/json'), (b'retry-after', b'5')], body)
+            return await self.bridge.send(response, send)
+
+        user_id, response = await self._in_pool(self._open, build_environ(scope), 'text/event-stream',
+                                                {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        if user_id is None:
+            return await self.bridge.send(response, send)
+
+        queue = self.hub.subscribe(user_id)
+        heartbeat = self.flask_app.config['ASGI_LIVE_HEARTBEAT']
+        try:
+            async with disconnect_watch(receive, on_disconnect=lambda: _wake(queue)) as disconnected:
+                await send({'type': 'http.response.start', 'status': 200, 'headers': response.headers})
+                await send({'type': 'http.response.body', 'body': sse('ready', {'user_id': user_id}),
+                            'more_body': True})
+                while not disconnected.is_set():
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                    except asyncio.TimeoutError:
+                        await send({'type': 'http.response.body', 'body': b': ping\n\n', 'more_body': True})
+                        continue
+                    if item is None:
+                        continue
+                    await send({'type': 'http.response.body', 'body': sse(*item), 'more_body': True})
+        finally:
+            self.hub.unsubscribe(user_id, queue)
+
+
+def _wake(queue):
+    with contextlib.suppress(asyncio.QueueFull):
+        queue.put_nowait(None)
+
+
+def _payment_pending(response):
+    if response.status != 200 or not response.complete:
+        return False
+    try:
+        return json.loads(response.body)['payment']['status'] == 'pending'
+    except (ValueError, KeyError, TypeError):
+        return False
+
+
+def create_asgi_app(flask_app=None):
+    """Фабрика для ASGI-серверів (uvicorn --factory asgi:create_asgi_app)."""
+    if flask_app is None:
+        from app import create_app
+        flask_app = create_app()
+    return DailyMoodASGI(flask_app)
@@ -0,0 +1,328 @@
+"""
+Збірка фронтенд-статики: бандли, мініфікація, попереднє стиснення.
+
+Кожен бандл — точка входу сторінки, що склеює кілька файлів static/ у
+static/dist/<ім'я>. Результат мініфікується (CSS/JS), поруч пишуться
+.gz та .br (лише якщо встановлено необов'язковий пакет Brotli) — їх віддає
+static_files.py за Accept-Encoding. У шаблонах бандл підключається через bundle_urls():
+якщо бандл зібраний — один URL з відбитком, інакше (dev) — вихідні файли.
+
+Переклади в бандли не входять: каталог активної мови вантажиться окремо
+(див. i18n.py), цитати віддає API (quotes.py).
+
+Мініфікатори консервативні і не залежать від сторонніх пакетів: прибирають
+коментарі та зайві пробіли, зберігаючи переноси рядків у JS (щоб не
+зламати автоматичну вставку крапки з комою).
+
+Запуск: python scripts/build_assets.py (див. також --strict для бюджету).
+"""
+
+import gzip
+import os
+import re
+
+from assets import DIST_DIR
+
+try:
+    import brotli
+except ImportError:  # brotli — необов'язкова залежність (pip install Brotli)
+    brotli = None
+
+# Точки входу: ім'я бандла -> вихідні файли (порядок важливий)
+BUNDLES = {
+    'base.css': ['style.css', 'css/christmas.css'],
+    'base.js': ['js/christmas.js', 'js/i18n_fixed.js'],
+    'app.js': ['script.js'],
+}
+
+# Бюджет передачі (gzip, байти) на бандл; перевищення — попередження або помилка з --strict
+BUDGETS = {
+    'base.css': 16 * 1024,
+    'base.js': 6 * 1024,
+    'app.js': 4 * 1024,
+}
+# Бюджет першого завантаження (усі бандли base.html, gzip)
+FIRST_LOAD_BUNDLES = ('base.css', 'base.js', 'app.js')
+FIRST_LOAD_BUDGET = 24 * 1024
+
+
+# -------------------- CSS --------------------
+
+_CSS_TOKENS = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)|(\s+)''', re.S)
+_CSS_TIGHT = set('{};,>')
+
+
+def minify_css(source):
+    """Прибирає коментарі та пробіли; рядки в лапках не чіпає."""
+    out = []
+    depth = 0
+    pos = 0
+
+    def last_char():
+        for chunk in reversed(out):
+            if chunk:
+                return chunk[-1]
+        return ''
+
+    for match in _CSS_TOKENS.finditer(source):
+        code = source[pos:match.start()]
+        depth = max(depth + code.count('{') - code.count('}'), 0)
+        out.append(code)
+        pos = match.end()
+        string, comment, space = match.groups()
+        if string:
+            out.append(string)
+        elif comment:
+            # /*! ... */ — ліцензійні коментарі залишаємо
+            if comment.startswith('/*!'):
+                out.append(comment)
+        elif space:
+            prev = last_char()
+            nxt = source[pos] if pos < len(source) else ''
+            # Пробіл потрібен лише між словами; після ':' — тільки в селекторах (a :hover)
+            if not prev or not nxt or prev in _CSS_TIGHT or nxt in _CSS_TIGHT or (prev == ':' and depth > 0):
+                continue
+            out.append(' ')
+    out.append(source[pos:])
+    return ''.join(out).replace(';}', '}').strip()
+
+
+# -------------------- JS --------------------
+
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = ('return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new',
+                   'delete', 'void', 'throw', 'yield', 'await')
+_JS_TIGHT = set('{}()[];,=:<>?!&|*%^~')
+
+
+def _regex_allowed(out):
+    i = len(out) - 1
+    while i >= 0 and out[i] in ' \n':
+        i -= 1
+    if i < 0:
+        return True
+    if out[i] in _REGEX_PRECEDERS:
+        return True
+    tail = ''.join(out[max(0, i - 7):i + 1])
+    return any(tail.endswith(k) and (len(tail) == len(k) or not (tail[-len(k) - 1].isalnum() or tail[-len(k) - 1] in '_$'))
+               for k in _REGEX_KEYWORDS)
+
+
+def minify_js(source):
+    """Консервативна мініфікація JS: коментарі, відступи, порожні рядки.
+
+    Рядки, шаблонні рядки (з ${...}) та regex-літерали копіюються як є.
+    Переноси рядків зберігаються (по одному), тож ASI працює як у вихідному коді.
+    """
+    out = []
+    n = len(source)
+    i = 0
+    # Стек глибини дужок для ${...} всередині шаблонних рядків
+    template_stack = []
+    brace_depth = 0
+
+    def push_space(ch):
+        if not out:
+            return
+        if ch == '\n':
+            while out and out[-1] == ' ':
+                out.pop()
+            if out and out[-1] != '\n':
+                out.append('\n')
+        elif out[-1] not in ' \n':
+            out.append(' ')
+
+    while i < n:
+        ch = source[i]
+        nxt = source[i + 1] if i + 1 < n else ''
+
+        if ch in ' \t\r\n\f\v':
+            j = i
+            newline = False
+            while j < n and source[j] in ' \t\r\n\f\v':
+                newline = newline or source[j] == '\n'
+                j += 1
+            push_space('\n' if newline else ' ')
+            i = j
+            continue
+
+        if ch == '/' and nxt == '/':
+            j = source.find('\n', i)
+            i = n if j == -1 else j
+            continue
+
+        if ch == '/' and nxt == '*':
+            j = source.find('*/', i + 2)
+            comment = source[i:] if j == -1 else source[i:j + 2]
+            if comment.startswith('/*!'):
+                out.append(comment)
+            elif '\n' in comment:
+                push_space('\n')
+            else:
+                push_space(' ')
+            i = n if j == -1 else j + 2
+            continue
+
+        if ch in '\'"':
+            j = i + 1
+            while j < n and source[j] != ch:
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '\n':
+                    break
+                j += 1
+            _drop_tight_space(out, ch)
+            out.append(source[i:j + 1])
+            i = j + 1
+            continue
+
+        if ch == '`' or (ch == '}' and template_stack and template_stack[-1] == brace_depth):
+            if ch == '}':
+                template_stack.pop()
+            else:
+                _drop_tight_space(out, ch)
+            j = i + 1
+            while j < n and source[j] != '`':
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '$' and j + 1 < n and source[j + 1] == '{':
+                    break
+                j += 1
+            if j < n and source[j] == '$':
+                out.append(source[i:j + 2])
+                template_stack.append(brace_depth)
+                i = j + 2
+            else:
+                out.append(source[i:j + 1])
+                i = j + 1
+            continue
+
+        if ch == '/' and _regex_allowed(out):
+            j = i + 1
+            in_class = False
+            while j < n:
+                c = source[j]
+                if c == '\\':
+                    j += 2
+                    continue
+                if c == '\n':
+                    break
+                if c == '[':
+                    in_class = True
+                elif c == ']':
+                    in_class = False
+                elif c == '/' and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < n and (source[j].isalnum() or source[j] == '_'):
+                j += 1
+            _drop_tight_space(out, ch)
+            out.append(source[i:j])
+            i = j
+            continue
+
+        if ch == '{':
+            brace_depth += 1
+        elif ch == '}':
+            brace_depth -= 1
+
+        if ch in _JS_TIGHT:
+            _drop_tight_space(out, ch)
+        elif out and out[-1] == ' ' and len(out) > 1 and out[-2] in _JS_TIGHT:
+            out.pop()
+        out.append(ch)
+        i += 1
+
+    return ''.join(out).strip() + '\n'
+
+
+def _drop_tight_space(out, ch):
+    """Прибирає пробіл (не перенос рядка) перед/після 'тісної' пунктуації."""
+    if out and out[-1] == ' ' and (ch in _JS_TIGHT or (len(out) > 1 and out[-2] in _JS_TIGHT)):
+        out.pop()
+
+
+# -------------------- Збірка --------------------
+
+def minify(name, source):
+    if name.endswith('.css'):
+        return minify_css(source)
+    if name.endswith('.js'):
+        return minify_js(source)
+    return source
+
+
+def bundle_path(name):
+    return f'{DIST_DIR}/{name}'
+
+
+def _write(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as fh:
+        fh.write(data)
+    os.replace(tmp_path, path)
+
+
+def _gzip(data):
+    # mtime=0 — однаковий вихід для однакового входу (стабільні відбитки)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def build_bundle(static_folder, name, sources, do_minify=True):
+    """Збирає один бандл і повертає статистику розмірів."""
+    parts = []
+    raw_size = 0
+    for src in sources:
+        with open(os.path.join(static_folder, src), encoding='utf-8') as fh:
+            text = fh.read()
+        raw_size += len(text.encode('utf-8'))
+        parts.append(minify(name, text) if do_minify else text)
+    # ';' між JS-файлами — щоб файл без завершальної крапки з комою не злився з наступним
+    separator = '\n;\n' if name.endswith('.js') else '\n'
+    data = separator.join(parts).encode('utf-8')
+
+    out_path = os.path.join(static_folder, DIST_DIR, name)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    _write(out_path, data)
+    gz = _gzip(data)
+    _write(out_path + '.gz', gz)
+    stats = {'name': name, 'raw': raw_size, 'min': len(data), 'gzip': len(gz), 'brotli': None}
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        _write(out_path + '.br', br)
+        stats['brotli'] = len(br)
+    return stats
+
+
+def build(static_folder, bundles=None, do_minify=True):
+    """Збирає всі бандли; повертає список статистик."""
+    bundles = BUNDLES if bundles is None else bundles
+    return [build_bundle(static_folder, name, sources, do_minify) for name, sources in bundles.items()]
+
+
+def check_budgets(stats, budgets=None, first_load=FIRST_LOAD_BUNDLES, first_load_budget=FIRST_LOAD_BUDGET):
+    """Повертає список порушень бюджету (рядки з описом)."""
+    budgets = BUDGETS if budgets is None else budgets
+    violations = []
+    for item in stats:
+        limit = budgets.get(item['name'])
+        if limit and item['gzip'] > limit:
+            violations.append(f"{item['name']}: {item['gzip']} B gzip > бюджет {limit} B")
+    total = sum(item['gzip'] for item in stats if item['name'] in first_load)
+    if first_load_budget and total > first_load_budget:
+        violations.append(f"перше завантаження: {total} B gzip > бюджет {first_load_budget} B")
+    return violations
+
+
+def format_report(stats, budgets=None):
+    budgets = BUDGETS if budgets is None else budgets
+    lines = [f"{'bundle':<12} {'raw':>9} {'min':>9} {'gzip':>9} {'brotli':>9} {'budget':>9}"]
+    for item in stats:
+        br = item['brotli'] if item['brotli'] is not None else '-'
+        budget = budgets.get(item['name'], '-')
+        flag = ' !' if isinstance(budget, int) and item['gzip'] > budget else ''
+        lines.append(f"{item['name']:<12} {item['raw']:>9} {item['min']:>9} {item['gzip']:>9} {br:>9} {budget:>9}{flag}")
+    total = sum(item['gzip'] for item in stats if item['name'] in FIRST_LOAD_BUNDLES)
+    lines.append(f"перше завантаження (gzip): {total} B / бюджет {FIRST_LOAD_BUDGET} B")
+    return '\n'.join(lines)
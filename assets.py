@@ -0,0 +1,160 @@
+"""
+Маніфест статичних файлів з хешами вмісту.
+
+Замість одного mtime style.css для всіх файлів кожен файл у static/
+отримує власний відбиток (перші 12 символів sha256 вмісту):
+    {{ asset('style.css') }}  ->  /static/style.css?v=3f1c2a9e7b7d
+
+Такі URL віддаються як immutable (див. static_files.py), тож після деплою
+браузер перезавантажує лише файли, вміст яких змінився.
+
+Маніфест будується один раз: скриптом scripts/build_assets.py під час
+збірки образу (static/asset-manifest.json) або, якщо файлу немає, при
+старті додатку в пам'яті. У debug-режимі записи оновлюються за mtime.
+
+Бандли (asset_pipeline.py) підключаються через {{ bundle_urls('base.js') }}:
+зібраний бандл дає один URL, інакше — URL вихідних файлів по черзі.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from flask import current_app
+
+MANIFEST_NAME = 'asset-manifest.json'
+DIST_DIR = 'dist'
+HASH_LENGTH = 12
+# Стиснуті варіанти віддаються замість оригіналу і окремих записів не мають
+SKIP_SUFFIXES = ('.gz', '.br', '.map')
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def _iter_files(static_folder):
+    for root, dirs, files in os.walk(static_folder):
+        dirs.sort()
+        for name in sorted(files):
+            if name == MANIFEST_NAME or name.endswith(SKIP_SUFFIXES) or name.startswith('.'):
+                continue
+            path = os.path.join(root, name)
+            yield os.path.relpath(path, static_folder).replace(os.sep, '/'), path
+
+
+def build_manifest(static_folder):
+    """Повертає {логічне ім'я: хеш вмісту} для всіх файлів static/."""
+    return {name: file_hash(path) for name, path in _iter_files(static_folder)}
+
+
+def write_manifest(static_folder, manifest=None):
+    if manifest is None:
+        manifest = build_manifest(static_folder)
+    path = os.path.join(static_folder, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_manifest(static_folder):
+    """Читає маніфест з диска; якщо його немає — будує в пам'яті."""
+    path = os.path.join(static_folder, MANIFEST_NAME)
+    try:
+        with open(path, encoding='utf-8') as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        manifest = build_manifest(static_folder)
+        logging.info("Маніфест статики побудовано при старті: %s файлів", len(manifest))
+        return manifest
+    except (OSError, ValueError):
+        logging.exception("Не вдалося прочитати %s, будуємо маніфест заново", path)
+        return build_manifest(static_folder)
+
+
+class AssetManifest:
+    """Відображення логічних імен у URL з відбитком вмісту."""
+
+    def __init__(self, app, bundles=None):
+        self.static_folder = app.static_folder
+        self.url_prefix = app.static_url_path.rstrip('/') + '/'
+        self.hashes = load_manifest(self.static_folder)
+        self.bundles = bundles or {}
+        self._urls = {}
+        self._mtimes = {}
+        self.configure(app)
+
+    def configure(self, app):
+        """Режим з ASSETS_*; не задані прапорці — за app.debug на момент виклику."""
+        auto_reload = app.config.get('ASSETS_AUTO_RELOAD')
+        use_bundles = app.config.get('ASSETS_USE_BUNDLES')
+        self.auto_reload = app.debug if auto_reload is None else auto_reload
+        self.use_bundles = (not app.debug) if use_bundles is None else use_bundles
+        self._urls.clear()
+
+    def bundle_urls(self, name):
+        """URL бандла з відбитком або (якщо бандл не зібраний) URL його вихідних файлів."""
+        dist_name = f'{DIST_DIR}/{name}'
+        if self.use_bundles and dist_name in self.hashes:
+            return [self.url(dist_name)]
+        return [self.url(src) for src in self.bundles.get(name, ())]
+
+    def digest(self, name):
+        """Поточний відбиток вмісту файлу або None, якщо його немає в маніфесті."""
+        name = name.lstrip('/')
+        if self.auto_reload:
+            self._refresh(name)
+        return self.hashes.get(name)
+
+    def url(self, name):
+        name = name.lstrip('/')
+        if self.auto_reload:
+            self._refresh(name)
+        url = self._urls.get(name)
+        if url is None:
+            digest = self.hashes.get(name)
+            url = self.url_prefix + name + (f'?v={digest}' if digest else '')
+            if digest is None:
+                logging.warning("Файл статики відсутній у маніфесті: %s", name)
+            self._urls[name] = url
+        return url
+
+    def _refresh(self, name):
+        path = os.path.join(self.static_folder, name)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return
+        if self._mtimes.get(name) != mtime:
+            self._mtimes[name] = mtime
+            self.hashes[name] = file_hash(path)
+            self._urls.pop(name, None)
+
+
+def asset(name):
+    """Jinja-хелпер: URL статичного файлу з відбитком вмісту."""
+    return current_app.extensions['assets'].url(name)
+
+
+def bundle_urls(name):
+    """Jinja-хелпер: список URL для точки входу (бандла)."""
+    return current_app.extensions['assets'].bundle_urls(name)
+
+
+def configure(app):
+    """Перевизначає режим маніфесту (create_app(): debug міг змінитися після імпорту)."""
+    app.extensions['assets'].configure(app)
+
+
+def init_app(app):
+    from asset_pipeline import BUNDLES
+    app.extensions['assets'] = AssetManifest(app, bundles=BUNDLES)
+    app.add_template_global(asset, 'asset')
+    app.add_template_global(bundle_urls, 'bundle_urls')
@@ -0,0 +1,13 @@
+"""
+Бенчмарки гарячих endpoint-ів DailyMood з еталоном і контролем регресій.
+
+    python -m benchmarks.run                      # замір і порівняння з benchmarks/baseline.json
+    python -m benchmarks.run --update-baseline    # записати новий еталон
+    python -m benchmarks.run --target gunicorn    # через реальний gunicorn на localhost
+
+Модулі:
+- dataset.py   — детермінований набір даних заданого розміру
+- scenarios.py — перелік endpoint-ів, що заміряються
+- runner.py    — цілі (Flask test client / gunicorn) та вимірювання
+- compare.py   — порівняння з еталоном
+"""
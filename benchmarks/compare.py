@@ -0,0 +1,125 @@
+"""
+Порівняння результатів бенчмарку з еталоном (benchmarks/baseline.json).
+
+Регресія — коли метрика погіршилась більше ніж на threshold (частка) і
+водночас більше за поріг шуму. Поріг шуму — більше з абсолютного
+NOISE_FLOOR і SPREAD_FACTOR розкидів між прогонами (spread у результаті
+runner.aggregate) в еталоні чи поточному запуску: на машині, де медіана p50
+між прогонами гуляє на 3 ms, зміна на 5 ms не доводить нічого. SQL-запитів
+на запит і помилок не має ставати більше взагалі — це детерміновані
+величини (N+1 видно одразу).
+
+Гейт — за p50 і throughput найкращого прогону: хвіст p95/p99 між
+запусками незмінного коду розходиться на десятки відсотків, тож він лише
+показується.
+"""
+
+DEFAULT_THRESHOLD = 0.25
+# Абсолютні пороги шуму: менші зміни не вважаються регресією
+NOISE_FLOOR = {
+    'p50_ms': 1.0,
+    'p95_ms': 2.0,
+    'p99_ms': 5.0,
+    'throughput_rps': 5.0,
+    'peak_memory_kb': 256.0,
+}
+# Розкид прогонів одного запуску (вони йдуть підряд) недооцінює дрейф машини між
+# запусками: на спільній 1-CPU машині медіани 12 запусків незмінного коду поспіль
+# розходились до ~3 розкидів (повільні періоди тривають десятки секунд). Найкращий
+# прогін (runner.aggregate) стабільніший, множник — із запасом
+SPREAD_FACTOR = 3.0
+# Метрика -> напрям: 'up' — погано, коли росте; 'down' — коли падає
+DIRECTION = {
+    'p50_ms': 'up',
+    'p95_ms': 'up',
+    'p99_ms': 'up',
+    'throughput_rps': 'down',
+    'peak_memory_kb': 'up',
+    'sql_per_request': 'up',
+    'errors': 'up',
+}
+GATED = ('p50_ms', 'throughput_rps', 'peak_memory_kb', 'sql_per_request', 'errors')
+EXACT = ('sql_per_request', 'errors')
+META_KEYS = ('target', 'size', 'seed')
+# Залізо: на іншій машині час, RPS і пам'ять неспівставні — гейт лише за EXACT
+HARDWARE_KEYS = ('cpus',)
+
+
+class BaselineMismatch(Exception):
+    """Еталон записано для іншої цілі / набору даних — порівняння некоректне."""
+
+
+def check_meta(current, baseline):
+    for key in META_KEYS:
+        if current['meta'].get(key) != baseline['meta'].get(key):
+            raise BaselineMismatch(
+                f"Еталон записано з {key}={baseline['meta'].get(key)!r}, поточний запуск — "
+                f"{key}={current['meta'].get(key)!r}")
+
+
+def hardware_mismatch(current, baseline):
+    """Відмінності заліза між запуском і еталоном (порожній список — та сама конфігурація)."""
+    return [f"{key}: еталон {baseline['meta'].get(key)!r}, поточний {current['meta'].get(key)!r}"
+            for key in HARDWARE_KEYS if current['meta'].get(key) != baseline['meta'].get(key)]
+
+
+def is_regression(metric, base, value, threshold, noise=0.0):
+    """noise — виміряний розкид метрики між прогонами (в її одиницях)."""
+    if base is None or value is None:
+        return False
+    if metric in EXACT:
+        return value > base
+    delta = value - base if DIRECTION[metric] == 'up' else base - value
+    if delta <= max(NOISE_FLOOR.get(metric, 0.0), noise):
+        return False
+    return delta > abs(base) * threshold
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD, gated=None):
+    """Повертає рядки порівняння: {scenario, metric, baseline, current, change, noise, regression}.
+
+    Якщо еталон записано на іншому залізі, регресією вважаються лише EXACT-метрики
+    (SQL-запити, помилки); решта показується для довідки.
+    """
+    check_meta(current, baseline)
+    if gated is None:
+        gated = EXACT if hardware_mismatch(current, baseline) else GATED
+    rows = []
+    for name, metrics in current['scenarios'].items():
+        base_metrics = baseline['scenarios'].get(name)
+        if base_metrics is None:
+            continue
+        for metric in DIRECTION:
+            base, value = base_metrics.get(metric), metrics.get(metric)
+            if base is None or value is None:
+                continue
+            change = (value - base) / base if base else None
+            noise = SPREAD_FACTOR * max(base_metrics.get('spread', {}).get(metric, 0.0),
+                                        metrics.get('spread', {}).get(metric, 0.0))
+            rows.append({
+                'scenario': name,
+                'metric': metric,
+                'baseline': base,
+                'current': value,
+                'change': change,
+                'noise': noise,
+                'regression': metric in gated and is_regression(metric, base, value, threshold, noise),
+            })
+    return rows
+
+
+def regressions(rows):
+    return [row for row in rows if row['regression']]
+
+
+def format_rows(rows, only_gated=GATED):
+    lines = [f"{'scenario':<34} {'metric':<16} {'baseline':>10} {'current':>10} {'change':>8} {'noise':>8}"]
+    for row in rows:
+        if row['metric'] not in only_gated and not row['regression']:
+            continue
+        change = f"{row['change'] * 100:+.0f}%" if row['change'] is not None else '-'
+        mark = '  REGRESSION' if row['regression'] else ''
+        noise = f"±{row['noise']:.3g}" if row['noise'] else '-'
+        lines.append(f"{row['scenario']:<34} {row['metric']:<16} {row['baseline']:>10} "
+                     f"{row['current']:>10} {change:>8} {noise:>8}{mark}")
+    return '\n'.join(lines)
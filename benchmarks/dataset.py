@@ -0,0 +1,130 @@
+"""
+Детермінований набір даних для бенчмарків.
+
+Розміри задаються пресетами (SIZES) — однаковий seed дає однакові дані,
+тож результати різних запусків порівнянні. Рядки вставляються пакетами
+через Core insert (без ORM-об'єктів і валідації моделей).
+
+Перший користувач (BENCH_EMAIL) — той, від імені якого йдуть запити:
+має преміум, записи щоденника за рік, звички та замовлення. Решта
+користувачів — фонові дані, щоб запити справді фільтрували таблиці.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+from werkzeug.security import generate_password_hash
+
+from models import db, User, MoodEntry, Product, Order, OrderItem, Entitlement
+from habits_models import Habit, HabitCompletion
+import entitlements
+
+BENCH_EMAIL = 'bench@dailymood.local'
+BENCH_PASSWORD = 'bench-password'
+DEFAULT_SEED = 42
+MOODS = ('happy', 'excited', 'neutral', 'calm', 'angry', 'sad', 'disappointed')
+ACTIVITIES = ('reading', 'exercise', 'meditation', 'walking', 'work', 'friends', 'music', 'cooking')
+HABIT_TYPES = ('daily', 'weekly')
+PRODUCT_TYPES = ('quote_pack', 'theme', 'journal_template', 'habit_course')
+ORDER_STATUSES = ('new', 'processing', 'completed', 'canceled')
+DAYS = 365
+BATCH_SIZE = 1000
+
+SIZES = {
+    'tiny': {'users': 2, 'entries_per_user': 30, 'habits_per_user': 2, 'orders_per_user': 2, 'products': 5},
+    'small': {'users': 10, 'entries_per_user': 365, 'habits_per_user': 5, 'orders_per_user': 10, 'products': 20},
+    'medium': {'users': 100, 'entries_per_user': 1000, 'habits_per_user': 8, 'orders_per_user': 30, 'products': 50},
+    'large': {'users': 1000, 'entries_per_user': 2000, 'habits_per_user': 10, 'orders_per_user': 50, 'products': 100},
+}
+
+
+def resolve_size(size):
+    if isinstance(size, dict):
+        return dict(size)
+    try:
+        return dict(SIZES[size])
+    except KeyError:
+        raise ValueError(f"Невідомий розмір набору '{size}'. Доступні: {', '.join(SIZES)}")
+
+
+def _insert(table, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(table.insert(), rows[start:start + BATCH_SIZE])
+
+
+def seed(app, size='small', seed=DEFAULT_SEED):
+    """Заповнює порожню БД; повертає {'user_id', 'email', 'password', 'counts'}."""
+    params = resolve_size(size)
+    rng = random.Random(seed)
+    today = date.today()
+    now = datetime.utcnow()
+    # Один хеш на всіх: генерація хешу пароля навмисно повільна
+    password_hash = generate_password_hash(BENCH_PASSWORD)
+
+    with app.app_context():
+        users = [{'email': BENCH_EMAIL if i == 0 else f'user{i}@bench.local', 'password_hash': password_hash,
+                  'is_premium': i == 0, 'premium_started_at': now if i == 0 else None, 'created_at': now}
+                 for i in range(params['users'])]
+        _insert(User.__table__, users)
+        user_ids = [row.id for row in db.session.query(User.id).order_by(User.id)]
+        bench_user_id = user_ids[0]
+        db.session.execute(Entitlement.__table__.insert(), [{
+            'user_id': bench_user_id, 'feature': entitlements.PREMIUM, 'granted_at': now}])
+
+        products = [{'name': f'Продукт {i}', 'slug': f'bench-product-{i}', 'type': rng.choice(PRODUCT_TYPES),
+                     'description': 'Продукт для бенчмарку', 'price': round(rng.uniform(1, 50), 2),
+                     'is_active': i % 10 != 9, 'created_at': now - timedelta(days=i)}
+                    for i in range(params['products'])]
+        _insert(Product.__table__, products)
+        product_rows = [(row.id, row.price) for row in db.session.query(Product.id, Product.price).order_by(Product.id)]
+
+        entries, habits = [], []
+        for user_id in user_ids:
+            for _ in range(params['entries_per_user']):
+                entries.append({
+                    'user_id': user_id,
+                    'mood': rng.choice(MOODS),
+                    'date': today - timedelta(days=rng.randrange(DAYS)),
+                    'title': f'Запис {rng.randrange(10 ** 6)}',
+                    'content': ' '.join(rng.choice(ACTIVITIES) for _ in range(rng.randint(5, 40))),
+                    'activities': ','.join(rng.sample(ACTIVITIES, rng.randint(0, 3))) or None,
+                    'sleep_quality': rng.randint(1, 4),
+                    'sleep_hours': round(rng.uniform(4, 10), 1),
+                    'created_at': now,
+                })
+            for h in range(params['habits_per_user']):
+                habits.append({'user_id': user_id, 'name': f'Звичка {h}', 'type': rng.choice(HABIT_TYPES),
+                               'created_at': now})
+        _insert(MoodEntry.__table__, entries)
+        _insert(Habit.__table__, habits)
+
+        completions = []
+        for (habit_id,) in db.session.query(Habit.id):
+            for day in range(60):
+                if rng.random() < 0.6:
+                    completions.append({'habit_id': habit_id, 'date': today - timedelta(days=day)})
+        _insert(HabitCompletion.__table__, completions)
+
+        orders = [{'user_id': user_id, 'status': rng.choice(ORDER_STATUSES), 'total_amount': 0.0,
+                   'created_at': now - timedelta(minutes=rng.randrange(DAYS * 24 * 60)), 'updated_at': now}
+                  for user_id in user_ids for _ in range(params['orders_per_user'])]
+        _insert(Order.__table__, orders)
+        items = []
+        for (order_id,) in db.session.query(Order.id):
+            for product_id, price in rng.sample(product_rows, min(rng.randint(1, 3), len(product_rows))):
+                quantity = rng.randint(1, 2)
+                items.append({'order_id': order_id, 'product_id': product_id, 'quantity': quantity,
+                              'unit_price': price, 'subtotal': price * quantity})
+        _insert(OrderItem.__table__, items)
+        order_total = (db.select(db.func.coalesce(db.func.sum(OrderItem.subtotal), 0.0))
+                       .where(OrderItem.order_id == Order.id).scalar_subquery())
+        db.session.execute(db.update(Order.__table__).values(total_amount=order_total))
+        db.session.commit()
+        entitlements.invalidate()
+
+        counts = {
+            'users': len(users), 'products': len(products), 'mood_entries': len(entries),
+            'habits': len(habits), 'habit_completions': len(completions),
+            'orders': len(orders), 'order_items': len(items),
+        }
+    return {'user_id': bench_user_id, 'email': BENCH_EMAIL, 'password': BENCH_PASSWORD, 'counts': counts}
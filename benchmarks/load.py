@@ -0,0 +1,409 @@
+"""
+Навантажувальний тест: відкритий потік сесій до запущеного сервера.
+
+    python -m benchmarks.load --base-url http://127.0.0.1:8000 --rate 2 --duration 60
+    python -m benchmarks.load --database-url sqlite:///data/load.db --rate 1 --ramp-to 20 --stages 5
+    python -m benchmarks.load --access-log logs/access.log --think-scale 0.1 --rate 5
+
+Сесії надходять з заданою швидкістю (--rate, сесій/с, пуассонівський
+потік) незалежно від того, чи встигає сервер — так повільні відповіді не
+зменшують навантаження (на відміну від замкненого циклу "запит — відповідь —
+запит"). Кожна сесія — віртуальний користувач з власними cookie: вхід один
+раз на користувача, повторний вхід після 401, далі кроки сесії з паузами.
+
+Кроки беруться з Postman-колекції (за замовчуванням) або відтворюються з
+журналів запитів (--access-log: access log gunicorn або app.log); див.
+workload.py. Користувачі й ідентифікатори записів беруться з БД набору
+даних (--database-url, див. benchmarks/generate.py), інакше — облікові
+дані з --email/--password чи з колекції.
+
+З --ramp-to швидкість зростає сходинками — звіт показує, на якій сходинці
+сервер насичується. Результат: JSON і HTML у benchmarks/results/.
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlsplit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from benchmarks import report, workload  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+DEFAULT_BASE_URL = 'http://127.0.0.1:5000'
+DEFAULT_USERS = 200
+DEFAULT_MAX_SESSIONS = 64
+DEFAULT_MAX_QUEUE = 1000
+# Ідентифікатори, які колекція підставляє у шляхи: змінна -> таблиця
+ID_VARIABLES = {
+    'entryId': 'mood_entries',
+    'orderId': 'orders',
+    'habitId': 'habits',
+    'goalId': 'monthly_goals',
+}
+
+
+class VirtualUser:
+    """Один користувач: keep-alive з'єднання, cookie і змінні колекції."""
+
+    def __init__(self, base_url, variables, timeout=30.0):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == 'https'
+        self.host = parts.hostname or '127.0.0.1'
+        self.port = parts.port or (443 if self.https else 80)
+        self.timeout = timeout
+        self.variables = dict(variables)
+        self.cookies = {}
+        self.logged_in = False
+        self.conn = None
+
+    def _connect(self):
+        factory = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return factory(self.host, self.port, timeout=self.timeout)
+
+    def send(self, method, path, body=None, headers=None):
+        """Повертає (status, тіло); status 0 — помилка з'єднання."""
+        headers = dict(headers or {})
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f'{k}={v}' for k, v in self.cookies.items())
+        if body is not None:
+            body = body.encode('utf-8') if isinstance(body, str) else body
+            headers.setdefault('Content-Type', 'application/json')
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = self._connect()
+            try:
+                self.conn.request(method, path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                payload = response.read()
+                break
+            except (OSError, http.client.HTTPException):
+                # Сервер закрив keep-alive з'єднання — повторюємо один раз на новому
+                self.close()
+                if attempt:
+                    return 0, b''
+        for header in response.msg.get_all('Set-Cookie') or []:
+            name, _, rest = header.partition('=')
+            value = rest.split(';', 1)[0]
+            if 'max-age=0' in header.lower() or 'expires=thu, 01 jan 1970' in header.lower():
+                self.cookies.pop(name.strip(), None)
+            else:
+                self.cookies[name.strip()] = value
+        return response.status, payload
+
+    def login(self):
+        email = self.variables.get('authEmail')
+        if not email:
+            return None
+        body = json.dumps({'email': email, 'password': self.variables.get('authPassword')})
+        status, _ = self.send('POST', workload.LOGIN_PATH, body)
+        self.logged_in = status == 200
+        return status
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class UserPool:
+    """Вільні віртуальні користувачі; сесія бере одного на весь час виконання."""
+
+    def __init__(self, base_url, accounts, variables, timeout=30.0):
+        self.base_url = base_url
+        self.accounts = itertools.cycle(accounts or [{}])
+        self.variables = variables
+        self.timeout = timeout
+        self.idle = deque()
+        self.all = []
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            if self.idle:
+                return self.idle.popleft()
+            # Коли облікових записів менше, ніж паралельних сесій, наступний
+            # користувач з тими самими даними отримує окрему серверну сесію
+            user = VirtualUser(self.base_url, dict(self.variables, **next(self.accounts)), self.timeout)
+            self.all.append(user)
+            return user
+
+    def release(self, user):
+        with self.lock:
+            self.idle.append(user)
+
+    def close(self):
+        for user in self.all:
+            user.close()
+
+
+class LoadTest:
+    """Відкритий потік сесій зі сходинками швидкості; збирає зразки для report.py."""
+
+    def __init__(self, pool, sessions, rates, stage_duration, max_sessions=DEFAULT_MAX_SESSIONS,
+                 max_queue=DEFAULT_MAX_QUEUE, seed=0, arrivals='poisson'):
+        self.pool = pool
+        self.sessions = sessions
+        self.rates = rates
+        self.stage_duration = stage_duration
+        self.max_sessions = max_sessions
+        self.max_queue = max_queue
+        self.rng = random.Random(seed)
+        self.arrivals = arrivals
+        self.samples = []
+        self.session_log = []
+        self.lock = threading.Lock()
+        self.queued = 0
+        self.stop = threading.Event()
+        self.started = None
+
+    def _now(self):
+        return time.monotonic() - self.started
+
+    def _record(self, t, latency_ms, status, endpoint, stage):
+        with self.lock:
+            self.samples.append((round(t, 3), round(latency_ms, 2), status, endpoint, stage))
+
+    def _timed(self, user, endpoint, stage, method, path, body=None, headers=None):
+        t = self._now()
+        t0 = time.perf_counter()
+        status, payload = user.send(method, path, body, headers)
+        self._record(t, (time.perf_counter() - t0) * 1000, status, endpoint, stage)
+        return status, payload
+
+    def _login(self, user, stage):
+        t = self._now()
+        t0 = time.perf_counter()
+        status = user.login()
+        if status is not None:
+            self._record(t, (time.perf_counter() - t0) * 1000, status, f'POST {workload.LOGIN_PATH}', stage)
+
+    def _run_session(self, scheduled, stage, steps):
+        with self.lock:
+            self.queued -= 1
+            self.session_log.append((round(scheduled, 3), max(self._now() - scheduled, 0.0), stage, False))
+        user = self.pool.acquire()
+        try:
+            for step in steps:
+                if self.stop.is_set():
+                    return
+                if step.think:
+                    self.stop.wait(step.think)
+                template = step.template
+                if template.is_login:
+                    if not user.logged_in:
+                        self._login(user, stage)
+                    continue
+                if not user.logged_in and user.variables.get('authEmail'):
+                    self._login(user, stage)
+                method, path, body, headers = template.render(user.variables)
+                t = self._now()
+                t0 = time.perf_counter()
+                status, payload = user.send(method, path, body, headers)
+                if status == 401 and user.variables.get('authEmail'):
+                    # Серверна сесія закінчилась — як браузер: вхід і повтор
+                    user.logged_in = False
+                    self._login(user, stage)
+                    t = self._now()
+                    t0 = time.perf_counter()
+                    status, payload = user.send(method, path, body, headers)
+                self._record(t, (time.perf_counter() - t0) * 1000, status, template.endpoint, stage)
+                if template.captures and 200 <= status < 300:
+                    try:
+                        template.capture(json.loads(payload), user.variables)
+                    except ValueError:
+                        pass
+        finally:
+            self.pool.release(user)
+
+    def _schedule(self):
+        """Моменти надходження сесій (с від старту) і номер сходинки."""
+        for stage, rate in enumerate(self.rates):
+            begin = stage * self.stage_duration
+            end = begin + self.stage_duration
+            t = begin
+            while rate > 0:
+                t += self.rng.expovariate(rate) if self.arrivals == 'poisson' else 1.0 / rate
+                if t >= end:
+                    break
+                yield t, stage
+
+    def run(self):
+        executor = ThreadPoolExecutor(max_workers=self.max_sessions, thread_name_prefix='load')
+        self.started = time.monotonic()
+        try:
+            for scheduled, stage in self._schedule():
+                delay = scheduled - self._now()
+                if delay > 0 and self.stop.wait(delay):
+                    break
+                with self.lock:
+                    if self.queued >= self.max_queue:
+                        self.session_log.append((round(scheduled, 3), 0.0, stage, True))
+                        continue
+                    self.queued += 1
+                executor.submit(self._run_session, scheduled, stage, self.sessions(self.rng))
+        except KeyboardInterrupt:
+            logging.warning('Перервано — дочікуємось активних запитів')
+            self.stop.set()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=self.stop.is_set())
+            self.pool.close()
+        return self._now()
+
+
+def dataset_accounts(database_url, limit, seed):
+    """Облікові записи з БД набору даних і по одному ідентифікатору кожного типу."""
+    from sqlalchemy import bindparam, create_engine, text
+    from benchmarks import dataset, generate
+
+    engine = create_engine(database_url)
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(text('SELECT id, email FROM users WHERE email LIKE :pattern ORDER BY id'),
+                                {'pattern': f'%@{generate.EMAIL_DOMAIN}'}).all()
+            password = generate.PASSWORD
+            if not rows:
+                rows = conn.execute(text('SELECT id, email FROM users WHERE email = :email'),
+                                    {'email': dataset.BENCH_EMAIL}).all()
+                password = dataset.BENCH_PASSWORD
+            rows = random.Random(seed).sample(rows, min(limit, len(rows)))
+            accounts = {row.id: {'authEmail': row.email, 'authPassword': password} for row in rows}
+            ids = list(accounts)
+            for variable, table in ID_VARIABLES.items():
+                query = text(f'SELECT user_id, MAX(id) AS id FROM {table} WHERE user_id IN :ids GROUP BY user_id')
+                query = query.bindparams(bindparam('ids', expanding=True))
+                for start in range(0, len(ids), 500):
+                    for row in conn.execute(query, {'ids': ids[start:start + 500]}):
+                        accounts[row.user_id][variable] = row.id
+    finally:
+        engine.dispose()
+    return list(accounts.values())
+
+
+def stage_rates(rate, ramp_to=None, stages=1):
+    if ramp_to is None or stages <= 1:
+        return [rate]
+    return [round(rate + (ramp_to - rate) * i / (stages - 1), 3) for i in range(stages)]
+
+
+def build_sessions(args, templates):
+    """Повертає (функція rng -> кроки сесії, опис джерела)."""
+    skip = [re.compile(p) for p in args.skip or []]
+
+    def keep(steps):
+        return [s for s in steps if not any(p.search(s.template.endpoint) for p in skip)]
+
+    if not args.access_log:
+        steps = keep(workload.collection_session(templates, args.think))
+        return (lambda rng: steps), os.path.relpath(args.collection, ROOT)
+
+    replayed, skipped = [], 0
+    for records in workload.read_log_sessions(args.access_log):
+        steps, dropped = workload.log_session_steps(records, templates, args.think_scale, args.max_think)
+        skipped += dropped
+        steps = keep(steps)
+        if steps:
+            replayed.append(steps)
+    if not replayed:
+        raise SystemExit('У журналах не знайдено запитів для відтворення')
+    logging.warning("Журнали: %d сесій, %d запитів; пропущено записів без тіла: %d",
+                    len(replayed), sum(map(len, replayed)), skipped)
+    order = itertools.cycle(replayed)
+    lock = threading.Lock()
+
+    def next_session(rng):
+        with lock:
+            return next(order)
+
+    return next_session, [os.path.relpath(p, ROOT) for p in args.access_log]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Навантажувальний тест DailyMood (відкритий потік сесій)')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--collection', default=os.path.join(ROOT, workload.DEFAULT_COLLECTION))
+    parser.add_argument('--access-log', action='append', help='Журнал для відтворення (можна кілька)')
+    parser.add_argument('--database-url', help='БД набору даних: користувачі та ідентифікатори записів')
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS, help='Скільки користувачів з БД взяти')
+    parser.add_argument('--email', help='Один обліковий запис замість БД')
+    parser.add_argument('--password')
+    parser.add_argument('--rate', type=float, default=1.0, help='Сесій за секунду (перша сходинка)')
+    parser.add_argument('--ramp-to', type=float, help='Швидкість останньої сходинки')
+    parser.add_argument('--stages', type=int, default=5)
+    parser.add_argument('--duration', type=float, default=60.0, help='Тривалість кожної сходинки, с')
+    parser.add_argument('--arrivals', choices=('poisson', 'uniform'), default='poisson')
+    parser.add_argument('--max-sessions', type=int, default=DEFAULT_MAX_SESSIONS,
+                        help='Одночасних сесій (потоків); решта чекає в черзі')
+    parser.add_argument('--max-queue', type=int, default=DEFAULT_MAX_QUEUE,
+                        help='Черга сесій; понад неї сесії відкидаються')
+    parser.add_argument('--think', type=float, default=0.5, help='Пауза між запитами сесії з колекції, с')
+    parser.add_argument('--think-scale', type=float, default=1.0, help='Множник пауз з журналу')
+    parser.add_argument('--max-think', type=float, default=10.0, help='Найбільша пауза з журналу, с')
+    parser.add_argument('--skip', action='append', help='Regex endpoint-ів, які не виконувати (напр. DELETE)')
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--window', type=float, default=5.0, help='Вікно часового ряду у звіті, с')
+    parser.add_argument('--slo-p95-ms', type=float, default=report.DEFAULT_SLO_P95_MS)
+    parser.add_argument('--max-error-rate', type=float, default=report.DEFAULT_MAX_ERROR_RATE)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Префікс файлів звіту (за замовчуванням — benchmarks/results/load-...)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(message)s')
+    templates, variables = workload.load_collection(args.collection)
+    variables['baseUrl'] = args.base_url.rstrip('/')
+    if args.email:
+        accounts = [{'authEmail': args.email, 'authPassword': args.password or ''}]
+    elif args.database_url:
+        accounts = dataset_accounts(args.database_url, args.users, args.seed)
+        if not accounts:
+            parser.error('У БД немає користувачів набору даних (python -m benchmarks.generate)')
+    else:
+        accounts = []
+    sessions, source = build_sessions(args, templates)
+    rates = stage_rates(args.rate, args.ramp_to, args.stages)
+
+    pool = UserPool(args.base_url, accounts, variables, args.timeout)
+    test = LoadTest(pool, sessions, rates, args.duration, args.max_sessions, args.max_queue, args.seed,
+                    args.arrivals)
+    started_at = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
+    print(f"Сходинки: {', '.join(f'{r:g}' for r in rates)} сесій/с по {args.duration:g} s -> {args.base_url}",
+          flush=True)
+    elapsed = test.run()
+
+    result = report.build({
+        'target': args.base_url, 'workload': source, 'rates': rates, 'stage_duration_s': args.duration,
+        'arrivals': args.arrivals, 'max_sessions': args.max_sessions, 'accounts': len(accounts) or 1,
+        'seed': args.seed, 'started_at': started_at, 'elapsed_s': round(elapsed, 2),
+    }, test.samples, test.session_log, rates, args.duration, window=args.window,
+        slo_p95_ms=args.slo_p95_ms, max_error_rate=args.max_error_rate)
+
+    prefix = args.output or os.path.join(RESULTS_DIR, f"load-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}")
+    report.write_json(prefix + '.json', result)
+    report.write_html(prefix + '.html', result)
+
+    summary = result['summary']
+    for row in result['stages']:
+        print(f"{row['offered_sessions_per_s']:>8g} сесій/с  {row['throughput_rps']:>8} req/s  "
+              f"p50 {row['p50_ms']} ms  p95 {row['p95_ms']} ms  p99 {row['p99_ms']} ms  "
+              f"помилок {row['error_rate']:.1%}  черга p95 {row['lag_p95_s']} s"
+              f"{'  НАСИЧЕННЯ' if row['saturated'] else ''}")
+    print(f"\nУсього {summary['requests']} запитів, {summary['error_rate']:.1%} помилок; "
+          f"звіт: {os.path.relpath(prefix, ROOT)}.json / .html")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
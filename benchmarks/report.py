@@ -0,0 +1,256 @@
+"""
+Звіт навантажувального тесту (benchmarks/load.py): JSON і самодостатній HTML.
+
+Зразок запиту — (t, latency_ms, status, endpoint, stage), де t — секунди від
+старту, stage — номер сходинки швидкості надходження. Сесія — (t, lag_s,
+stage, dropped): lag — наскільки пізніше запланованого сесія почалась
+(черга потоків), dropped — не почалась зовсім (черга переповнена).
+
+Точка насичення — перша сходинка, на якій p95 перевищує SLO, частка
+помилок більша за допустиму або сесії стоять у черзі довше за max_lag.
+"""
+
+import html
+import json
+import os
+
+from benchmarks.runner import percentile
+
+DEFAULT_SLO_P95_MS = 500.0
+DEFAULT_MAX_ERROR_RATE = 0.01
+DEFAULT_MAX_LAG = 1.0
+
+
+def latency_stats(latencies):
+    values = sorted(latencies)
+    if not values:
+        return {'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'mean_ms': None, 'max_ms': None}
+    return {
+        'p50_ms': round(percentile(values, 0.50), 2),
+        'p95_ms': round(percentile(values, 0.95), 2),
+        'p99_ms': round(percentile(values, 0.99), 2),
+        'mean_ms': round(sum(values) / len(values), 2),
+        'max_ms': round(values[-1], 2),
+    }
+
+
+def _is_error(status):
+    # 400/404/409 — відповіді бізнес-логіки, не ознака перевантаження
+    return status == 0 or status >= 500 or status in (401, 403, 429)
+
+
+def _group(samples):
+    latencies = [s[1] for s in samples]
+    errors = sum(1 for s in samples if _is_error(s[2]))
+    return dict(latency_stats(latencies), requests=len(samples), errors=errors,
+                error_rate=round(errors / len(samples), 4) if samples else 0.0)
+
+
+def _throughput(samples, duration):
+    # Сесії сходинки можуть завершуватись уже після неї — ділимо на фактичний проміжок
+    if not samples:
+        return 0.0
+    span = max(duration, max(s[0] for s in samples) - min(s[0] for s in samples))
+    return round(len(samples) / span, 2) if span else None
+
+
+def timeline(samples, sessions, window):
+    """Метрики за вікнами по window секунд."""
+    buckets = {}
+    for sample in samples:
+        buckets.setdefault(int(sample[0] // window), []).append(sample)
+    lags = {}
+    for session in sessions:
+        if not session[3]:
+            lags.setdefault(int(session[0] // window), []).append(session[1])
+    rows = []
+    for index in range(max(list(buckets) + list(lags) + [-1]) + 1):
+        group = buckets.get(index, [])
+        lag = sorted(lags.get(index, []))
+        rows.append(dict(_group(group), t=round(index * window, 1),
+                         throughput_rps=round(len(group) / window, 2),
+                         lag_p95_s=round(percentile(lag, 0.95), 3) if lag else None))
+    return rows
+
+
+def stages(samples, sessions, rates, duration, slo_p95_ms=DEFAULT_SLO_P95_MS,
+           max_error_rate=DEFAULT_MAX_ERROR_RATE, max_lag=DEFAULT_MAX_LAG):
+    """Метрики кожної сходинки швидкості і точка насичення."""
+    result = []
+    saturation = None
+    for index, rate in enumerate(rates):
+        group = [s for s in samples if s[4] == index]
+        stage_sessions = [s for s in sessions if s[2] == index]
+        started = [s[1] for s in stage_sessions if not s[3]]
+        dropped = sum(1 for s in stage_sessions if s[3])
+        row = dict(_group(group), stage=index, offered_sessions_per_s=rate,
+                   sessions=len(stage_sessions), dropped_sessions=dropped,
+                   throughput_rps=_throughput(group, duration),
+                   lag_p95_s=round(percentile(sorted(started), 0.95), 3) if started else None)
+        reasons = []
+        if row['p95_ms'] is not None and row['p95_ms'] > slo_p95_ms:
+            reasons.append(f"p95 {row['p95_ms']} ms > {slo_p95_ms:g} ms")
+        if row['error_rate'] > max_error_rate:
+            reasons.append(f"помилок {row['error_rate']:.1%} > {max_error_rate:.0%}")
+        if dropped or (row['lag_p95_s'] or 0) > max_lag:
+            reasons.append(f"сесії в черзі (lag p95 {row['lag_p95_s']} s, відкинуто {dropped})")
+        row['saturated'] = bool(reasons)
+        row['reasons'] = reasons
+        if reasons and saturation is None:
+            saturation = {'stage': index, 'offered_sessions_per_s': rate, 'reasons': reasons,
+                          'last_healthy_sessions_per_s': rates[index - 1] if index else None}
+        result.append(row)
+    return result, saturation
+
+
+def build(meta, samples, sessions, rates, stage_duration, window=5.0, **limits):
+    elapsed = meta.get('elapsed_s') or 1.0
+    endpoints = {}
+    for sample in samples:
+        endpoints.setdefault(sample[3], []).append(sample)
+    stage_rows, saturation = stages(samples, sessions, rates, stage_duration, **limits)
+    return {
+        'meta': meta,
+        'summary': dict(_group(samples), throughput_rps=round(len(samples) / elapsed, 2),
+                        sessions=len(sessions), dropped_sessions=sum(1 for s in sessions if s[3]),
+                        status_codes=_status_codes(samples)),
+        'timeline': timeline(samples, sessions, window),
+        'stages': stage_rows,
+        'saturation': saturation,
+        'endpoints': {name: _group(group) for name, group in sorted(endpoints.items())},
+    }
+
+
+def _status_codes(samples):
+    codes = {}
+    for sample in samples:
+        key = str(sample[2]) if sample[2] else 'connection_error'
+        codes[key] = codes.get(key, 0) + 1
+    return dict(sorted(codes.items()))
+
+
+def write_json(path, report):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
+        fh.write('\n')
+
+
+def _svg_chart(rows, series, title, unit, width=860, height=220):
+    """Лінійний графік без зовнішніх бібліотек: series — [(ключ, колір)]."""
+    pad_left, pad_bottom, pad_top = 56, 24, 24
+    points = [(row['t'], {key: row.get(key) for key, _ in series}) for row in rows]
+    values = [v for _, vals in points for v in vals.values() if v is not None]
+    top = max(values) if values else 1.0
+    top = top * 1.1 or 1.0
+    span = max(points[-1][0], 1.0) if points else 1.0
+    plot_w, plot_h = width - pad_left - 10, height - pad_top - pad_bottom
+
+    def xy(t, v):
+        return pad_left + t / span * plot_w, pad_top + plot_h - v / top * plot_h
+
+    parts = [f'<svg viewBox="0 0 {width} {height}" class="chart"><text x="{pad_left}" y="16" class="title">'
+             f'{html.escape(title)}</text>']
+    for i in range(5):
+        value = top * i / 4
+        _, y = xy(0, value)
+        parts.append(f'<line x1="{pad_left}" x2="{width - 10}" y1="{y:.1f}" y2="{y:.1f}" class="grid"/>'
+                     f'<text x="{pad_left - 6}" y="{y + 4:.1f}" class="axis" text-anchor="end">{value:.0f}</text>')
+    parts.append(f'<text x="{width - 10}" y="{height - 6}" class="axis" text-anchor="end">t, s</text>'
+                 f'<text x="4" y="{pad_top - 6}" class="axis">{html.escape(unit)}</text>')
+    for key, color in series:
+        coords = [xy(t, vals[key]) for t, vals in points if vals[key] is not None]
+        if coords:
+            path = ' '.join(f'{x:.1f},{y:.1f}' for x, y in coords)
+            parts.append(f'<polyline points="{path}" fill="none" stroke="{color}" stroke-width="2"/>')
+    legend = ''.join(f'<tspan fill="{color}" dx="14">■ {html.escape(key)}</tspan>' for key, color in series)
+    parts.append(f'<text x="{width - 10}" y="16" class="axis" text-anchor="end">{legend}</text></svg>')
+    return ''.join(parts)
+
+
+def _table(rows, columns):
+    head = ''.join(f'<th>{html.escape(title)}</th>' for _, title in columns)
+    body = []
+    for row in rows:
+        cells = []
+        for key, _ in columns:
+            value = row.get(key)
+            if isinstance(value, float):
+                value = f'{value:.4f}'.rstrip('0').rstrip('.') if key == 'error_rate' else f'{value:g}'
+            if isinstance(value, list):
+                value = '; '.join(value)
+            cells.append(f'<td>{html.escape("" if value is None else str(value))}</td>')
+        cls = ' class="bad"' if row.get('saturated') else ''
+        body.append(f'<tr{cls}>{"".join(cells)}</tr>')
+    return f'<table><thead><tr>{head}</tr></thead><tbody>{"".join(body)}</tbody></table>'
+
+
+def render_html(report):
+    meta, summary = report['meta'], report['summary']
+    saturation = report['saturation']
+    if saturation:
+        verdict = (f"Насичення на {saturation['offered_sessions_per_s']:g} сесій/с: "
+                   f"{'; '.join(saturation['reasons'])}. Остання здорова швидкість: "
+                   f"{saturation['last_healthy_sessions_per_s'] if saturation['last_healthy_sessions_per_s'] is not None else '—'}")
+    else:
+        verdict = 'Насичення не досягнуто на жодній сходинці'
+    rows = [{'name': name, **stats} for name, stats in report['endpoints'].items()]
+    stats_columns = [('requests', 'Запитів'), ('errors', 'Помилок'), ('error_rate', 'Частка'),
+                     ('p50_ms', 'p50, ms'), ('p95_ms', 'p95, ms'), ('p99_ms', 'p99, ms'), ('max_ms', 'max, ms')]
+    summary_items = ''.join(
+        f'<div class="card"><span>{html.escape(label)}</span><b>{html.escape(str(summary.get(key)))}</b></div>'
+        for key, label in (('requests', 'Запитів'), ('throughput_rps', 'req/s'), ('error_rate', 'Частка помилок'),
+                           ('p50_ms', 'p50, ms'), ('p95_ms', 'p95, ms'), ('p99_ms', 'p99, ms'),
+                           ('sessions', 'Сесій'), ('dropped_sessions', 'Відкинуто сесій')))
+    return f'''<!DOCTYPE html>
+<html lang="uk">
+<head>
+<meta charset="utf-8">
+<title>DailyMood — навантажувальний тест {html.escape(meta.get('started_at', ''))}</title>
+<style>
+body {{ font-family: system-ui, sans-serif; margin: 24px; color: #222; }}
+h1 {{ font-size: 22px; }} h2 {{ font-size: 17px; margin-top: 28px; }}
+.meta {{ color: #666; font-size: 13px; }}
+.cards {{ display: flex; flex-wrap: wrap; gap: 10px; }}
+.card {{ border: 1px solid #ddd; border-radius: 6px; padding: 8px 12px; min-width: 110px; }}
+.card span {{ display: block; color: #666; font-size: 12px; }} .card b {{ font-size: 18px; }}
+.verdict {{ padding: 10px 12px; border-radius: 6px; background: #f3f6ff; }}
+table {{ border-collapse: collapse; font-size: 13px; margin-top: 8px; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 8px; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+tr.bad td {{ background: #fdecec; }}
+.chart {{ width: 100%; max-width: 860px; display: block; margin-top: 12px; }}
+.chart .grid {{ stroke: #eee; }} .chart .axis {{ font-size: 11px; fill: #666; }}
+.chart .title {{ font-size: 13px; font-weight: 600; }}
+</style>
+</head>
+<body>
+<h1>Навантажувальний тест DailyMood</h1>
+<p class="meta">{html.escape(meta.get('target', ''))} · джерело: {html.escape(str(meta.get('workload')))} ·
+сходинки: {html.escape(', '.join(f'{r:g}' for r in meta.get('rates', [])))} сесій/с по {meta.get('stage_duration_s')} s ·
+{html.escape(meta.get('started_at', ''))}</p>
+<div class="cards">{summary_items}</div>
+<h2>Точка насичення</h2>
+<p class="verdict">{html.escape(verdict)}</p>
+{_table(report['stages'], [('offered_sessions_per_s', 'Сесій/с'), ('sessions', 'Сесій'),
+                           ('dropped_sessions', 'Відкинуто'), ('throughput_rps', 'req/s'), *stats_columns[:2],
+                           ('error_rate', 'Частка'), ('p50_ms', 'p50, ms'), ('p95_ms', 'p95, ms'),
+                           ('p99_ms', 'p99, ms'), ('lag_p95_s', 'Черга p95, s'), ('reasons', 'Причина')])}
+<h2>Затримка в часі</h2>
+{_svg_chart(report['timeline'], [('p50_ms', '#2b8a3e'), ('p95_ms', '#e67700'), ('p99_ms', '#c92a2a')],
+            'Перцентилі затримки', 'ms')}
+{_svg_chart(report['timeline'], [('throughput_rps', '#1971c2')], 'Пропускна здатність', 'req/s')}
+{_svg_chart(report['timeline'], [('errors', '#c92a2a')], 'Помилки за вікно', 'шт.')}
+<h2>Endpoint-и</h2>
+{_table(rows, [('name', 'Endpoint'), *stats_columns])}
+<h2>Коди відповіді</h2>
+<p class="meta">{html.escape(json.dumps(summary['status_codes']))}</p>
+</body>
+</html>
+'''
+
+
+def write_html(path, report):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fh:
+        fh.write(render_html(report))
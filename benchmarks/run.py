@@ -0,0 +1,191 @@
+"""
+Запуск бенчмарку гарячих endpoint-ів і контроль регресій.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --size medium --iterations 300 --scenarios journal_list,stats_trends
+    python -m benchmarks.run --target gunicorn --workers 2
+    python -m benchmarks.run --update-baseline
+    python -m benchmarks.run --runs 9
+
+Кожен сценарій проганяється --runs разів (5); у результаті — медіани та
+розкид між прогонами (runner.aggregate). Еталон записується так само.
+Кожен запуск пише JSON у benchmarks/results/ і, якщо є еталон
+(benchmarks/baseline.json) для тієї ж цілі / розміру / seed, порівнює з
+ним: код виходу 1 — є регресії, 2 — еталон несумісний.
+
+Без --database-url набір даних створюється в тимчасовій SQLite-БД. З
+--database-url (напр. PostgreSQL) схема розгортається, а дані сідуються
+лише якщо користувача бенчмарку ще немає — великий набір можна
+заповнити один раз і переміряти багато разів.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from benchmarks import compare, dataset, runner, scenarios  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def prepare_database(args):
+    """Імпортує app з потрібною БД, розгортає схему і сідує дані. Повертає (app, info)."""
+    # DATABASE_URL читається при імпорті app.py — задаємо до імпорту
+    os.environ['DATABASE_URL'] = args.database_url
+    from app import app
+    from models import User
+    import schema_bootstrap
+
+    schema_bootstrap.bootstrap(app)
+    with app.app_context():
+        existing = User.query.filter_by(email=dataset.BENCH_EMAIL).first()
+        existing_id = existing.id if existing else None
+    if existing_id is not None:
+        logging.warning("Користувач бенчмарку вже є в БД — використовуємо наявний набір даних")
+        return app, {'user_id': existing_id, 'email': dataset.BENCH_EMAIL,
+                     'password': dataset.BENCH_PASSWORD, 'counts': None}
+
+    started = time.perf_counter()
+    info = dataset.seed(app, args.size, args.seed)
+    logging.warning("Набір даних '%s' створено за %.1f s: %s", args.size, time.perf_counter() - started,
+                    info['counts'])
+    return app, info
+
+
+def run(args):
+    app, info = prepare_database(args)
+    selected = scenarios.select(args.scenarios)
+    if args.target == 'gunicorn':
+        # Дані вже закомічені; воркерам не потрібні з'єднання батьківського процесу
+        from models import db
+        with app.app_context():
+            db.engine.dispose()
+        target = runner.GunicornTarget(args.database_url, info['email'], info['password'],
+                                       port=args.port, workers=args.workers)
+    else:
+        target = runner.ClientTarget(app, info['user_id'])
+
+    def progress(run, scenario, m):
+        print(f"[{run + 1}/{args.runs}] {scenario.name:<34} p50 {m['p50_ms']:>8.2f}ms  p95 {m['p95_ms']:>8.2f}ms  "
+              f"p99 {m['p99_ms']:>8.2f}ms  {m['throughput_rps']:>7.1f} req/s  "
+              f"sql {m['sql_per_request'] if m['sql_per_request'] is not None else '-':>5}  "
+              f"mem {m['peak_memory_kb'] if m['peak_memory_kb'] is not None else '-':>8} KB  "
+              f"err {m['errors']}", flush=True)
+
+    try:
+        results = runner.measure_runs(target, selected, args.runs, args.iterations, args.warmup, progress)
+    finally:
+        target.close()
+
+    return {
+        'meta': {
+            'target': args.target,
+            'size': args.size,
+            'seed': args.seed,
+            'iterations': args.iterations,
+            'warmup': args.warmup,
+            'runs': args.runs,
+            'dataset': info['counts'],
+            'database': args.database_url.split(':', 1)[0],
+            'workers': args.workers if args.target == 'gunicorn' else None,
+            'git': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'created_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+        },
+        'scenarios': results,
+    }
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh, ensure_ascii=False, indent=2, sort_keys=True)
+        fh.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Бенчмарк гарячих endpoint-ів DailyMood')
+    parser.add_argument('--target', choices=('client', 'gunicorn'), default='client',
+                        help='Flask test client у процесі або gunicorn на localhost')
+    parser.add_argument('--size', default='small', choices=sorted(dataset.SIZES), help='Розмір набору даних')
+    parser.add_argument('--seed', type=int, default=dataset.DEFAULT_SEED)
+    parser.add_argument('--iterations', type=int, default=runner.DEFAULT_ITERATIONS)
+    parser.add_argument('--warmup', type=int, default=runner.DEFAULT_WARMUP)
+    parser.add_argument('--runs', type=int, default=runner.DEFAULT_RUNS,
+                        help='Прогонів кожного сценарію; гейт — за медіаною')
+    parser.add_argument('--scenarios', help='Імена сценаріїв через кому (за замовчуванням — усі)')
+    parser.add_argument('--database-url', help='БД для набору даних (за замовчуванням — тимчасова SQLite)')
+    parser.add_argument('--workers', type=int, default=2, help='Воркерів gunicorn (--target gunicorn)')
+    parser.add_argument('--port', type=int, default=5096)
+    parser.add_argument('--output', help='Файл результатів (за замовчуванням — benchmarks/results/...)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=compare.DEFAULT_THRESHOLD,
+                        help='Допустиме погіршення, частка (0.25 = 25%%)')
+    parser.add_argument('--update-baseline', action='store_true', help='Записати результат як новий еталон')
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error('--runs має бути не менше 1')
+
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(message)s')
+    with tempfile.TemporaryDirectory() as tmp:
+        if not args.database_url:
+            args.database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        report = run(args)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{args.target}-{args.size}-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.json")
+    write_json(output, report)
+    print(f"\nРезультати: {os.path.relpath(output, ROOT)}")
+
+    if args.update_baseline:
+        write_json(args.baseline, report)
+        print(f"Еталон оновлено: {os.path.relpath(args.baseline, ROOT)}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print('Еталону немає — порівняння пропущено (--update-baseline, щоб створити)')
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as fh:
+        baseline = json.load(fh)
+    mismatch = compare.hardware_mismatch(report, baseline)
+    if mismatch:
+        print(f"Увага: еталон записано на іншому залізі ({'; '.join(mismatch)}) — час, throughput і пам'ять "
+              f"лише для довідки, гейт — SQL-запити та помилки")
+    try:
+        rows = compare.compare(report, baseline, args.threshold)
+    except compare.BaselineMismatch as exc:
+        print(f'Еталон несумісний: {exc}')
+        return 2
+    print()
+    print(compare.format_rows(rows))
+    failed = compare.regressions(rows)
+    if failed:
+        print(f"\n{len(failed)} регресій (поріг {args.threshold:.0%})")
+        return 1
+    print(f"\nРегресій немає (поріг {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
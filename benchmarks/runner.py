@@ -0,0 +1,269 @@
+"""
+Цілі бенчмарку та вимірювання.
+
+- ClientTarget — Flask test client у тому ж процесі: без мережі, з точним
+  лічильником SQL-запитів (подія before_cursor_execute) і піковою
+  пам'яттю запиту (tracemalloc, окремий прохід — трасування сповільнює
+  запити і не має впливати на латентність)
+- GunicornTarget — реальний gunicorn (gunicorn.conf.py) на localhost,
+  keep-alive з'єднання; SQL-лічильника немає, пам'ять — пікове RSS
+  (VmHWM) воркерів
+
+Метрики сценарію: p50/p95/p99/mean (ms), throughput (послідовні запити
+одного клієнта, req/s), sql_per_request, peak_memory_kb, errors (4xx/5xx).
+
+Один прогін на спільній машині — шум: p95 і throughput між двома
+прогонами незмінного коду розходяться на десятки відсотків. Тому сценарії
+проганяються кілька разів (measure_runs, по колу — повільний дрейф машини
+розподіляється між сценаріями), а результат — найкращий прогін кожної
+метрики (як у timeit: сторонні процеси лише сповільнюють, тож мінімум часу —
+найвідтворюваніша оцінка) і розкид (max - min), за яким compare.py
+розширює поріг шуму.
+"""
+
+import http.client
+import json
+import math
+import os
+import signal
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from sqlalchemy import event
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_ITERATIONS = 100
+DEFAULT_WARMUP = 10
+DEFAULT_RUNS = 5
+# Помилка в будь-якому прогоні — вже проблема: береться найгірше значення.
+# SQL — як час, найкращий прогін: N+1 видно в кожному прогоні, а рідкісне
+# оновлення кешу посеред прогону (+1 запит) — ні
+WORST_OF = ('errors',)
+# Більше — краще; для решти метрик найкращий прогін — мінімум
+HIGHER_IS_BETTER = ('throughput_rps',)
+MEMORY_ITERATIONS = 5
+
+
+def percentile(sorted_values, q):
+    """Перцентиль методом найближчого рангу (значення з вибірки)."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(q * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class ClientTarget:
+    """Flask test client з сесією користувача з набору даних."""
+
+    name = 'client'
+
+    def __init__(self, app, user_id):
+        from models import db
+
+        self.app = app
+        self.client = app.test_client()
+        with self.client.session_transaction() as sess:
+            sess['user_id'] = user_id
+        with app.app_context():
+            self.engine = db.engine
+        self.sql_count = 0
+        event.listen(self.engine, 'before_cursor_execute', self._count_sql)
+
+    def _count_sql(self, *args):
+        self.sql_count += 1
+
+    def request(self, method, path, body=None):
+        response = self.client.open(path, method=method, json=body)
+        response.get_data()
+        status = response.status_code
+        response.close()
+        return status
+
+    def peak_memory_kb(self, scenario, start_iteration):
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for i in range(MEMORY_ITERATIONS):
+                self.request(scenario.method, scenario.path, scenario.payload(start_iteration + i))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return round(max(peak - baseline, 0) / 1024, 1)
+
+    def close(self):
+        event.remove(self.engine, 'before_cursor_execute', self._count_sql)
+        # Порожня сесія — Flask-Session видаляє її файл
+        self.client.post('/auth/logout')
+
+
+class GunicornTarget:
+    """gunicorn -c gunicorn.conf.py на localhost з окремою БД."""
+
+    name = 'gunicorn'
+    sql_count = None
+
+    def __init__(self, database_url, email, password, port=5096, workers=2, ready_timeout=30.0):
+        self.port = port
+        env = dict(os.environ, DATABASE_URL=database_url, WEB_CONCURRENCY=str(workers),
+                   GUNICORN_ACCESS_LOG='', GUNICORN_LOG_LEVEL='warning', GUNICORN_MAX_REQUESTS='0')
+        self.proc = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+                                      '-b', f'127.0.0.1:{port}'],
+                                     cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            self._wait_ready(ready_timeout)
+            self.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            self.cookie = ''
+            status = self.request('POST', '/auth/login', {'email': email, 'password': password})
+            if status != 200:
+                raise RuntimeError(f'Не вдалося увійти як {email}: HTTP {status}')
+        except Exception:
+            self.close()
+            raise
+
+    def _wait_ready(self, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f'gunicorn завершився з кодом {self.proc.returncode}')
+            try:
+                conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=1)
+                conn.request('GET', '/health')
+                if conn.getresponse().status == 200:
+                    conn.close()
+                    return
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError('gunicorn не відповів на /health')
+
+    def request(self, method, path, body=None):
+        headers = {'Cookie': self.cookie} if self.cookie else {}
+        data = None
+        if body is not None:
+            data = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+        for attempt in range(2):
+            try:
+                self.conn.request(method, path, body=data, headers=headers)
+                response = self.conn.getresponse()
+                response.read()
+                break
+            except (OSError, http.client.HTTPException):
+                # Сервер закрив keep-alive з'єднання — повторюємо один раз на новому
+                self.conn.close()
+                self.conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=30)
+                if attempt:
+                    raise
+        cookie = response.getheader('Set-Cookie')
+        if cookie:
+            self.cookie = cookie.split(';', 1)[0]
+        return response.status
+
+    def _worker_pids(self):
+        pids = []
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as fh:
+                    if int(fh.read().rsplit(')', 1)[1].split()[1]) == self.proc.pid:
+                        pids.append(int(entry))
+            except (OSError, ValueError, IndexError):
+                continue
+        return pids
+
+    def peak_memory_kb(self, scenario, start_iteration):
+        peak = None
+        for pid in self._worker_pids():
+            try:
+                with open(f'/proc/{pid}/status') as fh:
+                    for line in fh:
+                        if line.startswith('VmHWM:'):
+                            peak = max(peak or 0, int(line.split()[1]))
+            except OSError:
+                continue
+        return peak
+
+    def close(self):
+        conn = getattr(self, 'conn', None)
+        if conn is not None:
+            conn.close()
+        if self.proc.poll() is None:
+            self.proc.send_signal(signal.SIGTERM)
+            try:
+                self.proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+
+def measure(target, scenario, iterations=DEFAULT_ITERATIONS, warmup=DEFAULT_WARMUP):
+    """Прогін одного сценарію; повертає словник метрик."""
+    for i in range(warmup):
+        target.request(scenario.method, scenario.path, scenario.payload(i))
+
+    latencies = []
+    errors = 0
+    sql_before = target.sql_count
+    started = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        status = target.request(scenario.method, scenario.path, scenario.payload(warmup + i))
+        latencies.append((time.perf_counter() - t0) * 1000)
+        if status >= 400:
+            errors += 1
+    elapsed = time.perf_counter() - started
+    sql_per_request = None
+    if sql_before is not None:
+        sql_per_request = round((target.sql_count - sql_before) / iterations, 2)
+
+    latencies.sort()
+    return {
+        'iterations': iterations,
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'throughput_rps': round(iterations / elapsed, 1),
+        'sql_per_request': sql_per_request,
+        'peak_memory_kb': target.peak_memory_kb(scenario, warmup + iterations),
+        'errors': errors,
+    }
+
+
+def aggregate(runs):
+    """Найкращий прогін кожної метрики + spread (max - min) — шум цієї машини."""
+    result = {'runs': len(runs), 'spread': {}}
+    for metric in runs[0]:
+        values = [run[metric] for run in runs if run[metric] is not None]
+        if not values:
+            result[metric] = None
+            continue
+        if metric in WORST_OF:
+            result[metric] = max(values)
+            continue
+        result[metric] = max(values) if metric in HIGHER_IS_BETTER else min(values)
+        if len(values) > 1 and metric != 'sql_per_request':
+            result['spread'][metric] = round(max(values) - min(values), 3)
+    return result
+
+
+def measure_runs(target, selected, runs=DEFAULT_RUNS, iterations=DEFAULT_ITERATIONS, warmup=DEFAULT_WARMUP,
+                 progress=None):
+    """runs прогонів кожного сценарію по колу; повертає {сценарій: aggregate(...)}.
+
+    Сценарії, що пишуть (journal_create), змінюють дані, які читають інші, —
+    їхні прогони йдуть після всіх прогонів читання.
+    """
+    measured = {scenario.name: [] for scenario in selected}
+    reads = [scenario for scenario in selected if scenario.method == 'GET']
+    writes = [scenario for scenario in selected if scenario.method != 'GET']
+    for group in (reads, writes):
+        for run in range(runs):
+            for scenario in group:
+                result = measure(target, scenario, iterations, warmup)
+                measured[scenario.name].append(result)
+                if progress is not None:
+                    progress(run, scenario, result)
+    return {name: aggregate(results) for name, results in measured.items()}
@@ -0,0 +1,66 @@
+"""
+Endpoint-и, що заміряються бенчмарком.
+
+Кожен сценарій — один HTTP-запит від імені користувача з набору даних
+(dataset.BENCH_EMAIL). body — функція номера ітерації, щоб POST-и не
+створювали однакових записів.
+"""
+
+from datetime import date, timedelta
+
+from benchmarks.dataset import ACTIVITIES, MOODS
+
+
+class Scenario:
+    """Один endpoint: метод, шлях і (для POST) тіло запиту."""
+
+    def __init__(self, name, method, path, body=None, description=''):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.body = body
+        self.description = description
+
+    def payload(self, iteration):
+        return self.body(iteration) if self.body else None
+
+
+def _journal_entry(iteration):
+    return {
+        'mood': MOODS[iteration % len(MOODS)],
+        'date': (date.today() - timedelta(days=iteration % 365)).isoformat(),
+        'title': f'Бенчмарк {iteration}',
+        'content': 'Запис, створений бенчмарком',
+        'activities': list(ACTIVITIES[:iteration % 4]),
+        'sleep_quality': 1 + iteration % 4,
+        'sleep_hours': 7.5,
+    }
+
+
+SCENARIOS = [
+    Scenario('journal_list', 'GET', '/api/journal', description='Усі записи щоденника'),
+    Scenario('stats_trends', 'GET', '/api/stats/trends', description='Теплокарта за рік'),
+    Scenario('statistics_page', 'GET', '/statistics', description='HTML-сторінка статистики'),
+    Scenario('habits', 'GET', '/api/habits', description='Звички з виконаннями за 30 днів'),
+    Scenario('orders', 'GET', '/api/orders', description='Замовлення користувача'),
+    Scenario('products', 'GET', '/api/products', description='Публічний каталог'),
+    Scenario('premium_mood_predictor', 'GET', '/api/premium/mood-predictor', description='Прогноз настрою'),
+    Scenario('premium_sleep_trends', 'GET', '/api/premium/sleep-trends', description='Тренд сну'),
+    Scenario('premium_activity_recommendations', 'GET', '/api/premium/activity-recommendations',
+             description='Рекомендації активностей'),
+    # Останнім: нові записи не змінюють обсяг даних для попередніх сценаріїв
+    Scenario('journal_create', 'POST', '/api/journal', body=_journal_entry, description='Новий запис'),
+]
+
+
+def select(names=None):
+    """Сценарії за іменами (через кому або список); None — усі."""
+    if not names:
+        return list(SCENARIOS)
+    if isinstance(names, str):
+        names = [n.strip() for n in names.split(',') if n.strip()]
+    by_name = {s.name: s for s in SCENARIOS}
+    unknown = [n for n in names if n not in by_name]
+    if unknown:
+        raise ValueError(f"Невідомі сценарії: {', '.join(unknown)}")
+    return [by_name[n] for n in names]
@@ -0,0 +1,207 @@
+"""
+Джерела навантаження для benchmarks/load.py.
+
+- Postman-колекція (postman/DailyMood_API.postman_collection.json):
+  запити в порядку колекції, змінні {{...}} підставляються зі змінних
+  віртуального користувача, а значення, які тест-скрипти зберігають через
+  pm.collectionVariables.set('x', data.path), беруться з JSON-відповіді
+- Журнали запитів: access log gunicorn (combined) або рядки
+  "Request: METHOD URL" з app.log. Запити групуються в сесії за клієнтом і
+  паузами; запит, що збігається із запитом колекції (метод + шаблон
+  шляху), замінюється ним — так POST/PUT отримують тіло, а ідентифікатори
+  в шляху — значення поточного користувача. Записи без тіла пропускаються.
+"""
+
+import json
+import re
+from datetime import datetime
+from urllib.parse import urlsplit
+
+DEFAULT_COLLECTION = 'postman/DailyMood_API.postman_collection.json'
+LOGIN_PATH = '/auth/login'
+# Пауза між запитами клієнта, після якої починається нова сесія (с)
+SESSION_GAP = 30 * 60
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+_VARIABLE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+_NUMERIC_SEGMENT = re.compile(r'/\d+(?=/|$)')
+_CAPTURE = re.compile(r"pm\.collectionVariables\.set\(\s*['\"](\w+)['\"]\s*,\s*\w+((?:\.\w+)+)\s*\)")
+_ACCESS_LINE = re.compile(
+    r'^(?P<host>\S+) \S+ \S+ \[(?P<time>[^\]]+)\] "(?P<method>[A-Z]+) (?P<target>\S+) [^"]*" '
+    r'(?P<status>\d{3}) \S+(?: "[^"]*" "(?P<agent>[^"]*)")?')
+_APP_LINE = re.compile(
+    r'^(?P<time>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ \[\w+\] Request: (?P<method>[A-Z]+) (?P<url>\S+)')
+
+
+class RequestTemplate:
+    """Запит з підстановками {{змінна}} та правилами збереження змінних з відповіді."""
+
+    def __init__(self, name, method, url, body=None, headers=None, captures=None):
+        self.name = name
+        self.method = method.upper()
+        self.url = url
+        self.body = body
+        self.headers = dict(headers or {})
+        self.captures = dict(captures or {})
+        path = urlsplit(_strip_base(url)).path or '/'
+        self.path_template = path
+        pattern = re.escape(path)
+        for var in _VARIABLE.findall(path):
+            pattern = pattern.replace(re.escape('{{' + var + '}}'), f'(?P<{var}>[^/]+)', 1)
+        self._path_re = re.compile(f'^{pattern}$')
+
+    @property
+    def endpoint(self):
+        """Назва для звіту: метод і шаблон шляху."""
+        path = _VARIABLE.sub(lambda m: '{' + m.group(1) + '}', self.path_template)
+        return f"{self.method} {_NUMERIC_SEGMENT.sub('/{id}', path)}"
+
+    @property
+    def is_login(self):
+        return self.method == 'POST' and self.path_template == LOGIN_PATH
+
+    def match(self, method, path):
+        """Значення змінних зі шляху, якщо запит з журналу відповідає шаблону; інакше None."""
+        if method != self.method:
+            return None
+        m = self._path_re.match(path)
+        return m.groupdict() if m else None
+
+    def render(self, variables):
+        """(method, path з query, body, headers) з підставленими змінними."""
+        def sub(text):
+            return _VARIABLE.sub(lambda m: str(variables.get(m.group(1), m.group(0))), text)
+
+        url = _strip_base(sub(self.url))
+        body = sub(self.body) if self.body else None
+        return self.method, url, body, self.headers
+
+    def capture(self, payload, variables):
+        """Зберігає у variables значення з JSON-відповіді (як тест-скрипти колекції)."""
+        for var, path in self.captures.items():
+            value = payload
+            for key in path:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                if value is not None:
+                    variables[var] = value
+
+
+class Step:
+    """Крок сесії: шаблон і пауза перед ним (с)."""
+
+    def __init__(self, template, think=0.0):
+        self.template = template
+        self.think = think
+
+
+def _strip_base(url):
+    """'{{baseUrl}}/api/x' або 'http://host/api/x' -> '/api/x'."""
+    url = re.sub(r'^\{\{\s*baseUrl\s*\}\}', '', url)
+    if url.startswith(('http://', 'https://')):
+        parts = urlsplit(url)
+        url = parts.path + (f'?{parts.query}' if parts.query else '')
+    return url or '/'
+
+
+def _items(items):
+    for item in items:
+        if 'item' in item:
+            yield from _items(item['item'])
+        else:
+            yield item
+
+
+def load_collection(path):
+    """Повертає (templates, variables) з Postman-колекції v2.1."""
+    with open(path, encoding='utf-8') as fh:
+        collection = json.load(fh)
+    variables = {v['key']: v.get('value') for v in collection.get('variable', [])}
+    templates = []
+    for item in _items(collection.get('item', [])):
+        request = item['request']
+        url = request['url'] if isinstance(request['url'], str) else request['url'].get('raw', '')
+        body = (request.get('body') or {}).get('raw') if (request.get('body') or {}).get('mode') == 'raw' else None
+        headers = {h['key']: h['value'] for h in request.get('header', []) if not h.get('disabled')}
+        captures = {}
+        for event in item.get('event', []):
+            if event.get('listen') != 'test':
+                continue
+            for line in event.get('script', {}).get('exec', []):
+                for var, path in _CAPTURE.findall(line):
+                    captures[var] = path.strip('.').split('.')
+        templates.append(RequestTemplate(item.get('name', url), request.get('method', 'GET'), url, body,
+                                         headers, captures))
+    return templates, variables
+
+
+def collection_session(templates, think=0.0):
+    """Сесія "як у колекції": усі запити по черзі з паузою think."""
+    return [Step(t, think if i else 0.0) for i, t in enumerate(templates)]
+
+
+def parse_log_line(line):
+    """{'client', 'time', 'method', 'path'} для рядка access log / app.log або None."""
+    m = _ACCESS_LINE.match(line)
+    if m:
+        try:
+            moment = datetime.strptime(m.group('time'), '%d/%b/%Y:%H:%M:%S %z').timestamp()
+        except ValueError:
+            return None
+        target = m.group('target')
+        return {'client': f"{m.group('host')} {m.group('agent') or ''}", 'time': moment,
+                'method': m.group('method'), 'path': _strip_base(target)}
+    m = _APP_LINE.match(line)
+    if m:
+        moment = datetime.strptime(m.group('time'), '%Y-%m-%d %H:%M:%S').timestamp()
+        # app.log не містить клієнта — усе в одному потоці, сесії ріжуться паузами
+        return {'client': 'app.log', 'time': moment, 'method': m.group('method'), 'path': _strip_base(m.group('url'))}
+    return None
+
+
+def read_log_sessions(paths, session_gap=SESSION_GAP):
+    """Послідовності запитів за клієнтом: [[(time, method, path), ...], ...]."""
+    by_client = {}
+    for path in paths:
+        with open(path, encoding='utf-8', errors='replace') as fh:
+            for line in fh:
+                record = parse_log_line(line)
+                if record:
+                    by_client.setdefault(record['client'], []).append(
+                        (record['time'], record['method'], record['path']))
+    sessions = []
+    for requests in by_client.values():
+        requests.sort(key=lambda r: r[0])
+        current = []
+        for record in requests:
+            if current and record[0] - current[-1][0] > session_gap:
+                sessions.append(current)
+                current = []
+            current.append(record)
+        if current:
+            sessions.append(current)
+    return sessions
+
+
+def log_session_steps(records, templates, think_scale=1.0, max_think=10.0):
+    """Перетворює сесію з журналу на кроки; повертає (steps, skipped)."""
+    steps, skipped = [], 0
+    previous = None
+    for moment, method, path in records:
+        route = urlsplit(path).path
+        # Значення зі шляху (чужі id з продакшену) не використовуються —
+        # шаблон підставить ідентифікатори поточного користувача
+        template = next((t for t in templates if t.match(method, route) is not None), None)
+        if template is None:
+            if method in WRITE_METHODS:
+                # Тіла запиту в журналі немає — запис не відтворити
+                skipped += 1
+                continue
+            template = RequestTemplate(f'{method} {route}', method, path)
+        # Пауза рахується від попереднього відтвореного запиту — пропуски не скорочують сесію
+        think = 0.0 if previous is None else min(max(moment - previous, 0.0) * think_scale, max_think)
+        previous = moment
+        steps.append(Step(template, think))
+    return steps, skipped
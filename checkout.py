@@ -0,0 +1,100 @@
+"""
+Оформлення замовлення з фіксованою кількістю SQL-запитів.
+
+Раніше кожен рядок кошика робив окремий Product.query.get(), а
+order.calculate_total() перечитував lazy='dynamic' зв'язок items після
+flush. Тут:
+- усі продукти кошика вибираються одним запитом IN (...)
+- сума рахується в пам'яті ще до INSERT замовлення
+- усі OrderItem вставляються одним пакетним INSERT ... RETURNING
+- словник відповіді будується з об'єктів у пам'яті, без повторного читання
+
+Незалежно від кількості рядків у кошику: SELECT products, INSERT orders,
+INSERT order_items, COMMIT.
+"""
+
+from collections import defaultdict
+
+from sqlalchemy import insert
+
+from models import db, Product, Order, OrderItem
+
+
+class ProductUnavailable(Exception):
+    """Продукт з кошика не існує або деактивований."""
+
+    def __init__(self, product_id):
+        super().__init__(f'Продукт #{product_id} недоступний')
+        self.product_id = product_id
+
+
+def load_products(product_ids):
+    """Повертає {id: Product} для активних продуктів одним запитом."""
+    ids = {pid for pid in product_ids if pid is not None}
+    if not ids:
+        return {}
+    products = Product.query.filter(Product.id.in_(ids), Product.is_active.is_(True)).all()
+    return {p.id: p for p in products}
+
+
+def create_order(user_id, items_data, status='new'):
+    """Створює замовлення з рядками та повертає (order, order_dict).
+
+    items_data — список {'product_id': int, 'quantity': int}. Якщо будь-який
+    продукт недоступний, піднімається ProductUnavailable і нічого не пишеться.
+    Коміт транзакції виконується тут; order_dict зібраний до коміту, тому
+    для відповіді не потрібно перечитувати замовлення з БД.
+    """
+    products = load_products(item.get('product_id') for item in items_data)
+
+    lines = []
+    total = 0.0
+    for item_data in items_data:
+        product_id = item_data.get('product_id')
+        quantity = item_data.get('quantity', 1)
+        product = products.get(product_id)
+        if product is None:
+            raise ProductUnavailable(product_id)
+        subtotal = product.price * quantity
+        total += subtotal
+        lines.append((product, quantity, subtotal))
+
+    order = Order(user_id=user_id, status=status, total_amount=total)
+    db.session.add(order)
+    db.session.flush()  # Щоб отримати order.id для items
+
+    # ORM bulk INSERT ... VALUES (...), (...) RETURNING — один запит на всі рядки.
+    # Порядок RETURNING не гарантується всіма СУБД, тому зіставляємо рядки за
+    # (product_id, quantity): однакові пари взаємозамінні.
+    rows = db.session.execute(
+        insert(OrderItem).returning(OrderItem.id, OrderItem.product_id, OrderItem.quantity),
+        [
+            {
+                'order_id': order.id,
+                'product_id': product.id,
+                'quantity': quantity,
+                'unit_price': product.price,
+                'subtotal': subtotal
+            }
+            for product, quantity, subtotal in lines
+        ]
+    ).all()
+    ids_by_line = defaultdict(list)
+    for row in sorted(rows, key=lambda r: r.id):
+        ids_by_line[(row.product_id, row.quantity)].append(row.id)
+
+    order_dict = order.to_dict()
+    order_dict['items'] = [
+        {
+            'id': ids_by_line[(product.id, quantity)].pop(0),
+            'order_id': order.id,
+            'product_id': product.id,
+            'product_name': product.name,
+            'quantity': quantity,
+            'unit_price': product.price,
+            'subtotal': subtotal
+        }
+        for product, quantity, subtotal in lines
+    ]
+    db.session.commit()
+    return order, order_dict
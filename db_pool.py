@@ -0,0 +1,235 @@
+"""
+Пул з'єднань БД: налаштування з оточення, таймаути запитів і телеметрія.
+
+engine_options() будує SQLALCHEMY_ENGINE_OPTIONS (або опції окремого bind):
+- PostgreSQL: pool_size / max_overflow / pool_timeout / pool_recycle,
+  pool_pre_ping (з'єднання, розірване після failover, виявляється при
+  checkout і замінюється новим, а не падає в запиті), connect_timeout
+  (підключення до недоступного primary не висить) і серверний
+  statement_timeout через параметр старту libpq (-c statement_timeout=...)
+  — діє з першого запиту, без SET на кожне з'єднання; з pgbouncer потрібно
+  ignore_startup_parameters або таймаут на рівні ролі;
+- SQLite: розміри пулу типові (SQLAlchemy 2 використовує QueuePool для
+  файлової БД), лише телеметрія; :memory: — без змін.
+
+Телеметрія: клас пулу — підклас QueuePool, що міряє очікування checkout
+(час, максимум, таймаути) і рахує нові та інвалідовані з'єднання. Клас
+створюється на engine, тож лічильники переживають engine.dispose() (пул
+перестворюється з тим самим класом). Метрики — dailymood_db_pool_* на
+/metrics з міткою engine; readiness() — для /health/ready.
+"""
+
+import logging
+import threading
+import time
+import weakref
+
+from sqlalchemy import event, exc, text
+from sqlalchemy.pool import QueuePool
+
+import metrics
+import server_profile
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 5
+DEFAULT_POOL_TIMEOUT = 10.0
+DEFAULT_POOL_RECYCLE = 1800
+DEFAULT_STATEMENT_TIMEOUT_MS = 20000
+DEFAULT_CONNECT_TIMEOUT = 5
+
+# Статистика пулів за назвою engine ('default' або ключ bind)
+_stats = {}
+
+
+class PoolStats:
+    """Лічильники пулу одного engine (на процес)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidated = 0
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self):
+        return self._pool() if self._pool is not None else None
+
+    def attach(self, pool):
+        self._pool = weakref.ref(pool)
+
+    def on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidated += 1
+
+    def record_wait(self, seconds, timed_out=False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self):
+        pool = self.pool
+        capacity = pool.capacity if pool is not None else None
+        checked_out = pool.checkedout() if pool is not None else 0
+        return {
+            'engine': self.name,
+            'size': pool.size() if pool is not None else None,
+            'capacity': capacity,
+            'checked_out': checked_out,
+            'idle': pool.checkedin() if pool is not None else 0,
+            'overflow': max(pool.overflow(), 0) if pool is not None else 0,
+            'saturated': capacity is not None and checked_out >= capacity,
+            'checkouts': self.checkouts,
+            'wait_seconds': round(self.wait_seconds, 6),
+            'max_wait_seconds': round(self.max_wait_seconds, 6),
+            'timeouts': self.timeouts,
+            'connects': self.connects,
+            'invalidated': self.invalidated,
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool з часом очікування checkout; stats задає підклас на engine."""
+
+    stats = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # max_overflow=-1 — без обмеження
+        self.capacity = self.size() + self._max_overflow if self._max_overflow >= 0 else None
+        self.stats.attach(self)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def pool_class(name):
+    """Підклас InstrumentedQueuePool з власною статистикою для engine name."""
+    stats = _stats.setdefault(name, PoolStats(name))
+    return type(f'InstrumentedQueuePool[{name}]', (InstrumentedQueuePool,), {'stats': stats})
+
+
+def engine_options(url, config, name='default', statement_timeout_ms=None):
+    """Опції create_engine для url з налаштувань DB_* у config."""
+    backend = server_profile.database_backend(url)
+    if backend == 'sqlite':
+        if ':memory:' in url or url.rstrip('/') in ('sqlite:', 'sqlite:/'):
+            return {}
+        return {'poolclass': pool_class(name)}
+    if statement_timeout_ms is None:
+        statement_timeout_ms = config.get('DB_STATEMENT_TIMEOUT_MS', DEFAULT_STATEMENT_TIMEOUT_MS)
+    options = {
+        'poolclass': pool_class(name),
+        'pool_size': config.get('DB_POOL_SIZE', DEFAULT_POOL_SIZE),
+        'max_overflow': config.get('DB_MAX_OVERFLOW', DEFAULT_MAX_OVERFLOW),
+        'pool_timeout': config.get('DB_POOL_TIMEOUT', DEFAULT_POOL_TIMEOUT),
+        'pool_recycle': config.get('DB_POOL_RECYCLE', DEFAULT_POOL_RECYCLE),
+        'pool_pre_ping': config.get('DB_POOL_PRE_PING', True),
+    }
+    if backend == 'postgresql':
+        connect_args = {'connect_timeout': config.get('DB_CONNECT_TIMEOUT', DEFAULT_CONNECT_TIMEOUT)}
+        if statement_timeout_ms:
+            connect_args['options'] = f'-c statement_timeout={int(statement_timeout_ms)}'
+        options['connect_args'] = connect_args
+    return options
+
+
+def engine_name(bind_key):
+    return 'default' if bind_key is None else str(bind_key)
+
+
+def pool_status(db):
+    """Стан пулів усіх engine (без checkout)."""
+    return [engine.pool.stats.snapshot() for engine in db.engines.values()
+            if getattr(engine.pool, 'stats', None) is not None]
+
+
+def readiness(db):
+    """(ok, деталі): пул основної БД не вичерпаний і SELECT 1 проходить.
+
+    Додаткові engine (репліки) перевіряються так само, але не впливають на
+    ok — без них читання йдуть на primary.
+    """
+    checks = []
+    ok = True
+    for key, engine in db.engines.items():
+        name = engine_name(key)
+        stats = getattr(engine.pool, 'stats', None)
+        check = stats.snapshot() if stats is not None else {'engine': name}
+        if check.get('saturated'):
+            # Ping чекав би pool_timeout — вичерпаний пул і є відповіддю
+            check['ok'] = False
+            check['error'] = "Пул з'єднань вичерпано"
+        else:
+            started = time.perf_counter()
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text('SELECT 1'))
+                check['ok'] = True
+            except Exception as e:
+                logging.warning("Readiness: engine %s недоступний: %s", name, e)
+                check['ok'] = False
+                check['error'] = str(e)
+            check['ping_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        if key is None:
+            ok = ok and check['ok']
+        checks.append(check)
+    return ok, checks
+
+
+def collect(app):
+    """Метрики для /metrics: стан пулу, очікування checkout, таймаути."""
+    db = app.extensions['sqlalchemy']
+    with app.app_context():
+        pools = pool_status(db)
+    gauges = (
+        ('db_pool_size', 'size', "Постійний розмір пулу з'єднань"),
+        ('db_pool_checked_out', 'checked_out', "З'єднання, видані запитам"),
+        ('db_pool_idle', 'idle', "Вільні з'єднання в пулі"),
+        ('db_pool_overflow', 'overflow', "З'єднання понад pool_size"),
+    )
+    for metric, key, help_text in gauges:
+        yield (metric, 'gauge', help_text, [({'engine': p['engine']}, p[key] or 0) for p in pools])
+    counters = (
+        ('db_pool_checkouts_total', 'checkouts', "Успішні checkout з'єднань"),
+        ('db_pool_checkout_wait_seconds_total', 'wait_seconds', 'Сумарне очікування checkout'),
+        ('db_pool_checkout_timeouts_total', 'timeouts', "Checkout, що не дочекались з'єднання (pool_timeout)"),
+        ('db_pool_connections_total', 'connects', "Нові з'єднання з БД"),
+        ('db_pool_invalidated_total', 'invalidated', "Інвалідовані з'єднання (розрив, pre-ping)"),
+    )
+    for metric, key, help_text in counters:
+        yield (metric, 'counter', help_text, [({'engine': p['engine']}, p[key]) for p in pools])
+    yield ('db_pool_checkout_max_wait_seconds', 'gauge', 'Найдовше очікування checkout',
+           [({'engine': p['engine']}, p['max_wait_seconds']) for p in pools])
+
+
+def init_app(app, db):
+    """Підключає лічильники з'єднань до engine-ів застосунку."""
+    with app.app_context():
+        for key, engine in db.engines.items():
+            stats = _stats.get(engine_name(key))
+            if stats is None or event.contains(engine, 'connect', stats.on_connect):
+                continue
+            # Слухачі пулу переходять до нового пулу при engine.dispose()
+            event.listen(engine, 'connect', stats.on_connect)
+            event.listen(engine, 'invalidate', stats.on_invalidate)
+    metrics.register(collect)
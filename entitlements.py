@@ -0,0 +1,225 @@
+"""
+Індекс прав користувача (entitlements) на преміум та придбані продукти.
+
+Таблиця entitlements зберігає пари (user_id, feature) з терміном дії:
+- 'premium' — преміум-доступ (дзеркалиться в users.is_premium / premium_*_at)
+- 'product:<id>' — придбаний пакет цитат, тема, шаблон щоденника тощо
+
+Права видаються при завершенні платежу (grant_for_order). Перевірка
+has_premium() / has_entitlement() читає кешований набір прав користувача,
+тож преміум-ендпоінти не роблять User.query.get на кожен запит. Кеш
+локальний для процесу: зміни в цьому процесі інвалідовують його одразу,
+зміни з інших процесів (воркер черги) стають видимими через
+ENTITLEMENT_CACHE_TTL секунд.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from models import db, User, Product, OrderItem, Entitlement
+
+PREMIUM = 'premium'
+DEFAULT_CACHE_TTL = 10
+# 0 — преміум безстроковий (PREMIUM_DURATION_DAYS задає строк підписки)
+DEFAULT_PREMIUM_DAYS = 0
+_MAX_CACHED_USERS = 10000
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def product_feature(product_id):
+    return f'product:{product_id}'
+
+
+def is_premium_product(product_type, slug, name=None):
+    name = (name or '').lower()
+    return (product_type == 'subscription' or 'premium' in (slug or '').lower()
+            or 'premium' in name or 'преміум' in name)
+
+
+def invalidate(user_id=None):
+    """Скидає кеш прав одного користувача (або всіх)."""
+    with _cache_lock:
+        if user_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(user_id, None)
+
+
+def _load(user_id, now):
+    rows = (db.session.query(Entitlement.feature, Entitlement.expires_at)
+            .filter(Entitlement.user_id == user_id)
+            .all())
+    active = frozenset(f for f, exp in rows if exp is None or exp > now)
+    # Набір стає застарілим, щойно спливає найближчий термін дії
+    upcoming = [exp for f, exp in rows if exp is not None and exp > now]
+    next_expiry = min(upcoming) if upcoming else None
+    return active, next_expiry
+
+
+def get_entitlements(user_id):
+    """Повертає frozenset активних feature-ключів користувача (з кешу)."""
+    if not user_id:
+        return frozenset()
+    now = datetime.utcnow()
+    mono = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(user_id)
+    if cached is not None:
+        features, valid_until, next_expiry = cached
+        if mono < valid_until and (next_expiry is None or now < next_expiry):
+            return features
+
+    features, next_expiry = _load(user_id, now)
+    ttl = current_app.config.get('ENTITLEMENT_CACHE_TTL', DEFAULT_CACHE_TTL)
+    with _cache_lock:
+        if len(_cache) >= _MAX_CACHED_USERS:
+            _cache.clear()
+        _cache[user_id] = (features, mono + ttl, next_expiry)
+    return features
+
+
+def has_entitlement(user_id, feature):
+    return feature in get_entitlements(user_id)
+
+
+def has_premium(user_id):
+    return has_entitlement(user_id, PREMIUM)
+
+
+def grant(user_id, feature, product_id=None, payment_id=None, expires_at=None):
+    """Видає (або продовжує) право. Коміт робить викликач."""
+    ent = Entitlement.query.filter_by(user_id=user_id, feature=feature).first()
+    if ent is None:
+        ent = Entitlement(user_id=user_id, feature=feature, product_id=product_id,
+                          payment_id=payment_id, expires_at=expires_at)
+        db.session.add(ent)
+    else:
+        now = datetime.utcnow()
+        if expires_at is None:
+            ent.expires_at = None
+        elif ent.expires_at is not None:
+            if ent.expires_at > now:
+                # Ще активне — продовжуємо на той самий строк від поточного кінця
+                ent.expires_at = ent.expires_at + (expires_at - now)
+            else:
+                ent.expires_at = expires_at
+        ent.payment_id = payment_id or ent.payment_id
+    invalidate(user_id)
+    return ent
+
+
+def revoke(user_id, feature):
+    """Відкликає право. Коміт робить викликач."""
+    Entitlement.query.filter_by(user_id=user_id, feature=feature).delete(synchronize_session=False)
+    invalidate(user_id)
+
+
+def grant_premium(user, payment_id=None, days=None):
+    """Видає преміум і синхронізує поля users.is_premium / premium_*_at."""
+    if days is None:
+        days = current_app.config.get('PREMIUM_DURATION_DAYS', DEFAULT_PREMIUM_DAYS)
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=days) if days else None
+    ent = grant(user.id, PREMIUM, payment_id=payment_id, expires_at=expires_at)
+    user.is_premium = True
+    if not user.premium_started_at:
+        user.premium_started_at = now
+    user.premium_expires_at = ent.expires_at
+    return ent
+
+
+def revoke_premium(user):
+    revoke(user.id, PREMIUM)
+    user.is_premium = False
+    user.premium_expires_at = None
+
+
+def grant_for_order(order, payment_id=None):
+    """Видає права за всі продукти замовлення.
+
+    Повертає True, якщо замовлення містить преміум — воно цифрове і одразу
+    завершується; решта замовлень лишається в обробці, як і раніше.
+    Продукти вибираються одним JOIN-запитом замість ліниво завантажуваного
+    item.product для кожного рядка.
+    """
+    lines = (db.session.query(Product.id, Product.type, Product.slug, Product.name)
+             .join(OrderItem, OrderItem.product_id == Product.id)
+             .filter(OrderItem.order_id == order.id)
+             .all())
+    premium = False
+    for product_id, product_type, slug, name in lines:
+        if is_premium_product(product_type, slug, name):
+            premium = True
+        else:
+            grant(order.user_id, product_feature(product_id), product_id=product_id, payment_id=payment_id)
+
+    if premium:
+        user = db.session.get(User, order.user_id)
+        if user:
+            grant_premium(user, payment_id=payment_id)
+            logging.info(f"Premium активовано для користувача {user.email}")
+    return premium
+
+
+def backfill_premium():
+    """Створює записи 'premium' для користувачів, у яких is_premium=True без права в індексі."""
+    has_row = (db.session.query(Entitlement.id)
+               .filter(Entitlement.user_id == User.id, Entitlement.feature == PREMIUM)
+               .exists())
+    users = User.query.filter(User.is_premium.is_(True), ~has_row).all()
+    for user in users:
+        db.session.add(Entitlement(user_id=user.id, feature=PREMIUM,
+                                   granted_at=user.premium_started_at or datetime.utcnow(),
+                                   expires_at=user.premium_expires_at))
+    if users:
+        db.session.commit()
+        logging.info("Створено %s записів premium в індексі прав", len(users))
+    return len(users)
+
+
+def sweep_expired(batch_size=500):
+    """Знімає прострочений преміум і видаляє прострочені права пачками.
+
+    Повертає {'users': ..., 'entitlements': ...} — скільки оброблено.
+    """
+    now = datetime.utcnow()
+    swept_users = 0
+    while True:
+        users = (User.query
+                 .filter(User.is_premium.is_(True),
+                         User.premium_expires_at.isnot(None),
+                         User.premium_expires_at < now)
+                 .limit(batch_size)
+                 .all())
+        if not users:
+            break
+        for user in users:
+            user.is_premium = False
+            invalidate(user.id)
+        db.session.commit()
+        swept_users += len(users)
+
+    removed = 0
+    while True:
+        rows = (db.session.query(Entitlement.id, Entitlement.user_id)
+                .filter(Entitlement.expires_at.isnot(None), Entitlement.expires_at < now)
+                .limit(batch_size)
+                .all())
+        if not rows:
+            break
+        Entitlement.query.filter(Entitlement.id.in_([r.id for r in rows])).delete(synchronize_session=False)
+        db.session.commit()
+        for r in rows:
+            invalidate(r.user_id)
+        removed += len(rows)
+
+    if swept_users or removed:
+        logging.info("Прострочені права: знято преміум у %s користувачів, видалено %s записів",
+                     swept_users, removed)
+    return {'users': swept_users, 'entitlements': removed}
@@ -0,0 +1,68 @@
+"""
+Конфігурація gunicorn для production (див. server_profile.py).
+
+    gunicorn -c gunicorn.conf.py
+
+Воркери/потоки рахуються з CPU та DATABASE_URL; перевизначення — через
+WEB_CONCURRENCY, GUNICORN_THREADS, GUNICORN_WORKER_CLASS тощо.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import memory_monitor
+import server_profile
+
+_mode = server_profile.server_mode()
+_profile = server_profile.recommended(mode=_mode)
+_recycling = server_profile.recycling()
+
+# SERVER_MODE=asgi — той самий додаток за uvicorn-воркерами (asgi.py)
+wsgi_app = 'asgi:create_asgi_app()' if _mode == 'asgi' else 'app:create_app()'
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+workers = _profile['workers']
+threads = _profile['threads']
+worker_class = _profile['worker_class']
+
+# Додаток імпортується в master один раз — воркери ділять сторінки пам'яті (copy-on-write)
+preload_app = True
+
+# Перезапуск воркера після N запитів; jitter — щоб воркери не рестартували одночасно
+max_requests = _recycling['max_requests']
+max_requests_jitter = _recycling['max_requests_jitter']
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Heartbeat-файли воркерів у пам'яті, а не на диску контейнера
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# Порожнє значення вимикає access-лог
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-') or None
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def on_starting(server):
+    server.log.info(
+        "Профіль: mode=%s backend=%s cpu=%s workers=%s threads=%s class=%s max_requests=%s±%s",
+        _mode, server_profile.database_backend(), server_profile.cpu_count(),
+        workers, threads, worker_class, max_requests, max_requests_jitter)
+
+
+def pre_fork(server, worker):
+    # Об'єкти, створені при preload, не скануються GC воркерів — сторінки не копіюються
+    server_profile.freeze_heap()
+
+
+def post_fork(server, worker):
+    # Без preload додаток ще не завантажений — успадкованих з'єднань немає
+    if server.cfg.preload_app:
+        server_profile.dispose_engines(server.app.wsgi())
+    # MEMORY_MAX_RSS_MB: воркер понад бюджет завершується сам (SIGTERM — м'яке завершення)
+    memory_monitor.enable_recycling()
@@ -0,0 +1,206 @@
+"""
+Проби liveness / readiness для оркестратора (Docker HEALTHCHECK, Kubernetes).
+
+- GET /health/live (і /health для сумісності) — процес живий і обробляє
+  запити; жодного I/O, тож повільна БД не призводить до перезапуску воркера.
+- GET /health/ready — результат перевірок з кешу, який фоновий потік
+  воркера оновлює кожні HEALTH_CHECK_INTERVAL секунд:
+  - database — db_pool.readiness(): пул primary не вичерпано і SELECT 1 проходить;
+  - session — каталог Flask-Session доступний на запис (файл-проба);
+  - schema — усі таблиці та колонки моделей є в БД (інакше не виконано
+    scripts/init_db.py); після першого успіху не повторюється — код
+    процесу, а з ним і очікувана схема, не змінюється;
+  - warmup — create_app() завершено (логування, схема, прогрів шаблонів).
+  Проба лише читає готовий результат (мікросекунди) і не створює навантаження
+  на БД, хоч як часто її викликають. Потік стартує на першій пробі в процесі
+  (після fork gunicorn — окремо у кожному воркері); перша проба виконує
+  перевірки синхронно. Результат, старший за HEALTH_MAX_AGE (потік завис на
+  недоступній БД), — 503.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from flask import current_app
+
+import db_pool
+import metrics
+import schema_bootstrap
+
+DEFAULT_CHECK_INTERVAL = 5.0
+# Результат вважається застарілим після стількох інтервалів без оновлення
+STALE_INTERVALS = 3
+
+CHECKS = ('database', 'session', 'schema', 'warmup')
+
+
+class HealthMonitor:
+    """Кешований результат перевірок готовності та фоновий потік, що його оновлює."""
+
+    def __init__(self, app, db):
+        self.app = app
+        self.db = db
+        self.interval = max(app.config.get('HEALTH_CHECK_INTERVAL', DEFAULT_CHECK_INTERVAL), 0.1)
+        self.max_age = app.config.get('HEALTH_MAX_AGE') or self.interval * STALE_INTERVALS
+        self.require_warmup = app.config.get('HEALTH_REQUIRE_WARMUP', True)
+        self.warm = False
+        self.refreshes = 0
+        self._schema_ok = False
+        self._result = None
+        self._pid = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    # -------------------- Перевірки --------------------
+
+    def check_database(self):
+        ok, engines = db_pool.readiness(self.db)
+        return {'ok': ok, 'engines': engines}
+
+    def check_session(self):
+        config = self.app.config
+        session_type = config.get('SESSION_TYPE')
+        if session_type != 'filesystem':
+            return {'ok': True, 'type': session_type}
+        directory = config.get('SESSION_FILE_DIR')
+        probe = os.path.join(directory, f'.health-{os.getpid()}-{uuid.uuid4().hex[:8]}')
+        try:
+            with open(probe, 'w') as fh:
+                fh.write('ok')
+            os.remove(probe)
+        except OSError as e:
+            return {'ok': False, 'type': session_type, 'error': str(e)}
+        return {'ok': True, 'type': session_type}
+
+    def check_schema(self):
+        if self._schema_ok:
+            return {'ok': True, 'pending': []}
+        missing = schema_bootstrap.pending()
+        self._schema_ok = not missing
+        return {'ok': not missing, 'pending': missing}
+
+    def check_warmup(self):
+        return {'ok': self.warm or not self.require_warmup, 'warm': self.warm}
+
+    def run_checks(self):
+        """Виконує всі перевірки; помилка однієї — її ok=False, а не 500."""
+        checks = {}
+        with self.app.app_context():
+            for name in CHECKS:
+                started = time.perf_counter()
+                try:
+                    check = getattr(self, f'check_{name}')()
+                except Exception as e:
+                    logging.warning("Readiness: перевірка %s не вдалася: %s", name, e)
+                    check = {'ok': False, 'error': str(e)}
+                check['duration_ms'] = round((time.perf_counter() - started) * 1000, 2)
+                checks[name] = check
+        return checks
+
+    def refresh(self):
+        checks = self.run_checks()
+        ready = all(check['ok'] for check in checks.values())
+        previous = self._result
+        if previous is not None and previous['ready'] != ready:
+            failed = [name for name, check in checks.items() if not check['ok']]
+            logging.warning("Readiness: %s%s", 'готовий' if ready else 'не готовий',
+                            '' if ready else f" ({', '.join(failed)})")
+        self._result = {'ready': ready, 'checks': checks, 'monotonic': time.monotonic(),
+                        'checked_at': datetime.utcnow().isoformat() + 'Z'}
+        self.refreshes += 1
+        return self._result
+
+    # -------------------- Фоновий потік --------------------
+
+    def _run(self, stop):
+        while not stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                # Потік не має завершитися: без оновлень результат застаріє і проба дасть 503
+                logging.exception("Readiness: помилка оновлення перевірок")
+
+    def start(self):
+        """Запускає потік оновлення в цьому процесі (повторний виклик — без змін)."""
+        with self._lock:
+            pid = os.getpid()
+            if self._pid == pid and self._thread is not None and self._thread.is_alive():
+                return
+            if self._pid != pid:
+                # Результат, успадкований від master при fork, належить іншому процесу
+                self._result = None
+            self._pid = pid
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop,),
+                                            name='health-checks', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.interval)
+        self._thread = None
+
+    def reset(self):
+        """Скидає кеш (тести, зміна конфігурації): наступна проба перевіряє синхронно."""
+        self.stop()
+        self._result = None
+        self._schema_ok = False
+
+    # -------------------- Проби --------------------
+
+    def readiness(self):
+        """(ready, відповідь) з кешу; перша проба в процесі перевіряє синхронно."""
+        self.start()
+        result = self._result
+        if result is None:
+            with self._lock:
+                result = self._result or self.refresh()
+        age = time.monotonic() - result['monotonic']
+        ready = result['ready'] and age <= self.max_age
+        payload = {
+            'status': 'ok' if ready else 'unavailable',
+            'checked_at': result['checked_at'],
+            'age_seconds': round(age, 3),
+            'checks': result['checks'],
+        }
+        if age > self.max_age:
+            payload['error'] = 'Результат перевірок застарів'
+        return ready, payload
+
+
+def get_monitor(app=None):
+    app = app or current_app
+    return app.extensions.get('health')
+
+
+def mark_warm(app):
+    """Позначає завершення create_app(): з цього моменту воркер готовий за warmup."""
+    monitor = get_monitor(app)
+    if monitor is not None:
+        monitor.warm = True
+
+
+def collect(app):
+    """Метрики для /metrics: останній результат перевірок готовності."""
+    monitor = get_monitor(app)
+    result = monitor._result if monitor is not None else None
+    if result is None:
+        return
+    yield ('health_check_ok', 'gauge', 'Перевірка готовності пройшла (останній результат з кешу)',
+           [({'check': name}, check['ok']) for name, check in result['checks'].items()])
+    yield ('health_check_age_seconds', 'gauge', 'Вік кешованого результату перевірок',
+           [({}, round(time.monotonic() - result['monotonic'], 3))])
+    yield ('health_check_refreshes_total', 'counter', 'Оновлення результату перевірок у воркері',
+           [({}, monitor.refreshes)])
+
+
+def init_app(app, db):
+    app.extensions['health'] = HealthMonitor(app, db)
+    metrics.register(collect)
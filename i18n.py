@@ -0,0 +1,102 @@
+"""
+Каталоги перекладів інтерфейсу: по одному JSON на мову (static/i18n/<lang>.json).
+
+Раніше base.html підключав обидві мови та весь корпус цитат як JS (~200 KB
+до першого рендеру). Тепер:
+- сторінка синхронно завантажує лише активну мову через
+  GET /i18n/<lang>.js?v=<hash> — той самий JSON, обгорнутий у присвоєння
+  window.translations_<lang> (щоб існуючі скрипти читали переклади як раніше);
+- при перемиканні мови i18n_fixed.js довантажує JSON іншої мови
+  (/static/i18n/<lang>.json?v=<hash>) через fetch.
+
+Обидва URL мають відбиток вмісту з маніфесту статики і кешуються як immutable.
+Скрипт-обгортка збирається в пам'яті один раз на версію каталогу.
+"""
+
+import gzip
+import json
+import os
+
+from flask import Response, abort, current_app, request
+
+from assets import asset
+
+SUPPORTED_LANGUAGES = ('uk', 'en')
+CATALOG_DIR = 'i18n'
+IMMUTABLE_MAX_AGE = 31536000
+
+# (lang, version) -> (js bytes, gzip bytes)
+_scripts = {}
+
+
+def catalog_name(lang):
+    return f'{CATALOG_DIR}/{lang}.json'
+
+
+def catalog_version(lang):
+    return current_app.extensions['assets'].hashes.get(catalog_name(lang), '')
+
+
+def catalog_urls():
+    """{мова: URL JSON-каталогу з відбитком} для довантаження при зміні мови."""
+    return {lang: asset(catalog_name(lang)) for lang in SUPPORTED_LANGUAGES}
+
+
+def script_urls():
+    """{мова: URL скрипта-обгортки} для синхронного завантаження активної мови."""
+    return {lang: f'/i18n/{lang}.js?v={catalog_version(lang)}' for lang in SUPPORTED_LANGUAGES}
+
+
+def load_catalog(lang):
+    path = os.path.join(current_app.static_folder, catalog_name(lang))
+    with open(path, encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def _build_script(lang):
+    catalog = json.dumps(load_catalog(lang), ensure_ascii=False, separators=(',', ':'))
+    # Object.assign — щоб посилання на вже створений об'єкт (window.translations_xx) лишались дійсними
+    body = (f'window.translations_{lang}=Object.assign(window.translations_{lang}||{{}},{catalog});\n')
+    data = body.encode('utf-8')
+    return data, gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def catalog_script(lang):
+    """GET /i18n/<lang>.js — каталог активної мови як синхронний скрипт."""
+    if lang not in SUPPORTED_LANGUAGES:
+        abort(404)
+    version = catalog_version(lang)
+    if current_app.extensions['assets'].auto_reload:
+        # У dev відбиток оновлюється за mtime — перераховуємо через asset()
+        asset(catalog_name(lang))
+        version = catalog_version(lang)
+    key = (lang, version)
+    cached = _scripts.get(key)
+    if cached is None:
+        cached = _scripts[key] = _build_script(lang)
+    data, gz = cached
+
+    etag = f'{lang}-{version}'
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    elif request.accept_encodings['gzip']:
+        response = Response(gz, mimetype='text/javascript')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(data, mimetype='text/javascript')
+    response.set_etag(etag)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    if request.args.get('v') == version:
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.max_age = 0
+        response.cache_control.must_revalidate = True
+    return response
+
+
+def init_app(app):
+    app.add_url_rule('/i18n/<lang>.js', 'i18n_catalog_script', catalog_script)
+    app.add_template_global(catalog_urls, 'i18n_catalog_urls')
+    app.add_template_global(script_urls, 'i18n_script_urls')
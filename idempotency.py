@@ -0,0 +1,228 @@
+"""
+Підтримка заголовка Idempotency-Key для POST-ендпоінтів створення
+замовлень і платежів.
+
+Мобільні клієнти повторюють запити при нестабільній мережі. Декоратор
+@idempotent зберігає першу відповідь у таблиці idempotency_keys (з TTL)
+і, за наявності Redis, у швидкому кеші. Повторний запит з тим самим ключем
+отримує збережену відповідь без звернення до таблиць замовлень/продуктів.
+
+Конкурентні дублікати: перший запит вставляє рядок зі статусом in_flight;
+решта чекають на його завершення (в межах процесу — на threading.Event,
+між процесами — опитуванням БД) і віддають ту саму відповідь.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import wraps
+
+from flask import current_app, jsonify, make_response, request, session
+from sqlalchemy.exc import IntegrityError
+
+from models import db, IdempotencyRecord
+
+try:
+    import redis as _redis
+except ImportError:  # Redis — опційний рівень
+    _redis = None
+
+HEADER = 'Idempotency-Key'
+DEFAULT_TTL = 24 * 3600
+# Скільки чекати завершення конкурентного запиту з тим самим ключем
+WAIT_TIMEOUT = 10.0
+MAX_KEY_LENGTH = 255
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+_redis_client = None
+_redis_checked = False
+
+
+def _get_redis():
+    """Ледачо створює клієнт Redis, якщо задано IDEMPOTENCY_REDIS_URL/REDIS_URL."""
+    global _redis_client, _redis_checked
+    if _redis_checked:
+        return _redis_client
+    _redis_checked = True
+    url = current_app.config.get('IDEMPOTENCY_REDIS_URL') or os.environ.get('REDIS_URL')
+    if url and _redis is not None:
+        try:
+            _redis_client = _redis.Redis.from_url(url, socket_timeout=0.2)
+        except Exception as exc:
+            logging.warning("Idempotency: Redis недоступний (%s), використовуємо лише БД", exc)
+    return _redis_client
+
+
+def _redis_get(scope):
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.hgetall(f'idem:{scope}')
+    except Exception:
+        return None
+    if not raw:
+        return None
+    return {k.decode(): v.decode() for k, v in raw.items()}
+
+
+def _redis_put(scope, record, ttl):
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        key = f'idem:{scope}'
+        pipe = client.pipeline()
+        pipe.hset(key, mapping={
+            'request_hash': record.request_hash,
+            'response_code': record.response_code,
+            'response_body': record.response_body or '',
+            'content_type': record.content_type or 'application/json'
+        })
+        pipe.expire(key, ttl)
+        pipe.execute()
+    except Exception:
+        logging.debug("Idempotency: не вдалося записати у Redis", exc_info=True)
+
+
+def _replay(code, body, content_type):
+    response = make_response(body, int(code))
+    response.headers['Content-Type'] = content_type or 'application/json'
+    response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def _mismatch():
+    return jsonify({
+        'status': 'error',
+        'message': 'Idempotency-Key вже використано з іншим тілом запиту',
+        'code': 'IDEMPOTENCY_KEY_REUSED'
+    }), 422
+
+
+def _wait_for_completion(scope, event):
+    """Чекає, поки інший запит з тим самим ключем завершиться, і повертає запис."""
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    if event is not None:
+        event.wait(WAIT_TIMEOUT)
+    delay = 0.05
+    while True:
+        db.session.expire_all()
+        record = IdempotencyRecord.query.filter_by(scope=scope).first()
+        if record is None or record.status == 'completed':
+            return record
+        if time.monotonic() >= deadline:
+            return record
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+
+def purge_expired(batch_size=1000):
+    """Видаляє прострочені ключі пачками. Повертає кількість видалених рядків."""
+    total = 0
+    while True:
+        ids = [row.id for row in db.session.query(IdempotencyRecord.id)
+               .filter(IdempotencyRecord.expires_at < datetime.utcnow())
+               .limit(batch_size)]
+        if not ids:
+            return total
+        IdempotencyRecord.query.filter(IdempotencyRecord.id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+        total += len(ids)
+
+
+def idempotent(ttl=None):
+    """Декоратор: робить POST-ендпоінт ідемпотентним за заголовком Idempotency-Key.
+
+    Запити без заголовка обробляються як раніше.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            key = (request.headers.get(HEADER) or '').strip()
+            if not key:
+                return f(*args, **kwargs)
+            if len(key) > MAX_KEY_LENGTH:
+                return jsonify({'status': 'error', 'message': 'Idempotency-Key задовгий'}), 400
+
+            scope = f"{session.get('user_id')}:{request.method}:{request.path}:{key}"
+            request_hash = hashlib.sha256(request.get_data()).hexdigest()
+            lifetime = ttl or current_app.config.get('IDEMPOTENCY_TTL', DEFAULT_TTL)
+
+            # 1. Швидкий шлях: Redis
+            cached = _redis_get(scope)
+            if cached:
+                if cached.get('request_hash') != request_hash:
+                    return _mismatch()
+                return _replay(cached['response_code'], cached['response_body'], cached['content_type'])
+
+            # 2. Реєструємо себе як "власника" ключа або знаходимо існуючий запис
+            now = datetime.utcnow()
+            record = IdempotencyRecord(scope=scope, request_hash=request_hash, status='in_flight',
+                                       expires_at=now + timedelta(seconds=lifetime))
+            db.session.add(record)
+            try:
+                db.session.commit()
+                owner = True
+            except IntegrityError:
+                db.session.rollback()
+                owner = False
+
+            if not owner:
+                existing = IdempotencyRecord.query.filter_by(scope=scope).first()
+                if existing is not None and existing.expires_at < now:
+                    # Ключ прострочений — звільняємо його та обробляємо запит як новий
+                    db.session.delete(existing)
+                    db.session.commit()
+                    return decorated_function(*args, **kwargs)
+                if existing is not None and existing.status == 'in_flight':
+                    with _inflight_lock:
+                        event = _inflight.get(scope)
+                    existing = _wait_for_completion(scope, event)
+                if existing is None:
+                    return decorated_function(*args, **kwargs)
+                if existing.request_hash != request_hash:
+                    return _mismatch()
+                if existing.status != 'completed':
+                    return jsonify({
+                        'status': 'error',
+                        'message': 'Запит з цим Idempotency-Key ще обробляється',
+                        'code': 'IDEMPOTENCY_IN_PROGRESS'
+                    }), 409
+                return _replay(existing.response_code, existing.response_body, existing.content_type)
+
+            event = threading.Event()
+            with _inflight_lock:
+                _inflight[scope] = event
+            record_id = record.id
+            try:
+                response = make_response(f(*args, **kwargs))
+                record = db.session.get(IdempotencyRecord, record_id)
+                if response.status_code >= 500 or record is None:
+                    # Серверні помилки не запам'ятовуємо — клієнт може повторити
+                    if record is not None:
+                        db.session.delete(record)
+                        db.session.commit()
+                    return response
+                record.status = 'completed'
+                record.response_code = response.status_code
+                record.response_body = response.get_data(as_text=True)
+                record.content_type = response.headers.get('Content-Type')
+                db.session.commit()
+                _redis_put(scope, record, lifetime)
+                return response
+            except Exception:
+                db.session.rollback()
+                IdempotencyRecord.query.filter_by(id=record_id).delete(synchronize_session=False)
+                db.session.commit()
+                raise
+            finally:
+                event.set()
+                with _inflight_lock:
+                    _inflight.pop(scope, None)
+        return decorated_function
+    return decorator
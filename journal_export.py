@@ -0,0 +1,116 @@
+"""
+Потоковий експорт щоденника (CSV / JSON).
+
+Раніше GET /api/journal/export завантажував усі записи одним .all() і
+збирав увесь файл у пам'яті. Тепер записи читаються сторінками по
+JOURNAL_EXPORT_PAGE_SIZE (keyset за (date, id) — без OFFSET), а кожна
+сторінка одразу кодується у шматок відповіді. Функції без стану між
+сторінками (курсор передається явно), тож ними користуються і
+WSGI-view (генератор), і нативний async-обробник у asgi.py (кожна
+сторінка — окремий виклик у пулі потоків).
+"""
+
+import csv
+import io
+import json
+
+from models import db, MoodEntry
+
+DEFAULT_PAGE_SIZE = 500
+CSV_HEADER = ['id', 'date', 'mood', 'title', 'activities', 'content']
+CSV_MIMETYPE = 'text/csv; charset=utf-8'
+JSON_MIMETYPE = 'application/json'
+FORMATS = ('csv', 'json')
+
+
+def export_format(value):
+    fmt = (value or 'csv').strip().lower()
+    return fmt if fmt in FORMATS else 'csv'
+
+
+def mimetype(fmt):
+    return JSON_MIMETYPE if fmt == 'json' else CSV_MIMETYPE
+
+
+def headers(fmt):
+    if fmt == 'json':
+        return {}
+    return {'Content-Disposition': 'attachment; filename="journal_export.csv"'}
+
+
+def fetch_page(user_id, after=None, limit=DEFAULT_PAGE_SIZE):
+    """Сторінка записів після курсора (date, id). Повертає (записи, наступний курсор або None)."""
+    query = MoodEntry.query.filter_by(user_id=user_id)
+    if after is not None:
+        after_date, after_id = after
+        query = query.filter(db.or_(
+            MoodEntry.date > after_date,
+            db.and_(MoodEntry.date == after_date, MoodEntry.id > after_id),
+        ))
+    entries = query.order_by(MoodEntry.date.asc(), MoodEntry.id.asc()).limit(limit).all()
+    if len(entries) < limit:
+        return entries, None
+    last = entries[-1]
+    return entries, (last.date, last.id)
+
+
+def count(user_id):
+    return MoodEntry.query.filter_by(user_id=user_id).count()
+
+
+def csv_row(entry):
+    return [
+        entry.id,
+        entry.date.isoformat(),
+        entry.mood,
+        entry.title or '',
+        (entry.activities or ''),
+        (entry.content or '').replace('\n', ' ').strip()
+    ]
+
+
+def encode_csv(rows):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+def head(fmt, total=None):
+    if fmt == 'json':
+        return f'{{"status":"success","count":{int(total or 0)},"data":['
+    return encode_csv([CSV_HEADER])
+
+
+def tail(fmt):
+    return ']}' if fmt == 'json' else ''
+
+
+def encode_page(fmt, entries, first):
+    """Шматок відповіді для сторінки; first — чи це перша сторінка (без коми в JSON)."""
+    if not entries:
+        return ''
+    if fmt == 'json':
+        chunk = ','.join(json.dumps(e.to_dict(), ensure_ascii=False) for e in entries)
+        return chunk if first else ',' + chunk
+    return encode_csv(csv_row(e) for e in entries)
+
+
+def render_page(user_id, fmt, after=None, first=True, limit=DEFAULT_PAGE_SIZE):
+    """Одна сторінка у вигляді тексту. Повертає (шматок, наступний курсор)."""
+    entries, cursor = fetch_page(user_id, after, limit)
+    return encode_page(fmt, entries, first), cursor
+
+
+def stream(user_id, fmt, limit=DEFAULT_PAGE_SIZE):
+    """Генератор шматків повного експорту (потребує контексту додатку)."""
+    yield head(fmt, count(user_id) if fmt == 'json' else None)
+    cursor, first = None, True
+    while True:
+        chunk, cursor = render_page(user_id, fmt, cursor, first, limit)
+        if chunk:
+            yield chunk
+            first = False
+        if cursor is None:
+            break
+    yield tail(fmt)
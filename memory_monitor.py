@@ -0,0 +1,342 @@
+"""
+Пам'ять воркера: історія RSS, бюджет з перезапуском та tracemalloc (для адміністраторів).
+
+Воркери gunicorn живуть довго, а окремі шляхи будують великі тимчасові
+структури (повний експорт щоденника, річна теплокарта, звички з
+joined-завантаженими виконаннями). Модуль дає три інструменти:
+- історія RSS воркера: не частіше ніж раз на MEMORY_SAMPLE_INTERVAL секунд
+  after_request читає /proc/self/statm (в інших запитах — одне порівняння
+  часу); останні MEMORY_HISTORY_SIZE точок — у GET /api/admin/memory;
+- бюджет MEMORY_MAX_RSS_MB: якщо RSS його перевищує, воркер завершується
+  після відправки поточної відповіді (SIGTERM самому собі — у gunicorn це
+  звичайне м'яке завершення, master запускає новий воркер). Перезапуск
+  вмикає лише gunicorn.conf.py (post_fork) — під dev-сервером лише WARNING;
+- tracemalloc на вимогу: запуск / зупинка, знімки, топ місць алокації за
+  модулем / файлом / рядком / стеком і різниця між двома знімками.
+  tracemalloc сповільнює алокації в рази — вмикати лише на час
+  розслідування.
+
+Усе — на процес: tracemalloc і знімки живуть у пам'яті одного воркера
+gunicorn, і балансувальник може віддати наступний запит іншому. Тому id
+знімка має вигляд "<pid>-<n>", а API повертає 409 з pid обох воркерів, якщо
+запит дійшов не туди (див. app.py, /api/admin/memory/*); клієнт повторює
+запит, доки не потрапить у потрібний воркер, або розслідування ведеться з
+одним воркером.
+"""
+
+import gc
+import itertools
+import logging
+import os
+import signal
+import sysconfig
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict, deque
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import metrics
+
+DEFAULT_SAMPLE_INTERVAL = 10.0
+DEFAULT_HISTORY_SIZE = 360
+DEFAULT_MAX_SNAPSHOTS = 4
+DEFAULT_FRAMES = 1
+MAX_FRAMES = 50
+GROUP_BY = ('module', 'filename', 'lineno', 'traceback')
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_STDLIB = os.path.normpath(sysconfig.get_paths()['stdlib'])
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+# Встановлюється gunicorn.conf.py у воркері (enable_recycling)
+_recycler = None
+
+
+def snapshot_pid(snapshot_id):
+    """pid воркера з id знімка ("<pid>-<n>") або None, якщо id некоректний."""
+    pid, sep, number = str(snapshot_id).partition('-')
+    if not sep or not pid.isdigit() or not number.isdigit():
+        return None
+    return int(pid)
+
+
+def current_rss():
+    """Поточний RSS процесу в байтах (Linux) або пікове значення, якщо /proc немає."""
+    try:
+        with open('/proc/self/statm', 'rb') as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return peak_rss()
+
+
+def peak_rss():
+    if resource is None:
+        return None
+    # ru_maxrss: кілобайти в Linux, байти в macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == 'Darwin' else peak * 1024
+
+
+def _terminate_self():
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def enable_recycling(callback=None):
+    """Дозволяє перезапуск воркера при перевищенні бюджету (викликати в post_fork)."""
+    global _recycler
+    _recycler = callback or _terminate_self
+
+
+def module_name(filename, root):
+    """Модуль для файлу: app-модулі відносно root, пакети — за верхнім рівнем."""
+    path = os.path.normpath(filename)
+    # site-packages першими: віртуальне оточення може лежати всередині root
+    parts = path.split(os.sep)
+    for marker in ('site-packages', 'dist-packages'):
+        if marker in parts:
+            index = parts.index(marker)
+            if index + 1 < len(parts):
+                return parts[index + 1].split('.')[0]
+    if path.startswith(root + os.sep):
+        relative = os.path.relpath(path, root)
+        if relative.endswith('.py'):
+            relative = relative[:-3]
+        return relative.replace(os.sep, '.')
+    if path.startswith(_STDLIB + os.sep):
+        return 'stdlib.' + os.path.relpath(path, _STDLIB).split(os.sep)[0].split('.')[0]
+    return filename
+
+
+class MemoryMonitor:
+    """Історія RSS, бюджет і знімки tracemalloc поточного воркера."""
+
+    def __init__(self, app):
+        self.enabled = app.config.get('MEMORY_MONITOR_ENABLED', True)
+        self.interval = app.config.get('MEMORY_SAMPLE_INTERVAL', DEFAULT_SAMPLE_INTERVAL)
+        self.max_rss_bytes = int((app.config.get('MEMORY_MAX_RSS_MB') or 0) * 1024 * 1024)
+        self.max_snapshots = app.config.get('MEMORY_MAX_SNAPSHOTS', DEFAULT_MAX_SNAPSHOTS)
+        self.root = os.path.normpath(app.root_path)
+        self.history = deque(maxlen=app.config.get('MEMORY_HISTORY_SIZE', DEFAULT_HISTORY_SIZE))
+        self.pid = os.getpid()
+        self.started = time.time()
+        self.requests = 0
+        self.recycling = False
+        self._next_sample = 0.0
+        self._snapshots = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _check_fork(self):
+        # Після fork воркер успадковує історію master-а — починаємо спочатку
+        pid = os.getpid()
+        if pid != self.pid:
+            self.pid = pid
+            self.started = time.time()
+            self.requests = 0
+            self.recycling = False
+            self.history.clear()
+            self._snapshots.clear()
+
+    def sample(self):
+        """Знімає RSS і додає точку до історії."""
+        with self._lock:
+            self._check_fork()
+            point = {
+                'time': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+                'rss_bytes': current_rss(),
+                'requests': self.requests,
+            }
+            self.history.append(point)
+        return point
+
+    def over_budget(self, rss):
+        return bool(self.max_rss_bytes) and rss is not None and rss > self.max_rss_bytes
+
+    def after_request(self, response):
+        self.requests += 1
+        now = time.monotonic()
+        if now < self._next_sample:
+            return response
+        self._next_sample = now + self.interval
+        rss = self.sample()['rss_bytes']
+        if self.over_budget(rss) and not self.recycling:
+            self.recycling = True
+            if _recycler is None:
+                logging.warning("RSS воркера %s: %.1f MB понад бюджет %.1f MB (перезапуск лише під gunicorn)",
+                                self.pid, rss / 2**20, self.max_rss_bytes / 2**20)
+            else:
+                logging.warning("RSS воркера %s: %.1f MB понад бюджет %.1f MB — перезапуск після відповіді",
+                                self.pid, rss / 2**20, self.max_rss_bytes / 2**20)
+                response.call_on_close(_recycler)
+        return response
+
+    # ---- tracemalloc ----
+
+    def start_tracing(self, frames=DEFAULT_FRAMES):
+        frames = max(1, min(int(frames), MAX_FRAMES))
+        if tracemalloc.is_tracing() and tracemalloc.get_traceback_limit() != frames:
+            tracemalloc.stop()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            logging.info("tracemalloc запущено у воркері %s (%s кадрів)", os.getpid(), frames)
+        return frames
+
+    def stop_tracing(self):
+        """Зупиняє tracemalloc; знімки лишаються доступними."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logging.info("tracemalloc зупинено у воркері %s", os.getpid())
+
+    def take_snapshot(self):
+        """Знімок tracemalloc ("<pid>-<n>") або None, якщо трасування не запущено."""
+        if not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        with self._lock:
+            self._check_fork()
+            snapshot_id = f'{self.pid}-{next(self._ids)}'
+            self._snapshots[snapshot_id] = {
+                'snapshot': snapshot,
+                'time': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+                'rss_bytes': current_rss(),
+                'requests': self.requests,
+            }
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snapshot_id
+
+    def clear_snapshots(self):
+        with self._lock:
+            self._snapshots.clear()
+
+    def snapshot_info(self, snapshot_id):
+        entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            return None
+        traces = entry['snapshot'].traces
+        return {
+            'id': snapshot_id,
+            'pid': snapshot_pid(snapshot_id),
+            'time': entry['time'],
+            'rss_bytes': entry['rss_bytes'],
+            'requests': entry['requests'],
+            'traced_bytes': sum(trace.size for trace in traces),
+            'traces': len(traces),
+        }
+
+    def list_snapshots(self):
+        return [self.snapshot_info(snapshot_id) for snapshot_id in list(self._snapshots)]
+
+    def _location(self, frame):
+        filename = frame.filename
+        if filename.startswith(self.root + os.sep):
+            filename = os.path.relpath(filename, self.root)
+        return f'{filename}:{frame.lineno}'
+
+    def _key(self, stat, group_by):
+        if group_by == 'traceback':
+            return [self._location(frame) for frame in stat.traceback]
+        if group_by == 'lineno':
+            return self._location(stat.traceback[0])
+        filename = stat.traceback[0].filename
+        if group_by == 'module':
+            return module_name(filename, self.root)
+        return os.path.relpath(filename, self.root) if filename.startswith(self.root + os.sep) else filename
+
+    def top(self, snapshot_id, group_by='module', limit=20):
+        """Топ місць алокації знімка за розміром."""
+        entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            return None
+        key_type = 'filename' if group_by == 'module' else group_by
+        rows = {}
+        for stat in entry['snapshot'].statistics(key_type):
+            key = self._key(stat, group_by)
+            row = rows.setdefault(str(key), {group_by: key, 'size_bytes': 0, 'count': 0})
+            row['size_bytes'] += stat.size
+            row['count'] += stat.count
+        return sorted(rows.values(), key=lambda row: row['size_bytes'], reverse=True)[:limit]
+
+    def diff(self, snapshot_id, base_id, group_by='module', limit=20):
+        """Різниця snapshot_id відносно base_id, найбільші зміни першими."""
+        entry = self._snapshots.get(snapshot_id)
+        base = self._snapshots.get(base_id)
+        if entry is None or base is None:
+            return None
+        key_type = 'filename' if group_by == 'module' else group_by
+        rows = {}
+        for stat in entry['snapshot'].compare_to(base['snapshot'], key_type):
+            key = self._key(stat, group_by)
+            row = rows.setdefault(str(key), {group_by: key, 'size_bytes': 0, 'size_diff_bytes': 0,
+                                             'count': 0, 'count_diff': 0})
+            row['size_bytes'] += stat.size
+            row['size_diff_bytes'] += stat.size_diff
+            row['count'] += stat.count
+            row['count_diff'] += stat.count_diff
+        changed = [row for row in rows.values() if row['size_diff_bytes'] or row['count_diff']]
+        return sorted(changed, key=lambda row: abs(row['size_diff_bytes']), reverse=True)[:limit]
+
+    def status(self):
+        """Поточний стан пам'яті воркера для адмін-API."""
+        self.sample()
+        tracing = tracemalloc.is_tracing()
+        traced, traced_peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        return {
+            'pid': self.pid,
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'requests': self.requests,
+            'rss_bytes': self.history[-1]['rss_bytes'],
+            'peak_rss_bytes': peak_rss(),
+            'max_rss_bytes': self.max_rss_bytes or None,
+            'recycling': self.recycling,
+            'recycle_enabled': _recycler is not None,
+            'sample_interval': self.interval,
+            'history': list(self.history),
+            'gc': {'counts': gc.get_count(), 'frozen': gc.get_freeze_count()},
+            'tracemalloc': {
+                'tracing': tracing,
+                'frames': tracemalloc.get_traceback_limit() if tracing else None,
+                'traced_bytes': traced,
+                'traced_peak_bytes': traced_peak,
+                'overhead_bytes': tracemalloc.get_tracemalloc_memory() if tracing else 0,
+            },
+            'snapshots': self.list_snapshots(),
+        }
+
+
+def get_monitor(app):
+    return app.extensions.get('memory_monitor')
+
+
+def collect(app):
+    """Метрики для /metrics: RSS воркера, бюджет і tracemalloc."""
+    monitor = get_monitor(app)
+    if monitor is None:
+        return
+    yield ('worker_rss_bytes', 'gauge', 'Resident set size воркера', [({}, current_rss() or 0)])
+    if monitor.max_rss_bytes:
+        yield ('worker_rss_budget_bytes', 'gauge', 'Бюджет RSS воркера (MEMORY_MAX_RSS_MB)',
+               [({}, monitor.max_rss_bytes)])
+    yield ('worker_recycle_pending', 'gauge', 'Воркер завершується через перевищення бюджету RSS',
+           [({}, monitor.recycling)])
+    if tracemalloc.is_tracing():
+        yield ('tracemalloc_traced_bytes', 'gauge', "Пам'ять, відстежувана tracemalloc",
+               [({}, tracemalloc.get_traced_memory()[0])])
+
+
+def init_app(app):
+    monitor = app.extensions['memory_monitor'] = MemoryMonitor(app)
+    if not monitor.enabled:
+        return
+    app.after_request(monitor.after_request)
+    metrics.register(collect)
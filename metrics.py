@@ -0,0 +1,88 @@
+"""
+Метрики процесу у текстовому форматі Prometheus (GET /metrics).
+
+Модулі реєструють колектори через register(): колектор — функція
+collector(app), що повертає ітерабельне метрик
+(name, type, help, [(labels, value), ...]). Значення збираються в момент
+запиту, тож між скрейпами немає жодних накладних витрат.
+
+Метрики — на процес: кожен воркер gunicorn віддає власні значення
+(мітка pid додається до всіх рядків). Потрібен заголовок
+Authorization: Bearer <METRICS_TOKEN>; без METRICS_TOKEN кожен запит
+отримує 401 — метрики (ендпоінти, відбитки SQL) не публічні за замовчуванням.
+Вимкнути маршрут повністю — METRICS_ENABLED=false.
+"""
+
+import hmac
+import os
+
+from flask import current_app, request
+
+import session_policy
+
+METRICS_PATH = '/metrics'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+PREFIX = 'dailymood_'
+
+_collectors = []
+
+
+def register(collector):
+    """Додає колектор; повторна реєстрація тієї ж функції ігнорується."""
+    if collector not in _collectors:
+        _collectors.append(collector)
+    return collector
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def render(app):
+    """Текст експозиції з усіх колекторів."""
+    pid = str(os.getpid())
+    lines = []
+    for collector in _collectors:
+        for name, metric_type, help_text, samples in collector(app):
+            full_name = PREFIX + name
+            lines.append(f'# HELP {full_name} {help_text}')
+            lines.append(f'# TYPE {full_name} {metric_type}')
+            for labels, value in samples:
+                labels = dict(labels or {}, pid=pid)
+                rendered = ','.join(f'{key}="{_escape(val)}"' for key, val in sorted(labels.items()))
+                lines.append(f'{full_name}{{{rendered}}} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def is_authorized(app):
+    token = app.config.get('METRICS_TOKEN')
+    if not token:
+        return False
+    header = request.headers.get('Authorization', '')
+    return header.startswith('Bearer ') and hmac.compare_digest(header[7:].encode(), token.encode())
+
+
+def metrics_view():
+    app = current_app._get_current_object()
+    if not is_authorized(app):
+        return app.response_class('unauthorized\n', status=401, mimetype='text/plain')
+    response = app.response_class(render(app), mimetype='text/plain')
+    response.headers['Content-Type'] = CONTENT_TYPE
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+def init_app(app):
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    app.add_url_rule(METRICS_PATH, 'metrics', metrics_view, methods=['GET'])
+    # Скрейпер не має сесії — файл сесії не читається
+    session_policy.register_public(METRICS_PATH)
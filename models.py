@@ -3,6 +3,7 @@ from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash, check_password_hash
 import json
 
+# Клас сесії (маршрутизація читань на репліки) задає app.py — моделі залежать лише від SQLAlchemy
 db = SQLAlchemy()
 
 class User(db.Model):
@@ -259,4 +260,92 @@ class Payment(db.Model):
             'card_brand': self.card_brand,
             'created_at': self.created_at.isoformat(),
             'completed_at': self.completed_at.isoformat() if self.completed_at else None
-        }
\ No newline at end of file
+        }
+
+class BackgroundTask(db.Model):
+    """Модель фонової задачі для персистентної черги (див. task_queue.py)."""
+
+    __tablename__ = 'background_tasks'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    # Ключ ідемпотентності: повторний enqueue з тим самим ключем повертає існуючу задачу
+    key = db.Column(db.String(255), unique=True, nullable=True)
+    payload = db.Column(db.Text, nullable=True)  # JSON з аргументами задачі
+    status = db.Column(db.String(20), nullable=False, default='queued', index=True)  # queued, running, succeeded, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    run_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    locked_by = db.Column(db.String(100), nullable=True)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    result = db.Column(db.Text, nullable=True)  # JSON з результатом виконання
+    user_id = db.Column(db.Integer, nullable=True)  # Хто поставив задачу (для перевірки доступу до статусу)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        """Повертає стан задачі у вигляді словника."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'key': self.key,
+            'status': self.status,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'run_at': self.run_at.isoformat() if self.run_at else None,
+            'last_error': self.last_error,
+            'result': json.loads(self.result) if self.result else None,
+            'created_at': self.created_at.isoformat(),
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class IdempotencyRecord(db.Model):
+    """Збережена відповідь на запит з заголовком Idempotency-Key (див. idempotency.py)."""
+
+    __tablename__ = 'idempotency_keys'
+
+    id = db.Column(db.Integer, primary_key=True)
+    # user_id + метод + шлях + ключ клієнта: один ключ не може "перетікати" між ендпоінтами
+    scope = db.Column(db.String(500), unique=True, nullable=False)
+    request_hash = db.Column(db.String(64), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='in_flight')  # in_flight, completed
+    response_code = db.Column(db.Integer, nullable=True)
+    response_body = db.Column(db.Text, nullable=True)
+    content_type = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+
+class Entitlement(db.Model):
+    """Право користувача на функцію або придбаний продукт (див. entitlements.py).
+
+    feature: 'premium' для преміум-доступу або 'product:<id>' для куплених
+    пакетів цитат, тем, шаблонів щоденника тощо.
+    """
+
+    __tablename__ = 'entitlements'
+    __table_args__ = (db.UniqueConstraint('user_id', 'feature', name='uq_entitlement_user_feature'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    feature = db.Column(db.String(100), nullable=False)
+    product_id = db.Column(db.Integer, db.ForeignKey('products.id'), nullable=True)
+    payment_id = db.Column(db.Integer, nullable=True)  # Платіж, яким отримано право
+    granted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=True, index=True)  # None — безстроково
+
+    user = db.relationship('User', backref=db.backref('entitlements', lazy='dynamic', cascade='all, delete-orphan'))
+
+    def is_active(self, now=None):
+        return self.expires_at is None or self.expires_at > (now or datetime.utcnow())
+
+    def to_dict(self):
+        """Повертає право у вигляді словника."""
+        return {
+            'feature': self.feature,
+            'product_id': self.product_id,
+            'granted_at': self.granted_at.isoformat(),
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None
+        }
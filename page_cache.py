@@ -0,0 +1,223 @@
+"""
+Кеш відрендерених сторінок для статичних і майже статичних шаблонів.
+
+Сторінки about, lab6, favorites, journal, goals, store та головна не залежать
+від конкретного користувача: дані вони довантажують через API, мова
+перемикається на клієнті. Повний рендер base.html на кожен запит тут зайвий.
+
+Декоратор @cached_page зберігає готовий HTML за ключем
+(версія розгортання, endpoint, мова, auth-бакет):
+- версія розгортання — хеш маніфесту статики, шаблонів і PAGE_CACHE_VERSION,
+  тож новий деплой автоматично робить старі записи недосяжними;
+- мова — ?lang= або Accept-Language (лише підтримувані мови);
+- auth-бакет — 'anon' або 'user' (чи є user_id у сесії), без запиту до БД.
+
+Рівні кешу: LRU у процесі (PAGE_CACHE_SIZE записів) та, якщо задано
+PAGE_CACHE_REDIS_URL/REDIS_URL, спільний рівень у Redis для всіх воркерів.
+Відповідь має ETag і Cache-Control: private, no-cache — браузер
+перевіряє сторінку умовним запитом і отримує 304 без тіла.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, make_response, request, session
+
+from i18n import SUPPORTED_LANGUAGES
+
+try:
+    import redis as _redis
+except ImportError:  # Redis — опційний рівень
+    _redis = None
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL = 3600
+CACHE_HEADER = 'X-Page-Cache'
+DEFAULT_LANGUAGE = 'uk'
+
+
+def deploy_version(app):
+    """Хеш версії розгортання: маніфест статики + шаблони + PAGE_CACHE_VERSION."""
+    digest = hashlib.sha256()
+    digest.update(str(app.config.get('PAGE_CACHE_VERSION') or '').encode('utf-8'))
+    manifest = app.extensions.get('assets')
+    if manifest is not None:
+        for name, file_digest in sorted(manifest.hashes.items()):
+            digest.update(f'{name}={file_digest}\n'.encode('utf-8'))
+    template_folder = os.path.join(app.root_path, app.template_folder or 'templates')
+    for root, dirs, files in os.walk(template_folder):
+        dirs.sort()
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            digest.update(os.path.relpath(path, template_folder).encode('utf-8'))
+            with open(path, 'rb') as fh:
+                digest.update(hashlib.sha256(fh.read()).digest())
+    return digest.hexdigest()[:12]
+
+
+class PageCache:
+    """LRU відрендерених сторінок у процесі з опційним спільним рівнем у Redis."""
+
+    def __init__(self, app):
+        self.enabled = app.config.get('PAGE_CACHE_ENABLED', not app.debug)
+        self.max_entries = app.config.get('PAGE_CACHE_SIZE', DEFAULT_MAX_ENTRIES)
+        self.ttl = app.config.get('PAGE_CACHE_TTL', DEFAULT_TTL)
+        self.redis_url = app.config.get('PAGE_CACHE_REDIS_URL') or os.environ.get('REDIS_URL')
+        self.version = deploy_version(app)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis_client = None
+        self._redis_checked = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, endpoint, lang, bucket, view_args=None):
+        args = ','.join(f'{k}={v}' for k, v in sorted((view_args or {}).items()))
+        return f'page:{self.version}:{endpoint}:{args}:{lang}:{bucket}'
+
+    def get(self, key):
+        """Повертає (body, etag) або None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                body, etag, expires = entry
+                if now < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return body, etag
+                del self._entries[key]
+
+        shared = self._redis_get(key)
+        with self._lock:
+            if shared is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, shared[0], shared[1], now)
+        return shared
+
+    def put(self, key, body, etag):
+        with self._lock:
+            self._store(key, body, etag, time.monotonic())
+        self._redis_put(key, body, etag)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                'version': self.version, 'shared': self._get_redis() is not None}
+
+    def _store(self, key, body, etag, now):
+        self._entries[key] = (body, etag, now + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _get_redis(self):
+        if self._redis_checked:
+            return self._redis_client
+        self._redis_checked = True
+        if self.redis_url and _redis is not None:
+            try:
+                self._redis_client = _redis.Redis.from_url(self.redis_url, socket_timeout=0.2)
+            except Exception as exc:
+                logging.warning("Page cache: Redis недоступний (%s), лише кеш у процесі", exc)
+        return self._redis_client
+
+    def _redis_get(self, key):
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            raw = client.get(key)
+        except Exception:
+            return None
+        if not raw:
+            return None
+        etag, _, body = raw.partition(b'\n')
+        return body, etag.decode('ascii')
+
+    def _redis_put(self, key, body, etag):
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            client.setex(key, int(self.ttl), etag.encode('ascii') + b'\n' + body)
+        except Exception as exc:
+            logging.debug("Page cache: не вдалося записати в Redis: %s", exc)
+
+
+def get_cache():
+    return current_app.extensions['page_cache']
+
+
+def request_language():
+    """Мова сторінки: ?lang= або найкраща з Accept-Language."""
+    lang = (request.args.get('lang') or '').strip().lower()[:2]
+    if lang in SUPPORTED_LANGUAGES:
+        return lang
+    return request.accept_languages.best_match(SUPPORTED_LANGUAGES, default=DEFAULT_LANGUAGE)
+
+
+def auth_bucket():
+    return 'user' if 'user_id' in session else 'anon'
+
+
+def is_cached_page(app, endpoint):
+    """Чи позначений endpoint як кешована сторінка (before_request не вантажить користувача)."""
+    view = app.view_functions.get(endpoint)
+    return bool(getattr(view, 'page_cached', False))
+
+
+def _finish(response, etag, state):
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add('Cookie')
+    response.vary.add('Accept-Language')
+    response.headers[CACHE_HEADER] = state
+    return response.make_conditional(request)
+
+
+def cached_page(view):
+    """Кешує HTML-відповідь view для GET/HEAD-запитів."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        cache = get_cache()
+        if not cache.enabled or request.method not in ('GET', 'HEAD'):
+            return view(*args, **kwargs)
+
+        key = cache.key(request.endpoint, request_language(), auth_bucket(), request.view_args)
+        cached = cache.get(key)
+        if cached is not None:
+            body, etag = cached
+            response = current_app.response_class(body, mimetype='text/html')
+            return _finish(response, etag, 'HIT')
+
+        response = make_response(view(*args, **kwargs))
+        if response.status_code != 200 or response.mimetype != 'text/html':
+            return response
+        body = response.get_data()
+        etag = hashlib.sha256(body).hexdigest()[:16]
+        cache.put(key, body, etag)
+        return _finish(response, etag, 'MISS')
+
+    wrapper.page_cached = True
+    return wrapper
+
+
+def init_app(app):
+    app.extensions['page_cache'] = PageCache(app)
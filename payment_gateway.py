@@ -0,0 +1,138 @@
+"""
+Адаптер платіжного шлюзу.
+
+Запит POST /api/payments лише створює Payment зі статусом pending і ставить
+задачу 'payments.process' у чергу (task_queue). Воркер викликає
+gateway.authorize() — затримка шлюзу не блокує веб-воркер. Результат
+застосовується через apply_gateway_result(): або одразу (шлюз повернув
+фінальний статус), або пізніше через вебхук POST /api/payments/webhook
+(шлюз повернув pending і повідомить результат сам).
+
+Реалізації:
+- FakeGateway — локальний шлюз з налаштовуваною затримкою та відсотком відмов
+  (PAYMENT_GATEWAY_LATENCY, PAYMENT_GATEWAY_FAILURE_RATE)
+
+Новий процесор підключається підкласом PaymentGateway і реєстрацією в GATEWAYS.
+"""
+
+import hashlib
+import hmac
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
+import entitlements
+
+TERMINAL_STATUSES = ('completed', 'failed')
+
+
+@dataclass
+class GatewayResult:
+    """Відповідь шлюзу на авторизацію платежу."""
+    status: str  # pending, completed, failed
+    transaction_id: str = None
+    message: str = None
+
+
+class PaymentGateway:
+    """Базовий інтерфейс платіжного шлюзу."""
+
+    name = 'base'
+
+    def authorize(self, payment):
+        """Авторизує платіж. Повертає GatewayResult.
+
+        Викликається з фонового воркера, тож може блокуватись на час
+        мережевого запиту. Тимчасові збої слід піднімати як виняток —
+        задача буде повторена з backoff.
+        """
+        raise NotImplementedError
+
+
+class FakeGateway(PaymentGateway):
+    """Локальний шлюз для розробки та навантажувальних тестів."""
+
+    name = 'fake'
+
+    PREFIXES = {'card': 'TXN', 'online_banking': 'BANK', 'paypal': 'PP'}
+
+    def __init__(self, latency=0.5, failure_rate=0.0, seed=None):
+        self.latency = max(float(latency), 0.0)
+        self.failure_rate = min(max(float(failure_rate), 0.0), 1.0)
+        self._random = random.Random(seed)
+
+    def authorize(self, payment):
+        if self.latency:
+            time.sleep(self.latency)
+        prefix = self.PREFIXES.get(payment.payment_method, 'TXN')
+        transaction_id = f"{prefix}-{uuid.uuid4().hex[:12].upper()}"
+        if self._random.random() < self.failure_rate:
+            return GatewayResult('failed', transaction_id, 'Платіж відхилено шлюзом')
+        return GatewayResult('completed', transaction_id)
+
+
+GATEWAYS = {
+    'fake': FakeGateway,
+}
+
+
+def get_gateway(app):
+    """Повертає (і кешує) екземпляр шлюзу згідно з PAYMENT_GATEWAY."""
+    gateway = app.extensions.get('payment_gateway')
+    if gateway is None:
+        name = app.config.get('PAYMENT_GATEWAY', 'fake')
+        if name not in GATEWAYS:
+            raise KeyError(f'Невідомий платіжний шлюз: {name}')
+        if name == 'fake':
+            gateway = FakeGateway(
+                latency=app.config.get('PAYMENT_GATEWAY_LATENCY', 0.5),
+                failure_rate=app.config.get('PAYMENT_GATEWAY_FAILURE_RATE', 0.0)
+            )
+        else:
+            gateway = GATEWAYS[name]()
+        app.extensions['payment_gateway'] = gateway
+    return gateway
+
+
+def sign_payload(secret, body):
+    """HMAC-SHA256 підпис тіла вебхука (hex)."""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret, body, signature):
+    if not secret or not signature:
+        return False
+    return hmac.compare_digest(sign_payload(secret, body), signature)
+
+
+def apply_gateway_result(payment, result):
+    """Переводить платіж з pending у completed/failed та оновлює замовлення.
+
+    Повторне застосування до вже фінального платежу нічого не змінює, тож
+    дублікати вебхуків і повтори задачі безпечні. Коміт робить викликач.
+    """
+    if payment.status != 'pending' or result.status not in TERMINAL_STATUSES:
+        return False
+
+    order = payment.order
+    if result.transaction_id:
+        payment.transaction_id = result.transaction_id
+
+    if result.status == 'failed':
+        payment.status = 'failed'
+        order.status = 'canceled'
+        logging.info("Платіж #%s відхилено: %s", payment.id, result.message)
+        return True
+
+    payment.status = 'completed'
+    payment.completed_at = datetime.utcnow()
+
+    # Видаємо права на придбані продукти (один JOIN-запит замість item.product на кожен рядок)
+    is_digital = entitlements.grant_for_order(order, payment_id=payment.id)
+    order.status = 'completed' if is_digital else 'processing'
+    return True
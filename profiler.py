@@ -0,0 +1,470 @@
+"""
+Профілювання окремого запиту на вимогу (для адміністраторів).
+
+Запит профілюється, лише якщо він містить заголовок X-Profile (або
+?_profile=) і його надіслав адміністратор або клієнт із заголовком
+X-Profile-Secret, що збігається з PROFILER_SECRET. Значення вибирає режим:
+- sample (за замовчуванням) — потік-семплер знімає стек запиту кожні
+  PROFILER_SAMPLE_INTERVAL секунд; справжні стеки для flame graph
+- cprofile — детермінований cProfile: точні лічильники викликів, стеки
+  для експорту відновлюються з графа викликів (наближено)
+
+Разом з профілем зберігаються SQL-запити з тривалістю та час рендеру
+шаблонів. Знімок пишеться в PROFILER_DIR (data/profiles/<id>.json), id
+повертається в заголовку X-Profile-Id. Адмін-API: список, перегляд,
+експорт у speedscope (https://www.speedscope.app) та collapsed stacks
+(flamegraph.pl, inferno).
+
+Профіль охоплює обробку запиту до after_request; генерація потокових
+відповідей (експорт щоденника) після неї не потрапляє до знімка.
+
+Без тригера вартість — перевірка одного заголовка і query string у
+before_request: слухачі SQL і сигналів шаблонів підключаються лише поки
+триває хоча б одне профілювання і відфільтровують чужі запити.
+"""
+
+import cProfile
+import hmac
+import json
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from flask import g, has_app_context, request, session, before_render_template, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_QUERY_ARG = '_profile'
+SECRET_HEADER = 'X-Profile-Secret'
+ID_HEADER = 'X-Profile-Id'
+MODES = ('sample', 'cprofile')
+DEFAULT_DIR = os.path.join('data', 'profiles')
+DEFAULT_MAX_CAPTURES = 200
+DEFAULT_SAMPLE_INTERVAL = 0.005
+MAX_SQL_STATEMENTS = 500
+MAX_STATEMENT_LENGTH = 2000
+MAX_STACK_DEPTH = 128
+# Гілки наближених стеків cProfile, легші за це (ms), відкидаються
+MIN_STACK_WEIGHT_MS = 0.01
+_ID_RE = re.compile(r'^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}$')
+
+_active = 0
+_active_lock = threading.Lock()
+
+
+def profiles_dir(app):
+    path = app.config.get('PROFILER_DIR') or DEFAULT_DIR
+    return path if os.path.isabs(path) else os.path.join(app.root_path, path)
+
+
+_labels = {}
+
+
+def _label(code):
+    label = _labels.get(code)
+    if label is None:
+        label = _labels[code] = (code.co_name, code.co_filename, code.co_firstlineno)
+    return label
+
+
+class Sampler(threading.Thread):
+    """Знімає стек одного потоку з фіксованим інтервалом."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name='profiler-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = {}
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                stack.append(_label(frame.f_code))
+                frame = frame.f_back
+            key = tuple(reversed(stack))
+            self.counts[key] = self.counts.get(key, 0) + 1
+            self.samples += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class Capture:
+    """Стан профілювання одного запиту."""
+
+    def __init__(self, mode, interval):
+        self.mode = mode
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.created_at = datetime.utcnow()
+        self.sql = []
+        self.sql_count = 0
+        self.sql_total = 0.0
+        self.templates = []
+        self._template_starts = []
+        self.profiler = None
+        self.sampler = None
+
+    def start(self):
+        if self.mode == 'cprofile':
+            self.profiler = cProfile.Profile()
+            try:
+                self.profiler.enable()
+                return
+            except ValueError:
+                # Python 3.12+: одночасно може працювати лише один cProfile
+                self.profiler = None
+                self.mode = 'sample'
+        self.sampler = Sampler(threading.get_ident(), self.interval)
+        self.sampler.start()
+
+    def stop(self):
+        self.duration = time.perf_counter() - self.started
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.sampler is not None:
+            self.sampler.stop()
+
+    def add_sql(self, statement, duration, executemany):
+        self.sql_count += 1
+        self.sql_total += duration
+        if len(self.sql) < MAX_SQL_STATEMENTS:
+            self.sql.append({'sql': statement[:MAX_STATEMENT_LENGTH], 'duration_ms': round(duration * 1000, 3),
+                             'executemany': bool(executemany)})
+
+    def profile(self):
+        """{'mode', 'unit', 'frames', 'stacks': [[індекси кадрів], вага ms], ...}."""
+        frames, index = [], {}
+
+        def frame_id(label):
+            if label not in index:
+                index[label] = len(frames)
+                frames.append(list(label))
+            return index[label]
+
+        result = {'mode': self.mode, 'unit': 'milliseconds'}
+        if self.sampler is not None:
+            weight = self.interval * 1000
+            result['samples'] = self.sampler.samples
+            result['interval_ms'] = weight
+            stacks = self.sampler.counts.items()
+            result['stacks'] = [[[frame_id(label) for label in stack], round(count * weight, 3)]
+                                for stack, count in sorted(stacks, key=lambda item: -item[1])]
+        else:
+            stats = pstats.Stats(self.profiler).stats
+            result['functions'] = top_functions(stats)
+            result['stacks'] = [[[frame_id(label) for label in stack], round(ms, 3)]
+                                for stack, ms in cprofile_stacks(stats)]
+        result['frames'] = frames
+        return result
+
+
+def top_functions(stats, limit=50):
+    rows = []
+    for (filename, line, name), (cc, nc, tt, ct, _) in stats.items():
+        rows.append({'function': name, 'file': filename, 'line': line, 'calls': nc,
+                     'self_ms': round(tt * 1000, 3), 'total_ms': round(ct * 1000, 3)})
+    rows.sort(key=lambda row: -row['total_ms'])
+    return rows[:limit]
+
+
+def cprofile_stacks(stats):
+    """Наближені стеки з графа викликів cProfile.
+
+    Власний час функції розподіляється між її викликачами пропорційно
+    часу, проведеному у виклику з кожного з них, і так до коренів.
+    """
+    merged = {}
+
+    def label(func):
+        filename, line, name = func
+        return (name, filename, line)
+
+    def walk(func, weight, path):
+        callers = stats.get(func, (0, 0, 0, 0, {}))[4]
+        total = sum(edge[3] for edge in callers.values())
+        if not callers or not total or len(path) >= MAX_STACK_DEPTH:
+            stack = tuple(label(f) for f in reversed(path))
+            merged[stack] = merged.get(stack, 0.0) + weight
+            return
+        for caller, edge in callers.items():
+            share = weight * edge[3] / total
+            if share < MIN_STACK_WEIGHT_MS:
+                continue
+            if caller in path:
+                # Рекурсія — обриваємо стек на повторному кадрі
+                stack = tuple(label(f) for f in reversed(path))
+                merged[stack] = merged.get(stack, 0.0) + share
+            else:
+                walk(caller, share, path + [caller])
+
+    for func, (cc, nc, tt, ct, callers) in stats.items():
+        if tt * 1000 >= MIN_STACK_WEIGHT_MS:
+            walk(func, tt * 1000, [func])
+    return sorted(merged.items(), key=lambda item: -item[1])
+
+
+def _current():
+    if not has_app_context():
+        return None
+    return g.get('_profile_capture')
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current() is not None:
+        conn.info.setdefault('_profile_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    capture = _current()
+    started = conn.info.get('_profile_started')
+    if capture is not None and started:
+        capture.add_sql(statement, time.perf_counter() - started.pop(), executemany)
+
+
+def _before_render(sender, template, context, **extra):
+    capture = _current()
+    if capture is not None:
+        capture._template_starts.append(time.perf_counter())
+
+
+def _rendered(sender, template, context, **extra):
+    capture = _current()
+    if capture is not None and capture._template_starts:
+        duration = time.perf_counter() - capture._template_starts.pop()
+        capture.templates.append({'name': template.name, 'duration_ms': round(duration * 1000, 3)})
+
+
+def _install():
+    """Слухачі SQL і шаблонів — лише поки є активні профілювання."""
+    global _active
+    with _active_lock:
+        _active += 1
+        if _active == 1:
+            event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+            before_render_template.connect(_before_render)
+            template_rendered.connect(_rendered)
+
+
+def _uninstall():
+    global _active
+    with _active_lock:
+        _active -= 1
+        if _active == 0:
+            event.remove(Engine, 'before_cursor_execute', _before_cursor_execute)
+            event.remove(Engine, 'after_cursor_execute', _after_cursor_execute)
+            before_render_template.disconnect(_before_render)
+            template_rendered.disconnect(_rendered)
+
+
+def requested_mode():
+    """Режим із заголовка / query або None, якщо профілювання не запитано."""
+    value = request.headers.get(PROFILE_HEADER)
+    if value is None and PROFILE_QUERY_ARG.encode() in request.query_string:
+        value = request.args.get(PROFILE_QUERY_ARG)
+    if value is None:
+        return None
+    value = value.strip().lower()
+    return value if value in MODES else 'sample'
+
+
+def is_authorized(app):
+    """Секрет у заголовку або сесія адміністратора."""
+    secret = app.config.get('PROFILER_SECRET')
+    provided = request.headers.get(SECRET_HEADER)
+    if secret and provided and hmac.compare_digest(provided.encode(), secret.encode()):
+        return True
+    user_id = session.get('user_id')
+    if not user_id:
+        return False
+    from models import db, User
+    user = db.session.get(User, user_id)
+    return bool(user and user.is_admin)
+
+
+def _start(app):
+    mode = requested_mode()
+    if mode is None:
+        return
+    if not is_authorized(app):
+        logging.debug("Профілювання %s відхилено: немає прав", request.path)
+        return
+    capture = Capture(mode, app.config.get('PROFILER_SAMPLE_INTERVAL', DEFAULT_SAMPLE_INTERVAL))
+    _install()
+    g._profile_capture = capture
+    capture.start()
+
+
+def _finish(app, response=None, error=None):
+    capture = g.pop('_profile_capture', None)
+    if capture is None:
+        return None
+    try:
+        capture.stop()
+    finally:
+        _uninstall()
+    profile_id = f"{capture.created_at.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    template_total = sum(t['duration_ms'] for t in capture.templates)
+    data = {
+        'id': profile_id,
+        'created_at': capture.created_at.isoformat() + 'Z',
+        'method': request.method,
+        'path': request.path,
+        'query': request.query_string.decode('utf-8', 'replace'),
+        'endpoint': request.endpoint,
+        'status': response.status_code if response is not None else 500,
+        'error': repr(error) if error is not None else None,
+        'user_id': session.get('user_id'),
+        'duration_ms': round(capture.duration * 1000, 3),
+        'sql': {'count': capture.sql_count, 'total_ms': round(capture.sql_total * 1000, 3),
+                'statements': capture.sql},
+        'templates': {'count': len(capture.templates), 'total_ms': round(template_total, 3),
+                      'renders': capture.templates},
+        'profile': capture.profile(),
+    }
+    try:
+        save(app, data)
+    except OSError as exc:
+        logging.error("Не вдалося зберегти профіль %s: %s", profile_id, exc)
+        return None
+    logging.info("Профіль %s: %s %s за %.1f ms, SQL %s", profile_id, request.method, request.path,
+                 data['duration_ms'], capture.sql_count)
+    return profile_id
+
+
+def save(app, data):
+    directory = profiles_dir(app)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{data['id']}.json")
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh, ensure_ascii=False)
+    os.replace(tmp, path)
+    prune(app)
+
+
+def _ids(app):
+    try:
+        names = os.listdir(profiles_dir(app))
+    except FileNotFoundError:
+        return []
+    return sorted((name[:-5] for name in names if name.endswith('.json') and _ID_RE.match(name[:-5])),
+                  reverse=True)
+
+
+def prune(app):
+    keep = app.config.get('PROFILER_MAX_CAPTURES', DEFAULT_MAX_CAPTURES)
+    for profile_id in _ids(app)[keep:]:
+        try:
+            os.remove(os.path.join(profiles_dir(app), f'{profile_id}.json'))
+        except FileNotFoundError:
+            pass
+
+
+def load(app, profile_id):
+    """Повний знімок за id або None."""
+    if not _ID_RE.match(profile_id or ''):
+        return None
+    try:
+        with open(os.path.join(profiles_dir(app), f'{profile_id}.json'), encoding='utf-8') as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+
+
+def list_captures(app, limit=50):
+    """Короткі описи останніх знімків (новіші першими)."""
+    result = []
+    for profile_id in _ids(app)[:limit]:
+        data = load(app, profile_id)
+        if data is None:
+            continue
+        result.append({key: data.get(key) for key in ('id', 'created_at', 'method', 'path', 'endpoint',
+                                                      'status', 'user_id', 'duration_ms')})
+        result[-1].update({'mode': data['profile']['mode'], 'sql_count': data['sql']['count'],
+                           'sql_ms': data['sql']['total_ms'], 'template_ms': data['templates']['total_ms']})
+    return result
+
+
+def _short_file(filename, root):
+    try:
+        relative = os.path.relpath(filename, root)
+    except ValueError:
+        return filename
+    return filename if relative.startswith('..') else relative
+
+
+def to_speedscope(data, root=''):
+    """Файл формату speedscope (sampled-профіль із вагами в мілісекундах)."""
+    profile = data['profile']
+    stacks = profile['stacks']
+    total = sum(weight for _, weight in stacks)
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': f"{data['method']} {data['path']} ({data['id']})",
+        'exporter': 'DailyMood profiler',
+        'activeProfileIndex': 0,
+        'shared': {'frames': [{'name': name, 'file': _short_file(filename, root), 'line': line}
+                              for name, filename, line in profile['frames']]},
+        'profiles': [{
+            'type': 'sampled',
+            'name': f"{data['method']} {data['path']} — {profile['mode']}",
+            'unit': profile['unit'],
+            'startValue': 0,
+            'endValue': round(total, 3),
+            'samples': [frames for frames, _ in stacks],
+            'weights': [weight for _, weight in stacks],
+        }],
+    }
+
+
+def to_collapsed(data, root=''):
+    """Collapsed stacks: 'корінь;...;лист вага' на рядок (вага — мікросекунди)."""
+    frames = data['profile']['frames']
+    names = [f"{name} ({_short_file(filename, root)}:{line})".replace(';', ',') for name, filename, line in frames]
+    lines = []
+    for stack, weight in data['profile']['stacks']:
+        micros = int(round(weight * 1000))
+        if micros > 0:
+            lines.append(f"{';'.join(names[i] for i in stack)} {micros}")
+    return '\n'.join(lines) + '\n'
+
+
+def init_app(app):
+    if not app.config.get('PROFILER_ENABLED', True):
+        return
+
+    @app.before_request
+    def _profile_start():
+        # Найдешевша перевірка — до будь-якої іншої роботи
+        if PROFILE_HEADER in request.headers or PROFILE_QUERY_ARG.encode() in request.query_string:
+            _start(app)
+
+    @app.after_request
+    def _profile_response(response):
+        if '_profile_capture' in g:
+            profile_id = _finish(app, response)
+            if profile_id:
+                response.headers[ID_HEADER] = profile_id
+        return response
+
+    @app.teardown_request
+    def _profile_teardown(error=None):
+        # Необроблений виняток: after_request не викликався
+        if has_app_context() and '_profile_capture' in g:
+            _finish(app, error=error)
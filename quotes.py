@@ -0,0 +1,116 @@
+"""
+Сервіс цитат: цитата дня та посторінковий перегляд корпусу.
+
+Корпус (content/quotes/<lang>.json) раніше повністю вантажився в браузер
+як translations/quotes.js (~76 KB) заради однієї цитати на день. Тепер
+сервер читає його один раз і віддає:
+- GET /api/quotes/daily?lang=  — детермінована цитата на дату (UTC);
+  однакова для всіх воркерів, кешується в пам'яті та браузером до півночі;
+- GET /api/quotes?lang=&page=&per_page= — сторінка корпусу.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+from i18n import SUPPORTED_LANGUAGES
+
+DEFAULT_LANGUAGE = 'uk'
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+QUOTES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'content', 'quotes')
+
+_corpora = {}
+_daily = {}
+_lock = threading.Lock()
+
+
+class Corpus:
+    """Цитати однієї мови та відбиток їх вмісту (для ETag)."""
+
+    def __init__(self, lang, quotes):
+        self.lang = lang
+        self.quotes = quotes
+        raw = json.dumps(quotes, ensure_ascii=False).encode('utf-8')
+        self.version = hashlib.sha256(raw).hexdigest()[:12]
+
+    def __len__(self):
+        return len(self.quotes)
+
+
+def get_corpus(lang):
+    corpus = _corpora.get(lang)
+    if corpus is None:
+        with open(os.path.join(QUOTES_DIR, f'{lang}.json'), encoding='utf-8') as fh:
+            quotes = json.load(fh)
+        corpus = Corpus(lang, quotes)
+        with _lock:
+            _corpora[lang] = corpus
+    return corpus
+
+
+def daily_index(day, lang, size):
+    """Індекс цитати дня: хеш дати, а не random — однаковий у всіх процесах."""
+    digest = hashlib.sha256(f'{day.isoformat()}:{lang}'.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % size
+
+
+def daily_quote(lang, day=None):
+    """Повертає словник цитати дня (кешується на дату)."""
+    day = day or datetime.utcnow().date()
+    key = (lang, day)
+    cached = _daily.get(key)
+    if cached is not None:
+        return cached
+    corpus = get_corpus(lang)
+    index = daily_index(day, lang, len(corpus))
+    item = {
+        'id': index + 1,
+        'text': corpus.quotes[index],
+        'lang': lang,
+        'date': day.isoformat(),
+        'total': len(corpus),
+        'version': corpus.version,
+    }
+    with _lock:
+        # Попередні дні більше не потрібні
+        for stale in [k for k in _daily if k[1] != day]:
+            _daily.pop(stale, None)
+        _daily[key] = item
+    return item
+
+
+def seconds_until_midnight(now=None):
+    now = now or datetime.utcnow()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max(int((midnight - now).total_seconds()), 1)
+
+
+def page(lang, page_number=1, per_page=DEFAULT_PER_PAGE):
+    corpus = get_corpus(lang)
+    per_page = min(max(per_page, 1), MAX_PER_PAGE)
+    total = len(corpus)
+    pages = max((total + per_page - 1) // per_page, 1)
+    page_number = max(page_number, 1)
+    start = (page_number - 1) * per_page
+    items = [{'id': start + i + 1, 'text': text}
+             for i, text in enumerate(corpus.quotes[start:start + per_page])]
+    return {
+        'lang': lang,
+        'page': page_number,
+        'per_page': per_page,
+        'total': total,
+        'pages': pages,
+        'quotes': items,
+        'version': corpus.version,
+    }
+
+
+def resolve_language(value):
+    """Мова з параметра ?lang= (None — за замовчуванням); невідома — None."""
+    if not value:
+        return DEFAULT_LANGUAGE
+    value = value.strip().lower()[:2]
+    return value if value in SUPPORTED_LANGUAGES else None
@@ -0,0 +1,178 @@
+"""
+Маршрутизація читань на репліки БД з read-your-writes.
+
+DB_REPLICA_URLS (через кому) додає bind-и replica_1, replica_2, ... з тими
+ж налаштуваннями пулу (db_pool.engine_options) і власним
+DB_REPLICA_STATEMENT_TIMEOUT_MS. RoutingSession.get_bind() відправляє на
+репліку запити до основної БД, якщо:
+- запит HTTP GET/HEAD/OPTIONS (DB_REPLICA_ROUTE_GET) або view позначено
+  @replica, і view не позначено @primary;
+- клієнт не має cookie липкості: після запиту із записом у БД відповідь
+  ставить cookie на DB_REPLICA_STICKY_SECONDS — наступні запити цього
+  клієнта (будь-який воркер) читають з primary, поки репліка доганяє;
+- у цьому запиті ще не було запису: flush, INSERT/UPDATE/DELETE та все
+  після них — на primary.
+
+Репліка вибирається випадково один раз на запит. Після помилки з'єднання
+репліка виключається на DB_REPLICA_RETRY_SECONDS. Без реплік (або поза
+HTTP-запитом — CLI, воркер черги) усе йде на primary.
+
+Записи інших процесів (webhook, воркер черги) cookie не покриває — view,
+які опитують такий стан (статус платежу, задачі), позначені @primary.
+Локально: дві SQLite-бази і scripts/sync_sqlite_replica.py.
+"""
+
+import logging
+import random
+import threading
+import time
+
+from flask import current_app, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.expression import UpdateBase
+
+import db_pool
+import metrics
+
+BIND_PREFIX = 'replica_'
+READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+STICKY_COOKIE = 'dm_primary'
+DEFAULT_STICKY_SECONDS = 5
+DEFAULT_RETRY_SECONDS = 30
+
+_ROUTE_ATTR = '_db_route'
+_REPLICA_KEY = 'dailymood.db_replica'
+_WROTE_KEY = 'dailymood.db_wrote'
+
+
+def replica(view):
+    """Дозволяє читання з репліки для view з будь-яким методом."""
+    setattr(view, _ROUTE_ATTR, 'replica')
+    return view
+
+
+def primary(view):
+    """View завжди читає з primary (наприклад, опитування статусу)."""
+    setattr(view, _ROUTE_ATTR, 'primary')
+    return view
+
+
+def replica_binds(urls, config):
+    """SQLALCHEMY_BINDS для списку URL реплік."""
+    timeout = config.get('DB_REPLICA_STATEMENT_TIMEOUT_MS')
+    binds = {}
+    for index, url in enumerate(urls, 1):
+        key = f'{BIND_PREFIX}{index}'
+        binds[key] = dict(db_pool.engine_options(url, config, key, statement_timeout_ms=timeout), url=url)
+    return binds
+
+
+class ReplicaRouter:
+    """Вибір репліки для запиту, липкість після запису та стан реплік."""
+
+    def __init__(self, app):
+        self.route_get = app.config.get('DB_REPLICA_ROUTE_GET', True)
+        self.sticky_seconds = app.config.get('DB_REPLICA_STICKY_SECONDS', DEFAULT_STICKY_SECONDS)
+        self.retry_seconds = app.config.get('DB_REPLICA_RETRY_SECONDS', DEFAULT_RETRY_SECONDS)
+        self.cookie_secure = app.config.get('SESSION_COOKIE_SECURE', False)
+        self.engines = {}
+        self.routed = {}
+        self._down_until = {}
+        self._lock = threading.Lock()
+
+    def _count(self, target):
+        with self._lock:
+            self.routed[target] = self.routed.get(target, 0) + 1
+
+    def mark_down(self, key):
+        logging.warning("Репліка %s недоступна — читання з primary %s s", key, self.retry_seconds)
+        with self._lock:
+            self._down_until[key] = time.monotonic() + self.retry_seconds
+
+    def available(self):
+        now = time.monotonic()
+        return [key for key in self.engines if self._down_until.get(key, 0) <= now]
+
+    def choose(self):
+        """Рушій репліки для поточного запиту або None (primary)."""
+        if not self.engines:
+            return None
+        view = current_app.view_functions.get(request.endpoint)
+        mark = getattr(view, _ROUTE_ATTR, None)
+        if mark == 'primary' or (mark != 'replica' and not (self.route_get and request.method in READ_METHODS)):
+            return None
+        if request.cookies.get(STICKY_COOKIE):
+            self._count('sticky')
+            return None
+        keys = self.available()
+        if not keys:
+            self._count('fallback')
+            return None
+        key = random.choice(keys)
+        self._count(key)
+        return self.engines[key]
+
+    def after_request(self, response):
+        if self.engines and request.environ.get(_WROTE_KEY):
+            response.set_cookie(STICKY_COOKIE, '1', max_age=self.sticky_seconds, httponly=True,
+                                samesite='Lax', secure=self.cookie_secure)
+        return response
+
+
+def get_router(app=None):
+    app = app or current_app
+    return app.extensions.get('replica_routing')
+
+
+class RoutingSession(Session):
+    """Сесія Flask-SQLAlchemy, що віддає читання запиту репліці (див. ReplicaRouter)."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        if bind is not None or not has_request_context():
+            return engine
+        environ = request.environ
+        if self._flushing or isinstance(clause, UpdateBase):
+            environ[_WROTE_KEY] = True
+            return engine
+        if environ.get(_WROTE_KEY) or engine is not self._db.engines.get(None):
+            return engine
+        replica_engine = environ.get(_REPLICA_KEY)
+        if replica_engine is None:
+            router = get_router()
+            replica_engine = environ[_REPLICA_KEY] = (router.choose() if router is not None else None) or False
+        return replica_engine or engine
+
+
+def collect(app):
+    """Метрики для /metrics: куди маршрутизовано читання запитів."""
+    router = get_router(app)
+    if router is None or not router.engines:
+        return
+    with router._lock:
+        routed = dict(router.routed)
+    yield ('db_replica_routed_total', 'counter', 'Запити з читанням: репліка, sticky (після запису) або fallback',
+           [({'target': target}, count) for target, count in sorted(routed.items())])
+    available = set(router.available())
+    yield ('db_replica_up', 'gauge', "Репліка не виключена після помилки з'єднання",
+           [({'engine': key}, key in available) for key in router.engines])
+
+
+def _watch(router, key, engine):
+    """Розрив або невдале підключення виключає репліку на retry_seconds."""
+    def on_error(context):
+        if context.is_disconnect or context.connection is None:
+            router.mark_down(key)
+    event.listen(engine, 'handle_error', on_error)
+
+
+def init_app(app, db):
+    router = app.extensions['replica_routing'] = ReplicaRouter(app)
+    with app.app_context():
+        router.engines = {key: engine for key, engine in db.engines.items()
+                          if isinstance(key, str) and key.startswith(BIND_PREFIX)}
+    for key, engine in router.engines.items():
+        _watch(router, key, engine)
+    app.after_request(router.after_request)
+    metrics.register(collect)
@@ -0,0 +1,257 @@
+"""
+Одноразове розгортання схеми БД: create_all, SQLite-міграції колонок,
+заповнення індексу прав.
+
+Раніше все це виконувалось при кожному імпорті app.py — у кожному воркері
+gunicorn і кожному скрипті, з гонками між процесами. Тепер це явна команда:
+    python scripts/init_db.py
+(Dockerfile викликає її один раз перед стартом gunicorn; `python app.py`
+у розробці — теж). Паралельні запуски серіалізуються блокуванням:
+- PostgreSQL — pg_advisory_lock на час розгортання
+- SQLite/інші — файлове блокування (fcntl) поруч з БД
+На PostgreSQL розгортання виконується без statement_timeout з db_pool:
+очікування advisory lock і DDL на великих таблицях довші за таймаут запиту.
+"""
+
+import contextlib
+import logging
+import os
+import time
+
+from sqlalchemy import event, inspect, text
+
+from models import db
+import entitlements
+
+try:
+    import fcntl
+except ImportError:  # Windows — без файлового блокування
+    fcntl = None
+
+# Довільний, але сталий ключ advisory lock для PostgreSQL
+ADVISORY_LOCK_KEY = 0x44_4D_53_42  # 'DMSB'
+DEFAULT_LOCK_FILE = os.path.join('data', '.schema-bootstrap.lock')
+
+
+def lock_file(app):
+    path = app.config.get('SCHEMA_LOCK_FILE') or DEFAULT_LOCK_FILE
+    return path if os.path.isabs(path) else os.path.join(app.root_path, path)
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a') as fh:
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _advisory_lock():
+    with db.engine.connect() as conn:
+        conn.execute(text('SELECT pg_advisory_lock(:key)'), {'key': ADVISORY_LOCK_KEY})
+        try:
+            yield
+        finally:
+            conn.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': ADVISORY_LOCK_KEY})
+
+
+@contextlib.contextmanager
+def _session_setting(engine, statement):
+    """statement на кожному з'єднанні, взятому з пулу engine в межах блоку."""
+    def apply(dbapi_connection, connection_record, connection_proxy):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(statement)
+        cursor.close()
+
+    event.listen(engine, 'checkout', apply)
+    try:
+        yield
+    finally:
+        event.remove(engine, 'checkout', apply)
+        # З'єднання в пулі зберегли налаштування — нові знову отримають connect_args
+        engine.dispose()
+
+
+def without_statement_timeout(engine):
+    """Знімає statement_timeout (db_pool.engine_options) з'єднань PostgreSQL на час блоку."""
+    if engine.dialect.name != 'postgresql':
+        return contextlib.nullcontext()
+    return _session_setting(engine, 'SET statement_timeout = 0')
+
+
+def bootstrap_lock(app):
+    """Блокування, що серіалізує розгортання схеми між процесами."""
+    if db.engine.dialect.name == 'postgresql':
+        return _advisory_lock()
+    return _file_lock(lock_file(app))
+
+
+def ensure_user_avatar_column():
+    """Додає колонку avatar до таблиці users, якщо її ще немає."""
+    try:
+        inspector = inspect(db.engine)
+        columns = {col['name'] for col in inspector.get_columns('users')}
+        if 'avatar' not in columns:
+            with db.engine.connect() as conn:
+                conn.execute(text('ALTER TABLE users ADD COLUMN avatar VARCHAR(255)'))
+            logging.info("Додано колонку avatar до таблиці users")
+    except Exception as exc:
+        logging.error("Не вдалося гарантувати наявність avatar у users: %s", exc)
+
+
+def ensure_user_premium_columns():
+    """Додає колонки для преміум-статусу, якщо їх немає."""
+    try:
+        inspector = inspect(db.engine)
+        columns = {col['name'] for col in inspector.get_columns('users')}
+        alterations = []
+        if 'is_premium' not in columns:
+            alterations.append('ADD COLUMN is_premium BOOLEAN NOT NULL DEFAULT 0')
+        if 'premium_started_at' not in columns:
+            alterations.append('ADD COLUMN premium_started_at DATETIME')
+        if 'premium_expires_at' not in columns:
+            alterations.append('ADD COLUMN premium_expires_at DATETIME')
+        if alterations:
+            with db.engine.connect() as conn:
+                for statement in alterations:
+                    conn.execute(text(f'ALTER TABLE users {statement}'))
+            logging.info("Гарантовано наявність колонок преміум у таблиці users")
+    except Exception as exc:
+        logging.error("Не вдалося гарантувати наявність колонок преміум у users: %s", exc)
+
+
+def ensure_user_advice_unlock_column():
+    """Додає колонку advice_unlock_once для одноразового скидання блокування поради."""
+    try:
+        inspector = inspect(db.engine)
+        columns = {col['name'] for col in inspector.get_columns('users')}
+        if 'advice_unlock_once' not in columns:
+            with db.engine.connect() as conn:
+                conn.execute(text('ALTER TABLE users ADD COLUMN advice_unlock_once BOOLEAN NOT NULL DEFAULT 0'))
+            logging.info("Додано колонку advice_unlock_once до таблиці users")
+    except Exception as exc:
+        logging.error("Не вдалося гарантувати наявність advice_unlock_once у users: %s", exc)
+
+
+def ensure_mood_entry_user_id():
+    """Додає колонку user_id до mood_entries, якщо її немає."""
+    try:
+        inspector = inspect(db.engine)
+        columns = {col['name'] for col in inspector.get_columns('mood_entries')}
+        if 'user_id' not in columns:
+            # Спочатку додаємо колонку як nullable
+            with db.engine.connect() as conn:
+                conn.execute(text('ALTER TABLE mood_entries ADD COLUMN user_id INTEGER'))
+                conn.commit()
+            logging.info("Додано колонку user_id до таблиці mood_entries")
+
+            # Якщо є існуючі записи без user_id, видаляємо їх або присвоюємо першому користувачу
+            with db.engine.connect() as conn:
+                result = conn.execute(text('SELECT COUNT(*) as cnt FROM mood_entries WHERE user_id IS NULL'))
+                orphan_count = result.fetchone()[0]
+                if orphan_count > 0:
+                    # Присвоюємо першому користувачу
+                    first_user = conn.execute(text('SELECT id FROM users ORDER BY id LIMIT 1')).fetchone()
+                    if first_user:
+                        conn.execute(text(f'UPDATE mood_entries SET user_id = {first_user[0]} WHERE user_id IS NULL'))
+                        logging.info(f"Присвоєно {orphan_count} старих записів користувачу #{first_user[0]}")
+                    else:
+                        # Немає користувачів — видаляємо старі записи
+                        conn.execute(text('DELETE FROM mood_entries WHERE user_id IS NULL'))
+                        logging.info(f"Видалено {orphan_count} старих записів без користувачів")
+                    conn.commit()
+    except Exception as exc:
+        logging.error("Не вдалося гарантувати наявність user_id у mood_entries: %s", exc)
+
+
+def ensure_habit_user_column():
+    """Додає колонку user_id до таблиці habits, якщо її немає."""
+    try:
+        inspector = inspect(db.engine)
+        if 'habits' in inspector.get_table_names():
+            columns = {col['name'] for col in inspector.get_columns('habits')}
+            if 'user_id' not in columns:
+                with db.engine.connect() as conn:
+                    conn.execute(text('ALTER TABLE habits ADD COLUMN user_id INTEGER'))
+                logging.info('Додано колонку user_id до таблиці habits')
+    except Exception as exc:
+        logging.error('Не вдалося додати колонку user_id у habits: %s', exc)
+
+
+def ensure_goal_user_column():
+    """Додає колонку user_id до таблиці monthly_goals, якщо її немає."""
+    try:
+        inspector = inspect(db.engine)
+        if 'monthly_goals' in inspector.get_table_names():
+            columns = {col['name'] for col in inspector.get_columns('monthly_goals')}
+            if 'user_id' not in columns:
+                with db.engine.connect() as conn:
+                    conn.execute(text('ALTER TABLE monthly_goals ADD COLUMN user_id INTEGER'))
+                logging.info('Додано колонку user_id до таблиці monthly_goals')
+    except Exception as exc:
+        logging.error('Не вдалося додати колонку user_id у monthly_goals: %s', exc)
+
+
+SQLITE_MIGRATIONS = (
+    ensure_user_avatar_column,
+    ensure_user_premium_columns,
+    ensure_user_advice_unlock_column,
+    ensure_mood_entry_user_id,
+    ensure_habit_user_column,
+    ensure_goal_user_column,
+)
+
+
+def bootstrap(app):
+    """Створює таблиці, застосовує SQLite-міграції та заповнює індекс прав.
+
+    Ідемпотентна: повторний запуск нічого не змінює. Повертає тривалість у секундах.
+    """
+    started = time.perf_counter()
+    with app.app_context():
+        with without_statement_timeout(db.engine), bootstrap_lock(app):
+            db.create_all()
+            # Виконуємо допоміжні ALTER-и лише для SQLite (локальні оновлення схеми)
+            try:
+                if db.engine.dialect.name == 'sqlite':
+                    for migration in SQLITE_MIGRATIONS:
+                        migration()
+                else:
+                    logging.info("Skipping SQLite-specific schema helpers for %s", db.engine.dialect.name)
+            except Exception:
+                logging.exception("Failed running schema helpers")
+            try:
+                entitlements.backfill_premium()
+            except Exception:
+                db.session.rollback()
+                logging.exception("Failed backfilling entitlements")
+        db.session.remove()
+        # Не залишаємо відкритих з'єднань у процесі, що потім може fork-нутись (gunicorn --preload)
+        db.engine.dispose()
+    elapsed = time.perf_counter() - started
+    logging.info("Схему БД розгорнуто за %.0f ms", elapsed * 1000)
+    return elapsed
+
+
+def pending():
+    """Таблиці та колонки моделей, яких ще немає в основній БД (потрібен scripts/init_db.py).
+
+    Лише читає каталог БД; викликається з перевірки готовності (health.py).
+    """
+    inspector = inspect(db.engine)
+    existing = set(inspector.get_table_names())
+    missing = []
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing:
+            missing.append(table.name)
+            continue
+        columns = {col['name'] for col in inspector.get_columns(table.name)}
+        missing.extend(f'{table.name}.{column.name}' for column in table.columns if column.name not in columns)
+    return missing
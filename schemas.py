@@ -1,14 +1,11 @@
 """
 Marshmallow схеми для валідації API запитів та серіалізації відповідей
 """
-from flask_marshmallow import Marshmallow
-from marshmallow import fields, validates, validates_schema, ValidationError, validate
+from marshmallow import Schema, fields, validates, validates_schema, ValidationError, validate
 import re
 
-ma = Marshmallow()
-
 # ===== Product Schemas =====
-class ProductSchema(ma.Schema):
+class ProductSchema(Schema):
     """Схема для Product моделі"""
     id = fields.Int(dump_only=True)
     name = fields.Str(required=True, validate=validate.Length(min=1, max=200))
@@ -33,7 +30,7 @@ class ProductSchema(ma.Schema):
 
 
 # ===== Order Schemas =====
-class OrderItemInputSchema(ma.Schema):
+class OrderItemInputSchema(Schema):
     """Схема для вхідних даних item в замовленні"""
     product_id = fields.Int(required=True, validate=validate.Range(min=1))
     quantity = fields.Int(required=True, validate=validate.Range(min=1, max=100))
@@ -42,7 +39,7 @@ class OrderItemInputSchema(ma.Schema):
         ordered = True
 
 
-class OrderItemOutputSchema(ma.Schema):
+class OrderItemOutputSchema(Schema):
     """Схема для вихідних даних item в замовленні"""
     id = fields.Int(dump_only=True)
     product_id = fields.Int()
@@ -55,7 +52,7 @@ class OrderItemOutputSchema(ma.Schema):
         ordered = True
 
 
-class CreateOrderSchema(ma.Schema):
+class CreateOrderSchema(Schema):
     """Схема для створення замовлення"""
     items = fields.List(fields.Nested(OrderItemInputSchema), required=True, validate=validate.Length(min=1))
 
@@ -63,7 +60,7 @@ class CreateOrderSchema(ma.Schema):
         ordered = True
 
 
-class OrderOutputSchema(ma.Schema):
+class OrderOutputSchema(Schema):
     """Схема для відповіді з замовленням"""
     id = fields.Int(dump_only=True)
     user_id = fields.Int(dump_only=True)
@@ -77,7 +74,7 @@ class OrderOutputSchema(ma.Schema):
 
 
 # ===== Payment Schemas =====
-class CreatePaymentSchema(ma.Schema):
+class CreatePaymentSchema(Schema):
     """Схема для створення платежу"""
     order_id = fields.Int(required=True, validate=validate.Range(min=1))
     payment_method = fields.Str(
@@ -115,7 +112,7 @@ class CreatePaymentSchema(ma.Schema):
         ordered = True
 
 
-class PaymentOutputSchema(ma.Schema):
+class PaymentOutputSchema(Schema):
     """Схема для відповіді з платежем"""
     id = fields.Int(dump_only=True)
     order_id = fields.Int()
@@ -132,7 +129,7 @@ class PaymentOutputSchema(ma.Schema):
 
 
 # ===== Feedback Schemas =====
-class CreateFeedbackSchema(ma.Schema):
+class CreateFeedbackSchema(Schema):
     """Схема для створення відгуку"""
     name = fields.Str(required=True, validate=validate.Length(min=1, max=100))
     email = fields.Email(required=True, validate=validate.Length(max=200))
@@ -143,7 +140,7 @@ class CreateFeedbackSchema(ma.Schema):
         ordered = True
 
 
-class FeedbackOutputSchema(ma.Schema):
+class FeedbackOutputSchema(Schema):
     """Схема для відповіді з відгуком"""
     id = fields.Int(dump_only=True)
     name = fields.Str()
@@ -157,7 +154,7 @@ class FeedbackOutputSchema(ma.Schema):
 
 
 # ===== Journal Schemas =====
-class CreateJournalEntrySchema(ma.Schema):
+class CreateJournalEntrySchema(Schema):
     """Схема для створення запису настрою"""
     mood = fields.Str(
         required=True,
@@ -176,7 +173,7 @@ class CreateJournalEntrySchema(ma.Schema):
         ordered = True
 
 
-class JournalEntryOutputSchema(ma.Schema):
+class JournalEntryOutputSchema(Schema):
     """Схема для відповіді з записом настрою"""
     id = fields.Int(dump_only=True)
     user_id = fields.Int(dump_only=True)
@@ -193,7 +190,7 @@ class JournalEntryOutputSchema(ma.Schema):
 
 
 # ===== Auth Schemas =====
-class LoginSchema(ma.Schema):
+class LoginSchema(Schema):
     """Схема для логіну"""
     email = fields.Email(required=True, validate=validate.Length(max=200))
     password = fields.Str(required=True, validate=validate.Length(min=6, max=200))
@@ -202,7 +199,7 @@ class LoginSchema(ma.Schema):
         ordered = True
 
 
-class RegisterSchema(ma.Schema):
+class RegisterSchema(Schema):
     """Схема для реєстрації"""
     email = fields.Email(required=True, validate=validate.Length(max=200))
     password = fields.Str(required=True, validate=validate.Length(min=6, max=200))
@@ -211,7 +208,7 @@ class RegisterSchema(ma.Schema):
         ordered = True
 
 
-class UserOutputSchema(ma.Schema):
+class UserOutputSchema(Schema):
     """Схема для відповіді з користувачем"""
     id = fields.Int(dump_only=True)
     email = fields.Str()
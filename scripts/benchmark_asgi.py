@@ -0,0 +1,262 @@
+"""
+Порівняння ASGI-режиму (asgi.py) з sync-деплоєм gunicorn під утримуваними з'єднаннями.
+
+Обидва сервери запускаються через gunicorn.conf.py з однаковою кількістю
+воркерів на тимчасовій SQLite-БД (користувач, 10 000 записів щоденника,
+платіж у статусі pending). Сценарії (C одночасних клієнтів, D секунд):
+
+- poll — клієнти чекають на фінальний статус платежу: у sync — опитування
+  GET /api/payments/<id> раз на Retry-After (1 с), в ASGI — long-polling
+  ?wait=10 (одне утримуване з'єднання на клієнта)
+- slow — клієнти завантажують JSON-експорт щоденника і читають повільно
+  (4 KB кожні 50 ms, малий буфер прийому): у sync кожен такий клієнт
+  займає воркер
+
+Паралельно проба раз на 200 ms запитує /health: її затримка показує, чи
+лишилась у сервера вільна паралельність під цим навантаженням.
+
+    python scripts/benchmark_asgi.py
+    python scripts/benchmark_asgi.py --clients 200 --duration 15 --scenarios slow --json
+
+Потрібні gunicorn і uvicorn.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+from benchmark_server import wait_ready  # noqa: E402
+
+EMAIL = 'bench@dailymood.local'
+PASSWORD = 'bench-password'
+ENTRIES = 10000
+MODES = {
+    'sync': {'GUNICORN_WORKER_CLASS': 'sync', 'GUNICORN_THREADS': '1'},
+    'asgi': {'SERVER_MODE': 'asgi'},
+}
+PROBE_INTERVAL = 0.2
+PROBE_TIMEOUT = 5.0
+SLOW_CHUNK = 4096
+SLOW_DELAY = 0.05
+SLOW_RCVBUF = 8192
+POLL_WAIT = 10
+POLL_INTERVAL = 1.0
+
+
+def seed(db_path):
+    """Користувач, записи щоденника та платіж у статусі pending (виконується в дочірньому процесі)."""
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    sys.path.insert(0, ROOT)
+    from datetime import date, timedelta
+
+    from app import app
+    from models import db, MoodEntry, Order, Payment, User
+
+    with app.app_context():
+        user = User(email=EMAIL)
+        user.set_password(PASSWORD)
+        db.session.add(user)
+        db.session.flush()
+        start = date(2020, 1, 1)
+        db.session.execute(MoodEntry.__table__.insert(), [
+            {'user_id': user.id, 'mood': 'calm', 'date': start + timedelta(days=i % 1500),
+             'title': f'Запис {i}', 'content': 'Тестовий запис для бенчмарку ' * 3}
+            for i in range(ENTRIES)
+        ])
+        order = Order(user_id=user.id, status='new', total_amount=19.0)
+        db.session.add(order)
+        db.session.flush()
+        payment = Payment(order_id=order.id, payment_method='card', amount=19.0, status='pending')
+        db.session.add(payment)
+        db.session.commit()
+        print(payment.id)
+
+
+def login(port):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('POST', '/auth/login', body=json.dumps({'email': EMAIL, 'password': PASSWORD}),
+                 headers={'Content-Type': 'application/json'})
+    response = conn.getresponse()
+    response.read()
+    cookie = response.getheader('Set-Cookie') or ''
+    return cookie.split(';', 1)[0]
+
+
+async def open_request(port, path, cookie, rcvbuf=None):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if rcvbuf:
+        # Малий буфер прийому: сервер не може "скинути" відповідь у ядро і звільнитись
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, ('127.0.0.1', port))
+    reader, writer = await asyncio.open_connection(sock=sock)
+    writer.write((f'GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nCookie: {cookie}\r\n'
+                  f'Connection: close\r\n\r\n').encode('latin-1'))
+    await writer.drain()
+    return reader, writer
+
+
+async def fetch(port, path, cookie=''):
+    """Повний запит; повертає статус."""
+    reader, writer = await open_request(port, path, cookie)
+    try:
+        status_line = await reader.readline()
+        await reader.read()
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+async def poller(port, cookie, payment_id, mode, stop_at, stats):
+    path = f'/api/payments/{payment_id}?wait={POLL_WAIT}'
+    while time.monotonic() < stop_at:
+        try:
+            status = await asyncio.wait_for(fetch(port, path, cookie), timeout=POLL_WAIT + 10)
+            stats['requests'] += 1
+            if status >= 500:
+                stats['errors'] += 1
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+            stats['errors'] += 1
+        if mode == 'sync':
+            # Sync-сервер відповідає одразу — клієнт чекає Retry-After, як checkout.html
+            await asyncio.sleep(POLL_INTERVAL)
+
+
+async def slow_reader(port, cookie, stop_at, stats):
+    while time.monotonic() < stop_at:
+        try:
+            reader, writer = await open_request(port, '/api/journal/export?format=json', cookie, SLOW_RCVBUF)
+        except OSError:
+            stats['errors'] += 1
+            await asyncio.sleep(0.5)
+            continue
+        stats['requests'] += 1
+        try:
+            while time.monotonic() < stop_at:
+                chunk = await reader.read(SLOW_CHUNK)
+                if not chunk:
+                    break
+                await asyncio.sleep(SLOW_DELAY)
+        except OSError:
+            stats['errors'] += 1
+        finally:
+            writer.close()
+
+
+async def probe(port, stop_at, latencies, failures):
+    while time.monotonic() < stop_at:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(fetch(port, '/health'), timeout=PROBE_TIMEOUT)
+            latencies.append((time.perf_counter() - started) * 1000)
+        except (OSError, asyncio.TimeoutError, ValueError, IndexError):
+            failures[0] += 1
+        await asyncio.sleep(PROBE_INTERVAL)
+
+
+async def scenario(name, mode, port, cookie, payment_id, clients, duration):
+    stop_at = time.monotonic() + duration
+    stats = {'requests': 0, 'errors': 0}
+    latencies, failures = [], [0]
+    if name == 'poll':
+        tasks = [poller(port, cookie, payment_id, mode, stop_at, stats) for _ in range(clients)]
+    else:
+        tasks = [slow_reader(port, cookie, stop_at, stats) for _ in range(clients)]
+    # Проба стартує, коли клієнти вже відкрили з'єднання
+    await asyncio.gather(*tasks, asyncio.sleep(0.5), probe(port, stop_at, latencies, failures))
+    latencies.sort()
+    return {
+        'client_requests': stats['requests'],
+        'client_errors': stats['errors'],
+        'probe_p50_ms': statistics.median(latencies) if latencies else None,
+        'probe_p95_ms': latencies[max(int(len(latencies) * 0.95) - 1, 0)] if latencies else None,
+        'probe_failures': failures[0],
+    }
+
+
+def run_mode(mode, args, db_path, payment_id):
+    env = dict(os.environ)
+    env.update(MODES[mode])
+    env.update({
+        'DATABASE_URL': f'sqlite:///{db_path}',
+        'WEB_CONCURRENCY': str(args.workers),
+        'GUNICORN_ACCESS_LOG': '',
+        'GUNICORN_LOG_LEVEL': 'warning',
+        'GUNICORN_MAX_REQUESTS': '0',
+        'GUNICORN_TIMEOUT': str(int(args.duration) + 30),
+    })
+    proc = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+                             '-b', f'127.0.0.1:{args.port}'],
+                            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if not wait_ready(args.port):
+            raise RuntimeError(f'gunicorn ({mode}) не стартував')
+        cookie = login(args.port)
+        results = {}
+        for name in args.scenarios:
+            results[name] = asyncio.run(scenario(name, mode, args.port, cookie, payment_id,
+                                                 args.clients, args.duration))
+        return results
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ASGI vs sync gunicorn під утримуваними з\'єднаннями')
+    parser.add_argument('--workers', type=int, default=2, help='Воркерів в обох режимах')
+    parser.add_argument('--clients', type=int, default=50, help='Одночасних клієнтів')
+    parser.add_argument('--duration', type=float, default=10.0, help='Тривалість сценарію, секунди')
+    parser.add_argument('--scenarios', default='poll,slow', help='poll, slow через кому')
+    parser.add_argument('--port', type=int, default=5098)
+    parser.add_argument('--json', action='store_true', help='Вивести результат як JSON')
+    parser.add_argument('--seed', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.seed:
+        seed(args.seed)
+        return 0
+    args.scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip() in ('poll', 'slow')]
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{db_path}')
+        subprocess.run([sys.executable, os.path.join(ROOT, 'scripts', 'init_db.py')],
+                       cwd=ROOT, env=env, capture_output=True, check=True)
+        seeded = subprocess.run([sys.executable, os.path.abspath(__file__), '--seed', db_path],
+                                cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        payment_id = int(seeded.stdout.strip().splitlines()[-1])
+        for mode in MODES:
+            report[mode] = run_mode(mode, args, db_path, payment_id)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{'mode':<6} {'scenario':<8} {'client req':>10} {'errors':>6} {'/health p50':>12} "
+          f"{'p95':>9} {'timeouts':>8}")
+    for mode, results in report.items():
+        for name, data in results.items():
+            p50 = f"{data['probe_p50_ms']:.1f}ms" if data['probe_p50_ms'] is not None else '-'
+            p95 = f"{data['probe_p95_ms']:.1f}ms" if data['probe_p95_ms'] is not None else '-'
+            print(f"{mode:<6} {name:<8} {data['client_requests']:>10} {data['client_errors']:>6} "
+                  f"{p50:>12} {p95:>9} {data['probe_failures']:>8}")
+    print(f"workers={args.workers}, clients={args.clients}, duration={args.duration}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""
+Бенчмарк production-профілю gunicorn: пам'ять воркерів і пропускна здатність
+для sync та gthread воркерів (gunicorn.conf.py, server_profile.py).
+
+Для кожного класу воркерів запускається gunicorn з тимчасовою SQLite-БД,
+після прогріву вимірюється RSS та PSS кожного воркера (PSS ділить спільні
+copy-on-write сторінки між процесами — саме його зменшують preload і
+gc.freeze), потім C клієнтських потоків D секунд б'ють по набору URL.
+
+    python scripts/benchmark_server.py
+    python scripts/benchmark_server.py --workers 4 --concurrency 16 --duration 20 --json
+
+Лише Linux (читає /proc).
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PATHS = ('/', '/api/products', '/api/quotes/daily', '/about', '/health')
+CLASSES = {
+    'sync': {'GUNICORN_WORKER_CLASS': 'sync', 'GUNICORN_THREADS': '1'},
+    'gthread': {'GUNICORN_WORKER_CLASS': 'gthread', 'GUNICORN_THREADS': '4'},
+}
+
+
+def child_pids(parent):
+    pids = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as fh:
+                fields = fh.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == parent:
+            pids.append(int(entry))
+    return sorted(pids)
+
+
+def memory_kb(pid):
+    """(RSS, PSS) процесу в KB."""
+    rss = pss = None
+    with open(f'/proc/{pid}/status') as fh:
+        for line in fh:
+            if line.startswith('VmRSS:'):
+                rss = int(line.split()[1])
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as fh:
+            for line in fh:
+                if line.startswith('Pss:'):
+                    pss = int(line.split()[1])
+    except OSError:
+        pass
+    return rss, pss
+
+
+def wait_ready(port, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/health')
+            if conn.getresponse().status == 200:
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def load(port, concurrency, duration):
+    """C потоків з keep-alive з'єднаннями; повертає (запитів, помилок, латентності ms)."""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client(offset):
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        i = offset
+        local = []
+        local_errors = 0
+        while time.monotonic() < stop_at:
+            path = PATHS[i % len(PATHS)]
+            i += 1
+            started = time.perf_counter()
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 500:
+                    local_errors += 1
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+                continue
+            local.append((time.perf_counter() - started) * 1000)
+        with lock:
+            latencies.extend(local)
+            errors[0] += local_errors
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(latencies), errors[0], latencies
+
+
+def run_class(name, args, db_path, port):
+    env = dict(os.environ)
+    env.update(CLASSES[name])
+    env.update({
+        'DATABASE_URL': f'sqlite:///{db_path}',
+        'WEB_CONCURRENCY': str(args.workers),
+        'GUNICORN_ACCESS_LOG': '',
+        'GUNICORN_LOG_LEVEL': 'warning',
+        # Рециклінг воркерів посеред заміру рве keep-alive з'єднання клієнтів
+        'GUNICORN_MAX_REQUESTS': '0',
+    })
+    proc = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+                             '-b', f'127.0.0.1:{port}'],
+                            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if not wait_ready(port):
+            raise RuntimeError(f'gunicorn ({name}) не стартував')
+        # Прогрів: кожен воркер віддає всі URL хоча б раз
+        load(port, args.workers * 2, 1.0)
+        workers = child_pids(proc.pid)
+        memory = [memory_kb(pid) for pid in workers]
+        count, errors, latencies = load(port, args.concurrency, args.duration)
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+    latencies.sort()
+    return {
+        'workers': len(workers),
+        'threads': int(CLASSES[name]['GUNICORN_THREADS']),
+        'rss_kb': [m[0] for m in memory],
+        'pss_kb': [m[1] for m in memory],
+        'requests': count,
+        'errors': errors,
+        'rps': count / args.duration,
+        'p50_ms': statistics.median(latencies) if latencies else None,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] if latencies else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Бенчмарк gunicorn-профілю DailyMood')
+    parser.add_argument('--workers', type=int, default=2, help='Кількість воркерів (WEB_CONCURRENCY)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Клієнтських потоків')
+    parser.add_argument('--duration', type=float, default=10.0, help='Тривалість навантаження, секунди')
+    parser.add_argument('--classes', default=','.join(CLASSES), help='Класи воркерів через кому')
+    parser.add_argument('--port', type=int, default=5099)
+    parser.add_argument('--json', action='store_true', help='Вивести результат як JSON')
+    args = parser.parse_args(argv)
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{db_path}')
+        subprocess.run([sys.executable, os.path.join(ROOT, 'scripts', 'init_db.py')],
+                       cwd=ROOT, env=env, capture_output=True, check=True)
+        for name in [c.strip() for c in args.classes.split(',') if c.strip() in CLASSES]:
+            report[name] = run_class(name, args, db_path, args.port)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{'class':<8} {'workers':>7} {'threads':>7} {'RSS/worker':>11} {'PSS/worker':>11} "
+          f"{'req/s':>8} {'p50':>7} {'p95':>7} {'errors':>6}")
+    for name, data in report.items():
+        rss = statistics.mean(data['rss_kb']) / 1024 if data['rss_kb'] else 0
+        pss_values = [p for p in data['pss_kb'] if p is not None]
+        pss = f"{statistics.mean(pss_values) / 1024:>9.1f}MB" if pss_values else f"{'-':>11}"
+        print(f"{name:<8} {data['workers']:>7} {data['threads']:>7} {rss:>9.1f}MB {pss} "
+              f"{data['rps']:>8.1f} {data['p50_ms']:>6.1f}ms {data['p95_ms']:>6.1f}ms {data['errors']:>6}")
+    print(f"concurrency={args.concurrency}, duration={args.duration}s, URL: {', '.join(PATHS)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
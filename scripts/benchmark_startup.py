@@ -0,0 +1,116 @@
+"""
+Бенчмарк холодного старту: час до першої відповіді нового процесу.
+
+Кожен прогін — окремий процес Python, що імпортує app.py і віддає кілька
+сторінок через test_client. Порівнюються режими:
+    cold      — без кешу байткоду і прогріву (як було раніше)
+    bytecode  — кеш байткоду Jinja, заповнений precompile_templates.py
+    warmup    — кеш байткоду + прогрів шаблонів при старті
+
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --runs 10 --json
+
+Використовується тимчасова SQLite-БД і тимчасова папка кешу, кеш сторінок
+вимкнено — вимірюється саме рендер.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PAGES = ('/', '/about', '/store', '/journal', '/login')
+
+MODES = {
+    'cold': {'TEMPLATE_BYTECODE_CACHE': 'false', 'TEMPLATE_WARMUP': 'false'},
+    'bytecode': {'TEMPLATE_BYTECODE_CACHE': 'true', 'TEMPLATE_WARMUP': 'false'},
+    'warmup': {'TEMPLATE_BYTECODE_CACHE': 'true', 'TEMPLATE_WARMUP': 'true'},
+}
+
+
+def child():
+    """Один холодний старт: імпорт app і перші запити. Результат — JSON у stdout."""
+    started = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    from app import create_app
+    app = create_app()
+    imported = time.perf_counter()
+    client = app.test_client()
+    pages = {}
+    for path in PAGES:
+        t = time.perf_counter()
+        response = client.get(path)
+        pages[path] = {'ms': (time.perf_counter() - t) * 1000, 'status': response.status_code}
+    first = pages[PAGES[0]]['ms']
+    print(json.dumps({
+        'import_ms': (imported - started) * 1000,
+        'first_response_ms': first,
+        'time_to_first_response_ms': (imported - started) * 1000 + first,
+        'pages': pages,
+    }))
+
+
+def run_once(mode, cache_dir, db_path):
+    env = dict(os.environ)
+    env.update(MODES[mode])
+    env.update({
+        'TEMPLATE_CACHE_DIR': cache_dir,
+        'DATABASE_URL': f'sqlite:///{db_path}',
+        'PAGE_CACHE_ENABLED': 'false',
+    })
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child'],
+                         cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def summarize(results):
+    keys = ('import_ms', 'first_response_ms', 'time_to_first_response_ms')
+    summary = {key: statistics.median(r[key] for r in results) for key in keys}
+    summary['pages'] = {path: statistics.median(r['pages'][path]['ms'] for r in results) for path in PAGES}
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Бенчмарк холодного старту DailyMood')
+    parser.add_argument('--runs', type=int, default=5, help='Прогонів на режим (медіана)')
+    parser.add_argument('--modes', default=','.join(MODES), help='Режими через кому')
+    parser.add_argument('--json', action='store_true', help='Вивести результат як JSON')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child()
+        return 0
+
+    modes = [m.strip() for m in args.modes.split(',') if m.strip() in MODES]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, 'jinja')
+        db_path = os.path.join(tmp, 'bench.db')
+        subprocess.run([sys.executable, os.path.join(ROOT, 'scripts', 'precompile_templates.py'),
+                        '--cache-dir', cache_dir], cwd=ROOT, capture_output=True, check=True)
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{db_path}')
+        subprocess.run([sys.executable, os.path.join(ROOT, 'scripts', 'init_db.py')],
+                       cwd=ROOT, env=env, capture_output=True, check=True)
+        report = {mode: summarize([run_once(mode, cache_dir, db_path) for _ in range(args.runs)])
+                  for mode in modes}
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{'mode':<10} {'import':>10} {'1st resp':>10} {'TTFR':>10}   " + ' '.join(f'{p:>9}' for p in PAGES))
+    for mode, data in report.items():
+        pages = ' '.join(f"{data['pages'][p]:>9.1f}" for p in PAGES)
+        print(f"{mode:<10} {data['import_ms']:>10.1f} {data['first_response_ms']:>10.1f} "
+              f"{data['time_to_first_response_ms']:>10.1f}   {pages}")
+    print('мс, медіана з', args.runs, 'прогонів; TTFR = імпорт і create_app() + перша відповідь')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
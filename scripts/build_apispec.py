@@ -0,0 +1,32 @@
+"""
+Будує Swagger-специфікацію API один раз під час збірки образу (api_docs.py).
+
+Воркери віддають готовий файл з пам'яті й не імпортують flasgger:
+    python scripts/build_apispec.py
+    python scripts/build_apispec.py --out /tmp/apispec.json
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from app import app
+import api_docs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Збірка Swagger-специфікації DailyMood')
+    parser.add_argument('--out', help='Шлях файлу (за замовчуванням API_SPEC_DIR/apispec-<відбиток>.json)')
+    args = parser.parse_args(argv)
+
+    path = api_docs.write_spec(app, args.out)
+    print(f'{os.path.getsize(path)} B -> {path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Збирає фронтенд-статику: бандли з мініфікацією та .gz/.br (asset_pipeline.py),
+потім маніфест з хешами вмісту (static/asset-manifest.json).
+
+Запускається під час збірки образу, щоб додаток не хешував файли при старті:
+    python scripts/build_assets.py              # бандли + маніфест, звіт розмірів
+    python scripts/build_assets.py --strict     # код виходу 1 при перевищенні бюджету
+    python scripts/build_assets.py --manifest-only
+"""
+
+import argparse
+import os
+import sys
+
+# Ensure the project root is on sys.path so `import assets` works when this
+# script is executed from the scripts/ directory.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import asset_pipeline
+import assets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Збірка статики DailyMood')
+    parser.add_argument('--static', default=os.path.join(ROOT, 'static'),
+                        help='Папка статики (за замовчуванням static/)')
+    parser.add_argument('--manifest-only', action='store_true',
+                        help='Лише маніфест, без збірки бандлів')
+    parser.add_argument('--no-minify', action='store_true',
+                        help='Склеїти бандли без мініфікації (для налагодження)')
+    parser.add_argument('--strict', action='store_true',
+                        help='Завершитись з помилкою, якщо бандл перевищує бюджет')
+    args = parser.parse_args(argv)
+
+    violations = []
+    if not args.manifest_only:
+        stats = asset_pipeline.build(args.static, do_minify=not args.no_minify)
+        print(asset_pipeline.format_report(stats))
+        if asset_pipeline.brotli is None:
+            print('brotli не встановлено — .br варіанти не створено')
+        violations = asset_pipeline.check_budgets(stats)
+        for violation in violations:
+            print(f'Перевищено бюджет: {violation}', file=sys.stderr)
+
+    manifest = assets.build_manifest(args.static)
+    path = assets.write_manifest(args.static, manifest)
+    print(f'{len(manifest)} файлів -> {path}')
+
+    if violations and args.strict:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
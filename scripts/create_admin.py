@@ -16,6 +16,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app import app, db
 from models import User, Product
+import schema_bootstrap
 
 def create_admin(email='admin@dailymood.com', password='admin123'):
     """
@@ -113,6 +114,8 @@ if __name__ == '__main__':
     print(f'Email: {args.email}')
     print(f'Пароль: {args.password}\n')
     
+    # Імпорт app.py не створює таблиць — розгортаємо схему (ідемпотентно, під блокуванням)
+    schema_bootstrap.bootstrap(app)
     create_admin(args.email, args.password)
     create_sample_products()
     
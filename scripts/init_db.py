@@ -7,14 +7,15 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from app import app
-from models import db
+from app import create_app
+import schema_bootstrap
 
 
 def init_db():
-    with app.app_context():
-        db.create_all()
-        print('DB initialized at', app.config.get('SQLALCHEMY_DATABASE_URI'))
+    """Одноразове розгортання схеми (create_all, SQLite-міграції, індекс прав) під блокуванням."""
+    app = create_app()
+    elapsed = schema_bootstrap.bootstrap(app)
+    print('DB initialized at', app.config.get('SQLALCHEMY_DATABASE_URI'), f'({elapsed * 1000:.0f} ms)')
 
 
 if __name__ == '__main__':
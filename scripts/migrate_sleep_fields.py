@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app import app, db
 from models import MoodEntry
 from sqlalchemy import inspect, text
+import schema_bootstrap
 
 def migrate_sleep_fields():
     """Додає поля sleep_quality та sleep_hours до mood_entries таблиці"""
@@ -48,6 +49,8 @@ def migrate_sleep_fields():
 
 if __name__ == '__main__':
     try:
+        # Імпорт app.py не створює таблиць — на новій БД спершу розгортаємо схему
+        schema_bootstrap.bootstrap(app)
         migrate_sleep_fields()
     except Exception as e:
         print(f"✗ Помилка під час міграції: {e}")
@@ -0,0 +1,45 @@
+"""
+Компілює всі Jinja-шаблони в кеш байткоду (template_cache.py).
+
+Запускається під час збірки образу, щоб воркери не компілювали шаблони
+з вихідного коду при першому запиті:
+    python scripts/precompile_templates.py
+    python scripts/precompile_templates.py --cache-dir /tmp/jinja
+
+Використовується мінімальний Flask-додаток з тими ж шаблонами та
+налаштуваннями Jinja, що й app.py, — без підключення до БД та інших
+побічних ефектів імпорту app.py. Байткод прив'язаний до версії Python,
+тож кеш треба будувати тим самим інтерпретатором, що запускає додаток.
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from flask import Flask
+
+import template_cache
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Прекомпіляція шаблонів DailyMood')
+    parser.add_argument('--cache-dir', default=os.environ.get('TEMPLATE_CACHE_DIR') or os.path.join(ROOT, '.cache', 'jinja'),
+                        help='Папка кешу байткоду (за замовчуванням .cache/jinja)')
+    args = parser.parse_args(argv)
+
+    app = Flask('app', root_path=ROOT)
+    app.config['TEMPLATE_CACHE_DIR'] = args.cache_dir
+    if template_cache.init_app(app) is None:
+        print(f'Не вдалося створити кеш у {args.cache_dir}', file=sys.stderr)
+        return 1
+    count, elapsed = template_cache.precompile(app)
+    print(f'{count} шаблонів -> {template_cache.cache_dir(app)} ({elapsed * 1000:.0f} ms)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Воркер черги фонових задач DailyMood.
+
+Приклади:
+    python scripts/run_worker.py                      # 1 потік
+    python scripts/run_worker.py -c 4                 # 4 потоки
+    python scripts/run_worker.py -c 4 --mode process  # 4 процеси
+    python scripts/run_worker.py --burst              # обробити чергу і вийти
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Ensure the project root is on sys.path so `import app` works when this
+# script is executed from the scripts/ directory.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from app import create_app
+import task_queue
+import tasks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Воркер фонових задач DailyMood')
+    parser.add_argument('-c', '--concurrency', type=int,
+                        default=int(os.environ.get('TASK_WORKER_CONCURRENCY', 2)),
+                        help='Кількість потоків/процесів (TASK_WORKER_CONCURRENCY)')
+    parser.add_argument('--mode', choices=['thread', 'process'],
+                        default=os.environ.get('TASK_WORKER_MODE', 'thread'),
+                        help='Тип пулу: потоки або процеси (TASK_WORKER_MODE)')
+    parser.add_argument('--poll-interval', type=float,
+                        default=float(os.environ.get('TASK_WORKER_POLL_INTERVAL', 1.0)),
+                        help='Пауза між опитуваннями порожньої черги, секунди')
+    parser.add_argument('--burst', action='store_true',
+                        help='Завершити роботу, коли черга спорожніє')
+    args = parser.parse_args(argv)
+
+    app = create_app()
+    with app.app_context():
+        # Періодична чистка прострочених прав сама себе перепланує
+        tasks.schedule_entitlement_sweep()
+
+    logging.info("Старт воркера: concurrency=%s mode=%s", args.concurrency, args.mode)
+    task_queue.run_worker(app, concurrency=max(args.concurrency, 1), mode=args.mode,
+                          poll_interval=args.poll_interval, burst=args.burst)
+
+
+if __name__ == '__main__':
+    main()
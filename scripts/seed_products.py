@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from app import app, db
 from models import Product
+import schema_bootstrap
 
 def seed_products():
     """Create initial products in the database."""
@@ -87,6 +88,8 @@ def seed_products():
 if __name__ == '__main__':
     print("🌱 Початок заповнення бази продуктами...\n")
     try:
+        # Імпорт app.py не створює таблиць — розгортаємо схему (ідемпотентно, під блокуванням)
+        schema_bootstrap.bootstrap(app)
         seed_products()
     except Exception as e:
         print(f"\n❌ Помилка: {e}")
@@ -0,0 +1,56 @@
+"""
+Імітація асинхронної репліки для локальної перевірки replica_routing.py.
+
+Копіює основну SQLite-базу у файл репліки (sqlite3 backup API — цілісний
+знімок навіть під записами) кожні --interval секунд, тобто репліка
+відстає на 0..interval секунд:
+
+    python scripts/sync_sqlite_replica.py --replica data/replica.db --interval 3
+    DB_REPLICA_URLS=sqlite:///data/replica.db python app.py
+
+--once — одна копія і вихід.
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_PRIMARY = os.path.join(ROOT, 'data', 'dailymood.db')
+
+
+def sync(primary, replica):
+    source = sqlite3.connect(primary)
+    target = sqlite3.connect(replica)
+    try:
+        source.backup(target)
+    finally:
+        source.close()
+        target.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--primary', default=DEFAULT_PRIMARY, help='основна SQLite-база')
+    parser.add_argument('--replica', required=True, help='файл репліки')
+    parser.add_argument('--interval', type=float, default=3.0, help='секунди між копіями (відставання репліки)')
+    parser.add_argument('--once', action='store_true', help='одна копія і вихід')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.primary):
+        print(f'Основну базу не знайдено: {args.primary}', file=sys.stderr)
+        return 1
+    while True:
+        started = time.perf_counter()
+        sync(args.primary, args.replica)
+        print(f'{time.strftime("%H:%M:%S")} репліку оновлено ({(time.perf_counter() - started) * 1000:.0f} ms)',
+              flush=True)
+        if args.once:
+            return 0
+        time.sleep(args.interval)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
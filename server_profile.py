@@ -0,0 +1,115 @@
+"""
+Профіль production-сервера gunicorn (див. gunicorn.conf.py).
+
+- Кількість воркерів і потоків — від кількості CPU та типу БД:
+  PostgreSQL витримує паралельні записи з багатьох процесів (2*CPU+1
+  воркерів gthread по 2 потоки); SQLite серіалізує записи на рівні файлу,
+  тож більше процесів дає лише "database is locked" — 1–2 воркери з
+  потоками (I/O-очікування все одно паралельні).
+- preload: додаток імпортується один раз у master; перед fork — gc.freeze(),
+  щоб збирач сміття воркерів не торкався успадкованих об'єктів і сторінки
+  пам'яті лишались спільними (copy-on-write).
+- Після fork воркер скидає пули з'єднань БД, успадковані від master
+  (сокет не можна ділити між процесами).
+- Воркери перезапускаються після max_requests (+ випадковий jitter, щоб не
+  рестартували всі одночасно) — захист від поступового росту пам'яті.
+
+- SERVER_MODE=asgi — воркери uvicorn з asgi.py (по одному на CPU; паралельність
+  sync-view задає пул потоків ASGI_THREADS, очікування не займають потоків).
+
+Усе перевизначається змінними оточення WEB_CONCURRENCY, GUNICORN_THREADS,
+GUNICORN_WORKER_CLASS, GUNICORN_MAX_REQUESTS, GUNICORN_MAX_REQUESTS_JITTER.
+"""
+
+import gc
+import logging
+import os
+
+DEFAULT_MAX_REQUESTS = 1000
+DEFAULT_MAX_REQUESTS_JITTER = 100
+SQLITE_MAX_WORKERS = 2
+SQLITE_THREADS = 4
+POSTGRES_THREADS = 2
+ASGI_WORKER_CLASS = 'uvicorn.workers.UvicornWorker'
+
+
+def cpu_count():
+    """CPU, доступні процесу (з урахуванням affinity/cgroup cpuset)."""
+    try:
+        return max(len(os.sched_getaffinity(0)), 1)
+    except (AttributeError, OSError):
+        return max(os.cpu_count() or 1, 1)
+
+
+def database_backend(url=None):
+    url = url if url is not None else (os.environ.get('DATABASE_URL')
+                                       or os.environ.get('SQLALCHEMY_DATABASE_URI') or '')
+    if url.startswith(('postgres://', 'postgresql')):
+        return 'postgresql'
+    if not url or url.startswith('sqlite'):
+        return 'sqlite'
+    return url.split(':', 1)[0].split('+', 1)[0]
+
+
+def server_mode():
+    """'wsgi' (за замовчуванням) або 'asgi'."""
+    return 'asgi' if (os.environ.get('SERVER_MODE') or '').strip().lower() == 'asgi' else 'wsgi'
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def recommended(backend=None, cpus=None, mode=None):
+    """Повертає {'workers', 'threads', 'worker_class'} для бекенду, кількості CPU та режиму."""
+    backend = backend or database_backend()
+    cpus = cpus or cpu_count()
+    mode = mode or server_mode()
+    if mode == 'asgi':
+        workers = min(cpus, SQLITE_MAX_WORKERS) if backend == 'sqlite' else cpus
+        return {
+            'workers': max(_env_int('WEB_CONCURRENCY', workers), 1),
+            'threads': 1,
+            'worker_class': os.environ.get('GUNICORN_WORKER_CLASS') or ASGI_WORKER_CLASS,
+        }
+    if backend == 'sqlite':
+        workers = min(cpus, SQLITE_MAX_WORKERS)
+        threads = SQLITE_THREADS
+    else:
+        workers = 2 * cpus + 1
+        threads = POSTGRES_THREADS
+
+    workers = max(_env_int('WEB_CONCURRENCY', workers), 1)
+    threads = max(_env_int('GUNICORN_THREADS', threads), 1)
+    worker_class = os.environ.get('GUNICORN_WORKER_CLASS') or ('gthread' if threads > 1 else 'sync')
+    return {'workers': workers, 'threads': threads, 'worker_class': worker_class}
+
+
+def recycling():
+    return {
+        'max_requests': max(_env_int('GUNICORN_MAX_REQUESTS', DEFAULT_MAX_REQUESTS), 0),
+        'max_requests_jitter': max(_env_int('GUNICORN_MAX_REQUESTS_JITTER', DEFAULT_MAX_REQUESTS_JITTER), 0),
+    }
+
+
+def freeze_heap():
+    """Переносить усі наявні об'єкти в permanent generation перед fork."""
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
+
+
+def dispose_engines(app):
+    """Скидає успадковані від master пули з'єднань (у дочірньому процесі після fork)."""
+    from models import db
+
+    # ASGI-обгортка (asgi.py) тримає Flask-додаток в атрибуті flask_app
+    app = getattr(app, 'flask_app', app)
+    with app.app_context():
+        for engine in db.engines.values():
+            # close=False: не закривати сокети master-а, лише забути їх у цьому процесі
+            engine.dispose(close=False)
+    logging.debug("Пули з'єднань БД скинуто після fork (pid %s)", os.getpid())
@@ -0,0 +1,78 @@
+"""
+Класифікація запитів і вибіркове завантаження сесії.
+
+Flask-Session (filesystem) читає файл сесії ще до маршрутизації, а
+before_request підтягує User з БД — для кожного CSS/JS/перекладу, /health
+та публічного каталогу це зайва робота. SelectiveSessionInterface
+повертає для таких запитів null-сесію: файл не читається, cookie не
+оновлюється, save_session не викликається.
+
+Класи запитів:
+- 'static' — /static/*, /flasgger_static/*, /i18n/*, /favicon.ico
+- 'health' — /health, /health/*
+- 'public' — GET/HEAD публічного каталогу (продукти, специфікація API)
+- 'app'    — решта, звичайна сесія
+"""
+
+from flask.sessions import SessionInterface
+
+STATIC_PREFIXES = ('/static/', '/flasgger_static/', '/i18n/')
+STATIC_PATHS = {'/favicon.ico'}
+HEALTH_PATHS = {'/health'}
+HEALTH_PREFIXES = ('/health/',)
+PUBLIC_PATHS = {'/api/products', '/api/v1/products', '/api/v2/products', '/apispec.json'}
+PUBLIC_METHODS = ('GET', 'HEAD', 'OPTIONS')
+SESSIONLESS = ('static', 'health', 'public')
+
+_ENVIRON_KEY = 'dailymood.request_class'
+
+
+def register_public(*paths):
+    """Додає анонімні GET-маршрути, яким не потрібна сесія."""
+    PUBLIC_PATHS.update(paths)
+
+
+def classify(path, method='GET'):
+    if path.startswith(STATIC_PREFIXES) or path in STATIC_PATHS:
+        return 'static'
+    if path in HEALTH_PATHS or path.startswith(HEALTH_PREFIXES):
+        return 'health'
+    if method in PUBLIC_METHODS and path in PUBLIC_PATHS:
+        return 'public'
+    return 'app'
+
+
+def request_class(request):
+    """Клас запиту (рахується один раз і кешується в environ)."""
+    cls = request.environ.get(_ENVIRON_KEY)
+    if cls is None:
+        cls = classify(request.path, request.method)
+        request.environ[_ENVIRON_KEY] = cls
+    return cls
+
+
+def is_sessionless(request):
+    return request_class(request) in SESSIONLESS
+
+
+class SelectiveSessionInterface(SessionInterface):
+    """Обгортка над інтерфейсом Flask-Session, що пропускає сесію для static/health/public."""
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    def __getattr__(self, name):
+        # Атрибути конкретного бекенду (serializer, cache, ...) — з обгорнутого інтерфейсу
+        return getattr(self.inner, name)
+
+    def open_session(self, app, request):
+        if is_sessionless(request):
+            return self.make_null_session(app)
+        return self.inner.open_session(app, request)
+
+    def save_session(self, app, session, response):
+        return self.inner.save_session(app, session, response)
+
+
+def init_app(app):
+    app.session_interface = SelectiveSessionInterface(app.session_interface)
@@ -0,0 +1,235 @@
+"""
+Журнал повільних SQL-запитів з відбитками та автоматичним EXPLAIN.
+
+Слухачі before/after_cursor_execute (на класі Engine — охоплюють усі
+рушії застосунку) міряють кожен запит; запити, довші за
+SLOW_QUERY_THRESHOLD_MS, потрапляють до журналу:
+- текст нормалізується у відбиток (fingerprint): літерали та плейсхолдери
+  замінюються на ?, списки IN (?, ?, ...) і багаторядкові VALUES
+  згортаються, пробіли стискаються — запити, що відрізняються лише
+  параметрами, агрегуються разом (count / total / max, endpoint-и);
+- при першій появі відбитка для SELECT / WITH знімається план:
+  EXPLAIN QUERY PLAN (SQLite) або EXPLAIN (PostgreSQL) з тими ж
+  параметрами на тому ж з'єднанні (у PostgreSQL — всередині SAVEPOINT,
+  щоб помилка не зламала транзакцію запиту);
+- кожен повільний запит пишеться в лог (WARNING), текст і план — лише
+  при першій появі.
+
+Агрегати — на процес (воркер). Адмін-API: GET/DELETE
+/api/admin/slow-queries; метрики — dailymood_slow_query_* на /metrics.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+
+from flask import current_app, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import metrics
+
+DEFAULT_THRESHOLD_MS = 100.0
+DEFAULT_MAX_FINGERPRINTS = 500
+MAX_STATEMENT_LENGTH = 4000
+MAX_ENDPOINTS = 10
+EXPLAIN_PREFIXES = ('SELECT', 'WITH')
+SORT_KEYS = ('total_ms', 'count', 'max_ms', 'mean_ms')
+
+_COMMENTS = re.compile(r'--[^\n]*|/\*.*?\*/', re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDERS = re.compile(r'%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?')
+_NUMBERS = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b', re.I)
+_LISTS = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_VALUES_ROWS = re.compile(r'(\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+')
+_WHITESPACE = re.compile(r'\s+')
+
+_STARTED_KEY = '_slow_query_started'
+_explaining = threading.local()
+
+
+def fingerprint(statement):
+    """Нормалізований текст запиту без конкретних значень."""
+    text = _COMMENTS.sub(' ', statement)
+    text = _STRINGS.sub('?', text)
+    text = _PLACEHOLDERS.sub('?', text)
+    text = _NUMBERS.sub('?', text)
+    text = _LISTS.sub('(...)', text)
+    text = _VALUES_ROWS.sub(r'\1', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def fingerprint_id(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]
+
+
+def explain(cursor_connection, dialect_name, statement, parameters):
+    """План запиту рядками або (None, помилка)."""
+    if dialect_name == 'sqlite':
+        sql = 'EXPLAIN QUERY PLAN ' + statement
+    elif dialect_name == 'postgresql':
+        sql = 'EXPLAIN ' + statement
+    else:
+        return None, f'EXPLAIN не підтримується для {dialect_name}'
+
+    cursor = cursor_connection.cursor()
+    savepoint = dialect_name == 'postgresql'
+    try:
+        if savepoint:
+            cursor.execute('SAVEPOINT slow_query_explain')
+        try:
+            cursor.execute(sql, parameters or ())
+            rows = cursor.fetchall()
+        except Exception as exc:
+            if savepoint:
+                cursor.execute('ROLLBACK TO SAVEPOINT slow_query_explain')
+            return None, str(exc)
+        if savepoint:
+            cursor.execute('RELEASE SAVEPOINT slow_query_explain')
+    finally:
+        cursor.close()
+
+    if dialect_name == 'sqlite':
+        # (id, parent, notused, detail) — відступ за глибиною вузла
+        depth = {0: -1}
+        plan = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            plan.append('  ' * depth[node_id] + str(detail))
+        return plan, None
+    return [row[0] for row in rows], None
+
+
+class SlowQueryLog:
+    """Агрегати повільних запитів за відбитками (на процес)."""
+
+    def __init__(self, app):
+        self.enabled = app.config.get('SLOW_QUERY_LOG_ENABLED', True)
+        self.threshold_ms = app.config.get('SLOW_QUERY_THRESHOLD_MS', DEFAULT_THRESHOLD_MS)
+        self.explain_enabled = app.config.get('SLOW_QUERY_EXPLAIN', True)
+        self.max_fingerprints = app.config.get('SLOW_QUERY_MAX_FINGERPRINTS', DEFAULT_MAX_FINGERPRINTS)
+        self.dropped = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.dropped = 0
+
+    def record(self, statement, duration_ms, endpoint=None, explainer=None):
+        """Додає повільний запит; explainer() викликається лише для нового відбитка."""
+        text = fingerprint(statement)
+        key = fingerprint_id(text)
+        now = datetime.utcnow().isoformat(timespec='seconds') + 'Z'
+        with self._lock:
+            entry = self._entries.get(key)
+            is_new = entry is None
+            if is_new:
+                if len(self._entries) >= self.max_fingerprints:
+                    self.dropped += 1
+                    return None
+                entry = self._entries[key] = {
+                    'id': key, 'fingerprint': text, 'example': statement[:MAX_STATEMENT_LENGTH],
+                    'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'first_seen': now, 'last_seen': now,
+                    'endpoints': {}, 'plan': None, 'plan_error': None,
+                }
+            entry['count'] += 1
+            entry['total_ms'] += duration_ms
+            entry['max_ms'] = max(entry['max_ms'], duration_ms)
+            entry['last_seen'] = now
+            if endpoint and (endpoint in entry['endpoints'] or len(entry['endpoints']) < MAX_ENDPOINTS):
+                entry['endpoints'][endpoint] = entry['endpoints'].get(endpoint, 0) + 1
+
+        if is_new:
+            if explainer is not None and self.explain_enabled and text.upper().startswith(EXPLAIN_PREFIXES):
+                plan, error = explainer()
+                with self._lock:
+                    entry['plan'], entry['plan_error'] = plan, error
+            logging.warning("Slow query %.1f ms [%s] (%s): %s%s", duration_ms, key, endpoint or '-', text,
+                            ''.join(f'\n    {line}' for line in entry['plan'] or ()))
+        else:
+            logging.warning("Slow query %.1f ms [%s] (%s)", duration_ms, key, endpoint or '-')
+        return entry
+
+    def snapshot(self, sort='total_ms', limit=None):
+        """Копії записів, відсортовані за sort (спадання)."""
+        with self._lock:
+            entries = [dict(entry, endpoints=dict(entry['endpoints'])) for entry in self._entries.values()]
+        for entry in entries:
+            entry['total_ms'] = round(entry['total_ms'], 3)
+            entry['max_ms'] = round(entry['max_ms'], 3)
+            entry['mean_ms'] = round(entry['total_ms'] / entry['count'], 3)
+        entries.sort(key=lambda entry: entry[sort], reverse=True)
+        return entries[:limit] if limit else entries
+
+
+def get_log(app=None):
+    app = app or current_app
+    return app.extensions.get('slow_queries')
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _handle_error(context):
+    # Після помилки after_cursor_execute не викликається — знімаємо мітку часу
+    started = context.connection.info.get(_STARTED_KEY) if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get(_STARTED_KEY)
+    if not started:
+        return
+    duration_ms = (time.perf_counter() - started.pop()) * 1000
+    if getattr(_explaining, 'active', False) or not has_app_context():
+        return
+    log = get_log()
+    if log is None or not log.enabled or duration_ms < log.threshold_ms:
+        return
+
+    def explainer():
+        if executemany:
+            return None, 'executemany'
+        _explaining.active = True
+        try:
+            return explain(cursor.connection, conn.dialect.name, statement, parameters)
+        finally:
+            _explaining.active = False
+
+    endpoint = request.endpoint if has_request_context() else None
+    log.record(statement, duration_ms, endpoint, explainer)
+
+
+def collect(app):
+    """Метрики для /metrics: лічильники та час за відбитками."""
+    log = get_log(app)
+    if log is None:
+        return
+    entries = log.snapshot()
+    yield ('slow_queries_total', 'counter', 'Повільні SQL-запити за відбитком',
+           [({'fingerprint': e['id']}, e['count']) for e in entries])
+    yield ('slow_query_seconds_total', 'counter', 'Сумарний час повільних SQL-запитів за відбитком',
+           [({'fingerprint': e['id']}, e['total_ms'] / 1000) for e in entries])
+    yield ('slow_query_max_seconds', 'gauge', 'Найдовший повільний SQL-запит за відбитком',
+           [({'fingerprint': e['id']}, e['max_ms'] / 1000) for e in entries])
+    yield ('slow_query_fingerprints_dropped_total', 'counter',
+           'Повільні запити нових відбитків понад SLOW_QUERY_MAX_FINGERPRINTS', [({}, log.dropped)])
+
+
+def init_app(app):
+    log = app.extensions['slow_queries'] = SlowQueryLog(app)
+    if log.enabled and not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+    metrics.register(collect)
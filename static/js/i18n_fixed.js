@@ -4,10 +4,26 @@ const SUPPORTED_LANGUAGES = ['uk', 'en'];
 // Поточна мова
 let currentLanguage = localStorage.getItem('dailyMoodLanguage') || 'uk';
 
+// Довантажує каталог мови (JSON з відбитком, див. window.I18N_CATALOGS у base.html).
+// Каталог активної мови вже підключено синхронно, тож запит потрібен лише при перемиканні.
+function loadTranslations(lang) {
+    const key = 'translations_' + lang;
+    const target = window[key] || (window[key] = {});
+    const url = (window.I18N_CATALOGS || {})[lang];
+    if (Object.keys(target).length || !url) return Promise.resolve(target);
+    return fetch(url)
+        .then(response => response.ok ? response.json() : {})
+        .then(data => Object.assign(target, data))
+        .catch(() => target);
+}
+
 // Функція зміни мови
 function changeLanguage(lang) {
     if (!SUPPORTED_LANGUAGES.includes(lang)) return;
-    
+    return loadTranslations(lang).then(() => applyLanguage(lang));
+}
+
+function applyLanguage(lang) {
     const langSelect = document.getElementById('languageSelect');
     if (langSelect) {
         // Додаємо клас для анімації
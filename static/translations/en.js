@@ -1,415 +0,0 @@
-const translations_en = {
-    // Navigation
-    'nav_home': 'Home',
-    'nav_journal': 'Journal',
-    'nav_statistics': 'Statistics',
-    'nav_goals': 'Goals',
-    'nav_favorites': 'Favorites',
-    'nav_about': 'About',
-
-    // Favorites page
-    'favorites_title': 'Favorite Advice',
-    'favorites_description': 'Your saved advice is stored locally in your browser. Manage your collection: copy, delete, or return to the home page for new advice.',
-    'no_favorites': 'You have no saved advice yet. Return to the home page and save some!',
-    'delete': 'Delete',
-    'clear_all': 'Clear All',
-    'confirm_clear_all': 'Clear all saved quotes?',
-
-    // Home page
-    'new_quote': 'New Quote',
-    'new_advice': 'New Advice',
-    'daily_advice_locked': 'Daily Advice Activated',
-    'copy_quote': 'Copy',
-    'save_quote': 'Save',
-    'saved_quote': 'Saved',
-    'tip_new_quote': 'Tip: Press N for a new quote',
-    'tip_new_advice': 'Tip: Press N to get advice',
-    'theme_persist': 'Theme persists between visits',
-
-    // Journal
-    'journal_title': 'My Mood Journal',
-    'new_entry': 'New Entry',
-    'mood': 'Mood:',
-    'mood_happy': '😊 Happy',
-    'mood_excited': '🤩 Excited',
-    'mood_neutral': '😐 Neutral',
-    'mood_calm': '😌 Calm',
-    'mood_angry': '😠 Angry',
-    'mood_sad': '😢 Sad',
-    'mood_disappointed': '😔 Disappointed',
-    'sleep_quality': 'Sleep Quality:',
-    'sleep_terrible': 'Terrible',
-    'sleep_bad': 'Bad',
-    'sleep_good': 'Good',
-    'sleep_excellent': 'Super',
-    'date': 'Date:',
-    'entry_title': 'Title:',
-    'title_placeholder': 'Brief about the day',
-    'content': 'Day Description:',
-    'content_placeholder': 'What happened today? What affected your mood?',
-    'activities': 'Activities:',
-    'activity_exercise': '🏃‍♂️ Exercise',
-    'activity_meditation': '🧘‍♂️ Meditation',
-    'activity_reading': '📚 Reading',
-    'activity_social': '👥 Social',
-    'activity_nature': '🌳 Nature',
-    'activity_work': '💼 Work',
-    'activity_games': '🎮 Games',
-    'activity_music': '🎵 Music',
-    'activity_creativity': '🎨 Creativity',
-    'activity_cooking': '🍔 Cooking',
-    'activity_sleep': '💤 Sleep',
-    'activity_movies': '🎬 Movies/TV',
-    'activity_social_media': '📱 Social Media',
-    'activity_shopping': '🛍️ Shopping',
-    'save_entry': 'Save Entry',
-    'my_entries': 'My Entries',
-    'all_moods': 'All Moods',
-
-    // Statistics
-    'mood_analysis': 'Your Mood Analysis',
-    'overall_stats': 'Overall Statistics',
-    'monthly_entries': 'Entries Last Month',
-    'most_frequent': 'Most Frequent Mood',
-    'average_mood': 'Average Mood',
-    'mood_trend': 'Mood Trend Last Month',
-    'mood_distribution': 'Mood Distribution',
-    'mood_calendar': 'Mood Calendar',
-    'quotes_stats': 'Quotes Statistics',
-    'saved_quotes': 'Saved Quotes',
-    'favorite_quotes': 'Favorite Quotes',
-    'quote_of_day': 'Quote of the Day',
-
-    // Messages
-    'entry_saved': 'Entry saved!',
-    'save_error': 'Error saving entry',
-    'copied': 'Copied!',
-    'copy': 'Copy',
-
-    // Settings
-    'language': 'Language:',
-    'theme': 'Theme:',
-    'feedback_title': 'Feedback',
-    'feedback_name': 'Name (optional)',
-    'feedback_email': 'Email (optional)',
-    'feedback_message': 'Your feedback...',
-    'feedback_send': 'Send feedback',
-    'feedback_thanks': 'Thanks for your feedback!',
-    'feedback_error': 'Error sending feedback.',
-    'feedback_rating_none': 'No rating',
-
-    // Authentication
-    'login_title': 'Login',
-    'register_title': 'Register',
-    'email': 'Email',
-    'password': 'Password',
-    'login_button': 'Login',
-    'register_button': 'Register',
-    'logout': 'Logout',
-    'my_account': 'My Account',
-    'login_required_message': 'Please login to make a purchase',
-    'no_account': 'No account?',
-    'have_account': 'Already have an account?',
-    'password_hint': 'Minimum 6 characters',
-    'password_too_short': 'Password must be at least 6 characters',
-
-    // Admin Panel - Products
-    'admin_panel': 'Admin',
-    'admin_products_title': 'Product Management',
-    'admin_products_desc': 'Add, edit, and remove digital products in the store.',
-    'add_product': 'Add Product',
-    'new_product': 'New Product',
-    'edit_product': 'Edit Product',
-    'product_name': 'Product Name',
-    'product_slug': 'Slug (unique identifier)',
-    'product_type_select': 'Product Type',
-    'type_quote_pack': 'Quote Pack',
-    'type_theme': 'Theme',
-    'type_journal_template': 'Journal Template',
-    'type_habit_course': 'Habit Course',
-    'product_price': 'Price',
-    'product_description': 'Description',
-    'product_active': 'Active',
-    'no_products_yet': 'No products yet.',
-    'confirm_delete_product': 'Delete this product? (It will be deactivated)',
-    'product_not_found': 'Product not found',
-
-    // Admin Panel - Orders
-    'admin_orders_title': 'Order Management',
-    'admin_orders_desc': 'View user orders and update their status.',
-    'order_id': 'Order ID',
-    'user': 'User',
-    'status': 'Status',
-    'total': 'Total',
-    'created': 'Created',
-    'created_at': 'Created At',
-    'actions': 'Actions',
-    'order_details': 'Order Details',
-    'items': 'Items',
-    'quantity': 'Quantity',
-    'no_items': 'No items',
-    'no_orders_yet': 'No orders yet.',
-    'order_status_new': 'New',
-    'order_status_processing': 'Processing',
-    'order_status_completed': 'Completed',
-    'order_status_canceled': 'Canceled',
-    'confirm_delete_order': 'Delete this order?',
-    'view': 'View',
-    'close': 'Close',
-
-    // Admin dashboard
-    'admin_dashboard_title': 'Admin Dashboard',
-    'admin_dashboard_desc': 'Welcome! Choose a section to manage content and orders.',
-    'admin_dashboard_products_title': 'Store Products',
-    'admin_dashboard_products_desc': 'Add new digital resources, edit their details, and control availability.',
-    'admin_dashboard_orders_title': 'Orders',
-    'admin_dashboard_orders_desc': 'Review user purchases, update statuses, and monitor history.',
-    'admin_dashboard_users_title': 'Users',
-    'admin_dashboard_users_desc': 'Manage registered users and their access levels.',
-    'admin_dashboard_feedback_title': 'Feedback Inbox',
-    'admin_dashboard_feedback_desc': 'Read DailyMood community feedback and respond to important messages quickly.',
-    'admin_users_title': 'User Management',
-    'admin_users_desc': 'Promote or revoke admin rights and keep the user list tidy.',
-    'admin_users_empty': 'No other users are registered yet.',
-    'admin_role_admin': 'Administrator',
-    'admin_role_user': 'User',
-    'admin_make_admin': 'Grant admin rights',
-    'admin_remove_admin': 'Revoke admin rights',
-    'admin_delete_user': 'Delete user',
-    'admin_confirm_delete_user': 'Delete this user?',
-    'admin_primary_label': 'Primary administrator',
-
-    // Profile
-    'profile_title': 'My Profile',
-    'profile_intro': 'Review your account information, role, and order history.',
-    'profile_account_section': 'Account details',
-    'profile_overview_email': 'Email',
-    'profile_role': 'Role',
-    'profile_role_admin': 'Administrator',
-    'profile_role_user': 'User',
-
-    'role': 'Role',
-    'profile_registered_at': 'Registered on',
-    'profile_open_admin': 'Open admin dashboard',
-    'profile_orders_section': 'Orders',
-    'profile_orders_caption': 'Recent purchases and their status.',
-    'profile_go_to_store': 'Go to store',
-    'profile_no_orders': 'No orders yet.',
-    'profile_total_orders': 'Total orders',
-    'profile_completed_orders': 'Completed',
-    'profile_completed_hint': 'successfully fulfilled',
-    'profile_total_spent': 'Total spent',
-    'profile_total_spent_hint': 'UAH',
-    'profile_orders_recent': 'all time',
-
-    // Store
-    'store_title': 'Store',
-    'store_desc': 'Enhance your DailyMood experience with our digital products.',
-    'buy_now': 'Buy Now',
-    'purchase_success': 'Purchase successful! Order',
-    'purchase_failed': 'Purchase failed',
-    'no_products_available': 'No products available.',
-
-    // General
-    'save': 'Save',
-    'cancel': 'Cancel',
-    'edit': 'Edit',
-    'refresh': 'Refresh',
-    'loading': 'Loading...',
-    'load_failed': 'Failed to load data.',
-    'save_failed': 'Failed to save.',
-    'delete_failed': 'Failed to delete.',
-    'update_failed': 'Failed to update.',
-    'id': 'ID',
-    'name': 'Name',
-    'type': 'Type',
-    'price': 'Price',
-    'active': 'Active',
-    'inactive': 'Inactive',
-    'open_section': 'Open',
-
-    // Premium Features
-    'premium_badge': 'PREMIUM',
-    'premium_required': 'This feature is available only for Premium users',
-    'get_premium': 'Get Premium',
-    'premium_plan': 'Premium',
-    'free_plan': 'Free',
-    
-    // Mood Predictor
-    'mood_predictor_title': 'Mood Predictor',
-    'mood_predictor_desc': 'Predict tomorrow\'s mood based on your history',
-    'prediction_tomorrow': 'Tomorrow\'s Prediction',
-    'prediction_confidence': 'Confidence',
-    'prediction_trend': 'Trend',
-    'prediction_insights': 'Insights',
-    'trend_up': 'Improving',
-    'trend_down': 'Declining',
-    'trend_stable': 'Stable',
-    'predictor_loading': 'Loading prediction...',
-    'predictor_error': 'Failed to load prediction. Please try again later.',
-    
-    // Activity Recommendations
-    'activity_recs_title': 'Activity Recommendations',
-    'activity_recs_desc': 'Personalized activity suggestions based on your mood',
-    'recs_tip_label': 'Tip',
-    'recs_loading': 'Loading recommendations...',
-    'recs_error': 'Failed to load recommendations. Please try again later.',
-    
-    // Store Premium comparison
-    'store_premium_title': 'Premium and Support',
-    'store_premium_desc': 'Choose Premium for enhanced features or support us by purchasing add-ons.',
-    'compare_plans': 'Compare Plans',
-    'compare_title': 'Plan Comparison',
-    'compare_subtitle': 'What\'s available in Free and Premium',
-    'feature': 'Feature',
-    'feature_basic': 'Journal, favorites, goals',
-    'feature_stats': 'Basic statistics',
-    'feature_themes': 'Premium themes',
-    'feature_predictor': 'Mood Predictor — mood forecast',
-    'feature_recommendations': 'Activity Recommendations',
-    'feature_advanced_stats': 'Advanced statistics',
-    'feature_support': 'Priority support',
-    'more_details': 'More Details',
-    'free_plan_desc': 'Essential features for daily mood tracking.',
-    'premium_plan_desc': 'More themes, deeper insights, development support.',
-    
-    // Store new sections
-    'promo_title': '🎉 Special Offer',
-    'promo_desc': 'Get Premium at a special price! Enhanced features for better mood tracking.',
-    'popular_badge': 'POPULAR',
-    'why_premium_title': '💎 Why Choose Premium?',
-    'why_premium_subtitle': 'Enhanced features for deeper understanding of your mood',
-    'benefit_themes_title': 'Premium Themes',
-    'benefit_themes_desc': 'Personalize the interface to match your mood with unique design themes',
-    'benefit_predictor_title': 'Mood Predictor',
-    'benefit_predictor_desc': 'Forecast your mood based on analysis of previous entries',
-    'benefit_recommendations_title': 'Personal Recommendations',
-    'benefit_recommendations_desc': 'Get advice to improve your mood based on your data',
-    'benefit_analytics_title': 'Advanced Analytics',
-    'benefit_analytics_desc': 'Detailed statistics with charts and trends for better self-awareness',
-    'benefit_support_title': 'Priority Support',
-    'benefit_support_desc': 'Quick help from the team and first access to updates',
-    'benefit_project_title': 'Project Support',
-    'benefit_project_desc': 'Help us grow and add new features',
-    'faq_title': '❓ Frequently Asked Questions',
-    'faq_payment_q': 'How does Premium payment work?',
-    'faq_payment_a': 'After clicking "Buy" you will be redirected to a secure payment page. After successful payment, Premium activates automatically.',
-    'faq_duration_q': 'How long is Premium valid?',
-    'faq_duration_a': 'Premium is granted permanently after a one-time payment. All features remain available without time limits.',
-    'faq_data_q': 'Will my data be saved without Premium?',
-    'faq_data_a': 'Yes! All your entries and data stay with you forever, even if you use the free version.',
-    'faq_methods_q': 'What payment methods are supported?',
-    'faq_methods_a': 'We support all popular payment methods: bank cards (Visa, Mastercard), Google Pay, Apple Pay and other e-wallets.',
-    'faq_student_q': 'Are there student discounts?',
-    'faq_student_a': 'Yes! Email us at support@dailymood.app with proof of student status, and we\'ll provide a special discount.',
-    
-    // Checkout & Payment
-    'checkout_title': 'Checkout',
-    'checkout_payment_method': 'Payment Method',
-    'checkout_payment_desc': 'Choose your preferred payment method',
-    'checkout_card_details': 'Card Details',
-    'checkout_card_number': 'Card Number',
-    'checkout_card_holder': 'Cardholder Name',
-    'checkout_card_expiry': 'Expiry',
-    'checkout_card_cvv': 'CVV',
-    'checkout_pay_now': 'Pay Now',
-    'checkout_order_summary': 'Order Summary',
-    'checkout_subtotal': 'Subtotal',
-    'checkout_delivery': 'Delivery',
-    'checkout_free': 'Free',
-    'checkout_total': 'Total',
-    'checkout_secure': 'Secure Payment',
-    'checkout_secure_desc': 'Your data is protected by SSL encryption',
-    'no_payment_methods': 'No payment methods available',
-    'select_payment_method': 'Please select a payment method',
-    'invalid_card_number': 'Invalid card number',
-    'invalid_card_holder': 'Please enter cardholder name',
-    'invalid_card_expiry': 'Invalid expiry date (MM/YY)',
-    'invalid_card_cvv': 'Invalid CVV code',
-    'processing': 'Processing',
-    'payment_success': 'Payment Successful!',
-    'payment_success_desc': 'Thank you for your purchase. Redirecting to your profile...',
-    'payment_failed': 'Payment Failed',
-    'no_items': 'No items',
-
-    // Goals page
-    'goals_page_title': 'My Goals & Habits',
-    'habits_title': 'Daily Habits',
-    'monthly_goals_title': 'Monthly Goals',
-    'my_progress': 'My Progress',
-    'achievements': 'Achievements',
-    'new_habit_placeholder': 'New habit...',
-    'new_goal_placeholder': 'New goal...',
-    'add_habit': 'Add habit',
-    'add_goal': 'Add goal',
-    'add': 'Add',
-    'all_habits': 'All Habits',
-    'all_goals': 'All Goals',
-    'no_habits_yet': 'No habits yet',
-    'no_goals_yet': 'No goals yet',
-    'habit_singular': 'habit',
-    'habit_plural': 'habits',
-    'goal_singular': 'goal',
-    'goal_plural': 'goals',
-    'no_habits_calendar': 'No habits yet — add one to start tracking',
-    'ach_days_suffix': 'days',
-    'ach_longest_desc': 'Longest series of full days',
-    'ach_days_with_habits': 'days with all habits',
-    'ach_full_days_desc': 'Full days in last 30 days',
-    'ach_goals_done': 'goals completed',
-    'ach_completed_goals_desc': 'Monthly goals',
-
-    // About page
-    'about_title': 'About Us',
-    'about_description': 'DailyMood — a simple tool for tracking mood and habits. We help you notice patterns and maintain daily reflection through a convenient interface and non-intrusive reminders.',
-    'about_mission_title': 'Our Mission',
-    'about_mission_text': 'Promote psychological resilience through daily small steps: from recording mood to forming useful habits. We believe that conscious attention to your emotional state is the path to better self-understanding and harmonious living.',
-    'about_features_title': 'Key Features',
-    'about_feature_mood_tracking_title': 'Mood Tracking',
-    'about_feature_mood_tracking_desc': 'A convenient diary for recording your emotional state, activities and thoughts. Visualization of mood changes helps you understand yourself better.',
-    'about_feature_stats_title': 'Statistics and Analysis',
-    'about_feature_stats_desc': 'Detailed charts and reports help track mood trends and find factors that affect your well-being.',
-    'about_feature_quotes_title': 'Daily Quotes',
-    'about_feature_quotes_desc': 'A collection of inspiring quotes that help you find motivation and support. Ability to save favorite quotes to your collection.',
-    'about_feature_habits_title': 'Habit Tracking',
-    'about_feature_habits_desc': 'Tools for forming and maintaining useful habits. Mark your progress and get visual confirmation of your achievements.',
-    'about_special_title': 'Project Features',
-    'about_special_list_ux': 'Convenient and intuitive interface',
-    'about_special_list_theme': 'Support for light and dark themes',
-    'about_special_list_privacy': 'Privacy protection — your data is stored locally',
-    'about_special_list_no_ads': 'No intrusive ads or hidden payments',
-    'about_special_list_updates': 'Continuous updates and functional improvements',
-    'about_roadmap_title': 'Development Plans',
-    'about_roadmap_intro': 'We are constantly working on improving DailyMood. In the future we plan to add:',
-    'about_roadmap_list_analytics': 'Extended mood and habit analytics',
-    'about_roadmap_list_export': 'Ability to export data in various formats',
-    'about_roadmap_list_calendar': 'Calendar integration',
-    'about_roadmap_list_new_categories': 'New activity categories and metrics',
-    'about_contact_title': 'Contact and Feedback',
-    'about_contact_p1': 'The project is developed as an educational/demonstration project — for feedback or contributions see the repository on GitHub.',
-    'about_contact_p2': 'We are always happy to receive your suggestions for improving the project or new features. If you have ideas or found a bug, please create an issue in our repository.',
-    'recent_feedback_title': 'Recent Feedback',
-    
-    // Avatar labels
-    'avatar_label_none': 'No avatar',
-    'avatar_label_monkey': 'Cheerful Monkey',
-    'avatar_label_cat': 'Curious Cat',
-    'avatar_label_dog': 'Loyal Dog',
-    'avatar_label_bunny': 'Gentle Bunny',
-    'avatar_label_bear': 'Strong Bear',
-    'avatar_label_koala': 'Cozy Koala',
-    'avatar_label_bee': 'Busy Bee',
-    'avatar_label_penguin': 'Cool Penguin',
-    'avatar_label_frog': 'Happy Frog',
-    'avatar_label_mushroom': 'Cute Mushroom',
-    'avatar_label_star': 'Shining Star',
-    'avatar_label_cactus': 'Resilient Cactus',
-    'avatar_label_unicorn': 'Magical Unicorn',
-    'avatar_label_dragon': 'Wise Dragon',
-    'avatar_label_koi': 'Peaceful Koi',
-    'avatar_label_phoenix': 'Brave Phoenix',
-    'avatar_label_crown': 'Royal Crown',
-    'avatar_label_crystal': 'Mystic Crystal',
-    'avatar_label_moon': 'Dreamy Moon',
-    'avatar_label_butterfly': 'Free Butterfly'
-};
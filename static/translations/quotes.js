@@ -1,1015 +0,0 @@
-const translations_quotes_en = [
-    "Celebrate the effort, even if the outcome isn't perfect.",
-    "When overwhelmed, choose the next small action and do just that.",
-    "Breathe in calm, breathe out tension — five breaths is a reset.",
-    "A routine that supports you matters more than dramatic fixes.",
-    "You are more resilient than you think — one day at a time.",
-    "Tiny progress each day compounds into meaningful change.",
-    "Start where you are. Use what you have. Do what you can.",
-    "It's okay to take a break — rest is part of caring for yourself.",
-    "Name one small win from today, however small it seems.",
-    "Let curiosity lead when you feel stuck; ask one simple question.",
-    "Kindness toward yourself creates space to grow.",
-    "One mindful minute can return you to steady ground.",
-    "You don't have to know the whole path — just the next step.",
-    "Be present for one thing right now; let other worries wait.",
-    "Small rituals build comfort — pick one and repeat it tomorrow.",
-    "A gentle routine anchors the day more than bursts of productivity.",
-    "Listen to your body; it often knows what your mind has forgotten.",
-    "Give yourself credit for attempting — that's where courage starts.",
-    "Make space for one thing that genuinely makes you smile today.",
-    "It's okay to be exactly where you are; progress isn't always visible."
-    ,"Your mood is data, not a verdict — notice, then choose your next step."
-    ,"On tough days, shrink the goal until it's doable, then celebrate doing it."
-    ,"Rest first, then decide. Tired minds make harsh stories." 
-    ,"Five minutes of sunlight can reset more than you expect." 
-    ,"Swap self-criticism for curiosity: ask 'what would help by 1%?'" 
-    ,"Write down one worry, then one thing you can influence today." 
-    ,"When motivation is low, rely on structure, not willpower." 
-    ,"Movement shifts mood; even two minutes counts." 
-    ,"Name the feeling, name one need — small clarity reduces weight." 
-    ,"You don't have to earn rest. Rest helps you earn tomorrow." 
-    ,"If it's overwhelming, halve it; if still big, halve again." 
-    ,"Choose a kind tone to yourself; effort grows where kindness lives." 
-    ,"Plan a tiny reward before you start — future-you says thanks." 
-    ,"Let someone help; shared load is lighter and more human." 
-    ,"Water, breath, stretch: the simplest reset trio." 
-    ,"Your pace is valid; comparison is a noisy metric." 
-    ,"Anchor your day with one steady habit when everything else shifts." 
-    ,"Notice what worked last time you felt like this — reuse it." 
-    ,"Small joys accumulate — schedule one on purpose today."
-    ,"Sadness is weather, not identity; let it pass through."
-    ,"Heavy days are allowed; lighten them with one caring act."
-    ,"When hope feels thin, borrow it from a past victory."
-    ,"Your tears are honest data — they do not diminish you."
-    ,"Let slowness be your strategy when everything feels sharp."
-    ,"Grief rewrites maps; give yourself time to learn new routes."
-    ,"You can be both hurting and healing at the same time."
-    ,"If all you can do is breathe, that is still doing."
-    ,"Name the pain, then name one gentle response."
-    ,"Even wilted plants turn toward light when it appears."
-    ,"Rest is an act of resistance against burnout."
-    ,"You are allowed to ask for comfort before you feel strong."
-    ,"Rainy moods grow quiet wisdom — listen closely."
-    ,"Courage can be as small as getting out of bed once."
-    ,"Your worth is not a graph of productivity."
-    ,"Let go of perfect healing; aim for kinder moments."
-    ,"Pain shared is pain divided; reach out."
-    ,"Choose the softest next step; softness is strength."
-    ,"The story is still being written — hold the pen loosely."
-    ,"A single supportive voice, even your own, shifts the room."
-    ,"Slow mornings can mend what rushed nights frayed."
-    ,"You are not late; you are arriving with experience."
-    ,"Some lessons hurt because they matter."
-    ,"Let your heart be heavy and your actions be light."
-    ,"Bit by bit is still forward."
-    ,"You can pause without quitting."
-    ,"Hold yourself like you would hold a friend in pain."
-    ,"Your feelings are valid even when unseen."
-    ,"Gentle structure is kinder than harsh discipline."
-    ,"Offer your future self one small kindness today."
-    ,"When you cannot find meaning, make comfort."
-    ,"Even dim light guides — keep a candle lit."
-    ,"Ask, 'What would soothe me for two minutes?' then do that."
-    ,"Sadness can signal unmet needs; listen for them."
-    ,"You are allowed to rebuild slowly."
-    ,"Resting is not losing; it is preparing."
-    ,"Allow disappointment; don't let it drive."
-    ,"When waves are high, lower the sails and wait."
-    ,"Hope is a muscle — small reps still count."
-    ,"Some bridges must burn so you can see the sky."
-    ,"Gratitude can be quiet: a blanket, a warm drink, a safe room."
-    ,"It is okay to be a beginner at feeling again."
-    ,"Let silence answer what pressure cannot."
-    ,"Choose rest before you are forced to stop."
-    ,"Not every thought is a truth; test them gently."
-    ,"Whisper-kindness to yourself when shouting feels easier."
-    ,"Allow tears; they are honest visitors."
-    ,"Your soft heart is not a weakness; it is a sensor."
-    ,"Boundaries are bridges to yourself."
-    ,"Healing is rarely loud; it often sounds like breathing."
-    ,"Count safeties: a door, a friend, a cup, a song."
-    ,"Let yourself be held by routine when motivation is absent."
-    ,"It's okay to want less today."
-    ,"You do not have to solve everything to deserve calm."
-    ,"A slow walk can be a strong choice."
-    ,"Soothe first, solve later."
-    ,"You can start over at any hour."
-    ,"Let go of the timeline you imagined; live the one you have."
-    ,"One honest breath is a beginning."
-    ,"Even cracks let in warmth."
-    ,"Hold on to the thread of one supportive habit."
-    ,"Choose one corner of your life to tidy; momentum follows."
-    ,"You are not behind; you are on your path."
-    ,"Permission to be sad without rushing to fix it."
-    ,"Let music carry what words cannot."
-    ,"Your past self survived days you thought impossible."
-    ,"Stay curious about your own resilience."
-    ,"Speak kindly to the parts of you that ache."
-    ,"When joy feels far, look for neutral and rest there."
-    ,"Trust the smallest steps; they accumulate."
-    ,"Your feelings make sense in the story you've lived."
-    ,"Ask for a hug or offer yourself one."
-    ,"Soft blankets and soft words are valid strategies."
-    ,"Pause the doom-scroll; step to a window."
-    ,"If you can't be positive, be gentle."
-    ,"Let yourself be helped before you break."
-    ,"Your worth is intact even when plans fall apart."
-    ,"You are allowed to change your mind about what hurts."
-    ,"Safety can be a corner, a song, a friend on the line."
-    ,"Rewrite self-talk like you would speak to someone you love."
-    ,"Find one stable thing and orbit it today."
-    ,"Tired hope is still hope."
-    ,"Let your nervous system land before you act."
-    ,"Acknowledge the ache; add a cup of water and a breath."
-    ,"You won't feel like this forever — feelings move."
-    ,"Make room for both grief and grace."
-    ,"You can honor the pain and still choose a kind action."
-    ,"Slow down the day until it fits."
-    ,"Name three things that are not wrong right now."
-    ,"Set down the imaginary scorecard; rest isn't graded."
-    ,"Ask: what is the kindest choice available?"
-    ,"You are learning to carry what once crushed you."
-    ,"Even if you feel alone, you are connected by the trying."
-    ,"Let comfort be small: warm socks, dim lights, calm sounds."
-    ,"You do not need to earn gentleness."
-    ,"A wise heart knows when to idle."
-    ,"Let go of fixing; practice accompanying yourself."
-    ,"Crying is a release valve, not a failure."
-    ,"Choose rituals that whisper 'you are safe here'."
-    ,"Courage is also saying 'I need a pause'."
-    ,"You can feel lost and still be on the path."
-    ,"The moon waxes and wanes; so will your energy."
-    ,"Offer yourself the patience you offer others."
-    ,"You survived every hard day before this one."
-    ,"Let the day be simple; complexity can wait."
-    ,"Quiet acts of care are still acts of strength."
-    ,"Your tenderness is allowed in this world."
-    ,"When in doubt, lower the bar and lift your chin."
-    ,"You can rebuild trust with yourself one kept promise at a time."
-    ,"Step outside for ten breaths; return with softer shoulders."
-    ,"Not every season is for blooming; some are for rooting."
-    ,"Pain does not mean you are failing; it means you are feeling."
-    ,"Choose what hurts less and helps enough."
-    ,"You don't have to be cheerful to be worthy."
-    ,"When you feel empty, pour in rest and kindness."
-    ,"Allow space for sorrow; it often travels with love."
-    ,"Hold on to the truth that you matter, even unseen."
-    ,"Stay for the next sunrise; it keeps showing up."
-    ,"The mind storms; the body can anchor."
-    ,"Your pace is part of your wisdom."
-    ,"Softer goals for harder days."
-    ,"Tend to your nervous system like a garden."
-    ,"Let yourself be new at healing."
-    ,"Even a whisper of hope counts."
-    ,"You can carry sadness without letting it steer."
-    ,"Choose one doable, kind thing; let the rest wait."
-    ,"You are allowed to outgrow old coping stories."
-    ,"Rest is a radical answer in a rushing world."
-    ,"Your feelings are not flaws; they are signals."
-    ,"Make eye contact with something alive — a pet, a plant, a person."
-    ,"You can be soft and still make it through."
-    ,"Let your inner critic take the day off."
-    ,"One page, one step, one breath."
-    ,"Stop negotiating with exhaustion; give it what it asks."
-    ,"Comfort is productive when you're rebuilding."
-    ,"A heavy heart deserves a lighter schedule."
-    ,"Call someone who remembers your light."
-    ,"The goal today can be simply to feel a bit safer."
-    ,"Let kindness interrupt the spiral."
-    ,"Quiet rooms heal loud minds."
-    ,"It's okay if today is about survival, not success."
-    ,"You can be proud of small mercies you offer yourself."
-    ,"Choose presence over performance."
-    ,"The ground is still beneath you; notice it."
-    ,"Release the myth that suffering must be hidden."
-    ,"Let your to-do list shrink when your heart swells."
-    ,"Softening is not giving up; it's adapting."
-    ,"Drink water; unclench your jaw."
-    ,"Your scars are chapters, not conclusions."
-    ,"Safety first, then goals."
-    ,"Be loyal to your healing, not your hurry."
-    ,"You're allowed to need more time."
-    ,"Ease is medicine too."
-    ,"A kind pause can change the whole evening."
-    ,"Speak to yourself like you would to someone grieving."
-    ,"Stay tender; the world needs your softness."
-    ,"You are enough, even when you feel less."
-    ,"You can rest without guilt; you are not a machine."
-    ,"Make room for imperfection; it is human."
-    ,"Gentle progress is still progress."
-    ,"When stuck, switch to caring tasks: warm tea, tidy desk, soft light."
-    ,"Let the day be small; let the care be big."
-    ,"Your feelings won't break the world; sharing them may mend yours."
-    ,"Hold yourself through this hour; the next can differ."
-    ,"You are not alone in feeling alone."
-    ,"Stop bracing; start breathing."
-    ,"Let wisdom whisper louder than worry."
-    ,"Choose gentleness as your pace-setter."
-    ,"Your heart knows how to heal; give it time and care."
-    ,"You are doing better than you think by simply being here."
-    ,"Let compassion, not perfection, be your compass."
-    ,"Quiet hope is still hope."
-    ,"Make space for your own softness today."
-    ,"One act of care can tilt the day."
-    ,"Even in fog, take the next step you can see."
-    ,"You can start small and stay kind."
-    ,"Choose soothing over proving."
-    ,"Your tenderness is a strength in disguise."
-    ,"Let your breath be your anchor when thoughts race."
-    ,"Small comforts are valid strategies."
-    ,"Put down the weight that isn't yours."
-    ,"Listen to your needs like you would to a child you love."
-    ,"Let yourself be ordinary today; it's enough."
-    ,"Soft goals for hard times."
-    ,"Stay for the small joys — they add up."
-    ,"You are worthy of ease, not just endurance."
-    ,"The kindest choice is often the wisest."
-    ,"You can heal at your own speed."
-    ,"Let grace interrupt your self-critique."
-    ,"Rest is a right, not a reward."
-    ,"Your feelings matter; treat them with care."
-    ,"When in doubt, slow down and drink water."
-    ,"Soothe the system first; solutions follow."
-    ,"You are allowed to be both sad and hopeful."
-    ,"Give yourself the advice you'd give a dear friend."
-    ,"Be gentle with the parts of you that are learning."
-    ,"Let today's win be that you showed up."
-    ,"Soft lighting, soft words, soft plans."
-    ,"Your presence matters more than your pace."
-    ,"You can try again tomorrow; that's hope enough."
-    ,"Let kindness be the measure, not output."
-    ,"Feelings ebb; you remain."
-    ,"Even in sorrow, you deserve comfort."
-    ,"Choose one nurture task over one pressure task."
-    ,"Gentle is sustainable; harsh burns out."
-    ,"Your inner critic is not your coach."
-    ,"Soothe the body to steady the mind."
-    ,"It's okay to ask life to be simpler today."
-    ,"Name three supports you can reach for."
-    ,"You don't have to carry this alone."
-    ,"Allow rest to be productive healing."
-    ,"Wise hearts practice pacing."
-    ,"Stay soft with yourself; you're doing hard things."
-    ,"The night will end; hold on to that fact."
-    ,"You can lay the burden down for a moment."
-    ,"Let your breath be proof you're still choosing."
-    ,"Warmth is medicine: a bath, a blanket, a kind word."
-    ,"Even in doubt, keep a tiny promise to yourself."
-    ,"Sorrow shows what you value; honor that."
-    ,"You are allowed to seek comfort without apologizing."
-    ,"Let the day be about healing, not achieving."
-    ,"Your story includes this hard chapter, not only this chapter."
-    ,"Hold space for your heart; it's carrying a lot."
-    ,"Gentle consistency beats intense bursts."
-    ,"You can be tender and still resilient."
-    ,"Kindness toward yourself is a wise investment."
-    ,"Let yourself feel; then let yourself rest."
-    ,"Find one thing that feels safe and stay near it for a while."
-    ,"You are worth the effort of your own care."
-    ,"Softening your schedule can strengthen your spirit."
-    ,"It's okay to need more calm than others do."
-    ,"Let the day be light on demands and heavy on care."
-    ,"When the heart is tired, the bravest act is resting."
-    ,"Choose comfort that truly restores, not just distracts."
-    ,"You are enough even when you do less."
-    ,"Let yourself be a beginner at rest."
-    ,"Gentle plans survive rough days."
-    ,"Kind self-talk is practical support."
-    ,"Your feelings deserve a soft landing."
-    ,"Slow care is still care."
-    ,"Let quiet be medicine."
-    ,"You are not a burden; your pain is not an inconvenience."
-    ,"Stay close to what soothes you."
-    ,"It's okay to do the bare minimum and call it enough."
-    ,"Your softness can coexist with strength."
-    ,"Keep a small promise to yourself today; trust grows."
-    ,"Let today be about gentleness, not greatness."
-    ,"Warm food, warm words, warm rest."
-    ,"You can be wise and weary at once."
-    ,"Allow kindness to be your default response to yourself."
-    ,"You deserve care on sad days, not lectures."
-    ,"Let one comforting habit bookend your day."
-    ,"Soothe the heart, then solve the task."
-    ,"Your value is steady, regardless of output."
-    ,"A gentle routine is a quiet anchor."
-    ,"You can step back without falling behind."
-    ,"Softness is not surrender; it's strategy."
-    ,"Hold your heart like something precious — because it is."
-    ,"You are allowed to rest before you are empty."
-    ,"Choose the kindest interpretation of your effort."
-    ,"Your mood may be low; your worth is not."
-    ,"Let your plans flex to fit your feelings."
-    ,"Even slow healing is healing."
-    ,"You can pause, breathe, and begin again."
-    ,"Comfort is a wise choice when you are sad."
-    ,"Your feelings are honored here."
-    ,"Let go of perfect coping; choose workable coping."
-    ,"Stay curious about what soothes you — keep a list."
-    ,"You are worthy of patience, especially from yourself."
-    ,"Soft choices today can create strength tomorrow."
-    ,"Allow yourself to be helped; it is an act of wisdom."
-    ,"You don't need to be cheerful to be deserving."
-    ,"Gentle pacing is still movement."
-    ,"Let the day be merciful to you — start with being merciful to yourself."
-    ,"Choose the smaller task and finish it kindly."
-    ,"Sadness is real; so is your capacity to care for yourself within it."
-    ,"Trust that ease can coexist with effort."
-    ,"Be a friend to yourself when you need one most."
-    ,"Your calm can be rebuilt from tiny pieces."
-    ,"Let comfort be intentional, not accidental."
-    ,"A wise life includes days of doing less."
-    ,"Your heart is allowed to be tired; let your habits carry you."
-    ,"You can craft a day that is gentle and still meaningful."
-    ,"Choose rest like you choose nourishment."
-    ,"Let kindness be the language you use on yourself."
-    ,"You are allowed to put your wellbeing first."
-    ,"Even on sad days, there is room for small kindnesses."
-    ,"Breathe; you are here; that matters."
-    ,"Let hope be small and steady, like a pilot light."
-    ,"You can be both soft and steadfast."
-    ,"Soothe your senses: warm, dim, quiet, soft."
-    ,"Your feelings deserve your attention, not your judgment."
-    ,"Today, measure success by how kindly you treated yourself."
-    ,"Allow pauses; life continues when you rest."
-    ,"You can carry sadness gently and still move forward."
-    ,"Let grace in; it wants to help."
-    ,"Choose a comforting mantra and repeat it softly."
-    ,"Your presence is enough for someone, including you."
-    ,"Rest repairs what hustle harms."
-    ,"You deserve to feel safe in your own care."
-    ,"Let the day be about mending, not proving."
-    ,"Soft schedules are valid when hearts are heavy."
-    ,"Your emotions are information; respond with compassion."
-    ,"When overwhelmed, return to water and breath."
-    ,"Allow yourself to be sad without adding shame."
-    ,"A softer approach can unlock wiser choices."
-    ,"Keep a tiny promise: stretch, sip, step outside."
-    ,"You are enough, even when you feel tender."
-    ,"Let your care be consistent, not conditional."
-    ,"Choose what comforts and nourishes, not just distracts."
-    ,"You can move at the speed of kindness today."
-    ,"Your worth is unaltered by hard moods."
-    ,"Rest your body; calm follows."
-    ,"Gentle boundaries protect your healing."
-    ,"You can slow down without falling behind in life."
-    ,"Let softness be your strategy when strength feels distant."
-    ,"Your sadness deserves space and support."
-    ,"Make a refuge in small ways: tidy a corner, light a candle, breathe."
-    ,"Kindness toward yourself is an act of wisdom and courage."
-    ,"Let your heart be heard — even quietly."
-    ,"You can be wise, kind, and sad at once."
-    ,"A gentle night makes room for a gentler tomorrow."
-    ,"Offer yourself the grace you'd readily give to another."
-    ,"You are allowed to take up space with your feelings."
-    ,"Let tenderness guide your next decision."
-    ,"Rest like it's important — because it is."
-    ,"Even in sorrow, you can choose self-compassion."
-    ,"Quiet courage is still courage."
-    ,"Let the day be humane to you; adjust it until it is."
-    ,"You deserve to feel held by your own care."
-    ,"Sadness does not cancel your light; it only clouds it for a while."
-    ,"Lean on routines when emotions are loud."
-    ,"Your heart is learning; be patient with its pace."
-    ,"Gentle words to yourself are practical medicine."
-    ,"You can rest in the middle, not just at the end."
-    ,"Kindness scales: start small, repeat often."
-    ,"Let your inner voice be a soft place to land."
-    ,"You are still worthy on the days you only cope."
-    ,"Choose relief first; resolve later."
-    ,"Be on your own side today."
-    ,"Your sadness is seen; you are still whole."
-    ,"Small mercies matter most on hard days."
-    ,"You can trust yourself to get through this hour."
-    ,"Let patience be your pace."
-    ,"Care for yourself like someone worth saving — because you are."
-    ,"Soft strength carries you when hard strength fades."
-    ,"You don't owe the world a smile to deserve rest."
-    ,"Let your body soften; your mind will follow."
-    ,"Your gentle effort is enough today."
-    ,"You can choose grace over grit right now."
-    ,"Allow yourself to be comforted; it is wise."
-    ,"Stay; the story is not finished."
-    ,"Let your next choice be kind, then the next."
-    ,"Your heart is worthy of your gentlest care."
-    ,"Sadness visits; it does not own the house."
-    ,"Be gentle, be gentle, be gentle — it works."
-    ,"Find one thing you don't have to do. A task no one will notice. A call you don't need to make. This is your small freedom. Start there."
-    ,"Make a senseless decision. Come home by another route. Buy fruit you've never tried. Change the order of things. Break the pattern. Autopilot is death while alive."
-    ,"Do something poorly. Not perfectly. Not efficiently. Just do it. And leave it like that. The world will not fall apart."
-    ,"Allow yourself to hit rock bottom. Don't fight the fall. It's the only place where no one is waiting for you — the only place where you are truly safe. The bottom is not the end. It's the first solid surface you've found in a long time."
-    ,"One day you'll wake and feel nothing. And you'll be afraid. Because pain became part of your identity. And who are you without it? That's the moment you must start inventing yourself again. From scratch. Not as a victim, but as a desert after rain."
-    ,"The best time to plant a tree was 20 years ago. The second best time is now."
-    ,"You are not lazy. You are often just afraid."
-    ,"Progress is messy. Celebrate the mess."
-    ,"Your sensitivity is not weakness. It's your superpower."
-    ,"The people who love you do not need convincing."
-    ,"You don't have to be on all the time. Soft is strong."
-    ,"Your body keeps score. Listen to it."
-    ,"Healing is not linear. Neither are you required to be."
-    ,"You are allowed to take up space."
-    ,"The person you will become is not a stranger. They're just waiting for permission."
-    ,"Sometimes the bravest thing is admitting you don't know."
-    ,"Your rest is not laziness. It is resistance."
-    ,"You are not responsible for other people's comfort at the expense of your own."
-    ,"Write the story you wish someone had told you."
-    ,"The version of you that feels safe to be vulnerable will change the trajectory of your entire life."
-    ,"You don't owe anyone your explanation."
-    ,"Unfuck yourself by starting anywhere."
-    ,"Your trauma made you stronger. It also made you tired. Both things are true."
-    ,"The most important relationship you will ever have is with yourself."
-    ,"You are not broken. You are becoming."
-    ,"Stop waiting for permission. Start waiting for nothing."
-    ,"Boundaries are love made visible."
-    ,"You are allowed to outgrow people. You are allowed to leave."
-    ,"The strongest thing you can do is ask for help."
-    ,"Your past does not define your future unless you let it."
-    ,"Regret teaches. Shame teaches too. Learn and move on."
-    ,"You are not too much. You are exactly enough."
-    ,"The life you want is on the other side of your fear."
-    ,"Your worth is not negotiable."
-    ,"Sometimes saying no is the kindest thing you can say."
-    ,"You don't have to earn rest."
-    ,"Forgive yourself first. Everything else follows."
-    ,"Your voice matters. Even when it shakes."
-    ,"You are not responsible for saving anyone. You are responsible for yourself."
-    ,"Growth happens in the uncomfortable space."
-    ,"Your feelings are valid. Your boundaries are non-negotiable."
-    ,"You don't need to be fixed. You need to be believed in."
-    ,"The life you want is built by people who said no."
-    ,"Your story doesn't end because you feel sad today."
-    ,"You are brave for showing up. Even on the hard days."
-    ,"Healing is an art, not a race."
-    ,"You are not your mistakes. You are what you do after."
-    ,"The world needs your kindness. But not at your expense."
-    ,"You are allowed to change your mind."
-    ,"Breathe. You've survived 100% of your worst days."
-    ,"Your mistakes don't define you. Your response to them does."
-    ,"You are not selfish for wanting more."
-    ,"The most important thing you can learn is how to be gentle with yourself."
-    ,"You don't have to be productive to be worthy."
-    ,"Stop being ashamed of needing. Everyone needs."
-    ,"Your body is not a problem to be solved."
-    ,"You are not responsible for making others comfortable."
-    ,"The life you want starts with accepting where you are."
-    ,"You are not too sensitive. The world is too harsh."
-    ,"Your anger is valid. Your sadness is valid. Your joy is valid."
-    ,"You don't have to explain yourself to people who don't matter."
-    ,"Comparison is the thief of joy. Steal it back."
-    ,"You are allowed to want things."
-    ,"The person you are right now is not your final form."
-    ,"Your silence is not consent. It's survival."
-    ,"You are brave just by being here."
-    ,"Perfection is the enemy of progress."
-    ,"You don't have to have it all figured out."
-    ,"Your mental health is just as important as your physical health."
-    ,"You are not crazy. You are not broken. You are human."
-    ,"The best revenge is a life well-lived."
-    ,"You are allowed to rest without earning it."
-    ,"Your dreams are not too big. Your doubt is too loud."
-    ,"You don't have to apologize for taking care of yourself."
-    ,"Healing doesn't mean forgetting. It means accepting."
-    ,"You are not stuck. You are choosing. Now choose differently."
-    ,"Your potential is not determined by your past."
-    ,"You are allowed to leave situations that hurt you."
-    ,"The most powerful thing you can do is believe in yourself."
-    ,"You don't have to be perfect to be worthy."
-    ,"Your weakness is where your strength grows."
-    ,"You are not too much. You are not enough. You are just right."
-    ,"The life you want requires the version of you who is brave."
-    ,"You are allowed to say no without explaining why."
-    ,"Your feelings are not too big. Your container was too small."
-    ,"You don't have to earn love. You are loved for simply existing."
-    ,"Progress over perfection."
-    ,"You are brave for trying. Even when you fail."
-    ,"Your scars tell a story of survival."
-    ,"You are not responsible for other people's healing."
-    ,"The only approval you need is your own."
-    ,"You are allowed to take up space in your own life."
-    ,"Your past is not your future."
-    ,"You don't have to be good at everything to be good."
-    ,"Healing is not about erasing the past. It's about making peace with it."
-    ,"You are brave for asking for help."
-    ,"Your worth is not determined by your productivity."
-    ,"You are allowed to be selfish sometimes."
-    ,"The most important conversation is the one you have with yourself."
-    ,"You don't have to be broken to need healing."
-    ,"Your voice deserves to be heard."
-    ,"You are not your anxiety. You are not your depression."
-    ,"The life you want is worth the discomfort of change."
-    ,"You are allowed to prioritize yourself."
-    ,"Your story is not over. There are still chapters to write."
-    ,"You don't have to earn rest. You are human."
-    ,"You are brave just for living."
-    ,"The person you want to be is within reach."
-    ,"You are not too damaged. You are too valuable."
-    ,"Your pain is valid. Your healing is possible."
-];
-
-const translations_quotes_uk = [
-    "Святкуй зусилля, навіть якщо результат не ідеальний.",
-    "Коли все здається складним, обери одну малу дію і зроби її.",
-    "Вдихни спокій, видихни напругу — п'ять вдихів все змінюють.",
-    "Регулярна підтримка важливіша за різкі зміни.",
-    "Ти сильніший, ніж думаєш — один день за раз.",
-    "Щоденний маленький прогрес перетворюється на великі зміни.",
-    "Почни там, де ти є. Використовуй те, що маєш. Роби те, що можеш.",
-    "Добре зробити паузу — відпочинок це частина турботи про себе.",
-    "Назви одну маленьку перемогу сьогодні, якою б малою вона не здавалась.",
-    "Коли застряг, нехай цікавість веде — задай одне просте питання.",
-    "Доброта до себе створює простір для росту.",
-    "Одна усвідомлена хвилина може повернути тебе до стабільності.",
-    "Не обов'язково знати весь шлях — достатньо знати наступний крок.",
-    "Будь присутнім для однієї речі зараз; інші турботи можуть зачекати.",
-    "Маленькі ритуали створюють комфорт — обери один і повтори його завтра.",
-    "М'яка рутина краще тримає день, ніж сплески продуктивності.",
-    "Слухай своє тіло; воно часто знає те, що розум забув.",
-    "Подякуй собі за спробу — з цього починається хоробрість.",
-    "Зроби місце для однієї речі, яка щиро тебе радує сьогодні.",
-    "Добре бути саме там, де ти є; прогрес не завжди помітний."
-    ,"Твій настрій — це дані, а не вирок: поміть і вибери наступний крок."
-    ,"У складні дні зменшуй ціль, поки вона не стане під силу, і святкуй зроблене."
-    ,"Спершу відпочинь, потім вирішуй. Втомлений розум розповідає жорсткі історії."
-    ,"П'ять хвилин сонця можуть перезавантажити більше, ніж очікуєш."
-    ,"Заміні критику на цікавість: спитай себе «що допоможе на 1%?»"
-    ,"Запиши одну тривогу, а потім одну річ, на яку ти можеш вплинути сьогодні."
-    ,"Коли мотивації мало, покладайся на структуру, а не на силу волі."
-    ,"Рух змінює настрій; навіть дві хвилини мають значення."
-    ,"Назви почуття і одну потребу — трохи ясності полегшує вагу."
-    ,"Відпочинок не треба заслуговувати. Він допомагає заслуговувати завтра."
-    ,"Якщо завдання лякає, поділи його навпіл; якщо ще велике — знову навпіл."
-    ,"Обирай добрий тон до себе; зусилля ростуть там, де є доброта."
-    ,"Заплануй маленьку нагороду перед стартом — майбутнє «я» подякує."
-    ,"Дозволь комусь допомогти; розділений вантаж легший і більш людяний."
-    ,"Вода, дихання, розтяжка — просте тріо перезапуску."
-    ,"Твій темп валідний; порівняння — шумний показник."
-    ,"Зафіксуй день однією стабільною звичкою, коли все інше хитається."
-    ,"Згадай, що спрацювало минулого разу в такому стані — повтори це."
-    ,"Маленькі радості накопичуються — заплануй одну навмисно на сьогодні."
-    ,"Смуток — це погода, а не ідентичність; дозволь йому пройти."
-    ,"Важкі дні допустимі; полегши їх одним турботливим кроком."
-    ,"Коли надія тонка, позич її у минулої перемоги."
-    ,"Сльози — чесні дані; вони не зменшують тебе."
-    ,"Нехай повільність буде твоєю стратегією, коли все гостре."
-    ,"Горе переписує карти; дай собі час вивчити нові маршрути."
-    ,"Можна одночасно боліти й загоюватися."
-    ,"Якщо можеш лише дихати — це теж дія."
-    ,"Назви біль, а потім одну м'яку відповідь."
-    ,"Навіть зів'ялі рослини тягнуться до світла, коли воно є."
-    ,"Відпочинок — акт спротиву вигоранню."
-    ,"Ти маєш право просити про підтримку до того, як відчуєш силу."
-    ,"Дощові настрої приносять тиху мудрість — прислухайся."
-    ,"Відвага може бути такою малою, як раз піднятися з ліжка."
-    ,"Твоя цінність не є графіком продуктивності."
-    ,"Відпусти ідею ідеального зцілення; обирай більш добрі моменти."
-    ,"Біль, розділений з кимось, зменшується; звернись."
-    ,"Обери найлегший наступний крок; м'якість — це сила."
-    ,"Історія ще пишеться — тримай перо вільно."
-    ,"Один підтримуючий голос, навіть твій власний, змінює атмосферу."
-    ,"Повільні ранки лагодять те, що порвали поспішні ночі."
-    ,"Ти не запізнився; ти прибув із досвідом."
-    ,"Деякі уроки болять, бо важливі."
-    ,"Нехай серце буде важким, а кроки — легкими."
-    ,"Потроху — теж вперед."
-    ,"Можна робити паузу, не здаючись."
-    ,"Тримай себе, як тримав би друга в болі."
-    ,"Почуття важливі навіть тоді, коли їх ніхто не бачить."
-    ,"М'яка структура краща за жорстку дисципліну."
-    ,"Подаруй майбутньому собі маленьку доброту сьогодні."
-    ,"Коли не бачиш сенсу, створи комфорт."
-    ,"Навіть тьмяне світло веде — тримай свічку запаленою."
-    ,"Спитай: «Що мене заспокоїть на дві хвилини?» і зроби це."
-    ,"Смуток може сигналити про незадоволені потреби; прислухайся."
-    ,"Ти маєш право відбудовуватися повільно."
-    ,"Відпочинок — не поразка; це підготовка."
-    ,"Дозволь розчаруванню бути, але не керувати."
-    ,"Коли хвилі високі, опусти вітрила і зачекай."
-    ,"Надія — м'яз; навіть малі повтори рахуються."
-    ,"Деякі мости мають згоріти, щоб ти побачив небо."
-    ,"Вдячність може бути тихою: ковдра, теплий напій, безпечна кімната."
-    ,"Нормально знову бути новачком у відчуттях."
-    ,"Дозволь тиші відповісти там, де тиск не може."
-    ,"Обирай відпочинок до того, як доведеться зупинятись примусово."
-    ,"Не кожна думка — правда; перевіряй їх м'яко."
-    ,"Шепочи доброту собі, навіть якщо кричати простіше."
-    ,"Дозволь сльозам — це чесні гості."
-    ,"Твоє м'яке серце не слабкість; це сенсор."
-    ,"Межі — це мости до себе."
-    ,"Зцілення рідко гучне; частіше воно звучить як дихання."
-    ,"Порахуйте безпеки: двері, друг, чашка, пісня."
-    ,"Нехай рутина тримає, коли мотивації немає."
-    ,"Нормально хотіти менше сьогодні."
-    ,"Не треба вирішити все, щоб заслуговувати спокій."
-    ,"Повільна прогулянка може бути сильним вибором."
-    ,"Спершу заспокійся, потім вирішуй."
-    ,"Можна починати спочатку в будь-яку годину."
-    ,"Відпусти придуманий графік; живи тим, що є."
-    ,"Один чесний вдих — це початок."
-    ,"Навіть тріщини пропускають тепло."
-    ,"Тримайся за нитку однієї підтримуючої звички."
-    ,"Обери один кут у житті й наведи лад; інерція прийде."
-    ,"Ти не позаду; ти на своєму шляху."
-    ,"Дай собі бути сумним без поспіху 'полагодити'."
-    ,"Нехай музика понесе те, що не висловити словами."
-    ,"Твій минулий ти пережив дні, які здавались неможливими."
-    ,"Залишайся допитливим до власної стійкості."
-    ,"Говори лагідно до частин себе, що болять."
-    ,"Коли радість далеко, шукай нейтральність і відпочинь там."
-    ,"Довіряй найменшим крокам; вони накопичуються."
-    ,"Твої почуття логічні у твоїй історії."
-    ,"Попроси обійми або обійми себе сам."
-    ,"М'які ковдри й м'які слова — теж стратегія."
-    ,"Зупини безкінечну стрічку; підійди до вікна."
-    ,"Якщо не можеш бути позитивним, будь лагідним."
-    ,"Дозволь собі допомогу до того, як зламаєшся."
-    ,"Твоя цінність ціла, навіть коли плани валяться."
-    ,"Ти можеш змінити думку про те, що болить."
-    ,"Безпека може бути кутком, піснею чи другом на зв'язку."
-    ,"Перепиши внутрішній діалог так, як говорив би до коханої людини."
-    ,"Знайди щось стабільне й обертайся навколо цього сьогодні."
-    ,"Втомлена надія — все ще надія."
-    ,"Дай нервовій системі приземлитися перед діями."
-    ,"Визнай біль; додай склянку води й подих."
-    ,"Ти не будеш так відчувати завжди — почуття рухаються."
-    ,"Залиши місце і для горя, і для милості."
-    ,"Можна вшанувати біль і все ж обрати добрий крок."
-    ,"Уповільни день, поки він не стане зручним."
-    ,"Назви три речі, які зараз не зламані."
-    ,"Відклади уявний табель; відпочинок не оцінюється."
-    ,"Спитай: яка найлагідніша доступна дія?"
-    ,"Ти вчишся носити те, що колись ламало."
-    ,"Навіть якщо почуваєшся самотньо, тебе поєднує сам факт зусилля."
-    ,"Нехай комфорт буде маленьким: теплі шкарпетки, приглушене світло, спокійні звуки."
-    ,"Тобі не треба заслуговувати лагідність."
-    ,"Мудре серце знає, коли сповільнитись."
-    ,"Відпусти 'полагодити'; практикуй супровід себе."
-    ,"Сльози — клапан скидання, а не провал."
-    ,"Обирай ритуали, що шепочуть: «ти в безпеці»."
-    ,"Відвага — це також сказати «мені потрібна пауза»."
-    ,"Можна почуватися загубленим і все одно бути на шляху."
-    ,"Місяць то зростає, то спадає; так само й енергія."
-    ,"Дай собі терпіння, яке даєш іншим."
-    ,"Ти пережив кожен важкий день до цього."
-    ,"Нехай день буде простим; складність може почекати."
-    ,"Тихі акти турботи — теж сила."
-    ,"Твоя ніжність має право на існування."
-    ,"Коли сумніваєшся, опусти планку й підніми підборіддя."
-    ,"Відновлюй довіру до себе по одному виконаному обіцянню."
-    ,"Вийди на десять вдихів; повернися з м'якшими плечима."
-    ,"Не кожен сезон для цвітіння; деякі — для укорінення."
-    ,"Біль не означає поразку; це означає, що ти відчуваєш."
-    ,"Обирай те, що менше болить і достатньо допомагає."
-    ,"Не треба бути веселим, щоб бути гідним."
-    ,"Коли всередині порожньо, долий відпочинку й доброти."
-    ,"Дай місце смутку; часто поруч із ним є любов."
-    ,"Тримайся правди: ти важливий, навіть невидимий."
-    ,"Залишайся заради наступного світанку; він приходить."
-    ,"Розум штормить; тіло може заякорити."
-    ,"Твій темп — частина твоєї мудрості."
-    ,"М'якші цілі для важких днів."
-    ,"Доглядай нервову систему, як сад."
-    ,"Дозволь собі бути новачком у зціленні."
-    ,"Навіть шепіт надії рахується."
-    ,"Можна нести смуток, не дозволяючи йому керувати."
-    ,"Обери одну добру дію, що під силу; решта зачекає."
-    ,"Ти можеш перерости старі сценарії виживання."
-    ,"Відпочинок — радикальна відповідь у світі поспіху."
-    ,"Твої почуття — не дефекти, а сигнали."
-    ,"Подивись у очі чомусь живому — тварині, рослині, людині."
-    ,"Можна бути м'яким і все одно пройти через це."
-    ,"Нехай внутрішній критик візьме вихідний."
-    ,"Одна сторінка, один крок, один подих."
-    ,"Припини торг з виснаженням; дай йому, що просить."
-    ,"Комфорт — це продуктивність, коли ти відновлюєшся."
-    ,"Важке серце заслуговує легшого графіка."
-    ,"Подзвони тому, хто пам'ятає твоє світло."
-    ,"Мета дня може бути — відчути себе трохи безпечніше."
-    ,"Нехай доброта перерве спіраль."
-    ,"Тихі кімнати лікують гучні думки."
-    ,"Нормально, якщо сьогодні про виживання, а не успіх."
-    ,"Можна пишатися маленькими милостями, які даруєш собі."
-    ,"Обери присутність замість показності."
-    ,"Земля досі під тобою; відчуй її."
-    ,"Відпусти міф, що страждання слід ховати."
-    ,"Нехай список справ зменшиться, коли серце переповнене."
-    ,"Пом'якшення — не здача, а адаптація."
-    ,"Випий води; розтисни щелепу."
-    ,"Шрами — це розділи, а не фінал."
-    ,"Спершу безпека, потім цілі."
-    ,"Будь вірним своєму зціленню, а не поспіху."
-    ,"Ти маєш право потребувати більше часу."
-    ,"Легкість теж ліки."
-    ,"Одна лагідна пауза може змінити весь вечір."
-    ,"Говори до себе так, як до людини в жалобі."
-    ,"Залишайся ніжним; світ потребує твоєї м'якості."
-    ,"Ти достатній, навіть коли відчуваєш менше."
-    ,"Можна відпочивати без провини; ти не машина."
-    ,"Залиши місце для недосконалості; це по-людськи."
-    ,"Лагідний прогрес — теж прогрес."
-    ,"Коли застряг, переходь до турбот: теплий чай, порядок на столі, м'яке світло."
-    ,"Нехай день буде малим, а турбота великою."
-    ,"Твої почуття не зламають світ; поділитися ними може зцілити твій."
-    ,"Протримай себе цю годину; наступна може бути іншою."
-    ,"Ти не один у відчутті самотності."
-    ,"Перестань напружуватися; почни дихати."
-    ,"Нехай мудрість шепоче голосніше за тривогу."
-    ,"Обирай лагідність як свій темп."
-    ,"Твоє серце знає, як гоїтися; дай йому час і турботу."
-    ,"Ти робиш більше, ніж здається, просто залишаючись тут."
-    ,"Нехай співчуття, а не перфекціонізм, буде компасом."
-    ,"Тиха надія — все ще надія."
-    ,"Залиши місце для власної м'якості сьогодні."
-    ,"Один акт турботи може схилити день."
-    ,"Навіть у тумані роби наступний видимий крок."
-    ,"Можна починати малим і залишатися добрим."
-    ,"Обирай заспокоєння, а не доведення."
-    ,"Твоя ніжність — сила, схована в м'якості."
-    ,"Нехай дихання буде якорем, коли думки біжать."
-    ,"Малі втіхи — валідна стратегія."
-    ,"Відклади тягар, що не твій."
-    ,"Слухай свої потреби, як слухав би дитину, яку любиш."
-    ,"Дозволь собі бути звичайним сьогодні; цього достатньо."
-    ,"М'які цілі для жорстких часів."
-    ,"Залишайся заради маленьких радостей — вони накопичуються."
-    ,"Ти гідний легкості, не лише витривалості."
-    ,"Найлагідніший вибір часто наймудріший."
-    ,"Ти можеш гоїтись у своєму темпі."
-    ,"Нехай милість перерве самокритику."
-    ,"Відпочинок — право, а не нагорода."
-    ,"Твої почуття важливі; стався до них дбайливо."
-    ,"Коли сумніваєшся, сповільнись і випий води."
-    ,"Заспокой систему — рішення прийдуть."
-    ,"Можна бути і сумним, і сповненим надії."
-    ,"Дай собі пораду, яку дав би близькому."
-    ,"Будь лагідним до частин себе, що вчаться."
-    ,"Нехай сьогоднішня перемога буде в тому, що ти з'явився."
-    ,"М'яке світло, м'які слова, м'які плани."
-    ,"Твоя присутність важливіша за темп."
-    ,"Ти можеш спробувати завтра знову; цього досить."
-    ,"Нехай доброта буде мірилом, а не продуктивність."
-    ,"Почуття відпливають; ти лишаєшся."
-    ,"Навіть у смутку ти заслуговуєш на комфорт."
-    ,"Обери одну турботливу дію замість однієї тиснучої."
-    ,"Лагідність стійкіша за жорсткість."
-    ,"Твій внутрішній критик — не тренер."
-    ,"Заспокой тіло, щоб втихомирити розум."
-    ,"Нормально просити життя бути простішим сьогодні."
-    ,"Назви три опори, до яких можеш звернутись."
-    ,"Тобі не потрібно нести це самому."
-    ,"Дозволь відпочинку бути продуктивним лікуванням."
-    ,"Мудрі серця практикують темп."
-    ,"Будь ніжним із собою; ти робиш важкі речі."
-    ,"Ніч закінчиться; тримайся цього факту."
-    ,"Можна ненадовго покласти ношу."
-    ,"Нехай твій подих буде доказом твого вибору жити."
-    ,"Тепло — ліки: ванна, ковдра, добре слово."
-    ,"Навіть у сумнівах збережи маленьку обіцянку собі."
-    ,"Смуток показує, що для тебе важливо; вшануй це."
-    ,"Ти можеш шукати затишок без вибачень."
-    ,"Нехай день буде про зцілення, а не про доведення."
-    ,"Твоя історія включає цей важкий розділ, але не обмежується ним."
-    ,"Залиши простір для свого серця; воно несе багато."
-    ,"Лагідна сталість краща за інтенсивні спалахи."
-    ,"Можна бути ніжним і водночас стійким."
-    ,"Доброта до себе — мудра інвестиція."
-    ,"Дозволь собі відчути; потім дозволь собі відпочити."
-    ,"Знайди одну безпечну річ і побудь поруч із нею."
-    ,"Ти вартий зусиль своєї турботи."
-    ,"Пом'якшення розкладу може зміцнити дух."
-    ,"Нормально потребувати більше спокою, ніж інші."
-    ,"Нехай день буде легким на вимоги й багатим на турботу."
-    ,"Коли серце втомлене, найсміливіше — відпочити."
-    ,"Обирай комфорт, який справді відновлює, а не тільки відволікає."
-    ,"Ти достатній, навіть коли робиш менше."
-    ,"Дозволь собі бути новачком у відпочинку."
-    ,"Лагідні плани переживають важкі дні."
-    ,"Добрі слова до себе — практична підтримка."
-    ,"Твої почуття заслуговують м'якого приземлення."
-    ,"Повільна турбота — теж турбота."
-    ,"Нехай тиша буде ліками."
-    ,"Ти не тягар; твій біль — не незручність."
-    ,"Будь поруч із тим, що тебе заспокоює."
-    ,"Нормально зробити мінімум і визнати це достатнім."
-    ,"Твоя м'якість може співіснувати зі силою."
-    ,"Дотримай маленьку обіцянку собі сьогодні; довіра росте."
-    ,"Нехай сьогодні буде про лагідність, а не про велич."
-    ,"Тепла їжа, теплі слова, теплий відпочинок."
-    ,"Можна бути мудрим і втомленим одночасно."
-    ,"Дозволь доброті бути мовою, якою говориш до себе."
-    ,"Ти заслуговуєш на турботу у смутні дні, а не на нотації."
-    ,"Нехай один заспокійливий ритуал обрамляє твій день."
-    ,"Заспокой серце, потім вирішуй завдання."
-    ,"Твоя цінність стабільна, незалежно від продуктивності."
-    ,"Лагідна рутина — тихий якір."
-    ,"Можна відійти, не відстаючи."
-    ,"М'якість — це не капітуляція, а стратегія."
-    ,"Тримай своє серце, як щось цінне — бо так і є."
-    ,"Можна відпочити до того, як спорожнієш."
-    ,"Обери найлагідніше тлумачення своїх зусиль."
-    ,"Настрій може бути низьким; цінність незмінна."
-    ,"Нехай плани гнуться під почуття."
-    ,"Навіть повільне зцілення — зцілення."
-    ,"Можна зробити паузу, вдихнути й почати знову."
-    ,"Комфорт — мудрий вибір, коли сумно."
-    ,"Твої почуття тут шанують."
-    ,"Відпусти ідею ідеальних копінгів; обери робочі."
-    ,"Залишайся допитливим до того, що тебе заспокоює — веди список."
-    ,"Ти гідний терпіння, особливо від себе."
-    ,"Лагідні вибори сьогодні творять силу завтра."
-    ,"Дозволь собі прийняти допомогу; це мудро."
-    ,"Тобі не треба бути веселим, щоб бути гідним."
-    ,"Лагідний темп — теж рух."
-    ,"Нехай день буде милосердним до тебе — почни з милосердя до себе."
-    ,"Обери менше завдання й виконай його лагідно."
-    ,"Смуток реальний; так само реальна твоя здатність дбати про себе в ньому."
-    ,"Довіряй, що легкість може співіснувати із зусиллям."
-    ,"Будь собі другом, коли він найбільше потрібен."
-    ,"Твій спокій можна зібрати з маленьких шматочків."
-    ,"Нехай комфорт буде наміром, а не випадковістю."
-    ,"Мудре життя включає дні, коли робиш менше."
-    ,"Твоє серце має право бути втомленим; нехай звички несуть тебе."
-    ,"Можна створити день, що буде лагідним і все ж змістовним."
-    ,"Обирай відпочинок так, як обираєш їжу."
-    ,"Нехай доброта буде мовою, якою говориш до себе."
-    ,"Ти маєш право ставити своє благополуччя першим."
-    ,"Навіть у смутку є місце для маленьких доброт."
-    ,"Вдихни; ти тут; це важливо."
-    ,"Нехай надія буде маленькою й стійкою, як запальничка."
-    ,"Можна бути м'яким і водночас непохитним."
-    ,"Заспокой відчуття: тепло, напівтемрява, тиша, м'якість."
-    ,"Твої почуття заслуговують уваги, а не осуду."
-    ,"Сьогодні міряй успіх тим, наскільки лагідно ти до себе."
-    ,"Дозволь паузи; життя триває, поки ти відпочиваєш."
-    ,"Можна нести смуток лагідно і рухатися далі."
-    ,"Впусти милість; вона хоче допомогти."
-    ,"Обери заспокійливу мантру і повторюй тихо."
-    ,"Твоя присутність достатня для когось — і для себе."
-    ,"Відпочинок лагодить те, що руйнує поспіх."
-    ,"Ти заслуговуєш почуватися в безпеці у своїй турботі."
-    ,"Нехай день буде про відновлення, а не про доведення."
-    ,"М'які графіки валідні, коли серце важке."
-    ,"Твої емоції — інформація; відповідай співчуттям."
-    ,"Коли переповнений, повернись до води й дихання."
-    ,"Дозволь собі сумувати без додавання сорому."
-    ,"М'якший підхід може відкрити мудріші рішення."
-    ,"Тримай маленьку обіцянку: потягнись, зроби ковток, вийди на вулицю."
-    ,"Ти достатній, навіть коли ніжний."
-    ,"Нехай твоя турбота буде послідовною, а не умовною."
-    ,"Обирай те, що заспокоює й живить, а не лише відволікає."
-    ,"Можна рухатись із швидкістю доброти."
-    ,"Твоя цінність не змінюється від важких настроїв."
-    ,"Відпочинь тілом; спокій прийде."
-    ,"Лагідні межі захищають твоє зцілення."
-    ,"Можна сповільнитись, не відстаючи від життя."
-    ,"Нехай м'якість буде стратегією, коли сила далеко."
-    ,"Твій смуток заслуговує простору й підтримки."
-    ,"Створи притулок у дрібницях: прибери куток, запали свічку, вдихни."
-    ,"Доброта до себе — мудрість і відвага."
-    ,"Дай своєму серцю бути почутим — навіть тихо."
-    ,"Можна бути мудрим, добрим і сумним водночас."
-    ,"Лагідна ніч створює місце для лагідного завтра."
-    ,"Подаруй собі милість, яку легко даєш іншим."
-    ,"Ти маєш право займати простір своїми почуттями."
-    ,"Нехай ніжність веде твоє наступне рішення."
-    ,"Відпочивай так, ніби це важливо — бо так і є."
-    ,"Навіть у смутку можна обрати самоспівчуття."
-    ,"Тиха відвага — все ще відвага."
-    ,"Нехай день буде гуманним до тебе; підлаштуй його."
-    ,"Ти заслуговуєш відчувати опору у власній турботі."
-    ,"Смуток не скасовує твоє світло; лише тимчасово затінює."
-    ,"Спирайся на рутини, коли емоції гучні."
-    ,"Твоє серце вчиться; будь терплячим до його темпу."
-    ,"Лагідні слова до себе — практичні ліки."
-    ,"Можна відпочити посередині, не лише в кінці."
-    ,"Доброта масштабується: почни мало, повторюй часто."
-    ,"Нехай внутрішній голос буде м'яким місцем для приземлення."
-    ,"Ти все ще гідний у дні, коли лише тримаєшся."
-    ,"Обери полегшення спершу; вирішення — потім."
-    ,"Будь на своєму боці сьогодні."
-    ,"Твій смуток видно; ти все ще цілісний."
-    ,"Малі милості найбільше значать у важкі дні."
-    ,"Ти можеш довіряти собі пройти цю годину."
-    ,"Нехай терпіння буде твоїм темпом."
-    ,"Дбай про себе, як про когось, гідного порятунку — бо це так."
-    ,"М'яка сила несе, коли тверда вичерпується."
-    ,"Ти не винен світу посмішку, щоб заслужити відпочинок."
-    ,"Нехай тіло розм'якне; розум піде слідом."
-    ,"Твої лагідні зусилля сьогодні — достатньо."
-    ,"Можна вибрати милість замість напруження прямо зараз."
-    ,"Дозволь собі бути втішеним; це мудро."
-    ,"Залишайся; історія не завершена."
-    ,"Нехай наступний вибір буде добрим — і наступний теж."
-    ,"Твоє серце варте найніжнішої твоєї турботи."
-    ,"Смуток приходить у гості; він не господар будинку."
-    ,"Будь лагідним, лагідним, лагідним — це працює."
-    ,"Знайди одну річ, яку можна не зробити. Завдання, яке ніхто не помітить. Дзвінок, який можна не здійснити. Це — твоя маленька свобода. Почни з цього."
-    ,"Прийми безглузде рішення. Повернись додому іншим шляхом. Купи фрукти, які ніколи не пробував. Зміни порядок справ. Розірви шаблон. Автопілот — це смерть за життя."
-    ,"Зроби щось непогано. Не ідеально. Не ефективно. Просто зроби. І залиш так. Світ не розвалиться."
-    ,"Дозволь собі впасти на дно. Не борись з падінням. Це єдине місце, де тебе ніхто не чекає, а отже — єдине, де ти справді в безпеці. Дно — це не кінець. Це перша тверда поверхня, на яку ти натрапив задовго."
-    ,"Один день ти прокинешся і не відчуєш нічого. І ти злякаєшся. Бо біль став частиною твоєї ідентичності. І хто ти без нього? Це момент, коли ти повинен почати вигадувати себе наново. З нуля. Не як жертву, а як пустелю після дощу."
-    ,"Найкращий час для посадження дерева був 20 років тому. Другий найкращий час — зараз."
-    ,"Ти не ленивий. Ти часто просто боїшся."
-    ,"Прогрес брудний. Святкуй брудь."
-    ,"Твоя чутливість — не слабкість. Це твоя суперсила."
-    ,"Люди, які тебе люблять, не потребують переконань."
-    ,"Ти не мусиш бути ввімкненим весь час. М'якість — це сила."
-    ,"Твоє тіло все помнить. Слухай його."
-    ,"Прозріння не лінійне. І тобі не треба бути лінійним."
-    ,"Тобі дозволено займати місце."
-    ,"Людина, якою ти станеш, — це не незнайома. Вона просто чекає дозволу."
-    ,"Іноді найсміливіше — це визнати, що ти не знаєш."
-    ,"Твій відпочинок — це не лінь. Це опір."
-    ,"Ти не відповідаєш за комфорт інших за рахунок свого."
-    ,"Напиши історію, яку хотіла б почути сама."
-    ,"Версія тебе, яка почувається безпечно вразливою, змінить весь твій шлях."
-    ,"Ти нікому не винна пояснення."
-    ,"Розберися з собою, почавши звідкись."
-    ,"Твоя травма зробила тебе сильнішою. Вона також тебе втомила. Обидва речі правдиві."
-    ,"Найважливіший стосунок, який у тебе буде, — це стосунок із собою."
-    ,"Ти не зламана. Ти становишся."
-    ,"Припини чекати на дозвіл. Почни не чекати на нічого."
-    ,"Межі — це любов, що стала видимою."
-    ,"Тобі дозволено виростати з людьми. Тобі дозволено йти."
-    ,"Найсильніше, що ти можеш зробити, — попросити допомогу."
-    ,"Твоє минуле не визначає твоє майбутнє, якщо ти цього не дозволиш."
-    ,"Жаль навчає. Сором теж навчає. Вивчи й іди далі."
-    ,"Ти не занадто багато. Ти саме достатня."
-    ,"Життя, яке ти хочеш, чекає на іншому боці твого страху."
-    ,"Твоя вартість не підлягає переговорам."
-    ,"Іноді сказати ні — це найдобріше, що ти можеш зробити."
-    ,"Тобі не треба заробляти відпочинок."
-    ,"Спочатку пробач себе. Все інше йде далі."
-    ,"Твій голос має значення. Навіть коли він тремтить."
-    ,"Ти не відповідаєш за спасіння кого-небудь. Ти відповідаєш за себе."
-    ,"Ріст відбувається в незручному просторі."
-    ,"Твої почуття мають право. Твої межі — непохитні."
-    ,"Тобі не треба виправляти. Тобі треба, щоб у тебе вірили."
-    ,"Життя, яке ти хочеш, будують люди, які сказали ні."
-    ,"Твоя історія не закінчується, тому що ти сумуєш сьогодні."
-    ,"Ти сміливий за те, що з'явився. Навіть у важкі дні."
-    ,"Прозріння — це мистецтво, а не гонитва."
-    ,"Ти — це не твої помилки. Ти — це те, що ти робиш після."
-    ,"Світ потребує твоєї доброти. Але не за твій рахунок."
-    ,"Тобі дозволено змінити думку."
-    ,"Дихай. Ти пережила 100% найгірших своїх днів."
-    ,"Твої помилки не визначають тебе. Твоя реакція на них визначає."
-    ,"Ти не егоїстична за те, що хочеш більшого."
-    ,"Найважливіше, що ти можеш вивчити, — як бути доброю до себе."
-    ,"Тобі не треба бути продуктивною, щоб бути гідною."
-    ,"Припини соромитися потребу. Кожному щось потрібно."
-    ,"Твоє тіло — це не проблема, яку треба вирішити."
-    ,"Ти не відповідаєш за комфорт інших."
-    ,"Життя, яке ти хочеш, починається з прийняття того, де ти зараз."
-    ,"Ти не занадто чутлива. Світ занадто жорстокий."
-    ,"Твоя злість справедлива. Твоя сум справедливий. Твоя радість справедлива."
-    ,"Ти нікому не винна пояснення перед людьми, які не мають значення."
-    ,"Порівняння крадіє радість. Край назад."
-    ,"Тобі дозволено хотіти речей."
-    ,"Людина, якою ти зараз є, — це не твоя остаточна форма."
-    ,"Твоя мовчанка — це не згода. Це виживання."
-    ,"Ти сміливий просто від того, що тут."
-    ,"Досконалість — ворог прогресу."
-    ,"Тобі не треба мати все розібране."
-    ,"Твоє психічне здоров'я так само важливе, як фізичне."
-    ,"Ти не божевільна. Ти не зламана. Ти людина."
-    ,"Найкраща помста — це добре прожите життя."
-    ,"Тобі дозволено відпочивати без того, щоб його заробляти."
-    ,"Твої мрії не занадто великі. Твій сумнів занадто голосний."
-    ,"Тобі не треба вибачатися за дбання про себе."
-    ,"Прозріння не означає забування. Це означає прийняття."
-    ,"Ти не застрягла. Ти вибираєш. Тепер вибери інакше."
-    ,"Твій потенціал не визначається твоїм минулим."
-    ,"Тобі дозволено залишити ситуації, які тебе ранять."
-    ,"Найпотужніше, що ти можеш зробити, — вірити в себе."
-    ,"Тобі не треба бути досконалою, щоб бути гідною."
-    ,"Твоя слабкість — це де росте твоя сила."
-    ,"Ти не занадто багато. Ти не достатня. Ти саме правильна."
-    ,"Життя, яке ти хочеш, потребує версії тебе, яка сміливих."
-    ,"Тобі дозволено сказати ні без пояснення."
-    ,"Твої почуття не занадто великі. Твій контейнер був занадто малий."
-    ,"Тобі не треба заробляти любов. Ти любима просто за те, що існуєш."
-    ,"Прогрес замість досконалості."
-    ,"Ти сміливий за спробу. Навіть коли ти проваліваєшся."
-    ,"Твої шрами розповідають історію виживання."
-    ,"Ти не відповідаєш за исцеление інших людей."
-    ,"Єдиний дозвіл, який тобі потрібен, — це твій власний."
-    ,"Тобі дозволено займати місце у своєму власному житті."
-    ,"Твоє минуле — це не твоє майбутнє."
-    ,"Тобі не треба бути хорошою у всьому, щоб бути хорошою."
-    ,"Прозріння — це не про стирання минулого. Це про укладення миру з ним."
-    ,"Ти сміливий за попросити допомогу."
-    ,"Твоя вартість не визначається твоєю продуктивністю."
-    ,"Тобі дозволено бути егоїстичною іноді."
-    ,"Найважливіша розмова — та, яку ти ведеш із собою."
-    ,"Тобі не треба бути зламаною, щоб потребувати прозріння."
-    ,"Твій голос гідний, щоб його чули."
-    ,"Ти — це не твоя тривога. Ти — це не твоя депресія."
-    ,"Життя, яке ти хочеш, варте дискомфорту змін."
-    ,"Тобі дозволено пріоритизувати себе."
-    ,"Твоя історія не закінчена. Все ще є розділи для написання."
-    ,"Тобі не треба заробляти відпочинок. Ти людина."
-    ,"Ти сміливий просто від того, що живеш."
-    ,"Людина, якою ти хочеш бути, в межах твоєї досяжності."
-    ,"Ти не занадто пошкоджена. Ти занадто цінна."
-    ,"Твій біль справедливий. Твоє прозріння можливе."
-];
\ No newline at end of file
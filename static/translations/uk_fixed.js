@@ -1,425 +0,0 @@
-const translations_uk = {
-    // Навігація
-    'nav_home': 'Головна',
-    'nav_journal': 'Щоденник',
-    'nav_statistics': 'Статистика',
-    'nav_goals': 'Цілі',
-    'nav_favorites': 'Улюблене',
-    'nav_about': 'Про нас',
-
-    // Сторінка обраних цитат
-    'favorites_title': 'Обрані поради',
-    'favorites_description': 'Ваші збережені поради зберігаються локально у вашому браузері. Керуйте своєю колекцією: копіюйте, видаляйте або повертайтесь на головну за новими порадами.',
-    'no_favorites': 'У вас ще немає збережених порад. Поверніться на головну та збережіть декілька!',
-    'delete': 'Видалити',
-    'clear_all': 'Очистити все',
-    'confirm_clear_all': 'Очистити всі збережені цитати?',
-
-    // Головна сторінка
-    'new_quote': 'Нова цитата',
-    'new_advice': 'Нова порада',
-    'daily_advice_locked': 'Порада дня активована',
-    'copy_quote': 'Копіювати',
-    'save_quote': 'Зберегти',
-    'saved_quote': 'Збережено',
-    'tip_new_quote': 'Підказка: Натисніть N для нової цитати',
-    'tip_new_advice': 'Підказка: натисни N, щоб отримати пораду',
-    'theme_persist': 'Тема зберігається між відвідуваннями',
-
-    // Щоденник
-    'journal_title': 'Мій щоденник настрою',
-    'new_entry': 'Новий запис',
-    'mood': 'Настрій:',
-    'mood_happy': '😊 Щасливий',
-    'mood_excited': '🤩 Збуджений',
-    'mood_neutral': '😐 Нейтральний',
-    'mood_calm': '😌 Спокійний',
-    'mood_angry': '😠 Сердитий',
-    'mood_sad': '😢 Сумний',
-    'mood_disappointed': '😔 Розчарований',
-    'sleep_quality': 'Якість сну:',
-    'sleep_hours': 'Кількість годин сну:',
-    'sleep_terrible': 'Жахливо',
-    'sleep_bad': 'Погано',
-    'sleep_good': 'Добре',
-    'sleep_excellent': 'Супер',
-    'date': 'Дата:',
-    'entry_title': 'Заголовок:',
-    'title_placeholder': 'Коротко про день',
-    'content': 'Опис дня:',
-    'content_placeholder': 'Що сталося сьогодні? Що вплинуло на ваш настрій?',
-    'activities': 'Активності:',
-    'activity_exercise': '🏃‍♂️ Спорт',
-    'activity_meditation': '🧘‍♂️ Медитація',
-    'activity_reading': '📚 Читання',
-    'activity_social': '👥 Спілкування',
-    'activity_nature': '🌳 Природа',
-    'activity_work': '💼 Робота',
-    'activity_games': '🎮 Ігри',
-    'activity_music': '🎵 Музика',
-    'activity_creativity': '🎨 Творчість',
-    'activity_cooking': '🍔 Готування',
-    'activity_sleep': '💤 Сон',
-    'activity_movies': '🎬 Кіно/ТВ',
-    'activity_social_media': '📱 Соціальні мережі',
-    'activity_shopping': '🛍️ Шопінг',
-    'save_entry': 'Зберегти запис',
-    'my_entries': 'Мої записи',
-    'all_moods': 'Всі настрої',
-
-    // Статистика
-    'mood_analysis': 'Аналіз вашого настрою',
-    'overall_stats': 'Загальна статистика',
-    'monthly_entries': 'Записів за останній місяць',
-    'most_frequent': 'Найчастіший настрій',
-    'average_mood': 'Середній настрій',
-    'mood_trend': 'Тренд настрою за останній місяць',
-    'mood_distribution': 'Розподіл настроїв',
-    'mood_calendar': 'Календар настрою',
-    'sleep_statistics': 'Статистика сну',
-    'sleep_nights': 'Ночей зі сном',
-    'sleep_average': 'Середня кількість годин',
-    'sleep_best': 'Найбільше годин',
-    'sleep_worst': 'Найменше годин',
-    'sleep_quality_avg': 'Середня якість',
-    'sleep_trend_desc': 'Тренд твого сну за останній місяць',
-    'sleep_trend': 'Тренд сну за останній місяць',
-    'sleep_insights': 'Інсайти сну',
-    'quotes_stats': 'Статистика цитат',
-    'saved_quotes': 'Збережено цитат',
-    'favorite_quotes': 'Улюблених цитат',
-    'quote_of_day': 'Цитата дня',
-
-    // Повідомлення
-    'entry_saved': 'Запис збережено!',
-    'save_error': 'Помилка при збереженні запису',
-    'copied': 'Скопійовано!',
-    'copy': 'Копіювати',
-
-    // Налаштування
-    'language': 'Мова:',
-    'theme': 'Тема:',
-    'feedback_title': 'Зворотний зв`язок',
-    'feedback_name': 'Ім`я (необов`язково)',
-    'feedback_email': 'Email (необов`язково)',
-    'feedback_message': 'Ваш відгук...',
-    'feedback_send': 'Надіслати відгук',
-    'feedback_thanks': 'Дякуємо за ваш відгук!',
-    'feedback_error': 'Помилка при надсиланні відгуку.',
-    'feedback_rating_none': 'Без оцінки',
-
-    // Аутентифікація
-    'login_title': 'Вхід',
-    'register_title': 'Реєстрація',
-    'email': 'Email',
-    'password': 'Пароль',
-    'login_button': 'Увійти',
-    'register_button': 'Зареєструватися',
-    'logout': 'Вийти',
-    'my_account': 'Мій акаунт',
-    'login_required_message': 'Будь ласка, увійдіть щоб здійснити покупку',
-    'no_account': 'Немає акаунту?',
-    'have_account': 'Вже є акаунт?',
-    'password_hint': 'Мінімум 6 символів',
-    'password_too_short': 'Пароль повинен містити мінімум 6 символів',
-
-    // Адмін панель - Продукти
-    'admin_panel': 'Адмін',
-    'admin_products_title': 'Управління продуктами',
-    'admin_products_desc': 'Додавайте, редагуйте та видаляйте цифрові продукти в магазині.',
-    'add_product': 'Додати продукт',
-    'new_product': 'Новий продукт',
-    'edit_product': 'Редагувати продукт',
-    'product_name': 'Назва продукту',
-    'product_slug': 'Slug (унікальний ідентифікатор)',
-    'product_type_select': 'Тип продукту',
-    'type_quote_pack': 'Пакет цитат',
-    'type_theme': 'Тема оформлення',
-    'type_journal_template': 'Шаблон щоденника',
-    'type_habit_course': 'Курс звичок',
-    'product_price': 'Ціна',
-    'product_description': 'Опис',
-    'product_active': 'Активний',
-    'no_products_yet': 'Продуктів ще немає.',
-    'confirm_delete_product': 'Видалити цей продукт? (Він буде деактивований)',
-    'product_not_found': 'Продукт не знайдено',
-
-    // Адмін панель - Замовлення
-    'admin_orders_title': 'Управління замовленнями',
-    'admin_orders_desc': 'Переглядайте замовлення користувачів та оновлюйте їх статус.',
-    'order_id': 'ID замовлення',
-    'user': 'Користувач',
-    'status': 'Статус',
-    'total': 'Сума',
-    'created': 'Створено',
-    'created_at': 'Дата створення',
-    'actions': 'Дії',
-    'order_details': 'Деталі замовлення',
-    'items': 'Товари',
-    'quantity': 'Кількість',
-    'no_items': 'Немає товарів',
-    'no_orders_yet': 'Замовлень ще немає.',
-    'order_status_new': 'Нове',
-    'order_status_processing': 'В обробці',
-    'order_status_completed': 'Завершено',
-    'order_status_canceled': 'Скасовано',
-    'confirm_delete_order': 'Видалити це замовлення?',
-    'view': 'Переглянути',
-    'close': 'Закрити',
-
-    // Адмін дашборд
-    'admin_dashboard_title': 'Адмін-панель',
-    'admin_dashboard_desc': 'Ласкаво просимо! Оберіть розділ для керування контентом та замовленнями.',
-    'admin_dashboard_products_title': 'Продукти магазину',
-    'admin_dashboard_products_desc': 'Додавайте нові цифрові ресурси, редагуйте опис та керуйте активністю.',
-    'admin_dashboard_orders_title': 'Замовлення',
-    'admin_dashboard_orders_desc': 'Переглядайте покупки користувачів, оновлюйте статуси та відстежуйте історію.',
-    'admin_dashboard_users_title': 'Користувачі',
-    'admin_dashboard_users_desc': 'Керуйте зареєстрованими користувачами та їхніми правами доступу.',
-    'admin_dashboard_feedback_title': 'Зворотний зв\'язок',
-    'admin_dashboard_feedback_desc': 'Читайте відгуки спільноти DailyMood та швидко реагуйте на важливі повідомлення.',
-    'admin_users_title': 'Керування користувачами',
-    'admin_users_desc': 'Призначайте або забирайте адмін-права та очищуйте список користувачів.',
-    'admin_users_empty': 'Наразі немає інших зареєстрованих користувачів.',
-    'admin_role_admin': 'Адміністратор',
-    'admin_role_user': 'Користувач',
-    'admin_make_admin': 'Надати адмін-права',
-    'admin_remove_admin': 'Забрати адмін-права',
-    'admin_delete_user': 'Видалити користувача',
-    'admin_confirm_delete_user': 'Видалити цього користувача?',
-    'admin_primary_label': 'Головний адміністратор',
-
-    // Профіль
-    'profile_title': 'Мій профіль',
-    'profile_intro': 'Перегляньте інформацію про свій акаунт, роль та історію замовлень.',
-    'profile_account_section': 'Дані акаунту',
-    'profile_overview_email': 'Email',
-    'profile_role': 'Роль',
-    'profile_role_admin': 'Адміністратор',
-    'profile_role_user': 'Користувач',
-
-    'role': 'Роль',
-    'profile_registered_at': 'Зареєстровано',
-    'profile_open_admin': 'Відкрити адмін-панель',
-    'profile_orders_section': 'Замовлення',
-    'profile_orders_caption': 'Останні покупки та їхній статус.',
-    'profile_go_to_store': 'До магазину',
-    'profile_no_orders': 'Поки що немає замовлень.',
-    'profile_total_orders': 'Усього замовлень',
-    'profile_completed_orders': 'Завершено',
-    'profile_completed_hint': 'успішно доставлено',
-    'profile_total_spent': 'Сума покупок',
-    'profile_total_spent_hint': 'грн',
-    'profile_orders_recent': 'за весь час',
-
-    // Магазин
-    'store_title': 'Магазин',
-    'store_desc': 'Покращте свій досвід з DailyMood завдяки нашим цифровим продуктам.',
-    'buy_now': 'Купити',
-    'purchase_success': 'Покупка успішна! Замовлення',
-    'purchase_failed': 'Помилка покупки',
-    'no_products_available': 'Продуктів наразі немає.',
-
-    // Загальні
-    'save': 'Зберегти',
-    'cancel': 'Скасувати',
-    'edit': 'Редагувати',
-    'refresh': 'Оновити',
-    'loading': 'Завантаження...',
-    'load_failed': 'Не вдалося завантажити дані.',
-    'save_failed': 'Не вдалося зберегти.',
-    'delete_failed': 'Не вдалося видалити.',
-    'update_failed': 'Не вдалося оновити.',
-    'id': 'ID',
-    'name': 'Назва',
-    'type': 'Тип',
-    'price': 'Ціна',
-    'active': 'Активний',
-    'inactive': 'Неактивний',
-    'open_section': 'Відкрити',
-
-    // Premium Features
-    'premium_badge': 'PREMIUM',
-    'premium_required': 'Ця функція доступна тільки для Premium користувачів',
-    'get_premium': 'Отримати Premium',
-    'premium_plan': 'Premium',
-    'free_plan': 'Безкоштовний',
-    
-    // Mood Predictor
-    'mood_predictor_title': 'Mood Predictor',
-    'mood_predictor_desc': 'Передбачення настрою на завтра на основі твоєї історії',
-    'prediction_tomorrow': 'Прогноз на завтра',
-    'prediction_confidence': 'Впевненість',
-    'prediction_trend': 'Тренд',
-    'prediction_insights': 'Інсайти',
-    'trend_up': 'Покращується',
-    'trend_down': 'Знижується',
-    'trend_stable': 'Стабільний',
-    'predictor_loading': 'Завантаження прогнозу...',
-    'predictor_error': 'Не вдалося завантажити прогноз. Спробуйте пізніше.',
-    
-    // Activity Recommendations
-    'activity_recs_title': 'Activity Recommendations',
-    'activity_recs_desc': 'Персоналізовані поради активностей на основі твого настрою',
-    'recs_tip_label': 'Порада',
-    'recs_loading': 'Завантаження рекомендацій...',
-    'recs_error': 'Не вдалося завантажити рекомендації. Спробуйте пізніше.',
-    
-    // Store Premium comparison
-    'store_premium_title': 'Преміум та підтримка',
-    'store_premium_desc': 'Обери Premium для розширених можливостей або підтримай нас покупкою доповнень.',
-    'compare_plans': 'Порівняння тарифів',
-    'compare_title': 'Порівняння тарифів',
-    'compare_subtitle': 'Що доступно у Free та Premium',
-    'feature': 'Можливість',
-    'feature_basic': 'Журнал, улюблене, цілі',
-    'feature_stats': 'Базова статистика',
-    'feature_themes': 'Преміум теми',
-    'feature_predictor': 'Mood Predictor — прогноз настрою',
-    'feature_recommendations': 'Activity Recommendations',
-    'feature_advanced_stats': 'Розширена статистика',
-    'feature_support': 'Пріоритетна підтримка',
-    'more_details': 'Детальніше',
-    'free_plan_desc': 'Базовий функціонал для щоденного трекінгу настрою.',
-    'premium_plan_desc': 'Більше тем, глибша статистика, підтримка розвитку.',
-    
-    // Store new sections
-    'promo_title': '🎉 Спеціальна пропозиція',
-    'promo_desc': 'Отримай Premium за спеціальною ціною! Розширені функції для кращого трекінгу настрою.',
-    'popular_badge': 'ПОПУЛЯРНЕ',
-    'why_premium_title': '💎 Чому варто обрати Premium?',
-    'why_premium_subtitle': 'Розширені можливості для глибшого розуміння твого настрою',
-    'benefit_themes_title': 'Преміум теми',
-    'benefit_themes_desc': 'Персоналізуй інтерфейс під свій настрій з унікальними темами оформлення',
-    'benefit_predictor_title': 'Mood Predictor',
-    'benefit_predictor_desc': 'Прогнозування твого настрою на основі аналізу попередніх записів',
-    'benefit_recommendations_title': 'Персональні рекомендації',
-    'benefit_recommendations_desc': 'Отримуй поради для покращення настрою на основі твоїх даних',
-    'benefit_analytics_title': 'Розширена аналітика',
-    'benefit_analytics_desc': 'Детальна статистика з графіками та трендами для кращого самопізнання',
-    'benefit_support_title': 'Пріоритетна підтримка',
-    'benefit_support_desc': 'Швидка допомога від команди та першочергові оновлення',
-    'benefit_project_title': 'Підтримка проєкту',
-    'benefit_project_desc': 'Допоможи нам розвиватись та додавати нові функції',
-    'faq_title': '❓ Часті питання',
-    'faq_payment_q': 'Як працює оплата Premium?',
-    'faq_payment_a': 'Після натискання "Купити" ти будеш перенаправлений на безпечну сторінку оплати. Після успішної оплати Premium активується автоматично.',
-    'faq_duration_q': 'На який термін надається Premium?',
-    'faq_duration_a': 'Premium надається на постійній основі після одноразової оплати. Всі функції залишаються доступними без обмежень у часі.',
-    'faq_data_q': 'Чи збережуться мої дані без Premium?',
-    'faq_data_a': 'Так! Всі твої записи та дані залишаються у тебе назавжди, навіть якщо ти використовуєш безкоштовну версію.',
-    'faq_methods_q': 'Які способи оплати підтримуються?',
-    'faq_methods_a': 'Ми підтримуємо всі популярні способи оплати: банківські картки (Visa, Mastercard), Google Pay, Apple Pay та інші електронні гаманці.',
-    'faq_student_q': 'Чи є знижки для студентів?',
-    'faq_student_a': 'Так! Напиши нам на support@dailymood.app з підтвердженням студентського статусу, і ми надамо спеціальну знижку.',
-    
-    // Checkout & Payment
-    'checkout_title': 'Оформлення замовлення',
-    'checkout_payment_method': 'Спосіб оплати',
-    'checkout_payment_desc': 'Оберіть зручний спосіб оплати',
-    'checkout_card_details': 'Дані картки',
-    'checkout_card_number': 'Номер картки',
-    'checkout_card_holder': 'Власник картки',
-    'checkout_card_expiry': 'Термін дії',
-    'checkout_card_cvv': 'CVV',
-    'checkout_pay_now': 'Оплатити',
-    'checkout_order_summary': 'Підсумок замовлення',
-    'checkout_subtotal': 'Сума',
-    'checkout_delivery': 'Доставка',
-    'checkout_free': 'Безкоштовно',
-    'checkout_total': 'Разом',
-    'checkout_secure': 'Безпечна оплата',
-    'checkout_secure_desc': 'Ваші дані захищені SSL-шифруванням',
-    'no_payment_methods': 'Методи оплати недоступні',
-    'select_payment_method': 'Оберіть спосіб оплати',
-    'invalid_card_number': 'Невірний номер картки',
-    'invalid_card_holder': 'Введіть імʼя власника картки',
-    'invalid_card_expiry': 'Невірний термін дії (MM/YY)',
-    'invalid_card_cvv': 'Невірний CVV код',
-    'processing': 'Обробка',
-    'payment_success': 'Оплата успішна!',
-    'payment_success_desc': 'Дякуємо за покупку. Перенаправляємо вас у профіль...',
-    'payment_failed': 'Помилка оплати',
-    'no_items': 'Немає товарів',
-
-    // Goals page
-    'goals_page_title': 'Мої цілі та звички',
-    'habits_title': 'Щоденні звички',
-    'monthly_goals_title': 'Цілі на місяць',
-    'my_progress': 'Мій прогрес',
-    'achievements': 'Досягнення',
-    'new_habit_placeholder': 'Нова звичка...',
-    'new_goal_placeholder': 'Нова ціль...',
-    'add_habit': 'Додати звичку',
-    'add_goal': 'Додати ціль',
-    'add': 'Додати',
-    'all_habits': 'Усі звички',
-    'all_goals': 'Усі цілі',
-    'no_habits_yet': 'Звичок ще немає',
-    'no_goals_yet': 'Цілей ще немає',
-    'habit_singular': 'звичка',
-    'habit_plural': 'звички',
-    'goal_singular': 'ціль',
-    'goal_plural': 'цілі',
-    'no_habits_calendar': 'Звичок ще немає — додайте одну, щоб почати відстежувати',
-    'ach_days_suffix': 'днів',
-    'ach_longest_desc': 'Найдовша серія повних днів',
-    'ach_days_with_habits': 'днів з усіма звичками',
-    'ach_full_days_desc': 'Повні дні за останні 30 днів',
-    'ach_goals_done': 'цілей виконано',
-    'ach_completed_goals_desc': 'Місячні цілі',
-
-    // About page
-    'about_title': 'Про нас',
-    'about_description': 'DailyMood — простий інструмент для відстеження настрою й звичок. Ми допомагаємо помічати закономірності та підтримувати щоденну рефлексію за допомогою зручного інтерфейсу та ненав\'язливих нагадувань.',
-    'about_mission_title': 'Наша місія',
-    'about_mission_text': 'Сприяти психологічній стійкості через щоденні дрібні кроки: від запису настрою до формування корисних звичок. Ми віримо, що усвідомлене ставлення до свого емоційного стану — це шлях до кращого розуміння себе та гармонійного життя.',
-    'about_features_title': 'Основні можливості',
-    'about_feature_mood_tracking_title': 'Відстеження настрою',
-    'about_feature_mood_tracking_desc': 'Зручний щоденник для запису вашого емоційного стану, активностей та думок. Візуалізація змін настрою допомагає краще розуміти себе.',
-    'about_feature_stats_title': 'Статистика та аналіз',
-    'about_feature_stats_desc': 'Детальні графіки та звіти допомагають відслідковувати тенденції вашого настрою та знаходити фактори, які впливають на ваше самопочуття.',
-    'about_feature_goals_title': 'Постановка цілей',
-    'about_feature_goals_desc': 'Визначте свої особисті цілі та стежте за прогресом. Система допомагає розбивати великі цілі на менші кроки та святкувати досягнення.',
-    'about_feature_habits_title': 'Відстеження звичок',
-    'about_feature_habits_desc': 'Інструменти для формування та підтримки корисних звичок. Відмічайте свій прогрес та отримуйте візуальне підтвердження своїх досягнень.',
-    'about_special_title': 'Особливості проєкту',
-    'about_special_list_ux': 'Зручний та інтуїтивно зрозумілий інтерфейс',
-    'about_special_list_theme': 'Підтримка світлої та темної тем оформлення',
-    'about_special_list_privacy': 'Захист приватності — ваші дані зберігаються локально',
-    'about_special_list_no_ads': 'Немає нав\'язливої реклами чи прихованих платежів',
-    'about_special_list_updates': 'Постійне оновлення та покращення функціоналу',
-    'about_roadmap_title': 'Плани розвитку',
-    'about_roadmap_intro': 'Ми постійно працюємо над вдосконаленням DailyMood. У майбутньому плануємо додати:',
-    'about_roadmap_list_analytics': 'Розширену аналітику настрою та звичок',
-    'about_roadmap_list_export': 'Можливість експорту даних у різні формати',
-    'about_roadmap_list_calendar': 'Інтеграцію з календарем',
-    'about_roadmap_list_new_categories': 'Нові категорії активностей та метрик',
-    'about_contact_title': 'Контакти та зворотний зв\'язок',
-    'about_contact_p1': 'Проєкт розробляється як освітній/демонстраційний — для зворотного зв\'язку або внесків див. репозиторій на GitHub.',
-    'about_contact_p2': 'Ми завжди раді отримати ваші пропозиції щодо покращення проєкту чи нових функцій. Якщо у вас є ідеї або ви знайшли помилку, будь ласка, створіть issue в нашому репозиторії.',
-    'recent_feedback_title': 'Останні відгуки',
-    
-    // Аватари
-    'avatar_label_none': 'Без аватару',
-    'avatar_label_monkey': 'Веселий мавпа',
-    'avatar_label_cat': 'Допитливий котик',
-    'avatar_label_dog': 'Вірний собачка',
-    'avatar_label_bunny': 'Ніжний зайчик',
-    'avatar_label_bear': 'Сильний ведмедик',
-    'avatar_label_koala': 'Затишна коала',
-    'avatar_label_bee': 'Діловита бджілка',
-    'avatar_label_penguin': 'Крутий пінгвін',
-    'avatar_label_frog': 'Щаслива жабка',
-    'avatar_label_mushroom': 'Милий грибочок',
-    'avatar_label_star': 'Сяюча зірка',
-    'avatar_label_cactus': 'Витривалий кактус',
-    'avatar_label_unicorn': 'Чарівний єдиноріг',
-    'avatar_label_dragon': 'Мудрий дракон',
-    'avatar_label_koi': 'Спокійний коропик',
-    'avatar_label_phoenix': 'Відважний фенікс',
-    'avatar_label_crown': 'Королівська корона',
-    'avatar_label_crystal': 'Містичний кристал',
-    'avatar_label_moon': 'Мрійливий місяць',
-    'avatar_label_butterfly': 'Вільний метелик'
-};
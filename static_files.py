@@ -0,0 +1,78 @@
+"""
+Віддача статики з довгим кешуванням та попередньо стиснутими варіантами.
+
+Замінює стандартний view 'static':
+- якщо поруч з файлом лежить file.br / file.gz і клієнт їх приймає
+  (Accept-Encoding), віддається стиснутий варіант з Content-Encoding;
+- URL з поточним відбитком з маніфесту (?v=<хеш вмісту>) отримують
+  Cache-Control: immutable на рік, решта — STATIC_MAX_AGE секунд: застарілий
+  або вигаданий ?v= не закріплює в браузері інший вміст на рік;
+- файл віддається через send_from_directory, тобто wsgi.file_wrapper —
+  gunicorn передає його ядру через sendfile() без читання в пам'ять.
+"""
+
+import mimetypes
+import os
+from functools import lru_cache
+
+from flask import current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+# Порядок — пріоритет: brotli менший за gzip
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+IMMUTABLE_MAX_AGE = 31536000
+DEFAULT_MAX_AGE = 3600
+
+
+def _find_variants(folder, filename):
+    variants = []
+    for encoding, suffix in ENCODINGS:
+        path = safe_join(folder, filename + suffix)
+        if path and os.path.isfile(path):
+            variants.append((encoding, suffix))
+    return tuple(variants)
+
+
+_cached_variants = lru_cache(maxsize=2048)(_find_variants)
+
+
+def precompressed_variants(folder, filename):
+    """Доступні стиснуті варіанти файлу; у debug не кешуються (файли змінюються)."""
+    if current_app.debug:
+        return _find_variants(folder, filename)
+    return _cached_variants(folder, filename)
+
+
+def is_current_version(filename):
+    """?v= збігається з відбитком файлу в маніфесті (assets.py)."""
+    version = request.args.get('v')
+    manifest = current_app.extensions.get('assets')
+    return bool(version) and manifest is not None and manifest.digest(filename) == version
+
+
+def send_static_file(filename):
+    folder = current_app.static_folder
+    versioned = is_current_version(filename)
+    max_age = IMMUTABLE_MAX_AGE if versioned else current_app.config.get('STATIC_MAX_AGE', DEFAULT_MAX_AGE)
+
+    variants = precompressed_variants(folder, filename)
+    chosen = next((v for v in variants if request.accept_encodings[v[0]]), None)
+    if chosen:
+        encoding, suffix = chosen
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        response = send_from_directory(folder, filename + suffix, mimetype=mimetype, max_age=max_age)
+        response.headers['Content-Encoding'] = encoding
+    else:
+        response = send_from_directory(folder, filename, max_age=max_age)
+
+    if variants:
+        response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    if versioned:
+        response.cache_control.immutable = True
+    return response
+
+
+def init_app(app):
+    if app.has_static_folder:
+        app.view_functions['static'] = send_static_file
@@ -0,0 +1,313 @@
+"""
+Легка персистентна черга фонових задач поверх основної БД.
+
+Повільна робота (обробка платежу, каскадне видалення користувача тощо)
+виноситься з обробника запиту: хендлер викликає enqueue() і одразу
+повертає 202 з посиланням на статус, а воркер (scripts/run_worker.py)
+забирає задачі з таблиці background_tasks.
+
+Протокол захоплення задачі:
+- PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED у межах транзакції
+- SQLite: умовний UPDATE (compare-and-set) по id + статусу; SQLite має
+  одного writer-а, тому UPDATE з rowcount == 1 гарантує ексклюзивність
+
+Задачі реєструються декоратором @task('name') (див. tasks.py) і
+викликаються як handler(**payload). Результат має бути JSON-серіалізованим.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import traceback
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_, and_
+from sqlalchemy.exc import IntegrityError
+
+from models import db, BackgroundTask
+
+# Зареєстровані обробники: name -> (callable, max_attempts)
+_REGISTRY = {}
+
+DEFAULT_MAX_ATTEMPTS = 3
+# Базова затримка між повторами (секунди), подвоюється з кожною спробою
+RETRY_BASE_DELAY = 5
+RETRY_MAX_DELAY = 600
+# Якщо воркер помер посеред задачі, через LEASE_TIMEOUT задачу може забрати інший
+LEASE_TIMEOUT = 300
+
+
+def task(name, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """Декоратор для реєстрації обробника фонової задачі."""
+    def decorator(fn):
+        _REGISTRY[name] = (fn, max_attempts)
+        return fn
+    return decorator
+
+
+def retry_delay(attempts):
+    """Експоненційний backoff: 5s, 10s, 20s ... але не більше RETRY_MAX_DELAY."""
+    return min(RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0)), RETRY_MAX_DELAY)
+
+
+def enqueue(name, payload=None, key=None, user_id=None, delay=0, max_attempts=None):
+    """Ставить задачу в чергу і повертає BackgroundTask.
+
+    Якщо передано key і задача з таким ключем вже в черзі, виконується або
+    виконана, повертається вона — повторний виклик не створює дублікат.
+    Остаточно впала (failed) задача з тим самим ключем повертається в чергу
+    з новими спробами: інакше ключ був би зайнятий назавжди, і повтор
+    (платежу, видалення користувача) не робив би нічого. У режимі
+    TASK_QUEUE_EAGER задача виконується одразу (зручно для тестів і
+    локальної розробки).
+    """
+    if name not in _REGISTRY:
+        raise KeyError(f'Невідома задача: {name}')
+
+    _, default_attempts = _REGISTRY[name]
+    if key:
+        existing = BackgroundTask.query.filter_by(key=key).first()
+        if existing and existing.status == 'failed':
+            return _requeue(existing, name, payload, delay, max_attempts or default_attempts)
+        if existing:
+            return existing
+
+    job = BackgroundTask(
+        name=name,
+        key=key,
+        payload=json.dumps(payload or {}),
+        status='queued',
+        max_attempts=max_attempts or default_attempts,
+        run_at=datetime.utcnow() + timedelta(seconds=delay),
+        user_id=user_id
+    )
+    db.session.add(job)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Конкурентний enqueue з тим самим ключем — повертаємо переможця
+        db.session.rollback()
+        return BackgroundTask.query.filter_by(key=key).first()
+
+    return _run_if_eager(job)
+
+
+def _run_if_eager(job):
+    from flask import current_app
+    if current_app.config.get('TASK_QUEUE_EAGER'):
+        return run_task(job, worker_id='eager')
+    return job
+
+
+def _requeue(job, name, payload, delay, max_attempts):
+    """Повертає failed-задачу в чергу під тим самим ключем, зі скинутими спробами."""
+    # Умовний UPDATE: з двох конкурентних повторів задачу перезапускає лише один
+    updated = (BackgroundTask.query
+               .filter(BackgroundTask.id == job.id, BackgroundTask.status == 'failed')
+               .update({
+                   'name': name,
+                   'payload': json.dumps(payload or {}),
+                   'status': 'queued',
+                   'attempts': 0,
+                   'max_attempts': max_attempts,
+                   'run_at': datetime.utcnow() + timedelta(seconds=delay),
+                   'locked_by': None,
+                   'locked_at': None,
+                   'result': None,
+                   'finished_at': None,
+               }, synchronize_session=False))
+    db.session.commit()
+    db.session.refresh(job)
+    if updated == 1:
+        logging.info("Задача #%s (%s) знову в черзі після failed", job.id, name)
+        return _run_if_eager(job)
+    return job
+
+
+def _claimable(now):
+    """Умова для задач, які можна забрати: готові в черзі або з простроченою орендою."""
+    return or_(
+        and_(BackgroundTask.status == 'queued', BackgroundTask.run_at <= now),
+        and_(BackgroundTask.status == 'running',
+             BackgroundTask.locked_at < now - timedelta(seconds=LEASE_TIMEOUT))
+    )
+
+
+def _claim_for_update(worker_id, now):
+    """PostgreSQL: блокуємо рядок, пропускаючи вже заблоковані іншими воркерами."""
+    job = (BackgroundTask.query
+           .filter(_claimable(now))
+           .order_by(BackgroundTask.run_at, BackgroundTask.id)
+           .with_for_update(skip_locked=True)
+           .first())
+    if job is None:
+        db.session.rollback()
+        return None
+    job.status = 'running'
+    job.locked_by = worker_id
+    job.locked_at = now
+    job.attempts = (job.attempts or 0) + 1
+    db.session.commit()
+    return job
+
+
+def _claim_compare_and_set(worker_id, now, retries=5):
+    """SQLite: обираємо кандидата і атомарно перемикаємо його статус умовним UPDATE."""
+    for _ in range(retries):
+        candidate = (db.session.query(BackgroundTask.id)
+                     .filter(_claimable(now))
+                     .order_by(BackgroundTask.run_at, BackgroundTask.id)
+                     .first())
+        if candidate is None:
+            db.session.rollback()
+            return None
+        updated = (BackgroundTask.query
+                   .filter(BackgroundTask.id == candidate.id, _claimable(now))
+                   .update({
+                       'status': 'running',
+                       'locked_by': worker_id,
+                       'locked_at': now,
+                       'attempts': BackgroundTask.attempts + 1
+                   }, synchronize_session=False))
+        db.session.commit()
+        if updated == 1:
+            return db.session.get(BackgroundTask, candidate.id)
+        # Інший воркер встиг першим — пробуємо наступного кандидата
+    return None
+
+
+def claim_next(worker_id):
+    """Забирає наступну готову задачу для воркера або повертає None."""
+    now = datetime.utcnow()
+    if db.engine.dialect.name == 'postgresql':
+        return _claim_for_update(worker_id, now)
+    return _claim_compare_and_set(worker_id, now)
+
+
+def run_task(job, worker_id=None):
+    """Виконує вже захоплену (або eager) задачу та фіксує результат."""
+    handler, _ = _REGISTRY.get(job.name, (None, None))
+    if job.status != 'running':
+        job.status = 'running'
+        job.locked_by = worker_id
+        job.locked_at = datetime.utcnow()
+        job.attempts = (job.attempts or 0) + 1
+        db.session.commit()
+
+    task_id = job.id
+    try:
+        if handler is None:
+            raise KeyError(f'Невідома задача: {job.name}')
+        result = handler(**json.loads(job.payload or '{}'))
+        job = db.session.get(BackgroundTask, task_id)
+        job.status = 'succeeded'
+        job.result = json.dumps(result) if result is not None else None
+        job.last_error = None
+        job.finished_at = datetime.utcnow()
+        job.locked_by = None
+        db.session.commit()
+        logging.info("Задача #%s (%s) виконана", task_id, job.name)
+    except Exception as exc:
+        db.session.rollback()
+        job = db.session.get(BackgroundTask, task_id)
+        job.last_error = f"{exc}\n{traceback.format_exc()}"[-4000:]
+        job.locked_by = None
+        if job.attempts < job.max_attempts:
+            job.status = 'queued'
+            job.run_at = datetime.utcnow() + timedelta(seconds=retry_delay(job.attempts))
+            logging.warning("Задача #%s (%s) впала, повтор %s/%s: %s",
+                            task_id, job.name, job.attempts, job.max_attempts, exc)
+        else:
+            job.status = 'failed'
+            job.finished_at = datetime.utcnow()
+            logging.error("Задача #%s (%s) остаточно впала: %s", task_id, job.name, exc)
+        db.session.commit()
+    return job
+
+
+def process_one(worker_id):
+    """Забирає і виконує одну задачу. Повертає True, якщо задача була."""
+    job = claim_next(worker_id)
+    if job is None:
+        return False
+    run_task(job, worker_id)
+    return True
+
+
+def default_worker_id(suffix=None):
+    base = f"{socket.gethostname()}:{os.getpid()}"
+    return f"{base}:{suffix}" if suffix is not None else base
+
+
+def worker_loop(app, worker_id, poll_interval=1.0, stop_event=None, burst=False):
+    """Цикл воркера: обробляє задачі, поки є, інакше спить poll_interval.
+
+    burst=True — завершитись, коли черга порожня (для cron/тестів).
+    """
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        try:
+            with app.app_context():
+                had_work = process_one(worker_id)
+                db.session.remove()
+        except Exception:
+            logging.exception("Помилка у воркері %s", worker_id)
+            had_work = False
+        if not had_work:
+            if burst:
+                return
+            stop_event.wait(poll_interval)
+
+
+def _process_worker_main(worker_id, poll_interval, burst):
+    """Точка входу дочірнього процесу: імпортує додаток заново (spawn)."""
+    from app import create_app
+    app = create_app()
+    worker_loop(app, worker_id, poll_interval=poll_interval, burst=burst)
+
+
+def run_worker(app, concurrency=1, mode='thread', poll_interval=1.0, burst=False):
+    """Запускає пул воркерів (потоки або процеси) і блокується до завершення."""
+    if mode == 'process':
+        import multiprocessing
+        ctx = multiprocessing.get_context('spawn')
+        procs = [ctx.Process(target=_process_worker_main,
+                             args=(default_worker_id(i), poll_interval, burst),
+                             daemon=False)
+                 for i in range(concurrency)]
+        for p in procs:
+            p.start()
+        try:
+            for p in procs:
+                p.join()
+        except KeyboardInterrupt:
+            for p in procs:
+                p.terminate()
+        return
+
+    stop_event = threading.Event()
+    threads = [threading.Thread(target=worker_loop,
+                                args=(app, default_worker_id(i), poll_interval, stop_event, burst),
+                                name=f'task-worker-{i}', daemon=True)
+               for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    try:
+        while any(t.is_alive() for t in threads):
+            for t in threads:
+                t.join(timeout=0.5)
+    except KeyboardInterrupt:
+        stop_event.set()
+        for t in threads:
+            t.join(timeout=5)
+
+
+def start_embedded_worker(app, poll_interval=1.0):
+    """Фоновий потік-воркер усередині dev-сервера (щоб не запускати окремий процес)."""
+    t = threading.Thread(target=worker_loop,
+                         args=(app, default_worker_id('embedded'), poll_interval),
+                         name='task-worker-embedded', daemon=True)
+    t.start()
+    return t
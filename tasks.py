@@ -0,0 +1,78 @@
+"""
+Обробники фонових задач DailyMood.
+
+Кожна функція реєструється в task_queue через @task і виконується воркером
+у контексті додатку. Обробники мають бути ідемпотентними: при збої задача
+повторюється з backoff, тож повторний запуск не повинен дублювати ефект.
+"""
+
+import logging
+import time
+
+from flask import current_app
+
+from models import db, User, Payment
+from task_queue import task, enqueue
+import entitlements
+import idempotency
+import payment_gateway
+
+
+@task('payments.process')
+def process_payment(payment_id):
+    """Авторизує платіж у шлюзі; фінальний статус застосовується одразу або через вебхук."""
+    payment = db.session.get(Payment, payment_id)
+    if payment is None:
+        return {'payment_id': payment_id, 'status': 'missing'}
+    if payment.status != 'pending':
+        # Вже оброблений (повторний запуск задачі) — нічого не робимо
+        return {'payment_id': payment.id, 'status': payment.status}
+
+    gateway = payment_gateway.get_gateway(current_app)
+    result = gateway.authorize(payment)
+
+    if result.status == 'pending':
+        # Шлюз повідомить результат через POST /api/payments/webhook
+        if result.transaction_id:
+            payment.transaction_id = result.transaction_id
+            db.session.commit()
+        return {'payment_id': payment.id, 'status': 'pending', 'gateway': gateway.name}
+
+    payment_gateway.apply_gateway_result(payment, result)
+    db.session.commit()
+    return {'payment_id': payment.id, 'status': payment.status, 'order_status': payment.order.status}
+
+
+@task('users.delete')
+def delete_user(user_id):
+    """Видаляє користувача разом з усіма дочірніми записами (каскад ORM)."""
+    user = db.session.get(User, user_id)
+    if user is None:
+        return {'user_id': user_id, 'deleted': False}
+    db.session.delete(user)
+    db.session.commit()
+    logging.info("Користувача #%s видалено фоновою задачею", user_id)
+    return {'user_id': user_id, 'deleted': True}
+
+
+@task('idempotency.purge')
+def purge_idempotency_keys(batch_size=1000):
+    """Прибирає прострочені Idempotency-Key записи."""
+    return {'deleted': idempotency.purge_expired(batch_size=batch_size)}
+
+
+SWEEP_INTERVAL = 3600
+
+
+def schedule_entitlement_sweep(delay=0):
+    """Ставить чистку прострочених прав; ключ за годинним слотом не дає дублікатів."""
+    slot = int((time.time() + delay) // SWEEP_INTERVAL)
+    return enqueue('entitlements.sweep', key=f'entitlements.sweep:{slot}', delay=delay)
+
+
+@task('entitlements.sweep')
+def sweep_entitlements(batch_size=500):
+    """Знімає прострочений преміум пачками та планує наступний запуск."""
+    result = entitlements.sweep_expired(batch_size=batch_size)
+    schedule_entitlement_sweep(delay=SWEEP_INTERVAL)
+    return result
@@ -0,0 +1,75 @@
+"""
+Кеш байткоду Jinja та прогрів шаблонів.
+
+Без кешу кожен воркер gunicorn компілює base.html (~1600 рядків),
+statistics.html, store.html тощо з вихідного коду при першому зверненні —
+холодний старт лягає на запити користувачів після кожного деплою чи
+перезапуску воркера за max_requests.
+
+- FileSystemBytecodeCache у TEMPLATE_CACHE_DIR: скомпільований шаблон
+  зберігається на диску і перевикористовується всіма воркерами/рестартами
+  (ключ містить контрольну суму вихідного коду, тож змінений шаблон
+  перекомпілюється автоматично)
+- precompile(): заповнює кеш під час збірки образу
+  (python scripts/precompile_templates.py)
+- warmup(): завантажує всі шаблони в пам'ять процесу до прийому трафіку
+  (TEMPLATE_WARMUP; з gunicorn --preload — один раз у master до fork)
+"""
+
+import logging
+import os
+import time
+
+from jinja2 import FileSystemBytecodeCache
+
+DEFAULT_CACHE_DIR = os.path.join('.cache', 'jinja')
+TEMPLATE_EXTENSIONS = ('.html',)
+
+
+def cache_dir(app):
+    path = app.config.get('TEMPLATE_CACHE_DIR') or DEFAULT_CACHE_DIR
+    return path if os.path.isabs(path) else os.path.join(app.root_path, path)
+
+
+def init_app(app):
+    """Підключає файловий кеш байткоду до Jinja-середовища додатку."""
+    if not app.config.get('TEMPLATE_BYTECODE_CACHE', True):
+        return None
+    directory = cache_dir(app)
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as exc:
+        logging.warning("Кеш байткоду Jinja вимкнено: %s недоступна (%s)", directory, exc)
+        return None
+    cache = FileSystemBytecodeCache(directory)
+    app.jinja_env.bytecode_cache = cache
+    return cache
+
+
+def template_names(app):
+    return sorted(name for name in app.jinja_env.list_templates()
+                  if name.endswith(TEMPLATE_EXTENSIONS))
+
+
+def warmup(app):
+    """Завантажує (і за потреби компілює) всі шаблони. Повертає (кількість, секунди)."""
+    started = time.perf_counter()
+    loaded = 0
+    for name in template_names(app):
+        try:
+            app.jinja_env.get_template(name)
+            loaded += 1
+        except Exception:
+            logging.exception("Не вдалося завантажити шаблон %s", name)
+    elapsed = time.perf_counter() - started
+    logging.info("Прогріто %s шаблонів за %.1f ms", loaded, elapsed * 1000)
+    return loaded, elapsed
+
+
+def precompile(app):
+    """Компілює всі шаблони в кеш байткоду (для кроку збірки образу)."""
+    if app.jinja_env.bytecode_cache is None:
+        init_app(app)
+    # Кеш у пам'яті середовища обійшов би запис на диск
+    app.jinja_env.cache.clear()
+    return warmup(app)
@@ -7,6 +7,7 @@ import tempfile
 import os
 from app import app, db
 from models import User, Feedback
+import entitlements
 
 
 @pytest.fixture(scope='function')
@@ -19,6 +20,13 @@ def app_with_db():
     app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
     app.config['TESTING'] = True
     app.config['SECRET_KEY'] = 'test-secret-key'
+    app.config['TASK_QUEUE_EAGER'] = True
+    app.config['PAYMENT_GATEWAY_LATENCY'] = 0.0
+    app.config['PAYMENT_GATEWAY_FAILURE_RATE'] = 0.0
+    app.config['PAYMENT_WEBHOOK_SECRET'] = 'test-webhook-secret'
+    app.extensions.pop('payment_gateway', None)
+    entitlements.invalidate()
+    app.extensions['page_cache'].clear()
     
     # Створюємо контекст
     with app.app_context():
@@ -148,3 +156,29 @@ def logged_in_admin_client_db(client, real_admin):
     with client.session_transaction() as sess:
         sess['user_id'] = real_admin
     return client
+
+
+@pytest.fixture
+def health_monitor(app_with_db):
+    """Кеш перевірок готовності з чистого стану; воркер «прогрітий», потік зупиняється після тесту."""
+    import health
+    import schema_bootstrap
+    # Як scripts/init_db.py: create_all не додає колонок до вже наявних таблиць
+    for migration in schema_bootstrap.SQLITE_MIGRATIONS:
+        migration()
+    monitor = health.get_monitor(app_with_db)
+    interval = monitor.interval
+    monitor.reset()
+    monitor.warm = True
+    yield monitor
+    monitor.reset()
+    monitor.warm = False
+    monitor.interval = interval
+
+
+@pytest.fixture
+def metrics_auth(app_with_db):
+    """Заголовки скрейпера /metrics: без METRICS_TOKEN ендпоінт відповідає 401."""
+    app_with_db.config['METRICS_TOKEN'] = 'test-metrics-token'
+    yield {'Authorization': 'Bearer test-metrics-token'}
+    app_with_db.config['METRICS_TOKEN'] = None
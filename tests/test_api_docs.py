@@ -0,0 +1,69 @@
+"""
+Тести готової Swagger-специфікації та Swagger UI (api_docs.py).
+"""
+
+import gzip
+import json
+import sys
+
+import api_docs
+
+
+class TestApiSpec:
+    """Integration тести для /apispec.json."""
+
+    def setup_method(self):
+        api_docs.reset()
+
+    def teardown_method(self):
+        api_docs.reset()
+
+    def test_spec_has_etag_and_supports_304(self, client):
+        response = client.get('/apispec.json')
+        assert response.status_code == 200
+        assert '/api/products' in response.get_json()['paths']
+        etag = response.headers['ETag']
+
+        again = client.get('/apispec.json', headers={'If-None-Match': etag})
+        assert again.status_code == 304
+
+        zipped = client.get('/apispec.json', headers={'Accept-Encoding': 'gzip'})
+        assert zipped.headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(zipped.data)) == response.get_json()
+
+    def test_prebuilt_spec_is_served_without_flasgger(self, client, app_with_db, tmp_path, monkeypatch):
+        app_with_db.config['API_SPEC_DIR'] = str(tmp_path)
+        try:
+            path = api_docs.write_spec(app_with_db)
+            api_docs.reset()
+            monkeypatch.setitem(sys.modules, 'flasgger', None)
+            response = client.get('/apispec.json')
+        finally:
+            app_with_db.config['API_SPEC_DIR'] = None
+        assert response.status_code == 200
+        with open(path, 'rb') as fh:
+            assert response.data == fh.read()
+
+    def test_missing_flasgger_without_prebuilt_spec(self, client, app_with_db, tmp_path, monkeypatch):
+        app_with_db.config['API_SPEC_DIR'] = str(tmp_path)
+        monkeypatch.setitem(sys.modules, 'flasgger', None)
+        try:
+            response = client.get('/apispec.json')
+        finally:
+            app_with_db.config['API_SPEC_DIR'] = None
+        assert response.status_code == 503
+
+
+class TestSwaggerUI:
+    """Статика Swagger UI з відбитком версії."""
+
+    def test_versioned_ui_assets_are_immutable(self, client):
+        html = client.get('/api/docs').get_data(as_text=True)
+        version = api_docs.ui_version()
+        assert f'/flasgger_static/swagger-ui-bundle.js?v={version}' in html
+
+        response = client.get(f'/flasgger_static/swagger-ui.css?v={version}')
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+        assert response.cache_control.max_age == api_docs.IMMUTABLE_MAX_AGE
+        response.close()
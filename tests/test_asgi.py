@@ -0,0 +1,224 @@
+"""
+Тести ASGI-режиму (asgi.py) та потокового експорту щоденника (journal_export.py).
+"""
+
+import asyncio
+import csv
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytest
+
+from models import db, MoodEntry, Order, Payment
+import asgi
+
+
+def call(application, path, query='', method='GET', headers=(), body=b'', disconnect_after=None, messages=None):
+    """Виконує один HTTP-запит до ASGI-додатку; повертає (статус, заголовки, тіло).
+
+    messages — список, куди складаються ASGI-повідомлення (видно і після винятку).
+    """
+    messages = [] if messages is None else messages
+
+    async def run():
+        sent_request = asyncio.Event()
+
+        async def receive():
+            if not sent_request.is_set():
+                sent_request.set()
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            if disconnect_after is not None:
+                await asyncio.sleep(disconnect_after)
+            else:
+                await asyncio.Event().wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            'type': 'http', 'http_version': '1.1', 'method': method, 'scheme': 'http',
+            'path': path, 'raw_path': path.encode(), 'query_string': query.encode(), 'root_path': '',
+            'headers': [(k.lower().encode(), v.encode()) for k, v in headers],
+            'client': ('127.0.0.1', 5000), 'server': ('localhost', 80),
+        }
+        await application(scope, receive, send)
+
+    asyncio.run(run())
+    start = messages[0]
+    response_headers = {k.decode(): v.decode() for k, v in start['headers']}
+    data = b''.join(m.get('body', b'') for m in messages[1:])
+    return start['status'], response_headers, data
+
+
+@pytest.fixture
+def asgi_app(app_with_db):
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield asgi.DailyMoodASGI(app_with_db, executor)
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def cookie(logged_in_client_db):
+    return f"session={logged_in_client_db.get_cookie('session').value}"
+
+
+@pytest.fixture
+def entries(app_with_db, real_user):
+    """Записи з однаковими датами — перевірка keyset-курсора по (date, id)."""
+    start = date(2024, 1, 1)
+    for i in range(7):
+        db.session.add(MoodEntry(user_id=real_user, mood='calm', date=start + timedelta(days=i % 3),
+                                 title=f'Запис {i}', content='рядок 1\nрядок 2'))
+    db.session.commit()
+    return 7
+
+
+class TestJournalExport:
+    """Unit тести для сторінкового експорту."""
+
+    def test_wsgi_csv_streamed_in_pages(self, app_with_db, logged_in_client_db, entries):
+        app_with_db.config['JOURNAL_EXPORT_PAGE_SIZE'] = 2
+        response = logged_in_client_db.get('/api/journal/export')
+        assert response.status_code == 200
+        assert response.is_streamed
+        rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+        assert rows[0] == ['id', 'date', 'mood', 'title', 'activities', 'content']
+        assert len(rows) == entries + 1
+        assert rows[1][5] == 'рядок 1 рядок 2'
+        assert [r[1] for r in rows[1:]] == sorted(r[1] for r in rows[1:])
+        assert len({r[0] for r in rows[1:]}) == entries
+
+    def test_wsgi_json(self, app_with_db, logged_in_client_db, entries):
+        app_with_db.config['JOURNAL_EXPORT_PAGE_SIZE'] = 3
+        data = logged_in_client_db.get('/api/journal/export?format=json').get_json()
+        assert data['status'] == 'success'
+        assert data['count'] == entries
+        assert len({e['id'] for e in data['data']}) == entries
+
+
+class TestAsgiBridge:
+    """Інтеграційні тести WSGI-мосту та нативних обробників."""
+
+    def test_sync_views_through_bridge(self, asgi_app):
+        status, headers, body = call(asgi_app, '/health')
+        assert status == 200
+        status, _, body = call(asgi_app, '/auth/login', method='POST',
+                               headers=[('Content-Type', 'application/json')],
+                               body=json.dumps({'email': 'nobody@test.com', 'password': 'x'}).encode())
+        assert status == 401
+        assert json.loads(body)['status'] == 'error'
+
+    def test_native_export_requires_session(self, asgi_app):
+        status, _, body = call(asgi_app, '/api/journal/export')
+        assert status == 401
+        assert json.loads(body)['message'] == 'Потрібна авторизація'
+
+    def test_native_export_matches_wsgi(self, app_with_db, asgi_app, logged_in_client_db, cookie, entries):
+        app_with_db.config['JOURNAL_EXPORT_PAGE_SIZE'] = 2
+        expected = logged_in_client_db.get('/api/journal/export?format=json').get_json()
+        status, headers, body = call(asgi_app, '/api/journal/export', 'format=json', headers=[('Cookie', cookie)])
+        assert status == 200
+        assert headers['content-type'] == 'application/json'
+        assert json.loads(body) == expected
+
+        status, headers, body = call(asgi_app, '/api/journal/export', headers=[('Cookie', cookie)])
+        assert 'attachment' in headers['content-disposition']
+        assert body.decode('utf-8') == logged_in_client_db.get('/api/journal/export').get_data(as_text=True)
+
+    def test_native_export_failure_is_not_a_complete_document(self, app_with_db, asgi_app, cookie, entries,
+                                                             monkeypatch):
+        monkeypatch.setitem(app_with_db.config, 'JOURNAL_EXPORT_PAGE_SIZE', 2)
+        export_page = asgi_app._export_page
+        pages = []
+
+        def failing_page(*args):
+            if pages:
+                raise RuntimeError('БД недоступна')
+            pages.append(args)
+            return export_page(*args)
+        monkeypatch.setattr(asgi_app, '_export_page', failing_page)
+
+        messages = []
+        with pytest.raises(RuntimeError):
+            call(asgi_app, '/api/journal/export', 'format=json', headers=[('Cookie', cookie)], messages=messages)
+        body = b''.join(m.get('body', b'') for m in messages[1:])
+        assert body.startswith(b'{"status":"success"') and b'"title"' in body
+        # Відповідь не завершена і не є валідним JSON
+        assert messages[-1]['more_body'] is True
+        with pytest.raises(ValueError):
+            json.loads(body)
+
+    def test_payment_long_poll_returns_on_change(self, app_with_db, asgi_app, cookie, real_user):
+        app_with_db.config['ASGI_POLL_INTERVAL'] = 0.05
+        order = Order(user_id=real_user, status='new', total_amount=19.0)
+        db.session.add(order)
+        db.session.flush()
+        payment = Payment(order_id=order.id, payment_method='card', amount=19.0, status='pending')
+        db.session.add(payment)
+        db.session.commit()
+        payment_id = payment.id
+
+        def complete():
+            with app_with_db.app_context():
+                db.session.get(Payment, payment_id).status = 'completed'
+                db.session.commit()
+
+        timer = threading.Timer(0.2, complete)
+        timer.start()
+        status, headers, body = call(asgi_app, f'/api/payments/{payment_id}', 'wait=5', headers=[('Cookie', cookie)])
+        timer.join()
+        assert status == 200
+        assert json.loads(body)['payment']['status'] == 'completed'
+        assert 'retry-after' not in headers
+
+    def test_payment_long_poll_times_out_pending(self, app_with_db, asgi_app, cookie, real_user):
+        app_with_db.config['ASGI_POLL_INTERVAL'] = 0.05
+        app_with_db.config['ASGI_LONGPOLL_MAX'] = 0.2
+        order = Order(user_id=real_user, status='new', total_amount=19.0)
+        db.session.add(order)
+        db.session.flush()
+        payment = Payment(order_id=order.id, payment_method='card', amount=19.0, status='pending')
+        db.session.add(payment)
+        db.session.commit()
+
+        status, headers, body = call(asgi_app, f'/api/payments/{payment.id}', 'wait=30', headers=[('Cookie', cookie)])
+        assert status == 200
+        assert json.loads(body)['payment']['status'] == 'pending'
+        assert headers['retry-after'] == '1'
+
+    def test_payment_long_poll_rejects_non_finite_wait(self, app_with_db, asgi_app, cookie, real_user):
+        """wait=nan / inf не тримає з'єднання: як некоректне значення — відповідь одразу."""
+        app_with_db.config['ASGI_POLL_INTERVAL'] = 0.05
+        order = Order(user_id=real_user, status='new', total_amount=19.0)
+        db.session.add(order)
+        db.session.flush()
+        payment = Payment(order_id=order.id, payment_method='card', amount=19.0, status='pending')
+        db.session.add(payment)
+        db.session.commit()
+
+        for value in ('nan', 'inf', '-inf'):
+            started = time.monotonic()
+            status, headers, body = call(asgi_app, f'/api/payments/{payment.id}', f'wait={value}',
+                                         headers=[('Cookie', cookie)])
+            assert status == 200
+            assert json.loads(body)['payment']['status'] == 'pending'
+            assert time.monotonic() - started < 2
+
+    def test_live_stream_delivers_published_events(self, app_with_db, asgi_app, cookie, real_user):
+        app_with_db.config['ASGI_LIVE_HEARTBEAT'] = 0.05
+        publisher = threading.Timer(0.1, asgi_app.hub.publish, args=(real_user, 'payment', {'status': 'completed'}))
+        publisher.start()
+        status, headers, body = call(asgi_app, '/api/live', headers=[('Cookie', cookie)], disconnect_after=0.3)
+        publisher.join()
+        text = body.decode('utf-8')
+        assert status == 200
+        assert headers['content-type'].startswith('text/event-stream')
+        assert text.startswith('event: ready\n')
+        assert 'event: payment\ndata: {"status": "completed"}' in text
+        assert ': ping' in text
+        assert asgi_app.hub.connections == 0
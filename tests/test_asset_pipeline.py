@@ -0,0 +1,69 @@
+"""
+Тести збірки статики (asset_pipeline.py): мініфікація, бандли,
+попереднє стиснення та бюджет розміру.
+"""
+
+import gzip
+
+from app import app
+import asset_pipeline
+import assets
+
+
+class TestMinify:
+    """Unit тести для мініфікаторів CSS/JS."""
+
+    def test_css_keeps_strings_and_selector_spaces(self):
+        source = '''
+        /* коментар */
+        .a :hover , .b > .c {
+            content: "a , b" ;
+            width: calc(100% - 10px);
+        }
+        '''
+        assert asset_pipeline.minify_css(source) == \
+            '.a :hover,.b>.c{content:"a , b";width:calc(100% - 10px)}'
+
+    def test_js_keeps_strings_regex_and_templates(self):
+        source = (
+            "// коментар\n"
+            "function f(a) {\n"
+            "    const s = 'a // not comment';\n"
+            "    return /a\\/b/.test(a) ? `x ${a + 1} /* y */` : a / 2;\n"
+            "}\n"
+        )
+        assert asset_pipeline.minify_js(source) == (
+            "function f(a){\n"
+            "const s='a // not comment';\n"
+            "return /a\\/b/.test(a)?`x ${a + 1} /* y */`:a / 2;\n"
+            "}\n"
+        )
+
+
+class TestBuild:
+    """Integration тести для build() та bundle_urls()."""
+
+    def test_build_writes_bundle_and_gzip(self, tmp_path):
+        (tmp_path / 'a.js').write_text('var a = 1;  // a\n')
+        (tmp_path / 'b.js').write_text('var b = 2\n')
+        stats = asset_pipeline.build(str(tmp_path), {'x.js': ['a.js', 'b.js']})
+
+        bundle = (tmp_path / 'dist' / 'x.js').read_bytes()
+        assert bundle == b'var a=1;\n\n;\nvar b=2\n'
+        assert gzip.decompress((tmp_path / 'dist' / 'x.js.gz').read_bytes()) == bundle
+        assert stats[0]['min'] == len(bundle)
+
+    def test_budget_violation_is_reported(self):
+        stats = [{'name': 'x.js', 'raw': 10, 'min': 10, 'gzip': 5000, 'brotli': None}]
+        violations = asset_pipeline.check_budgets(stats, budgets={'x.js': 1000},
+                                                  first_load=('x.js',), first_load_budget=2000)
+        assert len(violations) == 2
+
+    def test_bundle_urls_fall_back_to_sources(self, app_with_db):
+        """Якщо бандл не зібраний, сторінка отримує вихідні файли."""
+        manifest = app.extensions['assets']
+        with app.test_request_context():
+            if 'dist/app.js' in manifest.hashes:
+                assert assets.bundle_urls('app.js') == [manifest.url('dist/app.js')]
+            else:
+                assert assets.bundle_urls('app.js') == [manifest.url('script.js')]
@@ -0,0 +1,63 @@
+"""
+Тести маніфесту статики (assets.py): відбитки вмісту та хелпер asset().
+"""
+
+from app import app
+import assets
+
+
+class TestAssetManifest:
+    """Unit тести для build_manifest / write_manifest."""
+
+    def test_only_changed_file_gets_new_hash(self, tmp_path):
+        """Зміна одного файлу не змінює відбитки інших."""
+        (tmp_path / 'css').mkdir()
+        (tmp_path / 'css' / 'a.css').write_text('a {}')
+        (tmp_path / 'b.js').write_text('var b;')
+        (tmp_path / 'b.js.gz').write_bytes(b'gz')
+        before = assets.build_manifest(str(tmp_path))
+        assert set(before) == {'css/a.css', 'b.js'}
+
+        (tmp_path / 'b.js').write_text('var b = 1;')
+        after = assets.build_manifest(str(tmp_path))
+        assert after['css/a.css'] == before['css/a.css']
+        assert after['b.js'] != before['b.js']
+
+    def test_written_manifest_is_loaded(self, tmp_path):
+        (tmp_path / 'x.css').write_text('x {}')
+        assets.write_manifest(str(tmp_path), {'x.css': 'deadbeef'})
+        assert assets.load_manifest(str(tmp_path)) == {'x.css': 'deadbeef'}
+
+    def test_unset_flags_follow_debug_at_configure(self, monkeypatch):
+        """Не задані ASSETS_* визначаються за app.debug у момент configure(), а не імпорту."""
+        manifest = app.extensions['assets']
+        monkeypatch.setitem(app.config, 'ASSETS_AUTO_RELOAD', None)
+        monkeypatch.setitem(app.config, 'ASSETS_USE_BUNDLES', None)
+        monkeypatch.setattr(app, 'debug', True)
+        try:
+            assets.configure(app)
+            assert manifest.auto_reload is True and manifest.use_bundles is False
+            # Явне значення має пріоритет над debug
+            app.config['ASSETS_USE_BUNDLES'] = True
+            assets.configure(app)
+            assert manifest.use_bundles is True
+        finally:
+            monkeypatch.undo()
+            assets.configure(app)
+
+
+class TestAssetHelper:
+    """Integration тести для asset() у шаблонах."""
+
+    def test_page_uses_fingerprinted_urls(self, client, app_with_db):
+        digest = app.extensions['assets'].hashes['style.css']
+        html = client.get('/about').get_data(as_text=True)
+        assert f'/static/style.css?v={digest}' in html
+
+    def test_fingerprinted_url_is_served_immutable(self, client, app_with_db):
+        with app.test_request_context():
+            url = assets.asset('style.css')
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+        response.close()
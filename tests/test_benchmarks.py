@@ -0,0 +1,397 @@
+"""
+Тести набору бенчмарків (benchmarks/): перцентилі, вибір сценаріїв,
+порівняння з еталоном, генератор синтетичних даних і навантажувальний тест.
+"""
+
+import json
+import threading
+import time
+from datetime import date
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from benchmarks import compare, dataset, generate, load, report, runner, scenarios, workload
+from models import db, MoodEntry
+
+
+def bench_report(target='client', size='small', seed=42, cpus=1, **metrics):
+    base = {'p50_ms': 10.0, 'p95_ms': 20.0, 'p99_ms': 30.0, 'throughput_rps': 100.0,
+            'peak_memory_kb': 1000.0, 'sql_per_request': 2.0, 'errors': 0}
+    base.update(metrics)
+    return {'meta': {'target': target, 'size': size, 'seed': seed, 'cpus': cpus},
+            'scenarios': {'journal_list': base}}
+
+
+class TestBenchmarkRunner:
+    """Unit тести для перцентилів, наборів даних і сценаріїв."""
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert runner.percentile(values, 0.50) == 50
+        assert runner.percentile(values, 0.95) == 95
+        assert runner.percentile(values, 0.99) == 99
+        assert runner.percentile([7], 0.99) == 7
+        assert runner.percentile([], 0.5) is None
+
+    def test_resolve_size(self):
+        assert dataset.resolve_size('tiny')['users'] == 2
+        assert dataset.resolve_size({'users': 3}) == {'users': 3}
+        with pytest.raises(ValueError):
+            dataset.resolve_size('huge')
+
+    def test_select_scenarios(self):
+        assert [s.name for s in scenarios.select(None)] == [s.name for s in scenarios.SCENARIOS]
+        assert [s.name for s in scenarios.select('orders, products')] == ['orders', 'products']
+        with pytest.raises(ValueError):
+            scenarios.select('orders,unknown')
+
+    def test_post_payload_varies(self):
+        create = scenarios.select('journal_create')[0]
+        assert create.payload(0)['mood'] in dataset.MOODS
+        assert create.payload(0) != create.payload(1)
+        assert scenarios.select('orders')[0].payload(0) is None
+
+
+class TestBenchmarkCompare:
+    """Unit тести для контролю регресій."""
+
+    def test_same_result_has_no_regressions(self):
+        rows = compare.compare(bench_report(), bench_report())
+        assert rows and not compare.regressions(rows)
+
+    def test_latency_over_threshold_is_regression(self):
+        failed = compare.regressions(compare.compare(bench_report(p50_ms=15.0), bench_report()))
+        assert [(r['scenario'], r['metric']) for r in failed] == [('journal_list', 'p50_ms')]
+
+    def test_small_absolute_change_is_noise(self):
+        # +40%, але лише на 0.8 ms — нижче порогу шуму
+        assert not compare.is_regression('p95_ms', 2.0, 2.8, 0.25)
+        assert compare.is_regression('p95_ms', 20.0, 26.0, 0.25)
+
+    def test_throughput_drop_is_regression(self):
+        assert compare.is_regression('throughput_rps', 100.0, 70.0, 0.25)
+        assert not compare.is_regression('throughput_rps', 100.0, 150.0, 0.25)
+
+    def test_sql_and_errors_are_exact(self):
+        assert compare.is_regression('sql_per_request', 2.0, 3.0, 0.25)
+        assert compare.is_regression('errors', 0, 1, 0.25)
+        assert not compare.is_regression('sql_per_request', 2.0, 2.0, 0.25)
+
+    def test_ungated_metric_is_reported_only(self):
+        # Хвіст однієї машини між прогонами незмінного коду — шум, тож p95 лише показується
+        rows = compare.compare(bench_report(p95_ms=100.0), bench_report())
+        p95 = next(r for r in rows if r['metric'] == 'p95_ms')
+        assert p95['change'] == pytest.approx(4.0)
+        assert not p95['regression']
+
+    def test_writes_run_after_reads(self):
+        class Target:
+            sql_count = None
+            seen = []
+
+            def request(self, method, path, body=None):
+                self.seen.append(method)
+                return 200
+
+            def peak_memory_kb(self, scenario, start_iteration):
+                return None
+
+        target = Target()
+        results = runner.measure_runs(target, scenarios.select('journal_create,products'), runs=2,
+                                      iterations=3, warmup=0)
+        assert target.seen == ['GET'] * 6 + ['POST'] * 6
+        assert results['products']['runs'] == 2
+
+    def test_aggregate_runs(self):
+        runs = [{'p50_ms': value, 'throughput_rps': 1000 / value, 'peak_memory_kb': None,
+                 'sql_per_request': sql, 'errors': errors}
+                for value, sql, errors in ((10.0, 2.0, 0), (14.0, 2.0, 1), (11.0, 3.0, 0))]
+        result = runner.aggregate(runs)
+        assert result['runs'] == 3
+        # Найкращий прогін: мінімум часу, максимум throughput
+        assert result['p50_ms'] == 10.0
+        assert result['throughput_rps'] == 100.0
+        assert result['spread']['p50_ms'] == 4.0
+        assert result['peak_memory_kb'] is None
+        # SQL — найкращий прогін (разове оновлення кешу не регресія), помилки — найгірший
+        assert result['sql_per_request'] == 2.0 and result['errors'] == 1
+        assert 'sql_per_request' not in result['spread']
+
+    def test_run_spread_widens_noise_floor(self):
+        baseline, current = bench_report(p50_ms=10.0), bench_report(p50_ms=13.0)
+        assert compare.regressions(compare.compare(current, baseline))
+        # +30%, але прогони еталону гуляли на 1.5 ms
+        baseline['scenarios']['journal_list']['spread'] = {'p50_ms': 1.5}
+        row = next(r for r in compare.compare(current, baseline) if r['metric'] == 'p50_ms')
+        assert row['noise'] == 1.5 * compare.SPREAD_FACTOR and not row['regression']
+        assert compare.is_regression('p50_ms', 10.0, 15.0, 0.25, noise=4.5)
+
+    def test_meta_mismatch(self):
+        with pytest.raises(compare.BaselineMismatch):
+            compare.compare(bench_report(size='medium'), bench_report())
+        with pytest.raises(compare.BaselineMismatch):
+            compare.compare(bench_report(target='gunicorn'), bench_report())
+
+
+    def test_other_hardware_gates_only_exact_metrics(self):
+        """Еталон з іншою кількістю CPU: час лише для довідки, SQL-запити — як і раніше."""
+        baseline = bench_report()
+        current = bench_report(cpus=4, p95_ms=40.0, sql_per_request=3.0)
+        assert compare.hardware_mismatch(current, baseline) == ['cpus: еталон 1, поточний 4']
+        failed = compare.regressions(compare.compare(current, baseline))
+        assert [r['metric'] for r in failed] == ['sql_per_request']
+
+
+class TestBenchmarkGate:
+    """Гейт на реальних прогонах: незмінний код не має давати регресій."""
+
+    def bench(self, app, selected):
+        # Свіжий набір даних на кожен запуск, як тимчасова БД у run.py
+        db.drop_all()
+        db.create_all()
+        info = dataset.seed(app, 'tiny')
+        target = runner.ClientTarget(app, info['user_id'])
+        try:
+            results = runner.measure_runs(target, selected, runs=5, iterations=20, warmup=2)
+        finally:
+            target.close()
+        return {'meta': {'target': 'client', 'size': 'tiny', 'seed': dataset.DEFAULT_SEED, 'cpus': 1},
+                'scenarios': results}
+
+    def test_unchanged_code_passes_gate(self, app_with_db):
+        selected = scenarios.select('journal_list,stats_trends,products,journal_create')
+        baseline = self.bench(app_with_db, selected)
+        current = self.bench(app_with_db, selected)
+        rows = compare.compare(current, baseline)
+        assert {r['scenario'] for r in rows} == {s.name for s in selected}
+        assert all(metrics['runs'] == 5 for metrics in current['scenarios'].values())
+        assert not compare.regressions(rows), compare.format_rows(rows)
+
+    def test_slowdown_fails_gate(self, app_with_db, monkeypatch):
+        selected = scenarios.select('journal_list,products')
+        baseline = self.bench(app_with_db, selected)
+        request = runner.ClientTarget.request
+
+        def slow_journal(self, method, path, body=None):
+            if path == '/api/journal':
+                time.sleep(0.015)
+            return request(self, method, path, body)
+
+        monkeypatch.setattr(runner.ClientTarget, 'request', slow_journal)
+        failed = compare.regressions(compare.compare(self.bench(app_with_db, selected), baseline))
+        assert ('journal_list', 'p50_ms') in [(r['scenario'], r['metric']) for r in failed]
+        assert 'products' not in {r['scenario'] for r in failed}
+
+
+class TestSyntheticDataset:
+    """Тести генератора синтетичного набору (benchmarks/generate.py)."""
+
+    END = date(2026, 1, 31)
+
+    def make_db(self, tmp_path, name):
+        url = f"sqlite:///{tmp_path / name}"
+        engine = create_engine(url)
+        db.metadata.create_all(engine)
+        engine.dispose()
+        return url
+
+    def dump(self, url):
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            data = {
+                'users': conn.execute(text('SELECT id, email, is_premium FROM users ORDER BY id')).all(),
+                'mood_entries': conn.execute(text(
+                    'SELECT user_id, date, mood, title, sleep_hours, activities FROM mood_entries '
+                    'ORDER BY user_id, date')).all(),
+                'orders': conn.execute(text('SELECT id, user_id, status, total_amount FROM orders ORDER BY id')).all(),
+                'payments': conn.execute(text('SELECT order_id, status, amount FROM payments ORDER BY order_id')).all(),
+            }
+        engine.dispose()
+        return data
+
+    def test_zipf_counts_are_skewed_and_capped(self):
+        caps = [365] * 200
+        counts = generate.zipf_entry_counts(200, 50, caps, s=1.1, seed=1)
+        assert max(counts) == 365
+        assert min(counts) >= 1
+        assert abs(sum(counts) / len(counts) - 50) < 2
+        # Медіанний користувач пише значно менше за середнє — довгий хвіст
+        assert sorted(counts)[100] < 50
+
+    def canonical(self, url):
+        """Усі таблиці генератора як байти: рядки без автоінкрементних id, відсортовані.
+
+        password_hash пропускається: werkzeug щоразу бере випадкову сіль.
+        """
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            tables = {}
+            for name, table in generate.TABLES.items():
+                columns = [c.name for c in table.columns
+                           if (c.name != 'id' or name in ('users', 'habits', 'orders')) and c.name != 'password_hash']
+                rows = conn.execute(text(f"SELECT {', '.join(columns)} FROM {name}")).all()
+                tables[name] = sorted(json.dumps(list(row), default=str) for row in rows)
+        engine.dispose()
+        return json.dumps(tables, sort_keys=True).encode('utf-8')
+
+    def test_deterministic_regardless_of_jobs(self, tmp_path, monkeypatch):
+        # Менші задачі — щоб jobs=2 справді ділив роботу між процесами
+        monkeypatch.setattr(generate, 'CHUNK_ENTRIES', 200)
+        options = dict(users=40, years=1, entries_per_user=30, products=5, seed=7, end=self.END)
+        offsets = {'users': 0, 'habits': 0, 'orders': 0}
+        chunks = generate.chunk_plan(generate.plan(40, 1, 30, generate.DEFAULT_ZIPF, 7), offsets)
+        assert len(chunks) >= 4
+
+        outputs = []
+        for jobs in (1, 2, 3):
+            url = self.make_db(tmp_path, f'jobs{jobs}.db')
+            totals = generate.generate(url, jobs=jobs, **options)
+            assert totals['users'] == 40
+            assert totals['mood_entries'] == 40 * 30
+            outputs.append(self.canonical(url))
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_rows_are_valid(self, tmp_path):
+        url = self.make_db(tmp_path, 'valid.db')
+        generate.generate(url, users=20, years=2, entries_per_user=40, products=5, seed=3, end=self.END, jobs=1)
+        data = self.dump(url)
+        assert {row.mood for row in data['mood_entries']} == set(MoodEntry.VALID_MOODS)
+        assert all(row.date <= self.END.isoformat() for row in data['mood_entries'])
+        totals = {row.id: row.total_amount for row in data['orders']}
+        assert all(row.amount == totals[row.order_id] for row in data['payments'])
+
+
+COLLECTION = {
+    'info': {'name': 'test'},
+    'variable': [{'key': 'baseUrl', 'value': 'http://localhost:5000'}, {'key': 'itemId', 'value': '1'},
+                 {'key': 'authEmail', 'value': 'a@b.c'}, {'key': 'authPassword', 'value': 'secret'}],
+    'item': [
+        {'name': 'Login', 'request': {'method': 'POST', 'url': '{{baseUrl}}/auth/login', 'body': {
+            'mode': 'raw', 'raw': '{"email": "{{authEmail}}", "password": "{{authPassword}}"}'}}},
+        {'name': 'Folder', 'item': [
+            {'name': 'Create', 'request': {'method': 'POST', 'url': {'raw': '{{baseUrl}}/api/items'},
+                                           'body': {'mode': 'raw', 'raw': '{"name": "x"}'}},
+             'event': [{'listen': 'test', 'script': {'exec': [
+                 "pm.collectionVariables.set('itemId', data.data.id);"]}}]},
+            {'name': 'Get', 'request': {'method': 'GET', 'url': {'raw': '{{baseUrl}}/api/items/{{itemId}}'}}},
+        ]},
+    ],
+}
+
+
+class LoadServer:
+    """Мінімальний WSGI-сервер із сесійною cookie для тестів генератора навантаження."""
+
+    def __init__(self):
+        self.seen = []
+        self.sessions = set()
+
+    def __call__(self, environ, start_response):
+        method, path = environ['REQUEST_METHOD'], environ['PATH_INFO']
+        cookie = environ.get('HTTP_COOKIE', '')
+        self.seen.append((method, path, cookie))
+        headers = [('Content-Type', 'application/json')]
+        if path == '/auth/login':
+            token = f'sid{len(self.sessions)}'
+            self.sessions.add(token)
+            headers.append(('Set-Cookie', f'session={token}; Path=/'))
+            body, status = {'status': 'success'}, '200 OK'
+        elif cookie.replace('session=', '') not in self.sessions:
+            body, status = {'status': 'error'}, '401 UNAUTHORIZED'
+        elif method == 'POST':
+            body, status = {'data': {'id': 7}}, '201 CREATED'
+        else:
+            body, status = {'path': path}, '200 OK'
+        start_response(status, headers)
+        return [json.dumps(body).encode()]
+
+
+@pytest.fixture
+def collection_file(tmp_path):
+    path = tmp_path / 'collection.json'
+    path.write_text(json.dumps(COLLECTION), encoding='utf-8')
+    return str(path)
+
+
+class TestLoadGenerator:
+    """Тести навантажувального тесту (benchmarks/workload.py, load.py, report.py)."""
+
+    def test_collection_import(self, collection_file):
+        templates, variables = workload.load_collection(collection_file)
+        assert [t.name for t in templates] == ['Login', 'Create', 'Get']
+        assert variables['itemId'] == '1'
+        login, create, get = templates
+        assert login.is_login
+        assert create.captures == {'itemId': ['data', 'id']}
+        assert get.endpoint == 'GET /api/items/{itemId}'
+        assert get.render({'itemId': 42})[:2] == ('GET', '/api/items/42')
+        assert login.render({'authEmail': 'u@x', 'authPassword': 'p'})[2] == '{"email": "u@x", "password": "p"}'
+
+        captured = {}
+        create.capture({'data': {'id': 9}}, captured)
+        assert captured == {'itemId': 9}
+
+    def test_log_parsing_and_sessions(self, tmp_path, collection_file):
+        templates, _ = workload.load_collection(collection_file)
+        log = tmp_path / 'access.log'
+        log.write_text(
+            '10.0.0.1 - - [19/Oct/2026:10:00:00 +0000] "GET /api/items/555 HTTP/1.1" 200 10 "-" "ua"\n'
+            '10.0.0.1 - - [19/Oct/2026:10:00:04 +0000] "DELETE /api/other/1 HTTP/1.1" 200 10 "-" "ua"\n'
+            '10.0.0.1 - - [19/Oct/2026:10:00:05 +0000] "GET /api/products?page=2 HTTP/1.1" 200 10 "-" "ua"\n'
+            '10.0.0.1 - - [19/Oct/2026:12:00:00 +0000] "GET /health HTTP/1.1" 200 10 "-" "ua"\n'
+            '2026-10-19 10:00:00,123 [INFO] Request: POST http://localhost:5000/api/items\n'
+            'сміття\n', encoding='utf-8')
+        sessions = workload.read_log_sessions([str(log)])
+        assert sorted(len(s) for s in sessions) == [1, 1, 3]
+
+        first = next(s for s in sessions if len(s) == 3)
+        steps, skipped = workload.log_session_steps(first, templates, think_scale=0.5)
+        assert skipped == 1
+        assert [s.template.endpoint for s in steps] == ['GET /api/items/{itemId}', 'GET /api/products']
+        assert steps[1].think == pytest.approx(2.5)
+        assert steps[1].template.render({})[1] == '/api/products?page=2'
+
+    def test_saturation_detection(self):
+        samples = ([(1.0, 20.0, 200, 'GET /a', 0)] * 50 + [(11.0, 900.0, 200, 'GET /a', 1)] * 50
+                   + [(21.0, 50.0, 503, 'GET /a', 2)] * 50)
+        sessions = [(0.5, 0.0, 0, False), (10.5, 0.0, 1, False), (20.5, 0.0, 2, False)]
+        result = report.build({'elapsed_s': 30.0}, samples, sessions, [1, 2, 4], 10.0)
+        assert [row['saturated'] for row in result['stages']] == [False, True, True]
+        assert result['saturation']['offered_sessions_per_s'] == 2
+        assert result['saturation']['last_healthy_sessions_per_s'] == 1
+        assert result['summary']['status_codes'] == {'200': 100, '503': 50}
+        assert len(result['timeline']) == 5
+        assert '<svg' in report.render_html(result)
+
+    def test_open_loop_run_with_cookies(self, collection_file):
+        templates, variables = workload.load_collection(collection_file)
+        app = LoadServer()
+        server = make_server('127.0.0.1', 0, app, handler_class=QuietHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f'http://127.0.0.1:{server.server_port}'
+            pool = load.UserPool(base_url, [{'authEmail': 'u1@x', 'authPassword': 'p'}], variables)
+            steps = workload.collection_session(templates)
+            test = load.LoadTest(pool, lambda rng: steps, [20], 0.3, max_sessions=1, arrivals='uniform')
+            test.run()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(test.session_log) == 5
+        logins = [s for s in app.seen if s[1] == '/auth/login']
+        # Один віртуальний користувач: вхід один раз, далі — його cookie
+        assert len(logins) == 1
+        assert all(cookie == 'session=sid0' for method, path, cookie in app.seen if path != '/auth/login')
+        # Id, збережений з відповіді Create, підставляється в Get
+        assert ('GET', '/api/items/7', 'session=sid0') in app.seen
+        assert {s[3] for s in test.samples} == {'POST /auth/login', 'POST /api/items', 'GET /api/items/{itemId}'}
+        assert all(s[2] in (200, 201) for s in test.samples)
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
@@ -0,0 +1,82 @@
+"""
+Тести оформлення замовлення (checkout.py): кількість SQL-запитів не
+повинна залежати від кількості рядків у кошику.
+"""
+
+import pytest
+from sqlalchemy import event
+from app import db
+from models import Product, Order, OrderItem
+
+
+@pytest.fixture
+def products(app_with_db):
+    """100 активних продуктів."""
+    items = [Product(name=f'Продукт {i}', slug=f'product-{i}', type='theme', price=float(i + 1))
+             for i in range(100)]
+    db.session.add_all(items)
+    db.session.commit()
+    return [p.id for p in items]
+
+
+def _count_queries(fn):
+    statements = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', _before)
+    try:
+        result = fn()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', _before)
+    return result, statements
+
+
+class TestCheckout:
+    """Integration тести POST /api/orders."""
+
+    def test_query_count_is_constant(self, logged_in_client_db, products):
+        """1, 10 та 100 рядків кошика — однакова кількість запитів."""
+        counts = []
+        for size in (1, 10, 100):
+            payload = {'items': [{'product_id': pid, 'quantity': 2} for pid in products[:size]]}
+            response, statements = _count_queries(
+                lambda: logged_in_client_db.post('/api/orders', json=payload))
+            assert response.status_code == 201
+            counts.append(len(statements))
+        assert counts[0] == counts[1] == counts[2], counts
+
+    def test_order_is_priced_in_memory(self, logged_in_client_db, products):
+        """Сума та рядки у відповіді відповідають збереженим у БД."""
+        payload = {'items': [{'product_id': products[0], 'quantity': 3},
+                             {'product_id': products[4], 'quantity': 1}]}
+        response = logged_in_client_db.post('/api/orders', json=payload)
+        data = response.get_json()['order']
+
+        assert data['total_amount'] == 1.0 * 3 + 5.0
+        assert [i['subtotal'] for i in data['items']] == [3.0, 5.0]
+        order = db.session.get(Order, data['id'])
+        assert order.total_amount == data['total_amount']
+        assert OrderItem.query.filter_by(order_id=order.id).count() == 2
+
+    def test_unavailable_product_creates_nothing(self, logged_in_client_db, products):
+        """Якщо один продукт недоступний, замовлення не створюється."""
+        payload = {'items': [{'product_id': products[0], 'quantity': 1},
+                             {'product_id': 99999, 'quantity': 1}]}
+        response = logged_in_client_db.post('/api/orders', json=payload)
+        assert response.status_code == 404
+        assert Order.query.count() == 0
+
+    def test_v1_accepts_string_ids(self, logged_in_client_db, products):
+        """V1 без валідації, як і раніше, приймає id та кількість рядками."""
+        payload = {'items': [{'product_id': str(products[1]), 'quantity': '2'}]}
+        response = logged_in_client_db.post('/api/v1/orders', json=payload)
+        assert response.status_code == 201
+        data = response.get_json()['order']
+        assert data['items'][0]['product_id'] == products[1]
+        assert data['total_amount'] == 2.0 * 2
+
+        response = logged_in_client_db.post('/api/v1/orders', json={'items': [{'product_id': 'abc'}]})
+        assert response.status_code == 400
+        assert Order.query.count() == 1
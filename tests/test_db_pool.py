@@ -0,0 +1,132 @@
+"""
+Тести налаштувань і телеметрії пулу з'єднань (db_pool.py).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event, exc, text
+
+import db_pool
+
+
+@pytest.fixture
+def small_engine(tmp_path):
+    name = f'test-{tmp_path.name}'
+    engine = create_engine(f'sqlite:///{tmp_path / "pool.db"}', poolclass=db_pool.pool_class(name),
+                           pool_size=1, max_overflow=0, pool_timeout=0.05)
+    stats = db_pool._stats[name]
+    event.listen(engine, 'connect', stats.on_connect)
+    event.listen(engine, 'invalidate', stats.on_invalidate)
+    yield name, engine, stats
+    engine.dispose()
+    db_pool._stats.pop(name, None)
+
+
+class TestEngineOptions:
+    """Тести опцій create_engine з конфігурації."""
+
+    def test_postgresql(self):
+        config = {'DB_POOL_SIZE': 8, 'DB_MAX_OVERFLOW': 2, 'DB_POOL_TIMEOUT': 3.0, 'DB_POOL_RECYCLE': 600,
+                  'DB_POOL_PRE_PING': True, 'DB_STATEMENT_TIMEOUT_MS': 15000, 'DB_CONNECT_TIMEOUT': 4}
+        options = db_pool.engine_options('postgres://u:p@db/dailymood', config)
+        assert issubclass(options.pop('poolclass'), db_pool.InstrumentedQueuePool)
+        assert options == {
+            'pool_size': 8, 'max_overflow': 2, 'pool_timeout': 3.0, 'pool_recycle': 600, 'pool_pre_ping': True,
+            'connect_args': {'connect_timeout': 4, 'options': '-c statement_timeout=15000'},
+        }
+        # Окремий таймаут для engine (наприклад, репліки) і вимкнений таймаут
+        replica = db_pool.engine_options('postgresql://u@replica/db', config, 'replica', statement_timeout_ms=0)
+        assert replica['connect_args'] == {'connect_timeout': 4}
+
+    def test_sqlite(self):
+        assert db_pool.engine_options('sqlite://', {}) == {}
+        assert db_pool.engine_options('sqlite:///:memory:', {}) == {}
+        assert list(db_pool.engine_options('sqlite:////tmp/x.db', {})) == ['poolclass']
+
+
+class TestPoolStats:
+    """Тести лічильників пулу."""
+
+    def test_checkout_wait_and_timeout(self, small_engine):
+        name, engine, stats = small_engine
+        held = engine.connect()
+        snapshot = stats.snapshot()
+        assert snapshot['checked_out'] == 1 and snapshot['capacity'] == 1 and snapshot['saturated']
+
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        held.close()
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+
+        snapshot = stats.snapshot()
+        assert snapshot['checkouts'] == 2
+        assert snapshot['timeouts'] == 1
+        assert snapshot['max_wait_seconds'] >= 0.05
+        assert snapshot['connects'] == 1
+        assert not snapshot['saturated']
+
+    def test_counters_survive_dispose(self, small_engine):
+        name, engine, stats = small_engine
+        with engine.connect() as connection:
+            connection.invalidate()
+        old_pool = engine.pool
+        engine.dispose()
+        assert engine.pool is not old_pool
+        with engine.connect():
+            pass
+        assert stats.pool is engine.pool
+        assert stats.invalidated == 1
+        assert stats.connects == 2
+        assert stats.checkouts == 2
+
+    def test_readiness_saturated_pool(self, small_engine):
+        name, engine, stats = small_engine
+        fake_db = SimpleNamespace(engines={None: engine})
+        ok, checks = db_pool.readiness(fake_db)
+        assert ok and checks[0]['ok'] and checks[0]['ping_ms'] >= 0
+
+        with engine.connect():
+            ok, checks = db_pool.readiness(fake_db)
+        assert not ok
+        # Без очікування pool_timeout
+        assert stats.timeouts == 0
+        assert checks[0]['error']
+
+    def test_replica_failure_is_not_fatal(self, small_engine):
+        name, engine, stats = small_engine
+        with engine.connect():
+            ok, checks = db_pool.readiness(SimpleNamespace(engines={'replica_1': engine}))
+        assert ok and not checks[0]['ok']
+
+
+class TestReadinessEndpoint:
+    """Тести /health/ready та метрик пулу."""
+
+    def test_ready(self, client, health_monitor):
+        response = client.get('/health/ready')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['status'] == 'ok'
+        engines = data['checks']['database']['engines']
+        assert engines[0]['engine'] == 'default' and engines[0]['ok']
+        assert 'Set-Cookie' not in response.headers
+
+    def test_database_down(self, client, app_with_db, health_monitor, monkeypatch):
+        engine = app_with_db.extensions['sqlalchemy'].engine
+
+        def fail(*args, **kwargs):
+            raise exc.OperationalError('SELECT 1', {}, Exception('connection refused'))
+        monkeypatch.setattr(type(engine), 'connect', fail)
+        response = client.get('/health/ready')
+        assert response.status_code == 503
+        data = response.get_json()
+        assert data['status'] == 'unavailable' and not data['checks']['database']['ok']
+
+    def test_metrics(self, client, health_monitor, metrics_auth):
+        client.get('/health/ready')
+        body = client.get('/metrics', headers=metrics_auth).get_data(as_text=True)
+        assert 'dailymood_db_pool_checked_out{engine="default",' in body
+        assert 'dailymood_db_pool_checkout_wait_seconds_total{engine="default",' in body
+        assert '# TYPE dailymood_db_pool_checkout_timeouts_total counter' in body
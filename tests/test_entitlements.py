@@ -0,0 +1,144 @@
+"""
+Тести індексу прав (entitlements.py): видача прав при оплаті,
+кешування перевірки преміуму та чистка прострочених прав.
+"""
+
+from datetime import datetime, timedelta
+
+from app import db
+from models import User, Product, Order, OrderItem, Payment, Entitlement, MoodEntry
+import entitlements
+
+
+def _paid_order(user_id, *products):
+    """Замовлення з продуктами та завершеним платежем, ще без виданих прав."""
+    order = Order(user_id=user_id, status='new', total_amount=sum(p.price for p in products))
+    db.session.add(order)
+    db.session.flush()
+    for product in products:
+        db.session.add(OrderItem(order_id=order.id, product_id=product.id,
+                                 quantity=1, unit_price=product.price, subtotal=product.price))
+    db.session.flush()
+    return order
+
+
+class TestEntitlements:
+    """Unit тести для grant / has_premium / sweep."""
+
+    def test_grant_for_order_indexes_products_and_premium(self, app_with_db, real_user):
+        """Оплата видає право на кожен продукт і преміум за підписку."""
+        theme = Product(name='Тема', slug='test-theme', type='theme', price=5.0)
+        sub = Product(name='Premium', slug='test-premium-plan', type='subscription', price=9.0)
+        db.session.add_all([theme, sub])
+        db.session.flush()
+        order = _paid_order(real_user, theme, sub)
+
+        assert entitlements.grant_for_order(order) is True
+        db.session.commit()
+
+        features = entitlements.get_entitlements(real_user)
+        assert entitlements.PREMIUM in features
+        assert entitlements.product_feature(theme.id) in features
+        user = db.session.get(User, real_user)
+        assert user.is_premium is True
+        # Без PREMIUM_DURATION_DAYS преміум безстроковий
+        assert user.premium_expires_at is None
+
+    def test_non_premium_order_is_not_completed(self, app_with_db, real_user):
+        """Замовлення без преміуму отримує права на продукти, але не вважається цифровим."""
+        theme = Product(name='Тема', slug='test-theme', type='theme', price=5.0)
+        db.session.add(theme)
+        db.session.flush()
+        order = _paid_order(real_user, theme)
+
+        assert entitlements.grant_for_order(order) is False
+        db.session.commit()
+        assert entitlements.get_entitlements(real_user) == {entitlements.product_feature(theme.id)}
+
+    def test_has_premium_is_cached(self, app_with_db, real_user):
+        """Повторна перевірка преміуму не звертається до БД."""
+        user = db.session.get(User, real_user)
+        entitlements.grant_premium(user)
+        db.session.commit()
+
+        assert entitlements.has_premium(real_user) is True
+        # Пряме видалення повз API не видно, доки не мине TTL кешу
+        Entitlement.query.delete()
+        db.session.commit()
+        assert entitlements.has_premium(real_user) is True
+
+        entitlements.invalidate(real_user)
+        assert entitlements.has_premium(real_user) is False
+
+    def test_sweep_removes_expired_premium(self, app_with_db, real_user):
+        """Прострочений преміум знімається з користувача та з індексу."""
+        user = db.session.get(User, real_user)
+        entitlements.grant_premium(user, days=1)
+        past = datetime.utcnow() - timedelta(minutes=1)
+        user.premium_expires_at = past
+        Entitlement.query.filter_by(user_id=real_user).update({'expires_at': past})
+        db.session.commit()
+
+        assert entitlements.has_premium(real_user) is False
+        assert entitlements.sweep_expired() == {'users': 1, 'entitlements': 1}
+        assert db.session.get(User, real_user).is_premium is False
+
+
+class TestEntitlementEndpoints:
+    """Integration тести для преміум-ендпоінтів та /api/me/entitlements."""
+
+    def test_premium_endpoint_requires_entitlement(self, logged_in_client_db, real_user):
+        """Без права 'premium' ендпоінт повертає 403, з правом — доступний."""
+        response = logged_in_client_db.get('/api/premium/mood-predictor')
+        assert response.status_code == 403
+        assert response.get_json()['premium_required'] is True
+
+        user = db.session.get(User, real_user)
+        entitlements.grant_premium(user)
+        db.session.commit()
+        response = logged_in_client_db.get('/api/premium/mood-predictor')
+        assert response.status_code == 200
+
+    def test_mood_predictor_buckets_extended_moods(self, logged_in_client_db, real_user):
+        """Розширені настрої (angry, excited) зводяться до шкали прогнозу, а не дають 500."""
+        user = db.session.get(User, real_user)
+        entitlements.grant_premium(user)
+        today = datetime.utcnow().date()
+        for days_ago, mood in ((0, 'angry'), (1, 'angry'), (2, 'excited')):
+            db.session.add(MoodEntry(mood=mood, date=today - timedelta(days=days_ago),
+                                     title=mood, user_id=real_user))
+        db.session.commit()
+
+        response = logged_in_client_db.get('/api/premium/mood-predictor')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['prediction'] == 'sad'
+        distribution = data['stats']['mood_distribution']
+        assert round(distribution['sad']) == 67 and round(distribution['happy']) == 33
+
+    def test_paid_order_shows_in_my_entitlements(self, logged_in_client_db, real_user):
+        """Після оплати придбаний продукт з'являється в /api/me/entitlements."""
+        theme = Product(name='Тема', slug='test-theme', type='theme', price=5.0)
+        db.session.add(theme)
+        db.session.flush()
+        order = _paid_order(real_user, theme)
+        db.session.commit()
+
+        response = logged_in_client_db.post('/api/payments', json={
+            'order_id': order.id,
+            'payment_method': 'paypal'
+        })
+        assert response.status_code == 202
+
+        data = logged_in_client_db.get('/api/me/entitlements').get_json()
+        assert data['product_ids'] == [theme.id]
+        assert data['is_premium'] is False
+
+    def test_admin_set_premium_updates_index(self, logged_in_admin_client_db, real_user):
+        """Адмін вмикає/вимикає преміум — індекс прав оновлюється одразу."""
+        url = f'/api/admin/users/{real_user}/premium'
+        assert logged_in_admin_client_db.put(url, json={'is_premium': True}).status_code == 200
+        assert entitlements.has_premium(real_user) is True
+
+        assert logged_in_admin_client_db.put(url, json={'is_premium': False}).status_code == 200
+        assert entitlements.has_premium(real_user) is False
@@ -0,0 +1,114 @@
+"""
+Тести проб liveness / readiness (health.py).
+"""
+
+import time
+
+from sqlalchemy import exc, text
+
+import schema_bootstrap
+from app import db
+
+
+def fail_connect(monkeypatch, app):
+    engine = app.extensions['sqlalchemy'].engine
+
+    def fail(*args, **kwargs):
+        raise exc.OperationalError('SELECT 1', {}, Exception('connection refused'))
+    monkeypatch.setattr(type(engine), 'connect', fail)
+
+
+class TestLiveness:
+    """/health/live не звертається ні до БД, ні до диска."""
+
+    def test_live_without_database(self, client, app_with_db, monkeypatch):
+        fail_connect(monkeypatch, app_with_db)
+        for path in ('/health/live', '/health'):
+            response = client.get(path)
+            assert response.status_code == 200
+            assert response.get_json() == {'status': 'ok'}
+            assert 'Set-Cookie' not in response.headers
+
+
+class TestReadiness:
+    """/health/ready віддає кешований результат перевірок."""
+
+    def test_ready_is_cached(self, client, health_monitor):
+        response = client.get('/health/ready')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert set(data['checks']) == {'database', 'session', 'schema', 'warmup'}
+        assert all(check['ok'] for check in data['checks'].values())
+        assert data['checks']['schema']['pending'] == []
+
+        # Повторна проба не виконує перевірок — лише читає кеш
+        refreshes = health_monitor.refreshes
+        client.get('/health/ready')
+        assert health_monitor.refreshes == refreshes
+        assert health_monitor._thread.is_alive()
+
+    def test_not_warm(self, client, health_monitor):
+        health_monitor.warm = False
+        response = client.get('/health/ready')
+        assert response.status_code == 503
+        warmup = response.get_json()['checks']['warmup']
+        assert not warmup['ok'] and not warmup['warm']
+        health_monitor.reset()
+        health_monitor.require_warmup = False
+        try:
+            assert client.get('/health/ready').status_code == 200
+        finally:
+            health_monitor.require_warmup = True
+
+    def test_session_dir_not_writable(self, client, app_with_db, health_monitor, tmp_path, monkeypatch):
+        monkeypatch.setitem(app_with_db.config, 'SESSION_FILE_DIR', str(tmp_path / 'missing'))
+        response = client.get('/health/ready')
+        assert response.status_code == 503
+        session = response.get_json()['checks']['session']
+        assert not session['ok'] and session['error']
+
+    def test_pending_schema(self, client, health_monitor, monkeypatch):
+        with db.engine.begin() as connection:
+            connection.execute(text('DROP TABLE feedback'))
+        response = client.get('/health/ready')
+        assert response.status_code == 503
+        assert response.get_json()['checks']['schema']['pending'] == ['feedback']
+
+        db.metadata.tables['feedback'].create(db.engine)
+        health_monitor.refresh()
+        # Після успіху схема більше не перевіряється
+        monkeypatch.setattr(schema_bootstrap, 'pending', lambda: ['never'])
+        health_monitor.refresh()
+        assert client.get('/health/ready').status_code == 200
+
+    def test_stale_result(self, client, health_monitor):
+        client.get('/health/ready')
+        health_monitor._result['monotonic'] -= health_monitor.max_age + 1
+        response = client.get('/health/ready')
+        assert response.status_code == 503
+        assert response.get_json()['error']
+
+    def test_background_refresh(self, client, health_monitor, app_with_db, monkeypatch):
+        health_monitor.interval = 0.05
+        assert client.get('/health/ready').status_code == 200
+        fail_connect(monkeypatch, app_with_db)
+        deadline = time.monotonic() + 5
+        while health_monitor._result['ready'] and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert client.get('/health/ready').status_code == 503
+
+    def test_result_not_inherited_after_fork(self, client, health_monitor):
+        client.get('/health/ready')
+        thread, stop = health_monitor._thread, health_monitor._stop
+        # Імітуємо дочірній процес: інший pid, результат і потік — від батька
+        health_monitor._pid = -1
+        health_monitor.start()
+        stop.set()
+        assert health_monitor._result is None
+        assert health_monitor._thread is not thread and health_monitor._thread.is_alive()
+
+    def test_metrics(self, client, health_monitor, metrics_auth):
+        client.get('/health/ready')
+        body = client.get('/metrics', headers=metrics_auth).get_data(as_text=True)
+        assert 'dailymood_health_check_ok{check="database",' in body
+        assert '# TYPE dailymood_health_check_age_seconds gauge' in body
@@ -0,0 +1,76 @@
+"""
+Тести для підтримки заголовка Idempotency-Key (idempotency.py).
+"""
+
+import pytest
+from sqlalchemy import event
+from app import db
+from models import Product, Order, Payment, IdempotencyRecord
+
+
+@pytest.fixture
+def product(app_with_db):
+    """Активний продукт для замовлень."""
+    p = Product(name='Пакет цитат', slug='quotes', type='quote_pack', price=29.0)
+    db.session.add(p)
+    db.session.commit()
+    return p.id
+
+
+class TestIdempotencyKey:
+    """Integration тести повторних запитів з Idempotency-Key."""
+
+    @pytest.mark.parametrize('url', ['/api/orders', '/api/v1/orders'])
+    def test_repeated_order_is_replayed(self, logged_in_client_db, product, url):
+        """Повтор з тим самим ключем не створює друге замовлення."""
+        payload = {'items': [{'product_id': product, 'quantity': 2}]}
+        headers = {'Idempotency-Key': 'order-abc'}
+
+        first = logged_in_client_db.post(url, json=payload, headers=headers)
+        second = logged_in_client_db.post(url, json=payload, headers=headers)
+
+        assert first.status_code == 201
+        assert second.status_code == 201
+        assert second.headers.get('Idempotent-Replayed') == 'true'
+        assert second.get_json() == first.get_json()
+        assert Order.query.count() == 1
+
+    def test_same_key_different_body_is_rejected(self, logged_in_client_db, product):
+        """Той самий ключ з іншим тілом запиту — 422."""
+        headers = {'Idempotency-Key': 'order-xyz'}
+        logged_in_client_db.post('/api/orders', json={'items': [{'product_id': product, 'quantity': 1}]},
+                                 headers=headers)
+        response = logged_in_client_db.post('/api/orders', json={'items': [{'product_id': product, 'quantity': 5}]},
+                                            headers=headers)
+        assert response.status_code == 422
+        assert Order.query.count() == 1
+
+    def test_requests_without_key_are_not_stored(self, logged_in_client_db, product):
+        """Без заголовка поведінка не змінюється."""
+        payload = {'items': [{'product_id': product, 'quantity': 1}]}
+        logged_in_client_db.post('/api/orders', json=payload)
+        logged_in_client_db.post('/api/orders', json=payload)
+        assert Order.query.count() == 2
+        assert IdempotencyRecord.query.count() == 0
+
+    def test_v2_concurrent_payment_is_payment_exists(self, logged_in_client_db, product):
+        """Платіж, створений конкурентним запитом після перевірки, — 400 PAYMENT_EXISTS, а не 500."""
+        order_id = logged_in_client_db.post('/api/orders', json={
+            'items': [{'product_id': product, 'quantity': 1}]
+        }).get_json()['order']['id']
+
+        def concurrent_payment(session, flush_context, instances):
+            # Інший запит вставляє платіж між перевіркою order.payment і commit
+            if any(isinstance(obj, Payment) for obj in session.new):
+                session.connection().execute(Payment.__table__.insert().values(
+                    order_id=order_id, payment_method='cash', amount=29.0, status='pending'))
+
+        event.listen(db.session, 'before_flush', concurrent_payment)
+        try:
+            response = logged_in_client_db.post('/api/v2/payments', json={
+                'order_id': order_id, 'payment_method': 'paypal'
+            })
+        finally:
+            event.remove(db.session, 'before_flush', concurrent_payment)
+        assert response.status_code == 400
+        assert response.get_json()['code'] == 'PAYMENT_EXISTS'
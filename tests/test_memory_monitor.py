@@ -0,0 +1,155 @@
+"""
+Тести моніторингу пам'яті воркера (memory_monitor.py).
+"""
+
+import os
+import tracemalloc
+
+import pytest
+
+import memory_monitor
+
+
+@pytest.fixture
+def monitor(app_with_db):
+    monitor = memory_monitor.get_monitor(app_with_db)
+    saved = (monitor.interval, monitor.max_rss_bytes, monitor.recycling)
+    monitor.history.clear()
+    monitor.clear_snapshots()
+    monitor._next_sample = 0.0
+    yield monitor
+    monitor.stop_tracing()
+    monitor.clear_snapshots()
+    monitor.interval, monitor.max_rss_bytes, monitor.recycling = saved
+    memory_monitor._recycler = None
+
+
+_retained = []
+
+
+def allocate_lists():
+    _retained.extend([i] * 100 for i in range(2000))
+
+
+class TestRssHistory:
+    """Тести історії RSS і бюджету."""
+
+    def test_current_rss(self):
+        assert memory_monitor.current_rss() > 0
+        assert memory_monitor.peak_rss() >= memory_monitor.current_rss() // 2
+
+    def test_sampling_interval(self, client, monitor):
+        monitor.interval = 3600
+        for _ in range(3):
+            client.get('/health')
+        assert len(monitor.history) == 1
+        assert monitor.history[0]['rss_bytes'] > 0
+
+    def test_budget_recycles_after_response(self, client, monitor):
+        calls = []
+        memory_monitor.enable_recycling(lambda: calls.append(os.getpid()))
+        monitor.max_rss_bytes = 1
+        monitor.interval = 0
+
+        response = client.get('/health')
+        assert calls == []
+        response.close()
+        assert calls == [os.getpid()]
+        # Повторно не запускається
+        client.get('/health').close()
+        assert calls == [os.getpid()]
+        assert monitor.recycling
+
+    def test_budget_without_gunicorn_only_warns(self, client, monitor):
+        monitor.max_rss_bytes = 1
+        monitor.interval = 0
+        client.get('/health').close()
+        assert monitor.recycling
+
+
+class TestModuleName:
+    """Тести групування алокацій за модулем."""
+
+    def test_app_and_packages(self, tmp_path):
+        root = str(tmp_path)
+        assert memory_monitor.module_name(os.path.join(root, 'models', 'habit.py'), root) == 'models.habit'
+        venv_file = os.path.join(root, '.venv', 'lib', 'python3.11', 'site-packages', 'sqlalchemy', 'orm', 'x.py')
+        assert memory_monitor.module_name(venv_file, root) == 'sqlalchemy'
+        assert memory_monitor.module_name(os.__file__, root) == 'stdlib.os'
+        assert memory_monitor.module_name('<unknown>', root) == '<unknown>'
+
+
+class TestAdminApi:
+    """Тести адмін-API пам'яті."""
+
+    def test_snapshot_diff(self, logged_in_admin_client_db, monitor):
+        client = logged_in_admin_client_db
+        assert client.post('/api/admin/memory/snapshots').status_code == 409
+
+        response = client.post('/api/admin/memory/tracemalloc', json={'frames': 5})
+        assert response.get_json()['frames'] == 5
+        base = client.post('/api/admin/memory/snapshots').get_json()['snapshot']['id']
+        allocate_lists()
+        try:
+            created = client.post('/api/admin/memory/snapshots')
+            assert created.status_code == 201
+            snapshot = created.get_json()['snapshot']['id']
+
+            diff = client.get(f'/api/admin/memory/snapshots/{snapshot}?base={base}').get_json()
+            top = diff['stats'][0]
+            assert top['module'] == 'tests.test_memory_monitor'
+            assert top['size_diff_bytes'] > 2000 * 100 * 8
+            assert top['count_diff'] >= 2000
+
+            by_line = client.get(f'/api/admin/memory/snapshots/{snapshot}?base={base}&group_by=lineno').get_json()
+            assert by_line['stats'][0]['lineno'].startswith(os.path.join('tests', 'test_memory_monitor.py') + ':')
+            by_stack = client.get(f'/api/admin/memory/snapshots/{snapshot}?group_by=traceback&limit=5').get_json()
+            assert len(by_stack['stats']) == 5 and isinstance(by_stack['stats'][0]['traceback'], list)
+        finally:
+            _retained.clear()
+
+        status = client.get('/api/admin/memory').get_json()['memory']
+        assert status['tracemalloc']['tracing'] and status['tracemalloc']['frames'] == 5
+        assert [s['id'] for s in status['snapshots']] == [base, snapshot]
+        assert status['history'][-1]['rss_bytes'] == status['rss_bytes']
+
+        assert client.get(f'/api/admin/memory/snapshots/{snapshot}?group_by=bogus').status_code == 400
+        assert client.get(f'/api/admin/memory/snapshots/{os.getpid()}-9999').status_code == 404
+        assert client.get('/api/admin/memory/snapshots/9999').status_code == 404
+        client.post('/api/admin/memory/tracemalloc', json={'enabled': False})
+        assert not tracemalloc.is_tracing()
+        assert client.delete('/api/admin/memory/snapshots').status_code == 200
+        assert monitor.list_snapshots() == []
+
+    def test_other_worker_is_conflict(self, logged_in_admin_client_db, monitor):
+        """Знімки — у пам'яті воркера: запит до чужого pid отримує 409, а не 404."""
+        client = logged_in_admin_client_db
+        other = os.getpid() + 1
+        client.post('/api/admin/memory/tracemalloc')
+        snapshot = client.post('/api/admin/memory/snapshots', json={'pid': os.getpid()}).get_json()['snapshot']
+        assert snapshot['id'].startswith(f'{os.getpid()}-') and snapshot['pid'] == os.getpid()
+
+        response = client.get(f'/api/admin/memory/snapshots/{other}-1')
+        assert response.status_code == 409
+        assert response.get_json()['pid'] == os.getpid()
+        assert response.get_json()['expected_pid'] == other
+        assert client.post('/api/admin/memory/snapshots', json={'pid': other}).status_code == 409
+        assert client.post('/api/admin/memory/tracemalloc', json={'enabled': False, 'pid': other}).status_code == 409
+        assert tracemalloc.is_tracing()
+        assert client.delete(f'/api/admin/memory/snapshots?pid={other}').status_code == 409
+        assert client.get(f"/api/admin/memory/snapshots/{snapshot['id']}?base={other}-1").status_code == 400
+        monitor.stop_tracing()
+
+    def test_snapshot_limit(self, app_with_db, monitor):
+        monitor.start_tracing()
+        ids = [monitor.take_snapshot() for _ in range(monitor.max_snapshots + 2)]
+        assert [s['id'] for s in monitor.list_snapshots()] == ids[2:]
+
+    def test_requires_admin(self, logged_in_client_db, monitor):
+        assert logged_in_client_db.get('/api/admin/memory').status_code == 403
+        assert logged_in_client_db.post('/api/admin/memory/tracemalloc').status_code == 403
+
+    def test_metrics(self, client, monitor, metrics_auth):
+        body = client.get('/metrics', headers=metrics_auth).get_data(as_text=True)
+        assert 'dailymood_worker_rss_bytes{' in body
+        assert 'dailymood_worker_recycle_pending{' in body
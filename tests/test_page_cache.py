@@ -0,0 +1,79 @@
+"""
+Тести кешу відрендерених сторінок (page_cache.py).
+"""
+
+from app import app
+from models import db, User
+import page_cache
+
+
+class TestPageCache:
+    """Unit тести для LRU кешу сторінок."""
+
+    def test_lru_evicts_oldest_entry(self, app_with_db):
+        cache = page_cache.PageCache(app_with_db)
+        cache.max_entries = 2
+        cache.put('a', b'A', 'ea')
+        cache.put('b', b'B', 'eb')
+        assert cache.get('a') == (b'A', 'ea')
+        cache.put('c', b'C', 'ec')
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('c') is not None
+
+    def test_key_includes_deploy_version(self, app_with_db):
+        cache = page_cache.PageCache(app_with_db)
+        key = cache.key('about', 'uk', 'anon')
+        app_with_db.config['PAGE_CACHE_VERSION'] = 'release-2'
+        try:
+            redeployed = page_cache.PageCache(app_with_db)
+        finally:
+            app_with_db.config['PAGE_CACHE_VERSION'] = None
+        assert redeployed.version != cache.version
+        assert redeployed.key('about', 'uk', 'anon') != key
+
+
+class TestCachedPages:
+    """Integration тести: кешовані сторінки, ETag та умовний GET."""
+
+    def test_second_hit_is_served_from_cache(self, client):
+        first = client.get('/about')
+        assert first.status_code == 200
+        assert first.headers[page_cache.CACHE_HEADER] == 'MISS'
+
+        second = client.get('/about')
+        assert second.headers[page_cache.CACHE_HEADER] == 'HIT'
+        assert second.get_data() == first.get_data()
+        assert second.headers['ETag'] == first.headers['ETag']
+        assert 'private' in second.headers['Cache-Control']
+
+    def test_conditional_get_returns_304(self, client):
+        etag = client.get('/store').headers['ETag']
+        response = client.get('/store', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.get_data() == b''
+
+    def test_buckets_by_language_and_auth_state(self, client, real_user):
+        client.get('/goals')
+        assert client.get('/goals?lang=en').headers[page_cache.CACHE_HEADER] == 'MISS'
+        with client.session_transaction() as sess:
+            sess['user_id'] = real_user
+        assert client.get('/goals').headers[page_cache.CACHE_HEADER] == 'MISS'
+        assert client.get('/goals').headers[page_cache.CACHE_HEADER] == 'HIT'
+
+
+class TestAdviceUnlock:
+    """Головна сторінка більше не змінює БД на GET."""
+
+    def test_index_get_keeps_flag_until_consumed(self, logged_in_client_db, real_user):
+        with app.app_context():
+            db.session.get(User, real_user).advice_unlock_once = True
+            db.session.commit()
+
+        assert logged_in_client_db.get('/').status_code == 200
+        me = logged_in_client_db.get('/api/me').get_json()
+        assert me['user']['advice_unlock_once'] is True
+
+        response = logged_in_client_db.post('/api/me/advice-unlock/consume')
+        assert response.get_json()['consumed'] is True
+        with app.app_context():
+            assert db.session.get(User, real_user).advice_unlock_once is False
@@ -0,0 +1,103 @@
+"""
+Тести адаптера платіжного шлюзу (payment_gateway.py): асинхронна
+авторизація, вебхук та незалежність затримки запиту від затримки шлюзу.
+"""
+
+import json
+import time
+
+import pytest
+from app import db
+from models import Product, Order, OrderItem, Payment
+import payment_gateway
+import task_queue
+
+
+@pytest.fixture
+def order_id(app_with_db, real_user):
+    """Замовлення з одним продуктом."""
+    product = Product(name='Тема', slug='theme', type='theme', price=19.0)
+    db.session.add(product)
+    db.session.flush()
+    order = Order(user_id=real_user, status='new', total_amount=19.0)
+    db.session.add(order)
+    db.session.flush()
+    db.session.add(OrderItem(order_id=order.id, product_id=product.id,
+                             quantity=1, unit_price=19.0, subtotal=19.0))
+    db.session.commit()
+    return order.id
+
+
+def _use_gateway(app, gateway):
+    app.extensions['payment_gateway'] = gateway
+
+
+class TestPaymentGateway:
+    """Integration тести проведення платежу через шлюз."""
+
+    def test_declined_payment_becomes_failed(self, logged_in_client_db, app_with_db, order_id):
+        """Відмова шлюзу переводить платіж у failed, замовлення — у canceled."""
+        _use_gateway(app_with_db, payment_gateway.FakeGateway(latency=0, failure_rate=1.0))
+        response = logged_in_client_db.post('/api/payments', json={'order_id': order_id, 'payment_method': 'paypal'})
+        assert response.status_code == 202
+
+        status = logged_in_client_db.get(response.get_json()['status_url']).get_json()
+        assert status['payment']['status'] == 'failed'
+        assert status['order']['status'] == 'canceled'
+
+    def test_request_latency_independent_of_gateway(self, logged_in_client_db, app_with_db, order_id):
+        """Повільний шлюз не затримує відповідь: авторизацію робить воркер."""
+        latency = 0.5
+        _use_gateway(app_with_db, payment_gateway.FakeGateway(latency=latency))
+        app_with_db.config['TASK_QUEUE_EAGER'] = False
+        try:
+            started = time.perf_counter()
+            response = logged_in_client_db.post('/api/payments',
+                                                json={'order_id': order_id, 'payment_method': 'paypal'})
+            elapsed = time.perf_counter() - started
+            assert response.status_code == 202
+            assert elapsed < latency
+
+            status_url = response.get_json()['status_url']
+            pending = logged_in_client_db.get(status_url)
+            assert pending.get_json()['payment']['status'] == 'pending'
+            assert pending.headers.get('Retry-After') == '1'
+
+            assert task_queue.process_one('test-worker') is True
+            assert logged_in_client_db.get(status_url).get_json()['payment']['status'] == 'completed'
+        finally:
+            app_with_db.config['TASK_QUEUE_EAGER'] = True
+
+
+class TestPaymentWebhook:
+    """Тести POST /api/payments/webhook."""
+
+    def _pending_payment(self, order_id):
+        payment = Payment(order_id=order_id, payment_method='card', amount=19.0, status='pending')
+        db.session.add(payment)
+        db.session.commit()
+        return payment.id
+
+    def test_signed_webhook_completes_payment(self, client, app_with_db, order_id):
+        """Підписаний callback переводить платіж у completed; дублікат нічого не змінює."""
+        payment_id = self._pending_payment(order_id)
+        body = json.dumps({'payment_id': payment_id, 'status': 'completed', 'transaction_id': 'TXN-1'})
+        signature = payment_gateway.sign_payload('test-webhook-secret', body)
+        headers = {'X-Gateway-Signature': signature, 'Content-Type': 'application/json'}
+
+        first = client.post('/api/payments/webhook', data=body, headers=headers)
+        assert first.status_code == 200
+        assert first.get_json()['applied'] is True
+        assert first.get_json()['payment']['status'] == 'completed'
+
+        duplicate = client.post('/api/payments/webhook', data=body, headers=headers)
+        assert duplicate.get_json()['applied'] is False
+
+    def test_unsigned_webhook_is_rejected(self, client, app_with_db, order_id):
+        """Callback без правильного підпису — 401."""
+        payment_id = self._pending_payment(order_id)
+        body = json.dumps({'payment_id': payment_id, 'status': 'completed'})
+        response = client.post('/api/payments/webhook', data=body,
+                               headers={'X-Gateway-Signature': 'bad', 'Content-Type': 'application/json'})
+        assert response.status_code == 401
+        assert db.session.get(Payment, payment_id).status == 'pending'
@@ -0,0 +1,117 @@
+"""
+Тести профілювання запитів на вимогу (profiler.py).
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+import profiler
+from app import db
+from models import MoodEntry
+
+
+@pytest.fixture
+def profiles(app_with_db, tmp_path):
+    app_with_db.config['PROFILER_DIR'] = str(tmp_path / 'profiles')
+    app_with_db.config['PROFILER_SECRET'] = 'profile-secret'
+    app_with_db.config['PROFILER_SAMPLE_INTERVAL'] = 0.001
+    yield tmp_path / 'profiles'
+    app_with_db.config['PROFILER_SECRET'] = None
+
+
+class TestProfiler:
+    """Тести тригера, прав і знімків профілю."""
+
+    def test_not_triggered_without_header(self, logged_in_admin_client_db, profiles):
+        response = logged_in_admin_client_db.get('/api/journal')
+        assert response.status_code == 200
+        assert profiler.ID_HEADER not in response.headers
+        assert not profiles.exists()
+        # Слухачі SQL і шаблонів не підключені
+        assert profiler._active == 0
+
+    def test_regular_user_cannot_trigger(self, logged_in_client_db, profiles):
+        response = logged_in_client_db.get('/api/journal', headers={'X-Profile': '1'})
+        assert response.status_code == 200
+        assert profiler.ID_HEADER not in response.headers
+        assert not profiles.exists()
+
+    def test_admin_capture_with_sql_and_templates(self, logged_in_admin_client_db, real_admin, profiles):
+        db.session.add(MoodEntry(user_id=real_admin, mood='happy', title='Тест', date=date.today()))
+        db.session.commit()
+
+        response = logged_in_admin_client_db.get('/statistics?_profile=1')
+        assert response.status_code == 200
+        profile_id = response.headers[profiler.ID_HEADER]
+        assert profiler._active == 0
+
+        data = json.loads((profiles / f'{profile_id}.json').read_text(encoding='utf-8'))
+        assert data['path'] == '/statistics'
+        assert data['user_id'] == real_admin
+        assert data['sql']['count'] >= 1
+        assert any('mood_entries' in s['sql'] for s in data['sql']['statements'])
+        assert data['templates']['renders'][0]['name'] == 'statistics.html'
+        assert data['profile']['mode'] == 'sample'
+
+    def test_secret_header_and_cprofile(self, client, app_with_db, profiles):
+        response = client.get('/api/products', headers={'X-Profile': 'cprofile',
+                                                       'X-Profile-Secret': 'profile-secret'})
+        assert response.status_code == 200
+        data = profiler.load(app_with_db, response.headers[profiler.ID_HEADER])
+        assert data['profile']['mode'] == 'cprofile'
+        assert data['profile']['functions']
+        assert data['profile']['stacks']
+
+        wrong = client.get('/api/products', headers={'X-Profile': '1', 'X-Profile-Secret': 'nope'})
+        assert profiler.ID_HEADER not in wrong.headers
+
+    def test_admin_list_and_export(self, logged_in_admin_client_db, profiles):
+        profile_id = logged_in_admin_client_db.get(
+            '/api/stats/trends', headers={'X-Profile': 'cprofile'}).headers[profiler.ID_HEADER]
+
+        listing = logged_in_admin_client_db.get('/api/admin/profiles').get_json()
+        assert listing['profiles'][0]['id'] == profile_id
+        assert listing['profiles'][0]['path'] == '/api/stats/trends'
+
+        speedscope = logged_in_admin_client_db.get(f'/api/admin/profiles/{profile_id}/export')
+        document = json.loads(speedscope.data)
+        assert document['profiles'][0]['type'] == 'sampled'
+        frames = document['shared']['frames']
+        samples = document['profiles'][0]['samples']
+        assert len(samples) == len(document['profiles'][0]['weights'])
+        assert all(0 <= i < len(frames) for stack in samples for i in stack)
+
+        collapsed = logged_in_admin_client_db.get(f'/api/admin/profiles/{profile_id}/export?format=collapsed')
+        line = collapsed.get_data(as_text=True).splitlines()[0]
+        stack, weight = line.rsplit(' ', 1)
+        assert ';' in stack and int(weight) > 0
+
+        assert logged_in_admin_client_db.get('/api/admin/profiles/../../etc').status_code == 404
+        assert logged_in_admin_client_db.get(
+            f'/api/admin/profiles/{profile_id}/export?format=svg').status_code == 400
+
+    def test_admin_endpoints_require_admin(self, logged_in_client_db, profiles):
+        assert logged_in_client_db.get('/api/admin/profiles').status_code == 403
+
+    def test_prune_keeps_newest(self, app_with_db, profiles):
+        app_with_db.config['PROFILER_MAX_CAPTURES'] = 2
+        try:
+            for second in range(4):
+                profiler.save(app_with_db, {'id': f'20260101T00000{second}-0000000{second}'})
+            assert profiler._ids(app_with_db) == [
+                '20260101T000003-00000003', '20260101T000002-00000002']
+        finally:
+            app_with_db.config['PROFILER_MAX_CAPTURES'] = 200
+
+    def test_cprofile_stacks_follow_callers(self):
+        main = ('app.py', 1, 'main')
+        helper = ('app.py', 10, 'helper')
+        stats = {
+            main: (1, 1, 0.002, 0.010, {}),
+            helper: (2, 2, 0.008, 0.008, {main: (2, 2, 0.008, 0.008)}),
+        }
+        stacks = dict(profiler.cprofile_stacks(stats))
+        assert stacks[(('main', 'app.py', 1), ('helper', 'app.py', 10))] == pytest.approx(8.0)
+        assert stacks[(('main', 'app.py', 1),)] == pytest.approx(2.0)
@@ -0,0 +1,72 @@
+"""
+Тести сервісу цитат (quotes.py) та каталогів перекладів (i18n.py).
+"""
+
+import json
+from datetime import date
+
+import quotes
+
+
+class TestQuotesService:
+    """Unit тести для daily_quote / page."""
+
+    def test_daily_quote_is_deterministic_per_day(self):
+        day = date(2026, 1, 15)
+        first = quotes.daily_quote('uk', day)
+        assert quotes.daily_quote('uk', day) is first
+        assert first['text'] == quotes.get_corpus('uk').quotes[first['id'] - 1]
+        assert quotes.daily_index(day, 'uk', 505) == quotes.daily_index(day, 'uk', 505)
+
+    def test_page_bounds(self):
+        data = quotes.page('en', page_number=1, per_page=1000)
+        assert data['per_page'] == quotes.MAX_PER_PAGE
+        assert len(data['quotes']) == quotes.MAX_PER_PAGE
+        assert data['pages'] == -(-data['total'] // quotes.MAX_PER_PAGE)
+
+
+class TestQuotesAPI:
+    """Integration тести для /api/quotes*."""
+
+    def test_daily_quote_supports_conditional_get(self, client):
+        response = client.get('/api/quotes/daily?lang=en')
+        assert response.status_code == 200
+        assert response.get_json()['quote']['lang'] == 'en'
+        assert response.cache_control.max_age > 0
+        assert 'Set-Cookie' not in response.headers
+
+        again = client.get('/api/quotes/daily?lang=en', headers={'If-None-Match': response.headers['ETag']})
+        assert again.status_code == 304
+
+    def test_paginated_quotes(self, client):
+        data = client.get('/api/quotes?lang=uk&page=2&per_page=5').get_json()
+        assert [q['id'] for q in data['quotes']] == [6, 7, 8, 9, 10]
+
+    def test_invalid_parameters(self, client):
+        assert client.get('/api/quotes/daily?lang=xx').status_code == 400
+        assert client.get('/api/quotes?page=abc').status_code == 400
+
+
+class TestTranslationCatalogs:
+    """Integration тести: сторінка вантажить лише активну мову."""
+
+    def test_page_does_not_embed_catalogs_or_quotes(self, client, app_with_db):
+        html = client.get('/about').get_data(as_text=True)
+        assert 'translations/quotes.js' not in html
+        assert 'I18N_CATALOGS' in html
+        assert '/i18n/uk.js?v=' in html
+
+    def test_catalog_script_matches_json(self, client, app_with_db):
+        html = client.get('/about').get_data(as_text=True)
+        start = html.index('/i18n/en.js?v=')
+        url = html[start:html.index('"', start)]
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+        body = response.get_data(as_text=True)
+        payload = body[body.index(',{') + 1:body.rindex(');')]
+        catalog_url = json.loads(html[html.index('window.I18N_CATALOGS = ') + 23:].split(';', 1)[0])['en']
+        catalog = client.get(catalog_url)
+        assert json.loads(payload) == catalog.get_json()
+        catalog.close()
@@ -0,0 +1,141 @@
+"""
+Тести маршрутизації читань на репліку (replica_routing.py) з двома SQLite-файлами.
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+
+import replica_routing
+from app import db
+from models import MoodEntry
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture
+def replica(app_with_db, tmp_path):
+    """Репліка — окремий SQLite-файл, який оновлюється лише через sync()."""
+    path = str(tmp_path / 'replica.db')
+    engine = create_engine(f'sqlite:///{path}')
+    router = replica_routing.get_router(app_with_db)
+    saved = router.engines
+
+    def sync():
+        db.session.commit()
+        source = sqlite3.connect(db.engine.url.database)
+        target = sqlite3.connect(path)
+        try:
+            source.backup(target)
+        finally:
+            source.close()
+            target.close()
+
+    router.engines = {'replica_1': engine}
+    router.routed.clear()
+    router._down_until.clear()
+    yield sync
+    router.engines = saved
+    router._down_until.clear()
+    engine.dispose()
+
+
+def add_entry(user_id, title, day):
+    db.session.add(MoodEntry(user_id=user_id, mood='happy', title=title, date=date(2026, 3, day)))
+    db.session.commit()
+
+
+def titles(client):
+    response = client.get('/api/journal')
+    assert response.status_code == 200
+    return sorted(entry['title'] for entry in response.get_json())
+
+
+class TestRouting:
+    """Читання GET з репліки, записи та read-your-writes — з primary."""
+
+    def test_reads_from_replica_until_write(self, logged_in_client_db, real_user, replica, app_with_db):
+        add_entry(real_user, 'A', 1)
+        replica()
+        # Запис, якого репліка ще не отримала
+        add_entry(real_user, 'B', 2)
+        assert titles(logged_in_client_db) == ['A']
+
+        response = logged_in_client_db.post('/api/journal', json={'mood': 'calm', 'date': '2026-03-03', 'title': 'C'})
+        assert response.status_code == 200
+        sticky = [h for h in response.headers.getlist('Set-Cookie') if h.startswith(replica_routing.STICKY_COOKIE)]
+        assert len(sticky) == 1 and 'Max-Age=5' in sticky[0] and 'HttpOnly' in sticky[0]
+        # Протягом вікна липкості — свої записи видно (primary)
+        assert titles(logged_in_client_db) == ['A', 'B', 'C']
+
+        logged_in_client_db.delete_cookie(replica_routing.STICKY_COOKIE)
+        assert titles(logged_in_client_db) == ['A']
+        routed = replica_routing.get_router(app_with_db).routed
+        assert routed['replica_1'] == 2 and routed['sticky'] == 1
+
+    def test_reads_without_writes_set_no_cookie(self, logged_in_client_db, real_user, replica):
+        replica()
+        logged_in_client_db.get('/api/journal')
+        assert logged_in_client_db.get_cookie(replica_routing.STICKY_COOKIE) is None
+
+    def test_marked_views(self, app_with_db, replica):
+        router = replica_routing.get_router(app_with_db)
+        with app_with_db.test_request_context('/api/tasks/1'):
+            assert router.choose() is None
+        with app_with_db.test_request_context('/api/journal', method='POST'):
+            assert router.choose() is None
+        with app_with_db.test_request_context('/api/journal'):
+            assert router.choose() is router.engines['replica_1']
+
+    def test_down_replica_falls_back_to_primary(self, logged_in_client_db, real_user, replica, app_with_db):
+        add_entry(real_user, 'A', 1)
+        router = replica_routing.get_router(app_with_db)
+        router.mark_down('replica_1')
+        # Репліка порожня, але виключена — читання з primary
+        assert titles(logged_in_client_db) == ['A']
+        assert router.routed == {'fallback': 1}
+
+    def test_connection_error_marks_replica_down(self, app_with_db, tmp_path):
+        router = replica_routing.ReplicaRouter(app_with_db)
+        engine = create_engine(f'sqlite:///{tmp_path}/missing/dir/replica.db')
+        router.engines = {'replica_1': engine}
+        replica_routing._watch(router, 'replica_1', engine)
+        with pytest.raises(Exception):
+            engine.connect()
+        assert router.available() == []
+        engine.dispose()
+
+
+class TestWithoutReplicas:
+    """Без DB_REPLICA_URLS усе йде на primary."""
+
+    def test_primary_only(self, logged_in_client_db, real_user, app_with_db):
+        assert replica_routing.get_router(app_with_db).engines == {}
+        add_entry(real_user, 'A', 1)
+        assert titles(logged_in_client_db) == ['A']
+        logged_in_client_db.post('/api/journal', json={'mood': 'calm', 'date': '2026-03-03', 'title': 'C'})
+        assert logged_in_client_db.get_cookie(replica_routing.STICKY_COOKIE) is None
+
+    def test_replica_binds(self):
+        binds = replica_routing.replica_binds(['postgresql://u@r1/db', 'sqlite:////tmp/r2.db'],
+                                              {'DB_REPLICA_STATEMENT_TIMEOUT_MS': 60000})
+        assert list(binds) == ['replica_1', 'replica_2']
+        assert binds['replica_1']['url'] == 'postgresql://u@r1/db'
+        assert binds['replica_1']['connect_args']['options'] == '-c statement_timeout=60000'
+        assert binds['replica_1']['pool_pre_ping'] is True
+        assert set(binds['replica_2']) == {'url', 'poolclass'}
+
+    def test_session_class(self, app_with_db):
+        assert isinstance(db.session(), replica_routing.RoutingSession)
+
+    def test_models_do_not_import_routing(self):
+        code = ('import sys, models; '
+                'print(sorted(m for m in ("replica_routing", "db_pool", "metrics", "session_policy", '
+                '"server_profile") if m in sys.modules))')
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == '[]'
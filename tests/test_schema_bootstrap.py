@@ -0,0 +1,65 @@
+"""
+Тести одноразового розгортання схеми (schema_bootstrap.py) та швидкого старту.
+"""
+
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine, inspect, text
+
+from app import app, db
+import schema_bootstrap
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+class TestSchemaBootstrap:
+    """Integration тести для bootstrap()."""
+
+    def test_bootstrap_is_idempotent(self, app_with_db, tmp_path):
+        lock_path = tmp_path / 'bootstrap.lock'
+        app_with_db.config['SCHEMA_LOCK_FILE'] = str(lock_path)
+        try:
+            db.drop_all()
+            schema_bootstrap.bootstrap(app_with_db)
+            schema_bootstrap.bootstrap(app_with_db)
+        finally:
+            app_with_db.config['SCHEMA_LOCK_FILE'] = None
+
+        tables = inspect(db.engine).get_table_names()
+        assert {'users', 'mood_entries', 'entitlements'} <= set(tables)
+        columns = {col['name'] for col in inspect(db.engine).get_columns('users')}
+        assert 'advice_unlock_once' in columns
+        assert lock_path.exists()
+
+    def test_session_setting_only_inside_block(self, tmp_path):
+        # Як SET statement_timeout = 0 на PostgreSQL: діє на з'єднання з пулу лише в межах блоку
+        engine = create_engine(f"sqlite:///{tmp_path / 'setting.db'}")
+        with schema_bootstrap._session_setting(engine, 'PRAGMA cache_size = 123'):
+            with engine.connect() as conn:
+                assert conn.execute(text('PRAGMA cache_size')).scalar() == 123
+        with engine.connect() as conn:
+            assert conn.execute(text('PRAGMA cache_size')).scalar() != 123
+        engine.dispose()
+
+
+class TestFastImport:
+    """Імпорт app.py без побічних ефектів."""
+
+    def test_import_does_not_load_flasgger_or_touch_db(self, tmp_path):
+        db_path = tmp_path / 'fresh.db'
+        code = ('import sys, app; '
+                'print("flasgger" in sys.modules, "flask_marshmallow" in sys.modules)')
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{db_path}')
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True)
+        assert out.stdout.split()[-2:] == ['False', 'False']
+        # Схема розгортається лише явною командою
+        assert not db_path.exists()
+
+    def test_swagger_spec_is_built_lazily(self, client):
+        response = client.get('/apispec.json')
+        assert response.status_code == 200
+        assert '/api/products' in response.get_json()['paths']
+        assert client.get('/api/docs').status_code == 200
@@ -0,0 +1,68 @@
+"""
+Тести production-профілю gunicorn (server_profile.py).
+"""
+
+import gc
+
+import pytest
+
+import server_profile
+from models import db
+
+ENV_KEYS = ('SERVER_MODE', 'WEB_CONCURRENCY', 'GUNICORN_THREADS', 'GUNICORN_WORKER_CLASS',
+            'GUNICORN_MAX_REQUESTS', 'GUNICORN_MAX_REQUESTS_JITTER')
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for key in ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
+class TestServerProfile:
+    """Unit тести для розрахунку воркерів і хуків fork."""
+
+    def test_database_backend(self):
+        assert server_profile.database_backend('sqlite:///data/x.db') == 'sqlite'
+        assert server_profile.database_backend('') == 'sqlite'
+        assert server_profile.database_backend('postgres://u@h/db') == 'postgresql'
+        assert server_profile.database_backend('postgresql+psycopg2://u@h/db') == 'postgresql'
+        assert server_profile.database_backend('mysql+pymysql://u@h/db') == 'mysql'
+
+    def test_sqlite_limits_processes(self, clean_env):
+        profile = server_profile.recommended('sqlite', cpus=8)
+        assert profile == {'workers': 2, 'threads': 4, 'worker_class': 'gthread'}
+        assert server_profile.recommended('sqlite', cpus=1)['workers'] == 1
+
+    def test_postgres_scales_with_cpu(self, clean_env):
+        profile = server_profile.recommended('postgresql', cpus=4)
+        assert profile == {'workers': 9, 'threads': 2, 'worker_class': 'gthread'}
+
+    def test_env_overrides(self, clean_env):
+        clean_env.setenv('WEB_CONCURRENCY', '3')
+        clean_env.setenv('GUNICORN_THREADS', '1')
+        assert server_profile.recommended('postgresql', cpus=4) == {
+            'workers': 3, 'threads': 1, 'worker_class': 'sync'}
+        clean_env.setenv('WEB_CONCURRENCY', 'abc')
+        assert server_profile.recommended('postgresql', cpus=4)['workers'] == 9
+
+    def test_recycling(self, clean_env):
+        assert server_profile.recycling() == {'max_requests': 1000, 'max_requests_jitter': 100}
+        clean_env.setenv('GUNICORN_MAX_REQUESTS', '0')
+        assert server_profile.recycling()['max_requests'] == 0
+
+    def test_freeze_heap(self):
+        try:
+            assert server_profile.freeze_heap() > 0
+        finally:
+            gc.unfreeze()
+
+    def test_dispose_engines_resets_pool(self, app_with_db):
+        with app_with_db.app_context():
+            db.session.execute(db.text('SELECT 1'))
+            db.session.remove()
+            engine = db.engine
+            pool_before = engine.pool
+        server_profile.dispose_engines(app_with_db)
+        assert engine.pool is not pool_before
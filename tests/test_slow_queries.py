@@ -0,0 +1,156 @@
+"""
+Тести журналу повільних SQL-запитів (slow_queries.py) і /metrics.
+"""
+
+from datetime import date
+
+import pytest
+
+import slow_queries
+from app import db
+from models import MoodEntry
+
+
+@pytest.fixture
+def slow_log(app_with_db):
+    log = slow_queries.get_log(app_with_db)
+    log.clear()
+    log.threshold_ms = 0.0
+    yield log
+    log.threshold_ms = app_with_db.config['SLOW_QUERY_THRESHOLD_MS']
+    log.clear()
+
+
+class TestFingerprint:
+    """Тести нормалізації тексту запиту."""
+
+    def test_literals_and_placeholders(self):
+        a = slow_queries.fingerprint("SELECT * FROM users WHERE email = 'a@b.c' AND id = 42 -- note")
+        b = slow_queries.fingerprint("SELECT *  FROM users\n WHERE email = ? AND id = :id_1")
+        assert a == b == 'SELECT * FROM users WHERE email = ? AND id = ?'
+
+    def test_in_lists_and_values_collapse(self):
+        short = slow_queries.fingerprint('SELECT id FROM t WHERE id IN (%(p1)s, %(p2)s)')
+        long = slow_queries.fingerprint('SELECT id FROM t WHERE id IN ($1, $2, $3, $4)')
+        assert short == long == 'SELECT id FROM t WHERE id IN (...)'
+        rows = slow_queries.fingerprint('INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)')
+        assert rows == 'INSERT INTO t (a, b) VALUES (...)'
+
+    def test_identifiers_and_casts_are_kept(self):
+        text = slow_queries.fingerprint('SELECT anon_1.c2, x::text FROM t1 AS anon_1 LIMIT 10')
+        assert text == 'SELECT anon_1.c2, x::text FROM t1 AS anon_1 LIMIT ?'
+
+
+class TestSlowQueryLog:
+    """Тести агрегації, EXPLAIN та адмін-API."""
+
+    def test_threshold_filters_fast_queries(self, app_with_db, slow_log):
+        slow_log.threshold_ms = 10_000
+        db.session.execute(db.text('SELECT 1')).all()
+        assert len(slow_log) == 0
+
+    def test_month_filter_aggregated_with_plan(self, logged_in_client_db, real_user, slow_log):
+        db.session.add(MoodEntry(user_id=real_user, mood='happy', title='Тест', date=date(2026, 3, 5)))
+        db.session.commit()
+        slow_log.clear()
+
+        for month in ('2026-03', '2026-04', '2026-03'):
+            assert logged_in_client_db.get(f'/api/journal?month={month}').status_code == 200
+
+        entries = [e for e in slow_log.snapshot() if 'FROM mood_entries' in e['fingerprint']
+                   and 'STRFTIME' in e['fingerprint']]
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry['count'] == 3
+        assert entry['endpoints'] == {'list_entries': 3}
+        assert entry['max_ms'] >= entry['mean_ms'] > 0
+        # План SQLite: повне сканування або пошук за індексом
+        assert entry['plan'] and any('mood_entries' in line for line in entry['plan'])
+        assert entry['plan_error'] is None
+
+    def test_explain_only_on_first_sighting(self, app_with_db, slow_log):
+        calls = []
+
+        def explainer():
+            calls.append(1)
+            return ['SCAN t'], None
+
+        for value in (1, 2, 3):
+            slow_log.record(f'SELECT * FROM t WHERE id = {value}', 5.0, explainer=explainer)
+        slow_log.record('UPDATE t SET a = 1', 5.0, explainer=explainer)
+        assert len(calls) == 1
+        assert slow_log.snapshot(sort='count')[0]['plan'] == ['SCAN t']
+
+    def test_max_fingerprints(self, app_with_db, slow_log):
+        slow_log.max_fingerprints = 2
+        try:
+            for table in ('a', 'b', 'c'):
+                slow_log.record(f'SELECT * FROM {table}', 1.0)
+            assert len(slow_log) == 2
+            assert slow_log.dropped == 1
+        finally:
+            slow_log.max_fingerprints = app_with_db.config['SLOW_QUERY_MAX_FINGERPRINTS']
+
+    def test_failed_statement_does_not_break_timing(self, app_with_db, slow_log):
+        with pytest.raises(Exception):
+            db.session.execute(db.text('SELECT * FROM missing_table')).all()
+        db.session.rollback()
+        db.session.execute(db.text('SELECT 2')).all()
+        connection = db.session.connection()
+        assert not connection.info.get(slow_queries._STARTED_KEY)
+
+    def test_admin_endpoint(self, logged_in_admin_client_db, slow_log):
+        slow_log.record('SELECT * FROM t WHERE id = 1', 50.0)
+        slow_log.record('SELECT * FROM t WHERE id = 2', 150.0)
+        slow_log.threshold_ms = 10_000
+
+        response = logged_in_admin_client_db.get('/api/admin/slow-queries?sort=max_ms')
+        assert response.status_code == 200
+        data = response.get_json()
+        query = next(q for q in data['queries'] if q['fingerprint'] == 'SELECT * FROM t WHERE id = ?')
+        assert query['count'] == 2
+        assert query['total_ms'] == 200.0
+        assert query['max_ms'] == 150.0
+
+        assert logged_in_admin_client_db.get('/api/admin/slow-queries?sort=bogus').status_code == 400
+        assert logged_in_admin_client_db.delete('/api/admin/slow-queries').status_code == 200
+        assert len(slow_log) == 0
+
+    def test_admin_endpoint_requires_admin(self, logged_in_client_db, slow_log):
+        assert logged_in_client_db.get('/api/admin/slow-queries').status_code == 403
+
+
+class TestMetrics:
+    """Тести /metrics."""
+
+    def test_slow_query_metrics(self, client, app_with_db, slow_log, metrics_auth):
+        slow_log.record('SELECT * FROM t WHERE id = 1', 250.0)
+        slow_log.threshold_ms = 10_000
+        key = slow_log.snapshot()[0]['id']
+
+        response = client.get('/metrics', headers=metrics_auth)
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+        body = response.get_data(as_text=True)
+        assert '# TYPE dailymood_slow_queries_total counter' in body
+        assert f'dailymood_slow_queries_total{{fingerprint="{key}",pid=' in body
+        assert 'dailymood_slow_query_max_seconds{' in body and '} 0.25' in body
+        # Скрейп не створює сесію
+        assert 'Set-Cookie' not in response.headers
+
+    def test_anonymous_rejected_by_default(self, client, app_with_db):
+        # METRICS_TOKEN не задано — метрики закриті для всіх, а не відкриті
+        assert app_with_db.config.get('METRICS_TOKEN') is None
+        response = client.get('/metrics')
+        assert response.status_code == 401
+        assert 'dailymood_' not in response.get_data(as_text=True)
+        assert client.get('/metrics', headers={'Authorization': 'Bearer '}).status_code == 401
+
+    def test_token(self, client, app_with_db):
+        app_with_db.config['METRICS_TOKEN'] = 'scrape-token'
+        try:
+            assert client.get('/metrics').status_code == 401
+            ok = client.get('/metrics', headers={'Authorization': 'Bearer scrape-token'})
+            assert ok.status_code == 200
+        finally:
+            app_with_db.config['METRICS_TOKEN'] = None
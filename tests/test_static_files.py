@@ -0,0 +1,93 @@
+"""
+Тести класифікації запитів (session_policy.py) та віддачі статики
+(static_files.py): без сесії, immutable-кеш, стиснуті варіанти.
+"""
+
+import gzip
+
+import pytest
+from app import app
+import assets
+import session_policy
+
+
+@pytest.fixture
+def static_dir(tmp_path, app_with_db):
+    """Тимчасова папка статики з файлом та його .gz-варіантом."""
+    (tmp_path / 'app.js').write_text('console.log("hi");\n' * 50)
+    (tmp_path / 'app.js.gz').write_bytes(gzip.compress((tmp_path / 'app.js').read_bytes()))
+    (tmp_path / 'plain.css').write_text('body { color: red; }')
+    original = app.static_folder
+    app.static_folder = str(tmp_path)
+    yield tmp_path
+    app.static_folder = original
+
+
+class TestRequestClassification:
+    """Unit тести для classify()."""
+
+    @pytest.mark.parametrize('path,method,expected', [
+        ('/static/style.css', 'GET', 'static'),
+        ('/flasgger_static/swagger-ui.css', 'GET', 'static'),
+        ('/health', 'GET', 'health'),
+        ('/api/products', 'GET', 'public'),
+        ('/api/products', 'POST', 'app'),
+        ('/api/me', 'GET', 'app'),
+    ])
+    def test_classify(self, path, method, expected):
+        assert session_policy.classify(path, method) == expected
+
+
+class TestSessionlessRequests:
+    """Integration тести: сесія не читається і cookie не ставиться."""
+
+    def test_health_does_not_open_session(self, client, monkeypatch):
+        """Запит /health не звертається до сховища сесій."""
+        def fail(*args, **kwargs):
+            raise AssertionError('session opened')
+        monkeypatch.setattr(app.session_interface.inner, 'open_session', fail)
+
+        response = client.get('/health')
+        assert response.status_code == 200
+        assert 'Set-Cookie' not in response.headers
+
+    def test_public_catalog_ignores_session(self, logged_in_client_db):
+        """GET /api/products працює без сесії і не оновлює cookie."""
+        response = logged_in_client_db.get('/api/products')
+        assert response.status_code == 200
+        assert 'Set-Cookie' not in response.headers
+
+
+class TestStaticFiles:
+    """Integration тести для заголовків та стиснутих варіантів статики."""
+
+    def test_versioned_url_is_immutable(self, client, static_dir, monkeypatch):
+        digest = assets.file_hash(static_dir / 'plain.css')
+        monkeypatch.setitem(app.extensions['assets'].hashes, 'plain.css', digest)
+        response = client.get(f'/static/plain.css?v={digest}')
+        assert response.status_code == 200
+        assert response.cache_control.immutable
+        assert response.cache_control.max_age == 31536000
+        assert 'Set-Cookie' not in response.headers
+
+    def test_stale_version_is_not_immutable(self, client, static_dir, monkeypatch):
+        monkeypatch.setitem(app.extensions['assets'].hashes, 'plain.css', assets.file_hash(static_dir / 'plain.css'))
+        for url in ('/static/plain.css?v=abc123', '/static/app.js?v=abc123'):
+            response = client.get(url, headers={'Accept-Encoding': 'identity'})
+            assert response.status_code == 200
+            assert not response.cache_control.immutable
+            assert response.cache_control.max_age == app.config['STATIC_MAX_AGE']
+            response.close()
+
+    def test_serves_gzip_variant_when_accepted(self, client, static_dir):
+        response = client.get('/static/app.js', headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.mimetype in ('text/javascript', 'application/javascript')
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert gzip.decompress(response.data) == (static_dir / 'app.js').read_bytes()
+
+    def test_serves_plain_file_without_accept_encoding(self, client, static_dir):
+        response = client.get('/static/app.js', headers={'Accept-Encoding': 'identity'})
+        assert 'Content-Encoding' not in response.headers
+        assert response.data == (static_dir / 'app.js').read_bytes()
+        response.close()
@@ -0,0 +1,121 @@
+"""
+Тести персистентної черги фонових задач (task_queue.py) та ендпоінтів,
+які ставлять роботу в чергу і повертають 202.
+"""
+
+from app import db
+from models import User, Product, Order, OrderItem, BackgroundTask
+import task_queue
+
+
+_calls = []
+
+
+@task_queue.task('tests.flaky', max_attempts=2)
+def _flaky_task(fail=False):
+    _calls.append(fail)
+    if fail:
+        raise RuntimeError('boom')
+    return {'ok': True}
+
+
+class TestTaskQueue:
+    """Unit тести для enqueue / claim / retry."""
+
+    def test_enqueue_with_key_is_idempotent(self, app_with_db):
+        """Повторний enqueue з тим самим ключем повертає ту саму задачу."""
+        app_with_db.config['TASK_QUEUE_EAGER'] = False
+        try:
+            first = task_queue.enqueue('tests.flaky', {}, key='same-key')
+            second = task_queue.enqueue('tests.flaky', {}, key='same-key')
+            assert first.id == second.id
+            assert BackgroundTask.query.count() == 1
+        finally:
+            app_with_db.config['TASK_QUEUE_EAGER'] = True
+
+    def test_worker_claims_and_runs_task(self, app_with_db):
+        """Воркер забирає задачу з черги та зберігає результат."""
+        app_with_db.config['TASK_QUEUE_EAGER'] = False
+        try:
+            job = task_queue.enqueue('tests.flaky', {})
+            assert task_queue.process_one('test-worker') is True
+            job = db.session.get(BackgroundTask, job.id)
+            assert job.status == 'succeeded'
+            assert job.to_dict()['result'] == {'ok': True}
+            # Черга порожня — наступний виклик нічого не бере
+            assert task_queue.process_one('test-worker') is False
+        finally:
+            app_with_db.config['TASK_QUEUE_EAGER'] = True
+
+    def test_failed_task_is_retried_with_backoff(self, app_with_db):
+        """Задача, що впала, повертається в чергу з затримкою, потім стає failed."""
+        job = task_queue.enqueue('tests.flaky', {'fail': True})
+        job = db.session.get(BackgroundTask, job.id)
+        assert job.status == 'queued'
+        assert job.attempts == 1
+        assert 'boom' in job.last_error
+
+        # Затримка ще не минула — задачу не можна забрати
+        assert task_queue.claim_next('test-worker') is None
+
+        task_queue.run_task(job, 'test-worker')
+        job = db.session.get(BackgroundTask, job.id)
+        assert job.status == 'failed'
+        assert job.attempts == 2
+
+    def test_failed_task_with_key_is_requeued(self, app_with_db):
+        """Повтор з ключем остаточно впалої задачі перезапускає її, а не повертає мертву."""
+        job = task_queue.enqueue('tests.flaky', {'fail': True}, key='retry-key')
+        task_queue.run_task(db.session.get(BackgroundTask, job.id), 'test-worker')
+        assert db.session.get(BackgroundTask, job.id).status == 'failed'
+
+        again = task_queue.enqueue('tests.flaky', {'fail': False}, key='retry-key')
+        assert again.id == job.id
+        assert again.status == 'succeeded'
+        assert again.attempts == 1
+        assert BackgroundTask.query.count() == 1
+        # Виконану задачу повтор не перезапускає
+        assert task_queue.enqueue('tests.flaky', {'fail': True}, key='retry-key').status == 'succeeded'
+
+
+class TestAsyncEndpoints:
+    """Integration тести для ендпоінтів, що повертають 202."""
+
+    def test_create_payment_returns_202(self, logged_in_client_db, real_user, app_with_db):
+        """POST /api/payments ставить платіж у чергу та повертає status_url."""
+        product = Product(name='Тема', slug='theme', type='theme', price=10.0)
+        db.session.add(product)
+        db.session.flush()
+        order = Order(user_id=real_user, status='new', total_amount=10.0)
+        db.session.add(order)
+        db.session.flush()
+        db.session.add(OrderItem(order_id=order.id, product_id=product.id,
+                                 quantity=1, unit_price=10.0, subtotal=10.0))
+        db.session.commit()
+
+        response = logged_in_client_db.post('/api/payments', json={
+            'order_id': order.id,
+            'payment_method': 'paypal'
+        })
+        assert response.status_code == 202
+        data = response.get_json()
+        assert data['status_url'] == f"/api/payments/{data['payment']['id']}"
+
+        status = logged_in_client_db.get(data['status_url']).get_json()
+        assert status['payment']['status'] == 'completed'
+
+    def test_admin_delete_user_returns_202(self, logged_in_admin_client_db, app_with_db):
+        """DELETE /api/admin/users/<id> ставить видалення у чергу."""
+        victim = User(email='victim@test.com')
+        victim.set_password('password123')
+        db.session.add(victim)
+        db.session.commit()
+        victim_id = victim.id
+
+        response = logged_in_admin_client_db.delete(f'/api/admin/users/{victim_id}')
+        assert response.status_code == 202
+        data = response.get_json()
+
+        task = logged_in_admin_client_db.get(data['status_url']).get_json()['task']
+        assert task['status'] == 'succeeded'
+        assert db.session.get(User, victim_id) is None
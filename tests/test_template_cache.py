@@ -0,0 +1,48 @@
+"""
+Тести кешу байткоду та прогріву шаблонів (template_cache.py).
+"""
+
+import os
+
+from flask import Flask
+
+from app import app
+import template_cache
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def make_app(cache_dir):
+    """Мінімальний додаток з тими ж шаблонами, що й app.py."""
+    bare = Flask('app', root_path=ROOT)
+    bare.config['TEMPLATE_CACHE_DIR'] = str(cache_dir)
+    return bare
+
+
+class TestTemplateCache:
+    """Unit тести для precompile / warmup."""
+
+    def test_precompile_writes_bytecode_for_all_templates(self, tmp_path):
+        bare = make_app(tmp_path)
+        count, _ = template_cache.precompile(bare)
+        assert count == len(template_cache.template_names(bare))
+        assert 'base.html' in template_cache.template_names(bare)
+        assert len(list(tmp_path.iterdir())) == count
+
+    def test_warmup_loads_from_precompiled_cache(self, tmp_path):
+        template_cache.precompile(make_app(tmp_path))
+        fresh = make_app(tmp_path)
+        template_cache.init_app(fresh)
+        # Новий процес: шаблон береться з байткоду, а не компілюється
+        fresh.jinja_env.compile = None
+        count, _ = template_cache.warmup(fresh)
+        assert count == len(template_cache.template_names(fresh))
+
+    def test_disabled_cache_leaves_environment_untouched(self, tmp_path):
+        bare = make_app(tmp_path)
+        bare.config['TEMPLATE_BYTECODE_CACHE'] = False
+        assert template_cache.init_app(bare) is None
+        assert bare.jinja_env.bytecode_cache is None
+
+    def test_app_uses_bytecode_cache(self):
+        assert app.jinja_env.bytecode_cache is not None
@@ -0,0 +1,274 @@
+"""
+Тести трасування запитів (tracing.py).
+"""
+
+import json
+import threading
+from datetime import date
+from types import SimpleNamespace
+from wsgiref.simple_server import make_server, WSGIRequestHandler
+
+import pytest
+from flask import Flask
+
+import tracing
+from app import db
+from models import MoodEntry
+
+
+@pytest.fixture
+def tracer(app_with_db, tmp_path, monkeypatch):
+    """Трасувальник застосунку, що деталізує кожен запит і пише у тимчасовий файл."""
+    tracer = app_with_db.extensions['tracing']
+    monkeypatch.setattr(tracer, 'sample_rate', 1.0)
+    monkeypatch.setattr(tracer, 'slow_paths', {})
+    monkeypatch.setattr(tracer.exporter, 'kind', 'file')
+    monkeypatch.setattr(tracer.exporter, 'path', str(tmp_path / 'traces.jsonl'))
+    yield tracer
+    tracer.exporter.flush()
+
+
+def fetch(client, method, path, **kwargs):
+    # Тестовий клієнт не закриває тіло відповіді — сервер закриває його завжди
+    response = client.open(path, method=method, **kwargs)
+    response.close()
+    return response
+
+
+def exported(tracer):
+    tracer.exporter.flush()
+    spans = []
+    with open(tracer.exporter.path, encoding='utf-8') as fh:
+        for line in fh:
+            payload = json.loads(line)
+            resource = payload['resourceSpans'][0]
+            assert {'key': 'service.name', 'value': {'stringValue': 'dailymood'}} in resource['resource']['attributes']
+            spans.extend(resource['scopeSpans'][0]['spans'])
+    return spans
+
+
+def attributes(span):
+    return {a['key']: next(iter(a['value'].values())) for a in span['attributes']}
+
+
+def children(spans, parent):
+    return [s for s in spans if s['parentSpanId'] == parent['spanId']]
+
+
+class TestRequestId:
+    """Тести X-Request-ID."""
+
+    def test_propagated_and_generated(self, client, tracer):
+        assert fetch(client, 'GET', '/health', headers={'X-Request-ID': 'req-42'}).headers['X-Request-ID'] == 'req-42'
+        generated = fetch(client, 'GET', '/health').headers['X-Request-ID']
+        assert len(generated) == 32
+        # Надто довге значення замінюється новим
+        assert fetch(client, 'GET', '/health', headers={'X-Request-ID': 'x' * 200}).headers['X-Request-ID'] != 'x' * 200
+
+    def test_health_not_traced(self, client, tracer):
+        decisions = sum(tracer.decisions.values())
+        fetch(client, 'GET', '/health')
+        assert sum(tracer.decisions.values()) == decisions
+
+
+class TestSpans:
+    """Тести спанів фаз запиту."""
+
+    def test_journal_phases(self, logged_in_client_db, real_user, tracer):
+        for day in (1, 2, 3):
+            db.session.add(MoodEntry(user_id=real_user, mood='happy', title=f'День {day}', date=date(2026, 3, day)))
+        db.session.commit()
+
+        fetch(logged_in_client_db, 'GET', '/api/journal', headers={'X-Request-ID': 'journal-1'})
+        spans = exported(tracer)
+        root = next(s for s in spans if s['name'] == 'GET /api/journal')
+        assert root['kind'] == tracing.KIND_SERVER
+        assert root['parentSpanId'] == ''
+        assert attributes(root)['http.request_id'] == 'journal-1'
+        assert attributes(root)['http.status_code'] == '200'
+
+        phases = [s['name'] for s in children(spans, root)]
+        assert phases == ['session.open', 'flask.before_request', 'handler list_entries', 'flask.after_request']
+
+        before = next(s for s in spans if s['name'] == 'flask.before_request')
+        assert [s['name'] for s in children(spans, before)] == ['db.query']
+
+        handler = next(s for s in spans if s['name'] == 'handler list_entries')
+        handler_children = children(spans, handler)
+        query = next(s for s in handler_children if s['name'] == 'db.query')
+        assert query['kind'] == tracing.KIND_CLIENT
+        assert 'FROM mood_entries' in attributes(query)['db.statement']
+        serialize = [s for s in handler_children if s['name'] == 'serialize.to_dict']
+        # Три послідовні to_dict() — один спан з лічильником
+        assert len(serialize) == 1
+        assert attributes(serialize[0]) == {'model': 'MoodEntry', 'dailymood.coalesced_count': '3'}
+        assert any(s['name'] == 'serialize.json' for s in handler_children)
+
+        for span in spans:
+            assert int(span['endTimeUnixNano']) >= int(span['startTimeUnixNano'])
+            if span['parentSpanId']:
+                parent = next(s for s in spans if s['spanId'] == span['parentSpanId'])
+                assert int(parent['startTimeUnixNano']) <= int(span['startTimeUnixNano'])
+                assert int(span['endTimeUnixNano']) <= int(parent['endTimeUnixNano'])
+
+    def test_validation_and_template_spans(self, logged_in_client_db, tracer):
+        fetch(logged_in_client_db, 'POST', '/api/journal',
+              json={'mood': 'happy', 'date': '2026-03-01', 'title': 'Тест'})
+        fetch(logged_in_client_db, 'GET', '/statistics')
+        names = [s['name'] for s in exported(tracer)]
+        assert 'validate' in names
+        assert 'template.render' in names
+        assert 'session.save' in names
+
+    def test_v2_validation_span(self, logged_in_client_db, tracer):
+        fetch(logged_in_client_db, 'POST', '/api/v2/journal', json={'mood': 'happy', 'date': '2026-03-01'})
+        validate = next(s for s in exported(tracer) if s['name'] == 'validate')
+        assert attributes(validate)['schema'] == 'CreateJournalEntrySchema'
+
+    def test_traceparent(self, client, tracer):
+        trace_id = '4bf92f3577b34da6a3ce929d0e0e4736'
+        upstream_id = '0' * 31 + '1'
+        fetch(client, 'GET', '/api/products', headers={'traceparent': f'00-{trace_id}-00f067aa0ba902b7-01'})
+        tracer.sample_rate = 0.0
+        fetch(client, 'GET', '/api/products', headers={'traceparent': f'00-{upstream_id}-00f067aa0ba902b7-01'})
+        spans = exported(tracer)
+        root = next(s for s in spans if s['traceId'] == trace_id and s['name'] == 'GET /api/products')
+        assert root['parentSpanId'] == '00f067aa0ba902b7'
+        # Прапорець sampled від клієнта зберігає трасу попри TRACING_SAMPLE_RATE=0
+        assert any(s['traceId'] == upstream_id for s in spans)
+
+
+class TestTailSampling:
+    """Тести рішень семплування."""
+
+    def test_fast_requests_dropped(self, client, tracer):
+        tracer.sample_rate = 0.0
+        dropped = tracer.decisions['dropped']
+        fetch(client, 'GET', '/api/products')
+        tracer.exporter.flush()
+        assert tracer.decisions['dropped'] == dropped + 1
+
+    def test_unsampled_requests_record_root_only(self, logged_in_client_db, tracer, monkeypatch):
+        tracer.sample_rate = 0.0
+        finished = []
+        finish = tracer.finish
+        monkeypatch.setattr(tracer, 'finish', lambda trace: finished.append(trace) or finish(trace))
+        fetch(logged_in_client_db, 'GET', '/api/journal')
+        trace, = finished
+        assert trace.detail is None
+        # Обгортки й слухачі (сесія, SQL, to_dict) спанів не створили
+        assert trace.spans == [trace.root]
+        assert trace.route == '/api/journal'
+
+    def test_slow_requests_kept(self, client, tracer):
+        tracer.sample_rate = 0.0
+        tracer.slow_ms = 0.0
+        fetch(client, 'GET', '/api/products')
+        spans = exported(tracer)
+        # Повільний запит без деталізації — лише кореневий спан
+        assert len(spans) == 1
+        assert attributes(spans[0])['dailymood.sampling'] == 'slow'
+        assert attributes(spans[0])['dailymood.detail'] == 'root'
+
+        # Наступні запити на цей шлях деталізуються
+        fetch(client, 'GET', '/api/products')
+        spans = exported(tracer)
+        root = [s for s in spans if s['parentSpanId'] == ''][1]
+        assert attributes(root)['dailymood.detail'] == 'slow_path'
+        assert children(spans, root)
+        assert tracer.slow_paths['/api/products'] == tracer.slow_detail
+
+    def test_errors_kept(self, tracer):
+        tracer.sample_rate = 0.0
+        trace = tracing.Trace('err', 16)
+        trace.root.attributes = {'http.method': 'GET', 'http.target': '/boom'}
+        trace.status_code = 500
+        tracer.finish(trace)
+        assert trace.root.status == tracing.STATUS_ERROR
+        assert attributes(exported(tracer)[0])['dailymood.sampling'] == 'error'
+
+    def test_span_limit(self):
+        trace = tracing.Trace('limit', 3)
+        for _ in range(5):
+            trace.end_span(trace.start_span('db.query'))
+        assert len(trace.spans) == 3
+        assert trace.dropped == 3
+
+
+class TestDefaults:
+    """Що вмикається без TRACING_* у конфігурації."""
+
+    def make_app(self, **config):
+        app = Flask(__name__)
+        app.config.update(TRACING_EXPORTER='none', **config)
+
+        @app.route('/ping')
+        def ping():
+            return 'pong'
+
+        class Entry:
+            def to_dict(self):
+                return {}
+        model = SimpleNamespace(class_=Entry)
+        tracing.init_app(app, SimpleNamespace(Model=SimpleNamespace(registry=SimpleNamespace(mappers=[model]))))
+        return app, Entry
+
+    def test_enabled_by_default(self):
+        app, entry = self.make_app()
+        tracer = app.extensions['tracing']
+        assert tracer.enabled and tracer.sample_rate == tracing.DEFAULT_SAMPLE_RATE
+        assert entry.to_dict._traced
+
+    def test_disabled(self):
+        app, entry = self.make_app(TRACING_ENABLED=False)
+        assert not hasattr(entry.to_dict, '_traced')
+        # X-Request-ID повертається і без трасування
+        assert app.test_client().get('/ping').headers[tracing.REQUEST_ID_HEADER]
+
+    def test_serialize_spans_opt_out(self):
+        _, entry = self.make_app(TRACING_SERIALIZE_SPANS=False)
+        assert not hasattr(entry.to_dict, '_traced')
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class TestOtlpExport:
+    """Експорт OTLP/HTTP JSON на заглушку колектора."""
+
+    def test_post_to_collector(self, client, tracer):
+        received = []
+
+        def collector(environ, start_response):
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+            received.append((environ['PATH_INFO'], environ.get('CONTENT_TYPE'),
+                             json.loads(environ['wsgi.input'].read(length))))
+            start_response('200 OK', [('Content-Type', 'application/json')])
+            return [b'{}']
+
+        server = make_server('127.0.0.1', 0, collector, handler_class=QuietHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        saved = tracer.exporter.endpoint
+        tracer.exporter.kind = 'otlp'
+        tracer.exporter.endpoint = f'http://127.0.0.1:{server.server_port}/v1/traces'
+        try:
+            fetch(client, 'GET', '/api/products')
+            tracer.exporter.flush()
+        finally:
+            tracer.exporter.endpoint = saved
+            server.shutdown()
+        path, content_type, payload = received[0]
+        assert path == '/v1/traces' and content_type == 'application/json'
+        spans = payload['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert spans[0]['name'] == 'GET /api/products'
+
+    def test_metrics(self, client, tracer, metrics_auth):
+        fetch(client, 'GET', '/api/products')
+        tracer.exporter.flush()
+        body = fetch(client, 'GET', '/metrics', headers=metrics_auth).get_data(as_text=True)
+        assert 'dailymood_traces_total{decision="sampled",' in body
+        assert 'dailymood_traces_detailed_total{' in body
+        assert 'dailymood_trace_export_total{' in body
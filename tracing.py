@@ -0,0 +1,665 @@
+"""
+Трасування запитів: спани фаз обробки з tail-семплуванням.
+
+Модель даних сумісна з OpenTelemetry (trace id 16 байт, span id 8 байт,
+kind, атрибути, статус), експорт — у форматі OTLP/JSON:
+- 'file' — рядок ExportTraceServiceRequest на пакет у TRACING_FILE
+  (як file exporter OTel Collector), з ротацією за розміром;
+- 'otlp' — POST на TRACING_OTLP_ENDPOINT (OTLP/HTTP JSON,
+  http://collector:4318/v1/traces або будь-яка заглушка);
+- 'none' — лише рішення семплування та метрики.
+
+Ідентифікатор запиту береться з X-Request-ID (або генерується) і
+повертається у відповіді; trace id і батьківський спан — з W3C traceparent,
+якщо він є. Статика та /health не трасуються (X-Request-ID вони отримують).
+
+Спани створюються автоматично:
+- http.request (SERVER) — увесь запит у WSGI-обгортці, до закриття тіла;
+- session.open / session.save — інтерфейс сесії (filesystem);
+- flask.before_request (завантаження користувача), handler <endpoint>,
+  flask.after_request — обгортки методів Flask;
+- db.query (CLIENT) — кожен SQL-запит (події курсора SQLAlchemy);
+- template.render — сигнали рендеру Jinja;
+- serialize.to_dict — виклики to_dict() моделей (TRACING_SERIALIZE_SPANS=false
+  прибирає обгортку зовсім); послідовні виклики (список записів) зливаються
+  в один спан з лічильником;
+- serialize.json — jsonify;
+- validate — span() у validate_request_data.
+
+Два рівні деталізації, щоб постійно увімкнене трасування вкладалося в
+бюджет накладних витрат:
+- кожен запит — лише кореневий спан (час, маршрут, статус); обгортки й
+  слухачі бачать, що деталізації немає, і одразу викликають оригінал;
+- дочірні спани (включно з serialize.to_dict) — лише для підмножини, обраної
+  на початку запиту: upstream-прапорець sampled, імовірність
+  TRACING_SAMPLE_RATE або шлях, який нещодавно був повільним (наступні
+  TRACING_SLOW_DETAIL запитів на нього).
+
+Рішення про збереження приймається в кінці запиту (tail-based): повільні
+(>= TRACING_SLOW_MS) і 5xx/винятки зберігаються завжди — якщо запит не був
+деталізований, то лише кореневим спаном; решта — лише деталізовані
+семпловані. Експорт — у фоновому потоці через обмежену чергу (при
+переповненні траси відкидаються), тож запит платить лише за збір спанів у
+пам'яті. TRACING_ENABLED=false — лише X-Request-ID, без обгорток і слухачів.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import queue
+import random
+import re
+import socket
+import threading
+import time
+import urllib.request
+from functools import wraps
+
+from flask import before_render_template, request, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from werkzeug.wsgi import ClosingIterator
+
+import metrics
+import session_policy
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+REQUEST_ID_ENVIRON_KEY = 'dailymood.request_id'
+DEFAULT_SAMPLE_RATE = 0.01
+DEFAULT_SLOW_MS = 500.0
+DEFAULT_SLOW_DETAIL = 5
+MAX_SLOW_PATHS = 256
+DEFAULT_MAX_SPANS = 512
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_FILE_MAX_BYTES = 50 * 1024 * 1024
+MAX_STATEMENT_LENGTH = 1000
+EXPORT_BATCH = 64
+# Пауза між викликами to_dict(), до якої вони зливаються в один спан (нс)
+COALESCE_GAP_NS = 1_000_000
+SERIALIZE_SPAN = 'serialize.to_dict'
+DB_SPAN = 'db.query'
+
+KIND_INTERNAL, KIND_SERVER, KIND_CLIENT = 1, 2, 3
+UNTRACED = ('static', 'health')
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+
+_REQUEST_ID_RE = re.compile(r'^[A-Za-z0-9._:@/+=-]{1,128}$')
+_TRACEPARENT_RE = re.compile(r'^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+
+# _root — трасування кожного запиту; _current — лише деталізованого (спани фаз)
+_root = contextvars.ContextVar('dailymood_root_trace', default=None)
+_current = contextvars.ContextVar('dailymood_trace', default=None)
+
+
+def new_id(bits):
+    """Випадковий hex-ідентифікатор (як у OpenTelemetry SDK: не криптографічний, зате дешевий)."""
+    return f'{random.getrandbits(bits):0{bits // 4}x}'
+
+
+class Span:
+    __slots__ = ('name', 'kind', 'parent', 'start', 'end', 'attributes', 'status', 'message', 'count')
+
+    def __init__(self, name, kind, parent, start, attributes):
+        self.name = name
+        self.kind = kind
+        self.parent = parent
+        self.start = start
+        self.end = None
+        self.attributes = attributes
+        self.status = STATUS_UNSET
+        self.message = None
+        self.count = 1
+
+    def set_error(self, message):
+        self.status = STATUS_ERROR
+        self.message = str(message)[:500]
+
+
+class Trace:
+    """Спани одного запиту; id спанів присвоюються лише при експорті."""
+
+    def __init__(self, request_id, max_spans, trace_id=None, remote_parent=None, sampled=False, detail=None):
+        self.request_id = request_id
+        # Без traceparent id генерується лише при експорті — більшість трас відкидаються
+        self.trace_id = trace_id
+        self.remote_parent = remote_parent
+        self.upstream_sampled = sampled
+        # Причина деталізації ('upstream', 'sampled', 'slow_path') або None — лише кореневий спан
+        self.detail = detail
+        self.max_spans = max_spans
+        self.spans = []
+        self.stack = []
+        self.dropped = 0
+        self.last_closed = None
+        self.route = None
+        self.status_code = None
+        self.root = self.start_span('http.request', KIND_SERVER)
+
+    def start_span(self, name, kind=KIND_INTERNAL, attributes=None, coalesce=False):
+        now = time.time_ns()
+        parent = self.stack[-1] if self.stack else None
+        if coalesce:
+            last = self.last_closed
+            if (last is not None and last.name == name and last.parent is parent
+                    and now - last.end <= COALESCE_GAP_NS and last.attributes == attributes):
+                last.count += 1
+                last.end = None
+                self.stack.append(last)
+                return last
+        if len(self.spans) >= self.max_spans:
+            self.dropped += 1
+            return None
+        span = Span(name, kind, parent, now, attributes)
+        self.spans.append(span)
+        self.stack.append(span)
+        return span
+
+    def end_span(self, span):
+        """Закриває span і всі незакриті дочірні (виняток посеред рендеру тощо)."""
+        if span is None:
+            return
+        now = time.time_ns()
+        stack = self.stack
+        if stack and stack[-1] is span:
+            stack.pop()
+            span.end = now
+            self.last_closed = span
+            return
+        if span not in stack:
+            return
+        while self.stack:
+            top = self.stack.pop()
+            top.end = now
+            if top is span:
+                break
+        self.last_closed = span
+
+    @property
+    def duration_ms(self):
+        end = self.root.end or time.time_ns()
+        return (end - self.root.start) / 1e6
+
+
+class span:
+    """Дочірній спан поточного запиту (контекстний менеджер); поза трасованим запитом нічого не робить."""
+
+    __slots__ = ('trace', 'current', 'args')
+
+    def __init__(self, name, kind=KIND_INTERNAL, coalesce=False, **attributes):
+        self.trace = _current.get()
+        self.current = None
+        self.args = (name, kind, attributes or None, coalesce)
+
+    def __enter__(self):
+        if self.trace is not None:
+            self.current = self.trace.start_span(*self.args)
+        return self.current
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.trace is not None:
+            if exc is not None and self.current is not None:
+                self.current.set_error(exc)
+            self.trace.end_span(self.current)
+        return False
+
+
+# -------------------- Експорт OTLP/JSON --------------------
+def _attribute(key, value):
+    if isinstance(value, bool):
+        wrapped = {'boolValue': value}
+    elif isinstance(value, int):
+        wrapped = {'intValue': str(value)}
+    elif isinstance(value, float):
+        wrapped = {'doubleValue': value}
+    else:
+        wrapped = {'stringValue': str(value)}
+    return {'key': key, 'value': wrapped}
+
+
+def otlp_spans(trace):
+    """Спани трасування у форматі OTLP/JSON (hex id, час у нс рядками)."""
+    if trace.trace_id is None:
+        trace.trace_id = new_id(128)
+    ids = {id(s): new_id(64) for s in trace.spans}
+    result = []
+    for s in trace.spans:
+        attributes = dict(s.attributes or {})
+        if s.count > 1:
+            attributes['dailymood.coalesced_count'] = s.count
+        if s is trace.root and trace.dropped:
+            attributes['dailymood.spans_dropped'] = trace.dropped
+        if s.parent is not None:
+            parent_id = ids[id(s.parent)]
+        else:
+            parent_id = trace.remote_parent or ''
+        item = {
+            'traceId': trace.trace_id,
+            'spanId': ids[id(s)],
+            'parentSpanId': parent_id,
+            'name': s.name,
+            'kind': s.kind,
+            'startTimeUnixNano': str(s.start),
+            'endTimeUnixNano': str(s.end or trace.root.end or s.start),
+            'attributes': [_attribute(k, v) for k, v in attributes.items() if v is not None],
+            'status': {'code': s.status},
+        }
+        if s.message:
+            item['status']['message'] = s.message
+        result.append(item)
+    return result
+
+
+def otlp_payload(traces, service_name):
+    """ExportTraceServiceRequest для пакета трасувань."""
+    resource = [_attribute('service.name', service_name),
+                _attribute('host.name', socket.gethostname()),
+                _attribute('process.pid', os.getpid())]
+    spans = [item for trace in traces for item in otlp_spans(trace)]
+    return {'resourceSpans': [{
+        'resource': {'attributes': resource},
+        'scopeSpans': [{'scope': {'name': 'dailymood.tracing'}, 'spans': spans}],
+    }]}
+
+
+class Exporter:
+    """Фоновий експорт збережених трасувань (потік стартує в кожному процесі окремо)."""
+
+    def __init__(self, app):
+        self.kind = app.config.get('TRACING_EXPORTER', 'file')
+        self.path = app.config.get('TRACING_FILE') or os.path.join('data', 'traces', 'traces.jsonl')
+        self.endpoint = app.config.get('TRACING_OTLP_ENDPOINT')
+        self.max_bytes = app.config.get('TRACING_FILE_MAX_BYTES', DEFAULT_FILE_MAX_BYTES)
+        self.service_name = app.config.get('TRACING_SERVICE_NAME', 'dailymood')
+        self.queue = queue.Queue(maxsize=app.config.get('TRACING_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+        self._pid = None
+        self._lock = threading.Lock()
+        self._failing = False
+
+    def submit(self, trace):
+        if self.kind == 'none':
+            return
+        self._ensure_thread()
+        try:
+            self.queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        """Чекає, доки черга буде експортована (тести, завершення процесу)."""
+        if self._pid == os.getpid():
+            self.queue.join()
+
+    def _ensure_thread(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # Після fork (gunicorn --preload) потік батька не існує — стартуємо свій
+                self._pid = os.getpid()
+                threading.Thread(target=self._run, name='trace-exporter', daemon=True).start()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < EXPORT_BATCH:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.export(batch)
+                self.exported += len(batch)
+                self._failing = False
+            except Exception as exc:
+                self.failed += len(batch)
+                if not self._failing:
+                    logging.warning("Tracing: експорт не вдався (%s)", exc)
+                self._failing = True
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def export(self, traces):
+        body = json.dumps(otlp_payload(traces, self.service_name), ensure_ascii=False, separators=(',', ':'))
+        if self.kind == 'otlp':
+            req = urllib.request.Request(self.endpoint, data=body.encode('utf-8'), method='POST',
+                                         headers={'Content-Type': 'application/json'})
+            with urllib.request.urlopen(req, timeout=5) as response:
+                response.read()
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        try:
+            if os.path.getsize(self.path) >= self.max_bytes:
+                os.replace(self.path, self.path + '.1')
+        except FileNotFoundError:
+            pass
+        with open(self.path, 'a', encoding='utf-8') as fh:
+            fh.write(body + '\n')
+
+
+# -------------------- Збір спанів --------------------
+class Tracer:
+    """Налаштування семплування та лічильники рішень для /metrics."""
+
+    def __init__(self, app):
+        self.enabled = app.config.get('TRACING_ENABLED', True)
+        self.sample_rate = app.config.get('TRACING_SAMPLE_RATE', DEFAULT_SAMPLE_RATE)
+        self.slow_ms = app.config.get('TRACING_SLOW_MS', DEFAULT_SLOW_MS)
+        self.slow_detail = app.config.get('TRACING_SLOW_DETAIL', DEFAULT_SLOW_DETAIL)
+        self.max_spans = app.config.get('TRACING_MAX_SPANS', DEFAULT_MAX_SPANS)
+        self.exporter = Exporter(app)
+        self.decisions = {'slow': 0, 'error': 0, 'upstream': 0, 'sampled': 0, 'dropped': 0}
+        self.details = {'upstream': 0, 'sampled': 0, 'slow_path': 0}
+        # Шлях -> скільки наступних запитів на нього деталізувати після повільного
+        self.slow_paths = {}
+
+    def _slow_path(self, path):
+        remaining = self.slow_paths.get(path)
+        if not remaining:
+            return False
+        # Гонки між потоками лише зсувають лічильник на одиницю
+        if remaining > 1:
+            self.slow_paths[path] = remaining - 1
+        else:
+            self.slow_paths.pop(path, None)
+        return True
+
+    def begin(self, environ, request_id):
+        trace_id = parent = None
+        sampled = False
+        traceparent = environ.get('HTTP_TRACEPARENT')
+        match = _TRACEPARENT_RE.match(traceparent) if traceparent else None
+        if match and match.group(1) != '0' * 32:
+            trace_id, parent = match.group(1), match.group(2)
+            sampled = bool(int(match.group(3), 16) & 1)
+        path = environ.get('PATH_INFO')
+        if sampled:
+            detail = 'upstream'
+        elif self.slow_paths and self._slow_path(path):
+            detail = 'slow_path'
+        elif random.random() < self.sample_rate:
+            detail = 'sampled'
+        else:
+            detail = None
+        if detail is not None:
+            self.details[detail] += 1
+        trace = Trace(request_id, self.max_spans, trace_id, parent, sampled, detail)
+        trace.root.attributes = {'http.method': environ.get('REQUEST_METHOD'),
+                                 'http.target': path,
+                                 'http.request_id': request_id}
+        return trace
+
+    def decide(self, trace):
+        """Tail-семплування: причина збереження або 'dropped'."""
+        if trace.root.status == STATUS_ERROR or (trace.status_code or 0) >= 500:
+            return 'error'
+        if trace.duration_ms >= self.slow_ms:
+            return 'slow'
+        if trace.upstream_sampled:
+            return 'upstream'
+        if trace.detail == 'sampled':
+            return 'sampled'
+        return 'dropped'
+
+    def finish(self, trace):
+        root = trace.root
+        trace.end_span(root)
+        method = root.attributes['http.method']
+        root.name = f"{method} {trace.route or root.attributes['http.target']}"
+        root.attributes['http.route'] = trace.route
+        root.attributes['http.status_code'] = trace.status_code
+        if (trace.status_code or 0) >= 500 and root.status != STATUS_ERROR:
+            root.set_error(f'HTTP {trace.status_code}')
+        decision = self.decide(trace)
+        self.decisions[decision] += 1
+        if decision == 'slow' and self.slow_detail:
+            # Наступні запити на цей шлях покажуть, на що йде час
+            paths = self.slow_paths
+            paths[root.attributes['http.target']] = self.slow_detail
+            if len(paths) > MAX_SLOW_PATHS:
+                paths.pop(next(iter(paths)), None)
+        if decision != 'dropped':
+            root.attributes['dailymood.sampling'] = decision
+            root.attributes['dailymood.detail'] = trace.detail or 'root'
+            self.exporter.submit(trace)
+
+
+def _valid_request_id(value):
+    return value if value and _REQUEST_ID_RE.match(value) else None
+
+
+class TracingMiddleware:
+    """WSGI-обгортка: X-Request-ID, кореневий спан і рішення семплування після тіла відповіді."""
+
+    def __init__(self, wsgi_app, tracer):
+        self.wsgi_app = wsgi_app
+        self.tracer = tracer
+
+    def __call__(self, environ, start_response):
+        request_id = _valid_request_id(environ.get('HTTP_X_REQUEST_ID')) or new_id(128)
+        environ[REQUEST_ID_ENVIRON_KEY] = request_id
+        trace = None
+        # Статика та health-перевірки — більшість запитів без фаз, які варто трасувати
+        if self.tracer.enabled and session_policy.classify(environ.get('PATH_INFO', '')) not in UNTRACED:
+            trace = self.tracer.begin(environ, request_id)
+
+        def traced_start_response(status, headers, exc_info=None):
+            if trace is not None:
+                trace.status_code = int(status[:3])
+            return start_response(status, list(headers) + [(REQUEST_ID_HEADER, request_id)], exc_info)
+
+        if trace is None:
+            return self.wsgi_app(environ, traced_start_response)
+
+        _root.set(trace)
+        if trace.detail is not None:
+            _current.set(trace)
+
+        def finish():
+            _root.set(None)
+            _current.set(None)
+            self.tracer.finish(trace)
+
+        try:
+            iterable = self.wsgi_app(environ, traced_start_response)
+        except BaseException as exc:
+            trace.root.set_error(exc)
+            finish()
+            raise
+        return ClosingIterator(iterable, finish)
+
+
+def _in_span(name, function, *args):
+    """function(*args) у спані name; дешевше за span() — для обгорток, що виконуються на кожен запит."""
+    trace = _current.get()
+    if trace is None:
+        return function(*args)
+    current = trace.start_span(name)
+    try:
+        return function(*args)
+    except BaseException as exc:
+        if current is not None:
+            current.set_error(exc)
+        raise
+    finally:
+        trace.end_span(current)
+
+
+def _wrap_method(obj, name, span_name):
+    original = getattr(obj, name)
+
+    @wraps(original)
+    def wrapper(*args, **kwargs):
+        if kwargs:
+            return _in_span(span_name, lambda: original(*args, **kwargs))
+        return _in_span(span_name, original, *args)
+
+    setattr(obj, name, wrapper)
+
+
+def _wrap_dispatch(app):
+    original = app.dispatch_request
+
+    @wraps(original)
+    def dispatch_request():
+        trace = _root.get()
+        if trace is None:
+            return original()
+        rule = request.url_rule
+        trace.route = rule.rule if rule is not None else None
+        if trace.detail is None:
+            return original()
+        return _in_span(f'handler {request.endpoint}', original)
+
+    app.dispatch_request = dispatch_request
+
+
+class TracingSessionInterface:
+    """Обгортка інтерфейсу сесії зі спанами session.open / session.save."""
+
+    def __init__(self, inner):
+        self.inner = inner
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def open_session(self, app, request):
+        return _in_span('session.open', self.inner.open_session, app, request)
+
+    def save_session(self, app, session, response):
+        return _in_span('session.save', self.inner.save_session, app, session, response)
+
+
+def _wrap_to_dict(model):
+    original = model.to_dict
+    attributes = {'model': model.__name__}
+    time_ns = time.time_ns
+
+    @wraps(original)
+    def to_dict(self, *args, **kwargs):
+        trace = _current.get()
+        stack = trace.stack if trace is not None else None
+        # Вкладені to_dict() (Order -> OrderItem) — частина зовнішнього спану
+        if not stack or stack[-1].name == SERIALIZE_SPAN:
+            return original(self, *args, **kwargs)
+        # Викликається для кожного елемента списку, тож без start_span/end_span і try:
+        # наступний виклик продовжує попередній спан, а незакритий після винятку
+        # спан закриє end_span батьківського
+        start = time_ns()
+        last = trace.last_closed
+        if (last is not None and last.attributes is attributes and last.parent is stack[-1]
+                and start - last.end <= COALESCE_GAP_NS):
+            current = last
+            current.count += 1
+        else:
+            current = trace.start_span(SERIALIZE_SPAN, KIND_INTERNAL, attributes)
+            if current is None:
+                return original(self, *args, **kwargs)
+            stack.pop()
+        stack.append(current)
+        result = original(self, *args, **kwargs)
+        if stack[-1] is current:
+            stack.pop()
+        current.end = time_ns()
+        trace.last_closed = current
+        return result
+
+    to_dict._traced = True
+    model.to_dict = to_dict
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current.get()
+    if trace is not None:
+        trace.start_span(DB_SPAN, KIND_CLIENT, {
+            'db.system': conn.dialect.name,
+            'db.statement': statement[:MAX_STATEMENT_LENGTH],
+        })
+
+
+def _db_span(trace):
+    # Між before/after_cursor_execute у потоці запиту інші спани не відкриваються
+    if trace is not None and trace.stack and trace.stack[-1].name == DB_SPAN:
+        return trace.stack[-1]
+    return None
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current.get()
+    current = _db_span(trace)
+    if current is not None:
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            current.attributes['db.rows_affected'] = cursor.rowcount
+        trace.end_span(current)
+
+
+def _handle_error(context):
+    trace = _current.get()
+    current = _db_span(trace)
+    if current is not None:
+        current.set_error(context.original_exception)
+        trace.end_span(current)
+
+
+def _before_render(sender, template, context, **extra):
+    trace = _current.get()
+    if trace is not None:
+        trace.start_span('template.render', attributes={'template': template.name})
+
+
+def _rendered(sender, template, context, **extra):
+    trace = _current.get()
+    if trace is not None and trace.stack and trace.stack[-1].name == 'template.render':
+        trace.end_span(trace.stack[-1])
+
+
+def collect(app):
+    """Метрики для /metrics: рішення семплування та стан експорту."""
+    tracer = app.extensions.get('tracing')
+    if tracer is None or not tracer.enabled:
+        return
+    yield ('traces_total', 'counter', 'Трасування за рішенням tail-семплування',
+           [({'decision': decision}, count) for decision, count in tracer.decisions.items()])
+    yield ('traces_detailed_total', 'counter', 'Запити з дочірніми спанами за причиною деталізації',
+           [({'reason': reason}, count) for reason, count in tracer.details.items()])
+    exporter = tracer.exporter
+    yield ('trace_export_total', 'counter', 'Результат експорту збережених трасувань',
+           [({'result': 'exported'}, exporter.exported), ({'result': 'failed'}, exporter.failed),
+            ({'result': 'queue_full'}, exporter.dropped)])
+
+
+def init_app(app, db):
+    tracer = app.extensions['tracing'] = Tracer(app)
+    # X-Request-ID повертається завжди, навіть із вимкненим трасуванням
+    app.wsgi_app = TracingMiddleware(app.wsgi_app, tracer)
+    if not tracer.enabled:
+        return
+
+    # Спани лише навколо сховища сесій: запити без сесії (session_policy) їх не мають
+    interface = app.session_interface
+    if isinstance(interface, session_policy.SelectiveSessionInterface):
+        interface.inner = TracingSessionInterface(interface.inner)
+    else:
+        app.session_interface = TracingSessionInterface(interface)
+    _wrap_method(app, 'preprocess_request', 'flask.before_request')
+    _wrap_method(app, 'process_response', 'flask.after_request')
+    _wrap_method(app.json, 'response', 'serialize.json')
+    _wrap_dispatch(app)
+
+    if app.config.get('TRACING_SERIALIZE_SPANS', True):
+        for mapper in db.Model.registry.mappers:
+            model = mapper.class_
+            if 'to_dict' in vars(model) and not getattr(model.to_dict, '_traced', False):
+                _wrap_to_dict(model)
+
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+    before_render_template.connect(_before_render, app)
+    template_rendered.connect(_rendered, app)
+    metrics.register(collect)